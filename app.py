@@ -1,7 +1,7 @@
 import asyncio
 import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -10,15 +10,32 @@ from textual.css.query import NoMatches
 from textual.widgets import Footer, Header
 
 import globals
-from collectors.base import collector_registry
-from collectors.top_processes import TopProcessCollector
+from collectors.discovery import CollectorSpec, discover_collectors
+from utils import startup_timer
+from utils.alerts import AlertEngine, AlertEvent, dispatch_hooks, load_alert_config
+from utils.cardinality import CardinalityGuard
+from utils.deadband import TOMBSTONE_EVENT, DeadbandFilter
+from utils.fleet import FleetManager, HostSpec
+from utils.log_index import DEFAULT_INDEX_DIR, LogIndex
 from utils.log_writer import LogWriter
 from utils.memory_cache import MetricCache
+from utils.openmetrics import MetricsExporter, MetricsServer
+from utils.quantile_sketch import QuantileSketchStore
+from utils.replay import MetricLogReader, ReplayState
+from utils.shm_snapshot import DEFAULT_SEGMENT_NAME, SnapshotPublisher
+from utils.warm_state import load_warm_state, save_warm_state
 from widgets import (
+    AlertsWidget,
+    AnomaliesWidget,
     CurrentTimeWidget,
     DmesgErrorsWidget,
     DockerStatsWidget,
+    FleetOverviewWidget,
+    IoThroughputWidget,
+    LogSearchWidget,
     SystemInfoWidget,
+    TcpTalkersWidget,
+    ThreadDrillDownWidget,
     TopProcessesWidget,
     UptimeWidget,
 )
@@ -26,6 +43,39 @@ from widgets import (
 COLLECTION_INTERVAL_SECONDS: int = 2
 METRIC_CACHE_TTL_SECONDS: int = 300
 LOG_DIR_NAME: str = "logs"
+COLLECTOR_CONFIG_NAME: str = "collectors.json"
+ALERT_CONFIG_NAME: str = "alerts.json"
+WARM_STATE_PATH: Path = Path("state") / "warm_state.bin"  # 앱 디렉터리 기준
+WARM_STATE_SAVE_INTERVAL_SECONDS: int = 60
+DEADBAND_KEEPALIVE_SECONDS: float = 60.0
+# URI glob -> (최대 시리즈 수, 넘치는 샘플을 "other" 버킷에 합산할지). 첫 번째 일치 패턴 적용.
+# 일치하지 않는 URI는 개수 제한 없이 유휴 시간만으로 정리됩니다.
+SERIES_LIMITS: Dict[str, Tuple[int, bool]] = {
+    "top_cpu.*": (200, True),
+    "top_mem.*": (200, True),
+    "docker.container.*": (3000, True),  # 컨테이너 1000개 x 메트릭 3개
+    "cgroup.*": (5000, False),
+    "net.tcp.remote.*": (200, True),  # 틱마다 상위 N개만 보고하지만 순위가 바뀌며 계속 생김
+    "net.tcp.port.*": (200, True),
+    "fs.*": (2000, False),  # 마운트당 최대 9개 (자동 마운트가 많은 호스트 대비 상한)
+}
+SERIES_IDLE_SECONDS: float = METRIC_CACHE_TTL_SECONDS
+PERCENTILE_SPAN_SECONDS: int = 3600  # 위젯에 표시하는 백분위수 구간
+REPLAY_MAX_WAIT_SECONDS: float = 5.0  # 기록 공백(재시작 등)을 재생할 때 실제로 기다리는 최대 시간
+REPLAY_POLL_SECONDS: float = 0.05
+# URI glob pattern -> (absolute tolerance, relative tolerance)
+DEADBAND_TOLERANCES: Dict[str, Tuple[float, float]] = {
+    "system.cpu.core*": (0.5, 0.0),
+    "system.memory.*_bytes": (0.0, 0.01),
+    "system.memory.*_per_sec": (0.0, 0.05),
+    "system.memory.*": (0.1, 0.0),
+    "system.pressure.*.avg*": (0.1, 0.0),
+    "system.pressure.*": (0.0, 0.05),
+    "docker.container.*.cpu_percent": (0.5, 0.0),
+    "docker.container.*.mem_*": (0.0, 0.005),
+    "top_cpu.*": (0.5, 0.0),
+    "top_mem.*": (0.05, 0.0),
+}
 
 
 class MonitoringDashboardApp(App[None]):
@@ -37,39 +87,107 @@ class MonitoringDashboardApp(App[None]):
         Binding("q", "quit", "종료"),
         Binding("ctrl+c", "quit", "종료"),
         Binding("d", "toggle_dark", "다크 모드 전환"),
+        Binding("s", "cycle_process_sort", "프로세스 정렬 기준"),
+        Binding("t", "toggle_process_tree", "프로세스 트리"),
+        Binding("slash", "open_log_search", "로그 검색"),
+        # 리플레이 모드 전용 (check_action에서 실시간 모드일 때 숨김)
+        Binding("space", "replay_toggle_pause", "재생/일시정지"),
+        Binding("left", "replay_seek(-60)", "-1분"),
+        Binding("right", "replay_seek(60)", "+1분"),
+        Binding("shift+left", "replay_seek(-600)", "-10분", show=False),
+        Binding("shift+right", "replay_seek(600)", "+10분", show=False),
+        Binding("1", "replay_speed(1)", "1×"),
+        Binding("2", "replay_speed(10)", "10×"),
+        Binding("3", "replay_speed(100)", "100×"),
+        # 플릿 모드 전용
+        Binding("o", "fleet_cycle_sort", "호스트 정렬 기준"),
+        Binding("h", "fleet_focus_overview", "호스트 목록"),
     ]
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        replay_path: Optional[Path] = None,
+        replay_speed: float = 1.0,
+        replay_start: Optional[datetime.time] = None,
+        extra_collectors: Optional[Dict[str, Dict[str, Any]]] = None,
+        stress_mode: bool = False,
+        shm_name: Optional[str] = DEFAULT_SEGMENT_NAME,
+        metrics_address: Optional[Tuple[str, int]] = None,
+        fleet_specs: Optional[List[HostSpec]] = None,
+    ) -> None:
+        """
+        Args:
+            replay_path: 지정하면 컬렉터 대신 기록된 메트릭 로그를 재생합니다.
+            replay_speed: 재생 배속.
+            replay_start: 재생을 시작할 (로컬) 시각. 없으면 파일 처음부터 재생합니다.
+            extra_collectors: 설정과 관계없이 켤 컬렉터 이름 -> 생성자 옵션
+                (예: {"SyntheticLoadCollector": {"series": 50000}}).
+            stress_mode: 스트레스 실행용. extra_collectors만 로드하고, 수집 타이머와
+                웜 스타트 복원/저장을 끄며, 틱은 호출자가 직접 구동합니다.
+            shm_name: 최신 스냅숏을 게시할 공유 메모리 세그먼트 이름 (None이면 게시 안 함).
+            metrics_address: OpenMetrics `/metrics` 엔드포인트 (host, port). None이면 끕니다.
+            fleet_specs: 지정하면 로컬 컬렉터 대신 여러 호스트의 NDJSON 스트림(`--stream`)을
+                받아 호스트 개요를 보여주고, 선택한 호스트를 기존 위젯에 표시합니다.
+        """
         super().__init__()
+        self.extra_collectors = extra_collectors or {}
+        self.stress_mode = stress_mode
         self.metric_cache: MetricCache = MetricCache(ttl_seconds=METRIC_CACHE_TTL_SECONDS)
-        self._initialize_collectors_and_logger()
+        # URI별 5분 창 DDSketch (최근 1시간 p50/p95/p99 조회용)
+        self.quantile_store: QuantileSketchStore = QuantileSketchStore()
+        self.cardinality: CardinalityGuard = CardinalityGuard(
+            SERIES_LIMITS, idle_seconds=SERIES_IDLE_SECONDS
+        )
+        self.deadband: DeadbandFilter = DeadbandFilter(
+            keepalive_seconds=DEADBAND_KEEPALIVE_SECONDS, tolerances=DEADBAND_TOLERANCES
+        )
+        # 지난 틱에 로그에 남긴 top_cpu/top_mem URI (목록에서 빠진 프로세스에 툼스톤을 쓰기 위함)
+        self._logged_top_uris: Set[str] = set()
+        self.replay_reader: Optional[MetricLogReader] = None
+        self.replay_speed: float = replay_speed
+        self.replay_paused: bool = False
+        self._replay_start = replay_start
+        self._replay_ts: Optional[datetime.datetime] = None
+        self._replay_seek_target: Optional[datetime.datetime] = None
+        self.fleet: Optional[FleetManager] = None
+        self.fleet_host: Optional[str] = None  # 기존 위젯에 표시 중인 호스트
+        if fleet_specs is not None:
+            # 원격 호스트의 값은 이 호스트의 로그/스냅숏/엔드포인트에 섞지 않습니다.
+            self.fleet = FleetManager(fleet_specs)
+            self.title = f"🛰 플릿: 호스트 {len(fleet_specs)}대"
+            shm_name, metrics_address = None, None
+        elif replay_path is not None:
+            # 리플레이 중에는 로그를 쓰지 않습니다 (재생한 값이 다시 기록되지 않도록).
+            self.replay_reader = MetricLogReader(replay_path)
+            self.title = f"⏪ 리플레이: {replay_path.name}"
+        else:
+            self._initialize_logger()
+        self._initialize_alerts()
+        self.snapshot_publisher: Optional[SnapshotPublisher] = None
+        if shm_name and self.replay_reader is None and not stress_mode:
+            try:
+                self.snapshot_publisher = SnapshotPublisher(
+                    shm_name, ttl_seconds=METRIC_CACHE_TTL_SECONDS
+                )
+            except OSError as e:
+                print(f"ERROR: 공유 메모리 스냅숏 게시 비활성화: {e}")
+        # 틱마다 한 번 렌더링한 OpenMetrics 본문(+gzip)을 스크레이프에 그대로 돌려줍니다.
+        self.metrics_exporter: Optional[MetricsExporter] = None
+        self.metrics_server: Optional[MetricsServer] = None
+        if metrics_address is not None and self.replay_reader is None and not stress_mode:
+            self.metrics_exporter = MetricsExporter()
+            self.metrics_server = MetricsServer(self.metrics_exporter, *metrics_address)
         self.docker_metrics_buffer: Dict[str, Dict[str, Any]] = {}
+        self.io_rates_buffer: Dict[str, float] = {}
+        self.socket_metrics_buffer: Dict[str, float] = {}
+        self._tick_process_tree: Optional[Any] = None  # TopProcessCollector의 트리 스냅숏
+        # numpy 임포트가 첫 화면을 늦추지 않도록 마운트 후 백그라운드에서 생성합니다.
+        self.anomaly_detector: Optional[Any] = None
+        self._log_index_reader: Optional[LogIndex] = None  # 색인 컬렉터가 없을 때 읽기 전용
+        self._begin_tick()
 
-    def _initialize_collectors_and_logger(self) -> None:
-        """컬렉터와 로거를 초기화합니다."""
-        instantiated_collectors = globals.get_instantiated_collectors()
-        if not instantiated_collectors:
-            collectors_to_init = []
-            for collector_cls in collector_registry:
-                try:
-                    collectors_to_init.append(collector_cls())
-                except Exception as e:
-                    msg = f"컬렉터 {collector_cls.__name__} 인스턴스화 실패: {e}"
-                    # Use self.log if available (after app init), otherwise print
-                    if hasattr(self, "log"):
-                        self.log.error(msg)
-                    else:
-                        print(f"ERROR: {msg}")  # Early error
-            globals.set_instantiated_collectors(collectors_to_init)
-
-        current_collectors = globals.get_instantiated_collectors()
-        if not current_collectors:
-            msg = "인스턴스화된 컬렉터 없음. 메트릭 수집 불가."
-            if hasattr(self, "log"):
-                self.log.error(msg)
-            else:
-                print(f"ERROR: {msg}")
-
+    def _initialize_logger(self) -> None:
+        """로거를 초기화합니다. 컬렉터는 첫 화면 이후 on_mount에서 지연 로드됩니다."""
         log_writer = globals.get_log_writer_instance()
         if log_writer is None:
             try:
@@ -89,6 +207,146 @@ class MonitoringDashboardApp(App[None]):
                 else:
                     print(f"ERROR: {msg}")
 
+    def _initialize_alerts(self) -> None:
+        """알림 규칙을 로드하고 규칙 엔진을 생성합니다."""
+        self.alert_webhook_url: Optional[str] = None
+        self.alert_command: Optional[List[str]] = None
+        try:
+            config = load_alert_config(Path(__file__).resolve().parent / ALERT_CONFIG_NAME)
+            self.alert_engine = AlertEngine(config["rules"])
+            self.alert_webhook_url = config["webhook_url"]
+            self.alert_command = config["command"]
+        except Exception as e:
+            print(f"ERROR: 알림 설정 로드 실패, 규칙 없이 실행합니다: {e}")
+            self.alert_engine = AlertEngine([])
+
+    async def _load_anomaly_detector(self) -> None:
+        """이상 탐지기를 스레드 풀에서 생성합니다 (numpy가 없으면 비활성화)."""
+
+        def create() -> Any:
+            from utils.anomaly import AnomalyDetector
+
+            return AnomalyDetector()
+
+        loop = asyncio.get_running_loop()
+        try:
+            self.anomaly_detector = await loop.run_in_executor(None, create)
+        except ImportError as e:
+            self.log.warning(f"이상 탐지 비활성화 (numpy 없음): {e}")
+            try:
+                self.query_one(AnomaliesWidget).set_unavailable()
+            except NoMatches:
+                pass
+        startup_timer.mark("anomaly_detector_ready")
+
+    async def _load_collectors(self) -> None:
+        """
+        사용 가능한 컬렉터를 탐색하고 각각 스레드 풀에서 병렬로 임포트/인스턴스화합니다.
+        준비가 끝난 컬렉터부터 수집 루프에 합류하므로 느린 컬렉터가 첫 화면을 막지 않습니다.
+        """
+        if globals.get_instantiated_collectors():
+            return
+        config_path = Path(__file__).resolve().parent / COLLECTOR_CONFIG_NAME
+        loop = asyncio.get_running_loop()
+        collector_states = {} if self.stress_mode else await self._restore_warm_state()
+        specs = await loop.run_in_executor(
+            None, discover_collectors, config_path, self.extra_collectors, self.stress_mode
+        )
+
+        async def load_one(spec: CollectorSpec) -> None:
+            def probe_and_instantiate() -> Any:
+                if not spec.is_available():
+                    return None
+                return spec.instantiate()
+
+            try:
+                collector = await loop.run_in_executor(None, probe_and_instantiate)
+            except Exception as e:
+                self.log.error(f"컬렉터 {spec.name} 인스턴스화 실패: {e}")
+                return
+            if collector is None:
+                self.log.info(f"컬렉터 {spec.name} 사용 불가 (프로브 실패), 건너뜁니다.")
+                return
+            saved_state = collector_states.get(collector.__class__.__name__)
+            if saved_state is not None:
+                try:
+                    collector.set_state(saved_state, max_age_seconds=METRIC_CACHE_TTL_SECONDS)
+                except Exception as e:
+                    self.log.warning(f"컬렉터 {spec.name} 상태 복원 실패: {e}")
+            globals.add_instantiated_collector(collector)
+            startup_timer.mark(f"collector_ready.{spec.name}")
+
+        await asyncio.gather(*(load_one(spec) for spec in specs))
+        startup_timer.mark("collectors_ready")
+        if not globals.get_instantiated_collectors():
+            self.log.error("인스턴스화된 컬렉터 없음. 메트릭 수집 불가.")
+        await self._log_startup_timing()
+
+    async def _restore_warm_state(self) -> Dict[str, Any]:
+        """
+        이전 실행의 캐시 스냅숏을 복원해 첫 화면을 바로 채웁니다.
+
+        Returns:
+            dict: 컬렉터 이름 -> 저장된 델타 상태 (재부팅 후에는 빈 dict).
+        """
+        path = Path(__file__).resolve().parent / WARM_STATE_PATH
+        loop = asyncio.get_running_loop()
+        try:
+            loaded = await loop.run_in_executor(None, load_warm_state, path)
+        except Exception as e:
+            self.log.warning(f"웜 스타트 상태 로드 실패, 빈 상태로 시작합니다: {e}")
+            return {}
+        if loaded is None:
+            return {}
+        entries, collector_states, same_boot = loaded
+        restored = await self.metric_cache.restore(entries)
+        if restored:
+            fresh = await self.metric_cache.snapshot()
+            self._begin_tick()
+            for uri, info in fresh.items():
+                if self.cardinality.admit(uri, info["value"], info["timestamp"]) is None:
+                    await self.metric_cache.forget(uri)
+                    continue
+                await self.ingest_sample(uri, info["value"], info["timestamp"], False)
+            self.cardinality.drain_overflow()  # 복원 값은 other 버킷에 합산하지 않습니다.
+            self._finish_tick([])
+        startup_timer.mark("warm_state_restored")
+        self.log.info(f"웜 스타트: 캐시 항목 {restored}개 복원")
+        return collector_states if same_boot else {}
+
+    async def save_warm_state(self) -> None:
+        """캐시와 컬렉터 델타 상태를 스냅숏 파일로 저장합니다."""
+        entries = await self.metric_cache.snapshot()
+        collector_states: Dict[str, Any] = {}
+        for collector in globals.get_instantiated_collectors():
+            try:
+                state = collector.get_state()
+            except Exception as e:
+                self.log.warning(f"{collector.__class__.__name__} 상태 수집 실패: {e}")
+                continue
+            if state is not None:
+                collector_states[collector.__class__.__name__] = state
+        path = Path(__file__).resolve().parent / WARM_STATE_PATH
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, save_warm_state, path, entries, collector_states)
+        except Exception as e:
+            self.log.error(f"웜 스타트 상태 저장 실패: {e}")
+
+    async def _log_startup_timing(self) -> None:
+        """시작 시간 측정값을 앱 로그와 메트릭 로그에 기록합니다."""
+        timings = startup_timer.marks()
+        self.log.info(f"시작 시간(ms): {timings}")
+        log_writer = globals.get_log_writer_instance()
+        if log_writer:
+            await log_writer.append(
+                {
+                    "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    "event": "startup_timing",
+                    "timings_ms": timings,
+                }
+            )
+
     def compose(self) -> ComposeResult:
         """앱의 레이아웃을 구성합니다."""
         yield Header(show_clock=False)
@@ -96,15 +354,34 @@ class MonitoringDashboardApp(App[None]):
             with Vertical(id="left-column"):
                 yield UptimeWidget(id="uptime")
                 yield SystemInfoWidget(id="sys_info")
+                yield IoThroughputWidget(id="io_throughput")
                 yield DmesgErrorsWidget(id="dmesg_errors")
+                yield AlertsWidget(id="alerts")
+                yield AnomaliesWidget(id="anomalies")
             with Vertical(id="right-column"):
+                yield FleetOverviewWidget(id="fleet_overview")
+                yield LogSearchWidget(id="log_search")
                 yield TopProcessesWidget(id="top_procs")
+                yield ThreadDrillDownWidget(id="thread_drilldown")
+                yield TcpTalkersWidget(id="tcp_talkers")
                 yield DockerStatsWidget(id="docker_stats")
         yield Footer()
         yield CurrentTimeWidget(id="custom_clock")  # Renamed from CurrentTime to CurrentTimeWidget
 
     async def on_mount(self) -> None:
         """앱 마운트 시 비동기 작업을 시작합니다."""
+        self.run_worker(self._load_anomaly_detector(), name="anomaly-loader", group="startup")
+        if self.replay_reader is not None:
+            self.run_worker(self._run_replay(), name="replay", group="replay")
+            return
+        if self.fleet is not None:
+            self.query_one(FleetOverviewWidget).display = True
+            self.fleet.start()
+            self.set_interval(COLLECTION_INTERVAL_SECONDS, self._refresh_fleet)
+            self.call_after_refresh(self.query_one("#fleet_table").focus)
+            self.sub_title = "호스트를 선택(Enter)하면 아래 위젯에 표시합니다."
+            return
+
         log_writer = globals.get_log_writer_instance()
         if log_writer:
             try:
@@ -125,21 +402,34 @@ class MonitoringDashboardApp(App[None]):
         else:
             self.log.warning("LogWriter가 초기화되지 않았습니다. 파일 로깅이 비활성화됩니다.")
 
-        if not globals.get_instantiated_collectors():
-            self.log.error("사용 가능한 컬렉터가 없어 메트릭 수집을 시작할 수 없습니다.")
-            return
+        if self.metrics_server is not None:
+            try:
+                await self.metrics_server.start()
+                self.log.info(
+                    f"OpenMetrics 엔드포인트: http://{self.metrics_server.host}:"
+                    f"{self.metrics_server.port}/metrics"
+                )
+            except OSError as e:
+                self.log.error(f"OpenMetrics 엔드포인트 시작 실패: {e}")
+                self.metrics_server = None
+                self.metrics_exporter = None
+
+        # 첫 프레임이 그려진 뒤 시점을 기록하고, 컬렉터는 백그라운드에서 로드합니다.
+        self.call_after_refresh(startup_timer.mark, "first_frame")
+        self.run_worker(self._load_collectors(), name="collector-loader", group="startup")
+        if self.stress_mode:
+            return  # 틱은 stress_run.py(저장소 루트)가 직접 구동합니다.
 
         self.set_interval(COLLECTION_INTERVAL_SECONDS, self.run_metric_collection_background)
+        self.set_interval(WARM_STATE_SAVE_INTERVAL_SECONDS, self.save_warm_state)
+        self.set_interval(WARM_STATE_SAVE_INTERVAL_SECONDS, self.log_deadband_stats)
         self.log.info("대시보드 초기화 완료 및 메트릭 수집 시작.")
 
     async def run_metric_collection_background(self) -> None:
         """백그라운드에서 주기적으로 메트릭을 수집하고 UI를 업데이트합니다."""
         current_time_utc = datetime.datetime.now(datetime.timezone.utc)
-        total_cpu_sum: float = 0.0
-        total_cpu_cores: int = 0
-        temp_per_core_cpu: Dict[str, float] = {}
         all_top_processes_data: List[Dict[str, Any]] = []  # Explicitly for TopProcessCollector
-        self.docker_metrics_buffer.clear()  # For DockerStatsCollector
+        self._begin_tick()
 
         log_writer = globals.get_log_writer_instance()
         instantiated_collectors = globals.get_instantiated_collectors()
@@ -150,41 +440,71 @@ class MonitoringDashboardApp(App[None]):
                 loop = asyncio.get_running_loop()
                 # The collected_data can be List[Tuple[str, Any]] or List[Dict[str, Any]]
                 collected_data: Union[List[Tuple[str, Any]], List[Dict[str, Any]], List[Any]]
-                collected_data = await loop.run_in_executor(None, collector_instance.collect)
+                if asyncio.iscoroutinefunction(collector_instance.collect):
+                    # 비동기 컬렉터(CommandCollector 등)는 스레드 없이 루프에서 실행합니다.
+                    collected_data = await collector_instance.collect()
+                else:
+                    collected_data = await loop.run_in_executor(None, collector_instance.collect)
 
                 if not collected_data:
                     continue
 
                 # Handle data based on collector type or data structure
-                if isinstance(collector_instance, TopProcessCollector):
+                if collector_name == "TopProcessCollector":
                     # This data is List[Dict[str, Any]]
                     all_top_processes_data = collected_data  # type: ignore [assignment]
+                    self._tick_process_tree = getattr(collector_instance, "tree_snapshot", None)
                     if log_writer:
+                        top_uris: Set[str] = set()
                         for proc_info in all_top_processes_data:  # proc_info is a Dict
+                            # 합집합 중 CPU/메모리 상위에 든 프로세스만 로그에 남깁니다.
+                            top_keys = proc_info.get("top_keys", ("cpu_percent", "memory_percent"))
                             pid = proc_info.get("pid", "unknown")
                             name = str(proc_info.get("name", "unknown_proc"))
                             # Sanitize name for URI if necessary
                             clean_name = "".join(
                                 c if c.isalnum() or c in ("-", "_", ".") else "_" for c in name
                             ).strip("_")
-                            if proc_info.get("cpu_percent") is not None:
-                                await log_writer.append(
-                                    {
-                                        "ts": current_time_utc.isoformat(),
-                                        "uri": f"top_cpu.{clean_name}.pid_{pid}.cpu_percent",
-                                        "value": proc_info["cpu_percent"],
-                                        "source": collector_name,
-                                    }
+                            samples = []
+                            if (
+                                "cpu_percent" in top_keys
+                                and proc_info.get("cpu_percent") is not None
+                            ):
+                                samples.append(
+                                    (
+                                        f"top_cpu.{clean_name}.pid_{pid}.cpu_percent",
+                                        proc_info["cpu_percent"],
+                                    )
                                 )
-                            if proc_info.get("memory_percent") is not None:
-                                await log_writer.append(
-                                    {
-                                        "ts": current_time_utc.isoformat(),
-                                        "uri": f"top_mem.{clean_name}.pid_{pid}.mem_percent",
-                                        "value": proc_info["memory_percent"],
-                                        "source": collector_name,
-                                    }
+                            if (
+                                "memory_percent" in top_keys
+                                and proc_info.get("memory_percent") is not None
+                            ):
+                                samples.append(
+                                    (
+                                        f"top_mem.{clean_name}.pid_{pid}.mem_percent",
+                                        proc_info["memory_percent"],
+                                    )
                                 )
+                            for uri, value in samples:
+                                # PID마다 새 URI가 생기므로 시리즈 수 제한을 거칩니다.
+                                admitted = self.cardinality.admit(uri, value, current_time_utc)
+                                if admitted is not None:
+                                    if admitted == uri:
+                                        top_uris.add(uri)
+                                    await self._append_log(
+                                        log_writer,
+                                        admitted,
+                                        value,
+                                        current_time_utc,
+                                        collector_name,
+                                    )
+                        # 상위 목록에서 빠졌거나 종료된 프로세스는 재생이 값을 붙잡지 않도록
+                        # 툼스톤을 남깁니다.
+                        for uri in self._logged_top_uris - top_uris:
+                            if self.deadband.forget(uri):
+                                await self._append_tombstone(log_writer, uri, current_time_utc)
+                        self._logged_top_uris = top_uris
                     # Skip to next collector as TopProcessCollector data is handled
                     continue
 
@@ -200,48 +520,144 @@ class MonitoringDashboardApp(App[None]):
                         continue  # Skip malformed item
 
                     uri, value = item
+                    admitted = self.cardinality.admit(uri, value, current_time_utc)
+                    if admitted is None:
+                        continue  # 시리즈 수 제한 초과 (other 버킷에 합산되었거나 버려짐)
+                    uri = admitted
 
-                    await self.metric_cache.update(uri, value, current_time_utc)
                     if log_writer:
-                        log_entry: Dict[str, Any] = {
-                            "ts": current_time_utc.isoformat(),
-                            "uri": uri,
-                            "value": value,
-                            "source": collector_name,
-                        }
-                        await log_writer.append(log_entry)
-
-                    # Update widgets based on URI
-                    self.update_widget_data(uri, value, temp_per_core_cpu)
-
-                    # Aggregate CPU and Docker data
-                    if isinstance(value, (int, float)):  # Ensure value is numeric for these calcs
-                        if uri.startswith("system.cpu.core"):
-                            total_cpu_sum += float(value)
-                            total_cpu_cores += 1
-                        elif uri.startswith("docker.container."):
-                            parts = uri.split(".")
-                            if len(parts) > 3:  # e.g., docker.container.NAME.metric_type
-                                container_name = parts[2]
-                                metric_type = parts[
-                                    3
-                                ]  # e.g., cpu_percent, mem_percent, mem_usage_mb
-                                if container_name not in self.docker_metrics_buffer:
-                                    self.docker_metrics_buffer[container_name] = {
-                                        "name": container_name
-                                    }
-                                self.docker_metrics_buffer[container_name][metric_type] = value
+                        await self._append_log(
+                            log_writer, uri, value, current_time_utc, collector_name
+                        )
+                    await self.ingest_sample(uri, value, current_time_utc)
             except Exception as e:
                 self.log.error(f"컬렉터 {collector_name} 처리 중 오류: {e}")
 
+        await self._apply_cardinality_guard(log_writer, current_time_utc)
+        self._detect_anomalies(current_time_utc)
+        await self._render_exposition()
+        self._finish_tick(all_top_processes_data)
+
+    async def _render_exposition(self) -> None:
+        """OpenMetrics 본문과 gzip 본문을 스레드 풀에서 한 번 만들어 둡니다."""
+        if self.metrics_exporter is None:
+            return
+        snapshot = await self.metric_cache.snapshot()
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.metrics_exporter.render, snapshot
+            )
+        except Exception as e:
+            self.log.error(f"OpenMetrics 렌더링 실패: {e}")
+
+    async def _apply_cardinality_guard(
+        self, log_writer: Optional[LogWriter], ts: datetime.datetime
+    ) -> None:
+        """
+        틱 끝에 other 버킷 합계와 시리즈 카운터를 기록하고, 제한/유휴로 밀려난
+        시리즈를 모든 URI별 상태에서 지웁니다.
+        """
+        samples = self.cardinality.drain_overflow()
+        for uri in self.cardinality.evict_idle(ts):
+            await self._forget_series(uri, ts)
+        samples.extend(self.cardinality.metrics())
+        for uri, value in samples:
+            if self.cardinality.admit(uri, value, ts) is None:
+                continue
+            if log_writer:
+                await self._append_log(log_writer, uri, value, ts, "CardinalityGuard")
+            await self.ingest_sample(uri, value, ts)
+
+    async def _forget_series(self, uri: str, ts: datetime.datetime) -> None:
+        """
+        시리즈 하나의 캐시와 URI별 상태(데드밴드, 알림, 이상 탐지, 분위수, 공유 메모리)를 지웁니다.
+        발생 중이던 알림은 resolved 이벤트로 위젯과 훅에 알립니다. 로그에 값이 남아 있던
+        시리즈에는 툼스톤을 기록합니다.
+        """
+        await self.metric_cache.forget(uri)
+        if self.deadband.forget(uri):
+            log_writer = globals.get_log_writer_instance()
+            if log_writer:
+                await self._append_tombstone(log_writer, uri, ts)
+        for alert_event in self.alert_engine.forget(uri, ts):
+            await self._handle_alert(alert_event)
+        self.quantile_store.forget(uri)
+        if self.anomaly_detector is not None:
+            self.anomaly_detector.forget(uri)
+        if self.snapshot_publisher is not None:
+            self.snapshot_publisher.forget(uri)
+
+    def _begin_tick(self) -> None:
+        """틱 단위 집계 버퍼를 초기화합니다."""
+        self._tick_cpu_sum: float = 0.0
+        self._tick_cpu_cores: int = 0
+        self._tick_per_core_cpu: Dict[str, float] = {}
+        self._tick_process_tree = None
+        self.docker_metrics_buffer.clear()  # For DockerStatsCollector
+        self.io_rates_buffer.clear()  # For IoThroughputCollector
+        self.socket_metrics_buffer.clear()  # For TcpSocketCollector
+
+    async def ingest_sample(
+        self, uri: str, value: Any, ts: datetime.datetime, evaluate_alerts: bool = True
+    ) -> None:
+        """
+        샘플 하나를 캐시, 위젯, 알림 엔진에 반영합니다.
+        실시간 수집, 리플레이, 웜 스타트 복원이 같은 경로를 사용합니다.
+        """
+        await self.metric_cache.update(uri, value, ts)
+        if self.snapshot_publisher is not None:
+            self.snapshot_publisher.stage(uri, value)
+
+        # Update widgets based on URI
+        self.update_widget_data(uri, value, self._tick_per_core_cpu)
+
+        if evaluate_alerts:
+            for alert_event in self.alert_engine.evaluate(uri, value, ts):
+                await self._handle_alert(alert_event)
+            self.quantile_store.observe(uri, value)
+            if self.anomaly_detector is not None:
+                self.anomaly_detector.observe(uri, value)
+
+        # Aggregate CPU and Docker data
+        if isinstance(value, (int, float)):  # Ensure value is numeric for these calcs
+            if uri.startswith("system.cpu.core"):
+                self._tick_cpu_sum += float(value)
+                self._tick_cpu_cores += 1
+            elif uri.startswith("docker.container."):
+                parts = uri.split(".")
+                if len(parts) > 3:  # e.g., docker.container.NAME.metric_type
+                    container_name = parts[2]
+                    metric_type = parts[3]  # e.g., cpu_percent, mem_percent, mem_usage_mb
+                    if container_name not in self.docker_metrics_buffer:
+                        self.docker_metrics_buffer[container_name] = {"name": container_name}
+                    self.docker_metrics_buffer[container_name][metric_type] = value
+
+    def _detect_anomalies(self, ts: datetime.datetime) -> None:
+        """이번 틱에 모인 샘플로 분위수 스케치와 기준선을 한 번에 갱신하고 이상치를 표시합니다."""
+        self.quantile_store.flush(ts.timestamp())
+        if self.anomaly_detector is None:
+            return
+        anomalies = self.anomaly_detector.step(ts)
+        if not anomalies:
+            return
+        try:
+            self.query_one(AnomaliesWidget).add_anomalies(anomalies)
+        except NoMatches:
+            self.log.warning("AnomaliesWidget을 찾을 수 없어 업데이트하지 못했습니다.")
+
+    def _finish_tick(self, all_top_processes_data: List[Dict[str, Any]]) -> None:
+        """틱 동안 모은 집계 값으로 위젯을 갱신하고 공유 메모리 스냅숏을 게시합니다."""
+        if self.snapshot_publisher is not None:
+            self.snapshot_publisher.publish()
+
         # Update SystemInfoWidget with aggregated CPU data
         try:
             sys_info_widget = self.query_one(SystemInfoWidget)
-            if total_cpu_cores > 0:
-                sys_info_widget.cpu_usage_overall = total_cpu_sum / total_cpu_cores
+            if self._tick_cpu_cores > 0:
+                sys_info_widget.cpu_usage_overall = self._tick_cpu_sum / self._tick_cpu_cores
             else:
                 sys_info_widget.cpu_usage_overall = 0.0  # Avoid division by zero
-            sys_info_widget.cpu_usage_per_core = temp_per_core_cpu
+            sys_info_widget.cpu_usage_per_core = self._tick_per_core_cpu
         except NoMatches:
             self.log.warning(
                 "SystemInfoWidget을 찾을 수 없어 CPU 데이터를 업데이트하지 못했습니다."
@@ -252,11 +668,35 @@ class MonitoringDashboardApp(App[None]):
             try:
                 top_procs_widget = self.query_one(TopProcessesWidget)
                 top_procs_widget.update_processes(all_top_processes_data)
+                if self._tick_process_tree is not None:
+                    top_procs_widget.update_tree(self._tick_process_tree)
             except NoMatches:
                 self.log.warning("TopProcessesWidget을 찾을 수 없어 업데이트하지 못했습니다.")
 
+        # Update IoThroughputWidget
+        if self.io_rates_buffer:
+            try:
+                self.query_one(IoThroughputWidget).update_throughput(self.io_rates_buffer)
+            except NoMatches:
+                self.log.warning("IoThroughputWidget을 찾을 수 없어 업데이트하지 못했습니다.")
+
+        # Update TcpTalkersWidget
+        if self.socket_metrics_buffer:
+            try:
+                self.query_one(TcpTalkersWidget).update_sockets(self.socket_metrics_buffer)
+            except NoMatches:
+                self.log.warning("TcpTalkersWidget을 찾을 수 없어 업데이트하지 못했습니다.")
+
         # Update DockerStatsWidget
         current_docker_stats_list = list(self.docker_metrics_buffer.values())
+        for container_stats in current_docker_stats_list:
+            percentiles = self.quantile_store.quantiles(
+                f"docker.container.{container_stats['name']}.cpu_percent",
+                (0.95, 0.99),
+                PERCENTILE_SPAN_SECONDS,
+            )
+            if percentiles is not None:
+                container_stats["cpu_p95"], container_stats["cpu_p99"] = percentiles
         if current_docker_stats_list:  # Check if there's any docker data
             try:
                 docker_stats_widget = self.query_one(DockerStatsWidget)
@@ -264,11 +704,259 @@ class MonitoringDashboardApp(App[None]):
             except NoMatches:
                 self.log.warning("DockerStatsWidget을 찾을 수 없어 업데이트하지 못했습니다.")
 
+    async def _handle_alert(self, event: AlertEvent) -> None:
+        """알림 상태 변화를 로그, 알림 위젯, 외부 훅으로 전달합니다."""
+        if event.state == "firing":
+            self.log.warning(event.message)
+        else:
+            self.log.info(event.message)
+        log_writer = globals.get_log_writer_instance()
+        if log_writer:
+            await log_writer.append(event.to_dict())
+        try:
+            self.query_one(AlertsWidget).add_event(event)
+        except NoMatches:
+            self.log.warning("AlertsWidget을 찾을 수 없어 알림을 표시하지 못했습니다.")
+        if self.replay_reader is None and (self.alert_webhook_url or self.alert_command):
+            # 훅이 느리더라도 수집 루프를 막지 않도록 백그라운드에서 실행합니다.
+            self.run_worker(self._run_alert_hooks(event), group="alert-hooks", exit_on_error=False)
+
+    async def _run_alert_hooks(self, event: AlertEvent) -> None:
+        try:
+            await dispatch_hooks(event, self.alert_webhook_url, self.alert_command)
+        except Exception as e:
+            self.log.error(f"알림 훅 실행 실패 ({event.rule.name}): {e}")
+
+    async def _run_replay(self) -> None:
+        """
+        기록된 로그를 틱 단위로 재생해 실시간 모드와 같은 캐시/위젯 갱신 경로로 전달합니다.
+        탐색(seek) 시에는 목표 시각 직전 구간을 조용히 적용해 값 상태를 복원합니다.
+        """
+        reader = self.replay_reader
+        assert reader is not None
+        if reader.first_ts is None:
+            self.sub_title = "재생할 메트릭이 없습니다."
+            return
+
+        target = reader.first_ts
+        if self._replay_start is not None:
+            local_day = reader.first_ts.astimezone().date()
+            target = datetime.datetime.combine(local_day, self._replay_start).astimezone()
+        state = ReplayState()
+        loop = asyncio.get_running_loop()
+
+        while True:
+            self._replay_seek_target = None
+            offset = await loop.run_in_executor(None, reader.seek, target - state.stale_after)
+            state.clear()
+            previous_ts: Optional[datetime.datetime] = None
+            for _, ts, entries in reader.ticks(offset):
+                if ts < target:
+                    state.apply(ts, entries)  # 탐색 목표 이전: 상태만 복원
+                    continue
+                if previous_ts is not None:
+                    delay = (ts - previous_ts).total_seconds() / self.replay_speed
+                    await self._replay_wait(min(delay, REPLAY_MAX_WAIT_SECONDS))
+                    if self._replay_seek_target is not None:
+                        break
+                state.apply(ts, entries)
+                await self._play_replay_tick(ts, state)
+                previous_ts = ts
+            else:
+                self.sub_title = "리플레이 끝 (←/→ 키로 탐색)"
+                while self._replay_seek_target is None:
+                    await asyncio.sleep(REPLAY_POLL_SECONDS)
+            assert self._replay_seek_target is not None
+            target = self._replay_seek_target
+
+    async def _replay_wait(self, seconds: float) -> None:
+        """일시정지 중에는 시간을 흘려보내지 않고, 탐색 요청이 오면 즉시 반환합니다."""
+        remaining = seconds
+        while remaining > 0 or self.replay_paused:
+            if self._replay_seek_target is not None:
+                return
+            paused = self.replay_paused
+            step = REPLAY_POLL_SECONDS if paused else min(remaining, REPLAY_POLL_SECONDS)
+            await asyncio.sleep(step)
+            if not paused:
+                remaining -= step
+
+    async def _play_replay_tick(self, ts: datetime.datetime, state: ReplayState) -> None:
+        self._replay_ts = ts
+        self._begin_tick()
+        for uri, value in state.samples():
+            admitted = self.cardinality.admit(uri, value, ts)
+            if admitted is not None:
+                await self.ingest_sample(admitted, value, ts)
+        await self._apply_cardinality_guard(None, ts)
+        self._detect_anomalies(ts)
+        self._finish_tick(state.processes())
+        self._update_replay_subtitle()
+
+    def _update_replay_subtitle(self) -> None:
+        if self._replay_ts is None:
+            return
+        status = "⏸ 일시정지" if self.replay_paused else "▶ 재생"
+        self.sub_title = (
+            f"{status} {self._replay_ts.astimezone():%Y-%m-%d %H:%M:%S} ×{self.replay_speed:g}"
+        )
+
+    async def _refresh_fleet(self) -> None:
+        """
+        호스트 개요를 다시 그리고, 선택한 호스트의 최신 스냅숏을 리플레이와 같은 경로로
+        기존 위젯에 반영합니다. 알림/분위수/이상 탐지는 로컬 호스트 전용이라 건너뜁니다.
+        """
+        assert self.fleet is not None
+        try:
+            self.query_one(FleetOverviewWidget).update_hosts(self.fleet.states())
+        except NoMatches:
+            return
+        host = self.fleet.hosts.get(self.fleet_host) if self.fleet_host else None
+        if host is None or host.received_at is None:
+            return
+        ts = datetime.datetime.now(datetime.timezone.utc)
+        self._begin_tick()
+        for uri, value in host.metrics.items():
+            await self.ingest_sample(uri, value, ts, evaluate_alerts=False)
+        self._finish_tick(host.processes)
+        self.sub_title = f"🖥 {host.name} ({host.status}, 스냅숏 {host.snapshot_ts})"
+
+    async def on_fleet_overview_widget_host_selected(
+        self, message: FleetOverviewWidget.HostSelected
+    ) -> None:
+        """선택한 호스트로 기존 위젯을 전환합니다 (이전 호스트 값은 캐시에서 비웁니다)."""
+        if message.name == self.fleet_host:
+            return
+        self.fleet_host = message.name
+        await self.metric_cache.clear()
+        try:
+            self.query_one(DockerStatsWidget).update_docker_stats([])
+            self.query_one(TopProcessesWidget).update_processes([])
+        except NoMatches:
+            pass
+        await self._refresh_fleet()
+
+    def action_fleet_cycle_sort(self) -> None:
+        """호스트 개요의 정렬 기준을 다음 키로 전환합니다."""
+        try:
+            self.query_one(FleetOverviewWidget).cycle_sort_key()
+        except NoMatches:
+            self.log.warning("FleetOverviewWidget을 찾을 수 없어 정렬 기준을 바꾸지 못했습니다.")
+
+    def action_fleet_focus_overview(self) -> None:
+        """호스트 개요 표로 포커스를 돌립니다."""
+        try:
+            self.query_one("#fleet_table").focus()
+        except NoMatches:
+            pass
+
+    def check_action(self, action: str, parameters: Tuple[object, ...]) -> Optional[bool]:
+        """리플레이/플릿 전용 키는 해당 모드에서만 활성화합니다."""
+        if action.startswith("replay_") and self.replay_reader is None:
+            return False
+        if action.startswith("fleet_") and self.fleet is None:
+            return False
+        return True
+
+    def action_open_log_search(self) -> None:
+        """로그 검색 패널을 엽니다. 색인 컬렉터가 없으면 (리플레이 등) 기존 색인을 읽기 전용으로 엽니다."""
+        from collectors.log_index import LogIndexCollector  # 지연 로드 (컬렉터 맵과 동일)
+
+        index: Optional[LogIndex] = next(
+            (
+                collector.index
+                for collector in globals.get_instantiated_collectors()
+                if isinstance(collector, LogIndexCollector)
+            ),
+            None,
+        )
+        if index is None:
+            if self._log_index_reader is None and DEFAULT_INDEX_DIR.is_dir():
+                self._log_index_reader = LogIndex(DEFAULT_INDEX_DIR, writable=False)
+            index = self._log_index_reader
+        try:
+            widget = self.query_one(LogSearchWidget)
+        except NoMatches:
+            return
+        widget.set_index(index)
+        widget.open()
+
+    def on_top_processes_widget_process_selected(
+        self, message: TopProcessesWidget.ProcessSelected
+    ) -> None:
+        """선택한 프로세스의 스레드 드릴다운 패널을 엽니다 (리플레이 중에는 현재 시스템이 아니므로 제외)."""
+        if self.replay_reader is not None or self.fleet is not None:
+            self.notify(
+                "리플레이/플릿 모드에서는 스레드 드릴다운을 사용할 수 없습니다.", severity="warning"
+            )
+            return
+        try:
+            self.query_one(ThreadDrillDownWidget).open(message.pid, message.name)
+        except NoMatches:
+            self.log.warning("ThreadDrillDownWidget을 찾을 수 없어 스레드 보기를 열지 못했습니다.")
+
+    def action_replay_toggle_pause(self) -> None:
+        self.replay_paused = not self.replay_paused
+        self._update_replay_subtitle()
+
+    def action_replay_speed(self, speed: float) -> None:
+        self.replay_speed = float(speed)
+        self._update_replay_subtitle()
+
+    def action_replay_seek(self, seconds: float) -> None:
+        reader = self.replay_reader
+        if reader is None or reader.first_ts is None or reader.last_ts is None:
+            return
+        current = self._replay_ts or reader.first_ts
+        target = current + datetime.timedelta(seconds=seconds)
+        self._replay_seek_target = min(max(target, reader.first_ts), reader.last_ts)
+
+    def action_cycle_process_sort(self) -> None:
+        """상위 프로세스 위젯의 정렬 기준을 다음 키로 전환합니다."""
+        try:
+            self.query_one(TopProcessesWidget).cycle_sort_key()
+        except NoMatches:
+            self.log.warning("TopProcessesWidget을 찾을 수 없어 정렬 기준을 바꾸지 못했습니다.")
+
+    def action_toggle_process_tree(self) -> None:
+        """상위 프로세스 목록과 프로세스 트리 보기를 전환합니다."""
+        try:
+            self.query_one(TopProcessesWidget).toggle_tree_mode()
+        except NoMatches:
+            self.log.warning("TopProcessesWidget을 찾을 수 없어 트리 보기를 전환하지 못했습니다.")
+
+    async def _append_log(
+        self,
+        log_writer: LogWriter,
+        uri: str,
+        value: Any,
+        ts: datetime.datetime,
+        source: str,
+    ) -> None:
+        """데드밴드 필터를 통과한 샘플만 로그 큐에 추가합니다."""
+        if not self.deadband.should_write(uri, value, ts):
+            return
+        await log_writer.append(
+            {"ts": ts.isoformat(), "uri": uri, "value": value, "source": source}
+        )
+
+    async def _append_tombstone(
+        self, log_writer: LogWriter, uri: str, ts: datetime.datetime
+    ) -> None:
+        """시리즈가 사라졌음을 로그에 남깁니다 (재생과 재구성이 마지막 값을 버리도록)."""
+        await log_writer.append({"ts": ts.isoformat(), "uri": uri, "event": TOMBSTONE_EVENT})
+
     def update_widget_data(self, uri: str, value: Any, temp_per_core_cpu: Dict[str, float]) -> None:
         """수집된 메트릭을 기반으로 해당 위젯의 데이터를 업데이트합니다."""
         try:
             if uri.startswith("system.cpu.core") and isinstance(value, (int, float)):
                 temp_per_core_cpu[uri] = float(value)  # Aggregated later
+            elif uri.startswith(("system.disk.", "system.net.")) and isinstance(
+                value, (int, float)
+            ):
+                self.io_rates_buffer[uri] = float(value)  # Rendered after the tick
+            elif uri.startswith(("net.tcp.", "net.udp.")) and isinstance(value, (int, float)):
+                self.socket_metrics_buffer[uri] = float(value)  # Rendered after the tick
             elif uri == "system.memory.used_percent" and isinstance(value, (int, float)):
                 self.query_one(SystemInfoWidget).mem_usage_percent = float(value)
             elif uri == "system.uptime.description":  # UptimeCollector now returns this
@@ -286,9 +974,50 @@ class MonitoringDashboardApp(App[None]):
         except Exception as e:
             self.log.error(f"위젯 데이터 업데이트 중 오류 ({uri}: {value}): {e}")
 
-    async def on_shutdown_request(self, _event: Any) -> None:
-        """애플리케이션 종료 요청 시 호출됩니다."""
-        self.log.info("애플리케이션 종료 요청 수신...")
+    async def on_unmount(self) -> None:
+        """
+        종료 시 웜 스타트 스냅숏과 데드밴드 통계를 남기고, 공유 메모리·메트릭 엔드포인트,
+        실행 중인 명령, 플릿 연결과 로그 큐를 정리합니다.
+        """
+        if self.fleet is not None:
+            await self.fleet.close()
+        elif self.replay_reader is None and not self.stress_mode:
+            await self.save_warm_state()
+        if self.snapshot_publisher is not None:
+            self.snapshot_publisher.close()
+            self.snapshot_publisher = None
+        if self.metrics_server is not None:
+            await self.metrics_server.close()
+            self.metrics_server = None
+        if self._log_index_reader is not None:
+            self._log_index_reader.close()
+            self._log_index_reader = None
+        for collector in globals.get_instantiated_collectors():
+            aclose = getattr(collector, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        if self.replay_reader is None and self.fleet is None and not self.stress_mode:
+            await self.log_deadband_stats()
+            await self._shutdown_log_writer()
+
+    async def log_deadband_stats(self) -> None:
+        """데드밴드 필터의 누적 압축률을 앱 로그와 메트릭 로그에 기록합니다."""
+        deadband_stats = self.deadband.stats()
+        if not deadband_stats["samples_seen"]:
+            return
+        self.log.info(f"데드밴드 압축률: {deadband_stats['compression_ratio']}")
+        log_writer = globals.get_log_writer_instance()
+        if log_writer:
+            await log_writer.append(
+                {
+                    "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    "event": "deadband_stats",
+                    **deadband_stats,
+                }
+            )
+
+    async def _shutdown_log_writer(self) -> None:
+        """종료 이벤트를 기록하고 로그 큐를 비운 뒤 쓰기 작업을 멈춥니다."""
         log_writer = globals.get_log_writer_instance()
         if log_writer:
             self.log.info("로그 큐 플러시 중...")
@@ -1,19 +1,52 @@
 # collectors/__init__.py
+#
+# Collector modules are imported lazily (see collectors/discovery.py) so that
+# importing the package does not pull in psutil and friends before the first frame.
+import importlib
+from typing import Any
+
 from .base import BaseCollector, register_collector
-from .dmesg_errors import DmesgErrorCollector
-from .docker_stats import DockerStatsCollector
-from .psutil_metrics import PsutilMetricsCollector
-from .syslog_lines import SyslogLineLengthCollector
-from .top_processes import TopProcessCollector
-from .uptime import UptimeCollector
+
+_LAZY_COLLECTORS = {
+    "CgroupStatsCollector": ".cgroup_stats",
+    "CommandCollector": ".command",
+    "DmesgErrorCollector": ".dmesg_errors",
+    "DockerStatsCollector": ".docker_stats",
+    "FilesystemCollector": ".filesystem",
+    "IoThroughputCollector": ".io_throughput",
+    "LogIndexCollector": ".log_index",
+    "PressureMemoryCollector": ".pressure_memory",
+    "PsutilMetricsCollector": ".psutil_metrics",
+    "SyntheticLoadCollector": ".synthetic_load",
+    "SyslogLineLengthCollector": ".syslog_lines",
+    "TcpSocketCollector": ".tcp_sockets",
+    "TopProcessCollector": ".top_processes",
+    "UptimeCollector": ".uptime",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_COLLECTORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
+
 
 __all__ = [
     "BaseCollector",
     "register_collector",
+    "CgroupStatsCollector",
+    "CommandCollector",
     "DmesgErrorCollector",
     "DockerStatsCollector",
+    "FilesystemCollector",
+    "IoThroughputCollector",
+    "LogIndexCollector",
+    "PressureMemoryCollector",
     "PsutilMetricsCollector",
+    "SyntheticLoadCollector",
     "SyslogLineLengthCollector",
+    "TcpSocketCollector",
     "TopProcessCollector",
     "UptimeCollector",
 ]
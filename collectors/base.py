@@ -1,6 +1,6 @@
 # apps/collectors/base.py
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple, Type, Union  # Added Union, Dict
+from typing import Any, Dict, List, Optional, Tuple, Type, Union  # Added Union, Dict
 
 
 class BaseCollector(ABC):
@@ -13,6 +13,14 @@ class BaseCollector(ABC):
     def collect(self) -> Union[List[Tuple[str, Any]], List[Dict[str, Any]]]:
         pass
 
+    def get_state(self) -> Optional[Any]:
+        """Returns JSON-serializable delta state to persist across restarts (None: nothing)."""
+        return None
+
+    def set_state(self, state: Any, max_age_seconds: Optional[float] = None) -> None:
+        """Restores state produced by `get_state()` (stale parts older than max_age are dropped)."""
+        pass
+
 
 collector_registry: List[Type[BaseCollector]] = []
 
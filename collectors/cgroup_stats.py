@@ -0,0 +1,254 @@
+# collectors/cgroup_stats.py
+"""
+cgroup v2 기반 컨테이너/슬라이스 메트릭 컬렉터 (Docker 데몬 불필요).
+
+The cgroup tree is walked once (and again every `RESCAN_INTERVAL_SECONDS` to pick
+up new containers) to build an index of interesting groups. Each indexed group
+keeps its `cpu.stat`, `memory.current`, `io.stat` and `pids.current` files open,
+so a tick is just one `pread` per file.
+"""
+
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.rate import RateCounter
+
+from .base import BaseCollector, register_collector
+
+CGROUP_ROOT: str = "/sys/fs/cgroup"
+RESCAN_INTERVAL_SECONDS: float = 30.0
+MAX_TRACKED_GROUPS: int = 128  # 그룹당 fd 4개를 유지하므로 fd 한도를 넘지 않도록 제한
+STAT_FILES: Tuple[str, ...] = ("cpu.stat", "memory.current", "io.stat", "pids.current")
+READ_SIZE: int = 65536
+
+# 디렉터리 이름 -> (종류, 컨테이너 ID)
+_CONTAINER_PATTERNS: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"^docker-([0-9a-f]{64})\.scope$"), "docker"),
+    (re.compile(r"^libpod-([0-9a-f]{64})\.scope$"), "podman"),
+    (re.compile(r"^cri-containerd-([0-9a-f]{64})\.scope$"), "containerd"),
+    (re.compile(r"^crio-([0-9a-f]{64})\.scope$"), "crio"),
+    (re.compile(r"^([0-9a-f]{64})$"), "container"),  # cgroupfs 드라이버 (/docker/<id>)
+]
+
+
+class ContainerNameResolver:
+    """
+    Maps container IDs to names using the runtimes' on-disk metadata.
+    Results (including misses) are cached until `forget_misses()` is called.
+    """
+
+    def __init__(
+        self,
+        docker_root: str = "/var/lib/docker",
+        podman_containers_json: str = (
+            "/var/lib/containers/storage/overlay-containers/containers.json"
+        ),
+    ) -> None:
+        self.docker_root = docker_root
+        self.podman_containers_json = podman_containers_json
+        self._cache: Dict[str, Optional[str]] = {}
+        self._podman_names: Optional[Dict[str, str]] = None
+
+    def _docker_name(self, container_id: str) -> Optional[str]:
+        path = os.path.join(self.docker_root, "containers", container_id, "config.v2.json")
+        try:
+            with open(path, encoding="utf-8") as f:
+                name = json.load(f).get("Name", "")
+        except (OSError, ValueError):
+            return None
+        return name.lstrip("/") or None
+
+    def _podman_name(self, container_id: str) -> Optional[str]:
+        if self._podman_names is None:
+            self._podman_names = {}
+            try:
+                with open(self.podman_containers_json, encoding="utf-8") as f:
+                    for entry in json.load(f):
+                        names = entry.get("names") or []
+                        if entry.get("id") and names:
+                            self._podman_names[entry["id"]] = names[0]
+            except (OSError, ValueError, AttributeError):
+                pass
+        return self._podman_names.get(container_id)
+
+    def resolve(self, container_id: str) -> str:
+        """컨테이너 이름을 반환합니다. 알 수 없으면 짧은 ID(12자)를 반환합니다."""
+        if container_id not in self._cache:
+            self._cache[container_id] = self._docker_name(container_id) or self._podman_name(
+                container_id
+            )
+        return self._cache[container_id] or container_id[:12]
+
+    def forget_misses(self) -> None:
+        """이름을 찾지 못한 항목을 캐시에서 지워 다음 조회 때 다시 시도하게 합니다."""
+        self._cache = {cid: name for cid, name in self._cache.items() if name is not None}
+        self._podman_names = None
+
+
+class _CgroupHandle:
+    """인덱싱된 cgroup 하나와 미리 열어둔 통계 파일 디스크립터."""
+
+    def __init__(self, path: str, kind: str, name: str) -> None:
+        self.path = path
+        self.kind = kind
+        self.name = name
+        self.fds: Dict[str, int] = {}
+        for file_name in STAT_FILES:
+            try:
+                self.fds[file_name] = os.open(os.path.join(path, file_name), os.O_RDONLY)
+            except OSError:
+                pass  # 해당 컨트롤러가 활성화되지 않은 그룹
+
+    def read(self, file_name: str) -> Optional[bytes]:
+        fd = self.fds.get(file_name)
+        if fd is None:
+            return None
+        return os.pread(fd, READ_SIZE, 0)
+
+    def close(self) -> None:
+        for fd in self.fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.fds.clear()
+
+
+def _uri_safe(name: str) -> str:
+    return "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in name)
+
+
+@register_collector
+class CgroupStatsCollector(BaseCollector):
+    def __init__(
+        self,
+        cgroup_root: str = CGROUP_ROOT,
+        name_resolver: Optional[ContainerNameResolver] = None,
+        include_services: bool = False,
+        max_groups: int = MAX_TRACKED_GROUPS,
+    ) -> None:
+        """
+        Args:
+            cgroup_root (str): cgroup v2 mount point (a fake tree can be used for testing).
+            name_resolver (ContainerNameResolver | None): Container ID -> name mapping.
+            include_services (bool): Also track systemd `*.service` groups.
+            max_groups (int): Upper bound on indexed groups (each holds up to 4 fds).
+        """
+        self.cgroup_root = cgroup_root
+        self.name_resolver = name_resolver or ContainerNameResolver()
+        self.include_services = include_services
+        self.max_groups = max_groups
+        self._groups: Dict[str, _CgroupHandle] = {}
+        self._last_scan: Optional[float] = None
+        self._rates = RateCounter()
+
+    def _classify(self, dir_name: str) -> Optional[Tuple[str, str]]:
+        """그룹 디렉터리 이름을 (종류, 표시 이름)으로 분류합니다. 관심 없는 그룹은 None."""
+        for pattern, kind in _CONTAINER_PATTERNS:
+            match = pattern.match(dir_name)
+            if match:
+                return kind, self.name_resolver.resolve(match.group(1))
+        if dir_name.endswith(".slice"):
+            return "slice", dir_name[: -len(".slice")]
+        if self.include_services and dir_name.endswith(".service"):
+            return "service", dir_name[: -len(".service")]
+        return None
+
+    def rescan(self) -> None:
+        """cgroup 트리를 한 번 순회해 인덱스를 갱신합니다 (새 그룹 열기, 사라진 그룹 닫기)."""
+        self.name_resolver.forget_misses()
+        found: Dict[str, Tuple[str, str]] = {}
+        for dir_path, dir_names, _ in os.walk(self.cgroup_root):
+            for dir_name in dir_names:
+                classified = self._classify(dir_name)
+                if classified is not None:
+                    found[os.path.join(dir_path, dir_name)] = classified
+            if len(found) >= self.max_groups:
+                break
+
+        for path in list(self._groups):
+            if path not in found:
+                self._groups.pop(path).close()
+        for path, (kind, name) in found.items():
+            if path not in self._groups and len(self._groups) < self.max_groups:
+                self._groups[path] = _CgroupHandle(path, kind, _uri_safe(name))
+        self._last_scan = time.monotonic()
+
+    def collect(self) -> List[Tuple[str, float]]:
+        now = time.monotonic()
+        if self._last_scan is None or now - self._last_scan >= RESCAN_INTERVAL_SECONDS:
+            try:
+                self.rescan()
+            except Exception as e:
+                print(f"[WARN][CgroupStatsCollector] cgroup 트리 탐색 실패: {e}")
+
+        metrics: List[Tuple[str, float]] = []
+        gone: List[str] = []
+        for path, group in self._groups.items():
+            prefix = f"cgroup.{group.kind}.{group.name}"
+            try:
+                metrics.extend(self._read_group(group, prefix, now))
+            except OSError:
+                gone.append(path)  # 그룹이 삭제됨 (ENODEV 등)
+            except (ValueError, IndexError) as e:
+                print(f"[WARN][CgroupStatsCollector] {path} 파싱 실패: {e}")
+        for path in gone:
+            self._groups.pop(path).close()
+        self._rates.sweep()
+        return metrics
+
+    def _read_group(self, group: _CgroupHandle, prefix: str, now: float) -> List[Tuple[str, float]]:
+        metrics: List[Tuple[str, float]] = []
+
+        cpu_stat = group.read("cpu.stat")
+        if cpu_stat is not None:
+            for line in cpu_stat.splitlines():
+                if line.startswith(b"usage_usec "):
+                    usage_rate = self._rates.rate((group.path, "cpu"), int(line[11:]), now)
+                    if usage_rate is not None:
+                        # usec/sec -> 코어 1개 기준 퍼센트 (docker stats와 동일한 기준)
+                        metrics.append((f"{prefix}.cpu_percent", usage_rate / 10_000.0))
+                    break
+
+        memory_current = group.read("memory.current")
+        if memory_current is not None:
+            metrics.append((f"{prefix}.mem_usage_mb", int(memory_current) / 1024 / 1024))
+
+        io_stat = group.read("io.stat")
+        if io_stat is not None:
+            read_bytes = 0
+            write_bytes = 0
+            for line in io_stat.splitlines():
+                for field in line.split()[1:]:
+                    key, _, value = field.partition(b"=")
+                    if key == b"rbytes":
+                        read_bytes += int(value)
+                    elif key == b"wbytes":
+                        write_bytes += int(value)
+            read_rate = self._rates.rate((group.path, "rbytes"), read_bytes, now)
+            write_rate = self._rates.rate((group.path, "wbytes"), write_bytes, now)
+            if read_rate is not None:
+                metrics.append((f"{prefix}.io_read_bytes_per_sec", read_rate))
+            if write_rate is not None:
+                metrics.append((f"{prefix}.io_write_bytes_per_sec", write_rate))
+
+        pids_current = group.read("pids.current")
+        if pids_current is not None:
+            metrics.append((f"{prefix}.pids", float(int(pids_current))))
+
+        return metrics
+
+    def get_state(self) -> Optional[Any]:
+        return self._rates.get_state()
+
+    def set_state(self, state: Any, max_age_seconds: Optional[float] = None) -> None:
+        self._rates.set_state(state, max_age_seconds)
+
+    async def aclose(self) -> None:
+        """열어둔 모든 파일 디스크립터를 닫습니다 (앱 종료 시 호출)."""
+        for group in self._groups.values():
+            group.close()
+        self._groups.clear()
@@ -0,0 +1,377 @@
+# collectors/command.py
+"""
+Config-driven async command collector.
+
+Runs arbitrary commands with `asyncio.create_subprocess_exec` (no worker thread
+per command) and maps their output to URIs with a small set of precompiled
+parsers. Configured through `collectors.json`:
+
+    {
+        "enabled": ["CommandCollector"],
+        "options": {"CommandCollector": {
+            "max_concurrency": 4,
+            "commands": [
+                {"name": "ntp", "argv": ["chronyc", "-c", "tracking"], "interval": 30,
+                 "parser": "regex", "pattern": "^[^,]*,[^,]*,[^,]*,[^,]*,(?P<offset>[-\\\\d.]+)"},
+                {"name": "nginx", "argv": ["curl", "-s", "localhost/status.json"],
+                 "parser": "json", "fields": {"active": "connections.active"}},
+                {"name": "raid", "argv": ["cat", "/sys/block/md0/md/mismatch_cnt"],
+                 "parser": "lines"}
+            ]
+        }}
+    }
+
+Each command produces `<prefix>.<key>` samples (prefix defaults to `command.<name>`)
+plus `<prefix>.status` (0 ok, -1 non-zero exit, -2 not found, -3 error, -4 timeout)
+and `<prefix>.duration_ms`.
+
+A tick never waits for a slow command: `collect()` starts the refreshes that are
+due, waits at most `tick_budget` seconds for them and returns the latest cached
+results. Commands still running finish in the background (bounded by the shared
+semaphore and their own timeout, after which the process group is killed), and
+their results are picked up by the next tick. Results are cached per argv for
+`interval` seconds, so commands shared by several entries run once, and the output
+is parsed once when a run finishes rather than on every tick that reuses it.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import re
+import signal
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .base import BaseCollector, register_collector
+
+DEFAULT_INTERVAL_SECONDS: float = 10.0
+DEFAULT_TIMEOUT_SECONDS: float = 5.0
+DEFAULT_MAX_CONCURRENCY: int = 4
+DEFAULT_TICK_BUDGET_SECONDS: float = 0.2
+MAX_OUTPUT_BYTES: int = 1 << 20
+
+STATUS_OK: float = 0.0
+STATUS_FAILED: float = -1.0
+STATUS_NOT_FOUND: float = -2.0
+STATUS_ERROR: float = -3.0
+STATUS_TIMEOUT: float = -4.0
+
+Samples = List[Tuple[str, float]]
+Parser = Callable[[str], Samples]  # 명령 출력 -> (키, 값) 목록 (키는 접두사 뒤에 붙음)
+ParserFactory = Callable[[Dict[str, Any]], Parser]
+
+parser_registry: Dict[str, ParserFactory] = {}
+
+
+def register_parser(name: str) -> Callable[[ParserFactory], ParserFactory]:
+    """
+    Registers a parser factory. The factory receives the command's config entry once
+    (compile patterns there) and returns the per-run parse function.
+    """
+
+    def decorator(factory: ParserFactory) -> ParserFactory:
+        parser_registry[name] = factory
+        return factory
+
+    return decorator
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).strip().rstrip("%"))
+    except ValueError:
+        return None
+
+
+def _clean_key(key: str) -> str:
+    """URI 구성 요소로 쓸 수 없는 문자를 '_'로 바꿉니다."""
+    return re.sub(r"[^A-Za-z0-9_-]", "_", key.strip()) or "_"
+
+
+@register_parser("lines")
+def _lines_parser(config: Dict[str, Any]) -> Parser:
+    """비어 있지 않은 줄 수 (`"match"` 정규식이 있으면 일치하는 줄만)."""
+    key = config.get("key", "lines")
+    match = re.compile(config["match"]) if config.get("match") else None
+
+    def parse(output: str) -> Samples:
+        lines = [line for line in output.splitlines() if line.strip()]
+        if match is not None:
+            lines = [line for line in lines if match.search(line)]
+        return [(key, float(len(lines)))]
+
+    return parse
+
+
+@register_parser("regex")
+def _regex_parser(config: Dict[str, Any]) -> Parser:
+    """
+    Named groups become keys: `(?P<offset>...)` -> `<prefix>.offset`. With a group
+    named `key`, every match is used and keys become `<key>.<group>`.
+    """
+    pattern = re.compile(config["pattern"], re.MULTILINE)
+    value_groups = [name for name in pattern.groupindex if name != "key"]
+    keyed = "key" in pattern.groupindex
+
+    def parse(output: str) -> Samples:
+        samples: Samples = []
+        matches = pattern.finditer(output) if keyed else filter(None, [pattern.search(output)])
+        for match in matches:
+            base = f"{_clean_key(match.group('key'))}." if keyed else ""
+            for name in value_groups:
+                value = _to_float(match.group(name)) if match.group(name) is not None else None
+                if value is not None:
+                    samples.append((f"{base}{name}", value))
+        return samples
+
+    return parse
+
+
+def _flatten_json(value: Any, path: str, out: Samples) -> None:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _flatten_json(
+                child, f"{path}.{_clean_key(str(key))}" if path else _clean_key(str(key)), out
+            )
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            _flatten_json(child, f"{path}.{index}" if path else str(index), out)
+    elif isinstance(value, (int, float)):
+        out.append((path or "value", float(value)))
+
+
+@register_parser("json")
+def _json_parser(config: Dict[str, Any]) -> Parser:
+    """
+    `"fields": {"key": "dotted.path"}` picks values; without fields every numeric leaf
+    is emitted under its dotted path.
+    """
+    fields: Dict[str, List[str]] = {
+        key: str(path).split(".") for key, path in (config.get("fields") or {}).items()
+    }
+
+    def parse(output: str) -> Samples:
+        document = json.loads(output)
+        samples: Samples = []
+        if not fields:
+            _flatten_json(document, "", samples)
+            return samples
+        for key, path in fields.items():
+            node = document
+            for part in path:
+                if isinstance(node, list) and part.isdigit() and int(part) < len(node):
+                    node = node[int(part)]
+                elif isinstance(node, dict) and part in node:
+                    node = node[part]
+                else:
+                    node = None
+                    break
+            value = _to_float(node) if node is not None else None
+            if value is not None:
+                samples.append((key, value))
+        return samples
+
+    return parse
+
+
+@register_parser("kv")
+def _kv_parser(config: Dict[str, Any]) -> Parser:
+    """`key=value` 쌍 (구분자는 `"separator"`, 기본 "="). 숫자가 아닌 값은 무시합니다."""
+    separator = re.escape(config.get("separator", "="))
+    pattern = re.compile(rf"([^\s{separator}]+)\s*{separator}\s*([^\s,;]+)")
+    keys = set(config["keys"]) if config.get("keys") else None
+
+    def parse(output: str) -> Samples:
+        samples: Samples = []
+        for key, raw in pattern.findall(output):
+            if keys is not None and key not in keys:
+                continue
+            value = _to_float(raw)
+            if value is not None:
+                samples.append((_clean_key(key), value))
+        return samples
+
+    return parse
+
+
+class CommandSpec:
+    """One configured command (validated and with its parser built once)."""
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.name = str(config["name"])
+        argv = config["argv"]
+        if isinstance(argv, str) or not argv or not all(isinstance(a, str) for a in argv):
+            raise ValueError(f"argv는 문자열 목록이어야 합니다: {argv!r}")
+        self.argv: Tuple[str, ...] = tuple(argv)
+        self.prefix = str(config.get("prefix", f"command.{_clean_key(self.name)}"))
+        self.interval = float(config.get("interval", DEFAULT_INTERVAL_SECONDS))
+        self.timeout = float(config.get("timeout", DEFAULT_TIMEOUT_SECONDS))
+        parser_name = config.get("parser", "lines")
+        factory = parser_registry.get(parser_name)
+        if factory is None:
+            raise ValueError(f"알 수 없는 파서: {parser_name} (가능: {', '.join(parser_registry)})")
+        self.parse = factory(config)
+
+
+class _CommandResult:
+    __slots__ = ("finished_at", "status", "duration_ms", "samples")
+
+    def __init__(
+        self,
+        finished_at: float,
+        status: float,
+        duration_ms: float,
+        samples: Dict[CommandSpec, Samples],
+    ) -> None:
+        self.finished_at = finished_at
+        self.status = status
+        self.duration_ms = duration_ms
+        self.samples = samples  # 항목별로 파싱해 접두사를 붙인 샘플 (실행이 끝날 때 한 번)
+
+
+@register_collector
+class CommandCollector(BaseCollector):
+    def __init__(
+        self,
+        commands: Optional[List[Dict[str, Any]]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tick_budget: float = DEFAULT_TICK_BUDGET_SECONDS,
+    ) -> None:
+        """
+        Args:
+            commands (list | None): Command entries (see module docstring).
+            max_concurrency (int): Commands running at the same time, across all entries.
+            tick_budget (float): Seconds `collect()` waits for due refreshes before it
+                returns cached results.
+        """
+        self.specs: List[CommandSpec] = []
+        for config in commands or []:
+            try:
+                self.specs.append(CommandSpec(config))
+            except (KeyError, TypeError, ValueError, re.error) as e:
+                print(f"[WARN][CommandCollector] 잘못된 명령 설정 무시: {config} ({e})")
+        self.max_concurrency = max(1, max_concurrency)
+        self.tick_budget = tick_budget
+        self._semaphore: Optional[asyncio.Semaphore] = None  # 첫 collect()의 루프에서 생성
+        self._results: Dict[Tuple[str, ...], _CommandResult] = {}  # argv -> 마지막 결과
+        self._running: Dict[Tuple[str, ...], "asyncio.Task[None]"] = {}
+        self._processes: Dict[Tuple[str, ...], asyncio.subprocess.Process] = {}
+        # argv -> 명령 주기 (같은 argv를 공유하는 항목 중 가장 짧은 주기로 캐시)
+        self._ttl: Dict[Tuple[str, ...], float] = {}
+        for spec in self.specs:
+            self._ttl[spec.argv] = min(self._ttl.get(spec.argv, spec.interval), spec.interval)
+        self._timeouts: Dict[Tuple[str, ...], float] = {}
+        for spec in self.specs:
+            self._timeouts[spec.argv] = max(self._timeouts.get(spec.argv, 0.0), spec.timeout)
+
+    async def _run(self, argv: Tuple[str, ...]) -> None:
+        assert self._semaphore is not None
+        async with self._semaphore:
+            started = time.monotonic()
+            status, output = STATUS_OK, ""
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    start_new_session=True,  # 시간 초과 시 자식까지 프로세스 그룹째 종료
+                )
+                self._processes[argv] = process
+                try:
+                    stdout, _ = await asyncio.wait_for(
+                        process.communicate(), timeout=self._timeouts[argv]
+                    )
+                    output = stdout[:MAX_OUTPUT_BYTES].decode(errors="ignore")
+                    if process.returncode != 0:
+                        status = STATUS_FAILED
+                except asyncio.TimeoutError:
+                    status = STATUS_TIMEOUT
+                    await self._kill(process)
+                finally:
+                    self._processes.pop(argv, None)
+            except FileNotFoundError:
+                status = STATUS_NOT_FOUND
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[WARN][CommandCollector] {argv[0]} 실행 실패: {e}")
+                status = STATUS_ERROR
+            finished = time.monotonic()
+        samples = self._parse_output(argv, output) if status == STATUS_OK else {}
+        self._results[argv] = _CommandResult(
+            finished, status, (finished - started) * 1000.0, samples
+        )
+
+    def _parse_output(self, argv: Tuple[str, ...], output: str) -> Dict[CommandSpec, Samples]:
+        """같은 argv를 쓰는 항목마다 출력을 파싱합니다 (실패한 항목은 값 샘플 없이 상태만 보고)."""
+        samples: Dict[CommandSpec, Samples] = {}
+        for spec in self.specs:
+            if spec.argv != argv:
+                continue
+            try:
+                parsed = spec.parse(output)
+            except Exception as e:
+                print(f"[WARN][CommandCollector] {spec.name} 출력 파싱 실패: {e}")
+                continue
+            samples[spec] = [(f"{spec.prefix}.{key}", value) for key, value in parsed]
+        return samples
+
+    def _finished(self, argv: Tuple[str, ...], _task: "asyncio.Task[None]") -> None:
+        self._running.pop(argv, None)
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        try:
+            await process.wait()
+        except Exception:
+            pass
+
+    def _start_due_refreshes(self, now: float) -> List["asyncio.Task[None]"]:
+        started: List["asyncio.Task[None]"] = []
+        for argv, ttl in self._ttl.items():
+            if argv in self._running:
+                continue  # 이전 실행이 아직 끝나지 않았으면 겹쳐 띄우지 않습니다.
+            result = self._results.get(argv)
+            if result is not None and now - result.finished_at < ttl:
+                continue
+            task = asyncio.get_running_loop().create_task(self._run(argv))
+            task.add_done_callback(functools.partial(self._finished, argv))
+            self._running[argv] = task
+            started.append(task)
+        return started
+
+    async def collect(self) -> Samples:  # type: ignore[override]
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = self._start_due_refreshes(time.monotonic())
+        if started and self.tick_budget > 0:
+            await asyncio.wait(started, timeout=self.tick_budget)
+
+        metrics: Samples = []
+        for spec in self.specs:
+            result = self._results.get(spec.argv)
+            if result is None:
+                continue  # 첫 실행이 아직 진행 중
+            metrics.append((f"{spec.prefix}.status", result.status))
+            metrics.append((f"{spec.prefix}.duration_ms", round(result.duration_ms, 1)))
+            metrics.extend(result.samples.get(spec, ()))
+        return metrics
+
+    async def aclose(self) -> None:
+        """실행 중인 명령을 모두 종료합니다 (앱 종료 시 호출)."""
+        for process in list(self._processes.values()):
+            await self._kill(process)
+        for task in list(self._running.values()):
+            task.cancel()
+        if self._running:
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
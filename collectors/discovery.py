@@ -0,0 +1,300 @@
+# collectors/discovery.py
+"""
+Lazy collector discovery.
+
+Collectors are described by lightweight `CollectorSpec` entries instead of being
+imported up front. A spec is only imported (and its heavy dependencies such as
+psutil loaded) after its availability probe passes and it is enabled by config.
+
+Sources, in order:
+    1. Built-in collectors (`BUILTIN_COLLECTORS`).
+    2. Installed plugins exposing the `pysnoop.collectors` entry point group
+       (value format: "package.module:ClassName").
+    3. A JSON config file (default: `collectors.json` next to app.py):
+
+        {
+            "enabled": ["SomeOptInCollector"],
+            "disabled": ["SyslogLineLengthCollector"],
+            "plugins": [{"name": "MyCollector", "module": "my_pkg.mod", "class": "MyCollector"}],
+            "options": {"SyntheticLoadCollector": {"series": 50000, "churn_rate": 0.01}}
+        }
+
+    `options` are passed as keyword arguments to the collector constructor.
+"""
+
+import importlib
+import importlib.util
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from .base import BaseCollector
+
+ENTRY_POINT_GROUP: str = "pysnoop.collectors"
+SYSLOG_PATHS: tuple[str, ...] = ("/var/log/syslog", "/var/log/messages")
+DOCKER_SOCKET_PATH: str = "/var/run/docker.sock"
+CGROUP2_CONTROLLERS_PATH: str = "/sys/fs/cgroup/cgroup.controllers"
+KMSG_PATH: str = "/dev/kmsg"
+
+Probe = Callable[[], bool]
+
+
+class CollectorSpec:
+    """
+    Describes a collector without importing it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        module: str,
+        class_name: str,
+        probe: Optional[Probe] = None,
+        enabled_by_default: bool = True,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Args:
+            name (str): Name used in config files (usually the class name).
+            module (str): Absolute module path that defines the collector.
+            class_name (str): Attribute name of the collector class in `module`.
+            probe (Callable | None): Cheap check that the collector can work on this host.
+            enabled_by_default (bool): False for opt-in collectors.
+            options (dict | None): Keyword arguments for the collector constructor.
+        """
+        self.name = name
+        self.module = module
+        self.class_name = class_name
+        self.probe = probe
+        self.enabled_by_default = enabled_by_default
+        self.options: Dict[str, Any] = dict(options or {})
+
+    def is_available(self) -> bool:
+        """Runs the availability probe. Collectors without a probe are always available."""
+        if self.probe is None:
+            return True
+        try:
+            return bool(self.probe())
+        except Exception:
+            return False
+
+    def load(self) -> Type[BaseCollector]:
+        """Imports the collector module and returns the collector class."""
+        module = importlib.import_module(self.module)
+        return getattr(module, self.class_name)
+
+    def instantiate(self) -> BaseCollector:
+        """Imports the collector class and creates it with the configured options."""
+        return self.load()(**self.options)
+
+    def __repr__(self) -> str:
+        return f"CollectorSpec({self.name!r}, {self.module}:{self.class_name})"
+
+
+def _module_available(name: str) -> Probe:
+    return lambda: importlib.util.find_spec(name) is not None
+
+
+def _command_available(command: str) -> Probe:
+    return lambda: shutil.which(command) is not None
+
+
+def probe_docker() -> bool:
+    """docker CLI가 있고 데몬 소켓(또는 DOCKER_HOST)이 있는지 확인합니다."""
+    if shutil.which("docker") is None:
+        return False
+    return os.path.exists(DOCKER_SOCKET_PATH) or bool(os.environ.get("DOCKER_HOST"))
+
+
+def probe_syslog() -> bool:
+    """읽을 수 있는 syslog 파일이 있는지 확인합니다."""
+    return any(os.access(path, os.R_OK) for path in SYSLOG_PATHS)
+
+
+def probe_log_sources() -> bool:
+    """색인할 syslog 파일이나 /dev/kmsg를 읽을 수 있는지 확인합니다."""
+    return probe_syslog() or os.access(KMSG_PATH, os.R_OK)
+
+
+def probe_cgroup2() -> bool:
+    """cgroup v2(unified) 계층이 마운트되어 있는지 확인합니다."""
+    return os.path.exists(CGROUP2_CONTROLLERS_PATH)
+
+
+BUILTIN_COLLECTORS: List[CollectorSpec] = [
+    CollectorSpec(
+        "CgroupStatsCollector",
+        "collectors.cgroup_stats",
+        "CgroupStatsCollector",
+        probe_cgroup2,
+    ),
+    CollectorSpec(
+        "CommandCollector",
+        "collectors.command",
+        "CommandCollector",
+        enabled_by_default=False,
+    ),
+    CollectorSpec(
+        "DmesgErrorCollector",
+        "collectors.dmesg_errors",
+        "DmesgErrorCollector",
+        _command_available("dmesg"),
+    ),
+    CollectorSpec(
+        "DockerStatsCollector",
+        "collectors.docker_stats",
+        "DockerStatsCollector",
+        probe_docker,
+    ),
+    CollectorSpec(
+        "FilesystemCollector",
+        "collectors.filesystem",
+        "FilesystemCollector",
+        lambda: os.path.exists("/proc/self/mountinfo"),
+    ),
+    CollectorSpec(
+        "IoThroughputCollector",
+        "collectors.io_throughput",
+        "IoThroughputCollector",
+        lambda: os.path.exists("/proc/diskstats") or os.path.exists("/proc/net/dev"),
+    ),
+    CollectorSpec(
+        "LogIndexCollector",
+        "collectors.log_index",
+        "LogIndexCollector",
+        probe_log_sources,
+    ),
+    CollectorSpec(
+        "PressureMemoryCollector",
+        "collectors.pressure_memory",
+        "PressureMemoryCollector",
+        lambda: os.path.exists("/proc/meminfo"),
+    ),
+    CollectorSpec(
+        "PsutilMetricsCollector",
+        "collectors.psutil_metrics",
+        "PsutilMetricsCollector",
+        _module_available("psutil"),
+    ),
+    CollectorSpec(
+        "SyntheticLoadCollector",
+        "collectors.synthetic_load",
+        "SyntheticLoadCollector",
+        enabled_by_default=False,
+    ),
+    CollectorSpec(
+        "SyslogLineLengthCollector",
+        "collectors.syslog_lines",
+        "SyslogLineLengthCollector",
+        probe_syslog,
+    ),
+    CollectorSpec(
+        "TcpSocketCollector",
+        "collectors.tcp_sockets",
+        "TcpSocketCollector",
+        lambda: os.path.exists("/proc/net/tcp"),  # numpy는 큰 표에서만 (없으면 줄 단위 파싱)
+    ),
+    CollectorSpec(
+        "TopProcessCollector",
+        "collectors.top_processes",
+        "TopProcessCollector",
+        _module_available("psutil"),
+    ),
+    CollectorSpec(
+        "UptimeCollector",
+        "collectors.uptime",
+        "UptimeCollector",
+        _command_available("uptime"),
+    ),
+]
+
+
+def _load_config(config_path: Optional[Path]) -> Dict:
+    if config_path is None or not config_path.is_file():
+        return {}
+    try:
+        with open(config_path, encoding="utf-8") as f:
+            config = json.load(f)
+        return config if isinstance(config, dict) else {}
+    except Exception as e:
+        print(f"[WARN][discovery] 컬렉터 설정 파일 {config_path} 읽기 실패: {e}")
+        return {}
+
+
+def _entry_point_specs() -> List[CollectorSpec]:
+    specs: List[CollectorSpec] = []
+    # importlib.metadata는 임포트만으로 수십 ms가 들어 플러그인을 찾을 때만 불러옵니다.
+    from importlib.metadata import entry_points
+
+    try:
+        eps = entry_points(group=ENTRY_POINT_GROUP)
+    except Exception:
+        return specs
+    for ep in eps:
+        module, _, class_name = ep.value.partition(":")
+        if module and class_name:
+            specs.append(CollectorSpec(ep.name, module, class_name))
+    return specs
+
+
+def discover_collectors(
+    config_path: Optional[Path] = None,
+    enable: Optional[Dict[str, Dict[str, Any]]] = None,
+    exclusive: bool = False,
+) -> List[CollectorSpec]:
+    """
+    Returns the enabled collector specs without importing any collector module.
+
+    Args:
+        config_path (Path | None): Optional JSON config file (see module docstring).
+        enable (dict | None): Collector name -> constructor options, enabled regardless
+            of the config file (used by command-line flags such as `--synthetic-series`).
+        exclusive (bool): Only return the collectors named in `enable`.
+
+    Returns:
+        list: Enabled specs, built-ins first, then entry points, then config plugins.
+    """
+    config = _load_config(config_path)
+    enable = enable or {}
+    enabled = set(config.get("enabled", [])) | enable.keys()
+    disabled = set(config.get("disabled", [])) - enable.keys()
+    options = config.get("options", {})
+    if not isinstance(options, dict):
+        print(f"[WARN][discovery] 잘못된 options 설정 무시: {options}")
+        options = {}
+
+    specs = list(BUILTIN_COLLECTORS)
+    builtin_names = {spec.name for spec in specs}
+    if not (exclusive and enable.keys() <= builtin_names):
+        # --only가 내장 컬렉터만 고르면 설치된 패키지의 entry point는 볼 필요가 없습니다.
+        specs += _entry_point_specs()
+    for plugin in config.get("plugins", []):
+        try:
+            specs.append(CollectorSpec(plugin["name"], plugin["module"], plugin["class"]))
+        except (KeyError, TypeError):
+            print(f"[WARN][discovery] 잘못된 플러그인 설정 무시: {plugin}")
+
+    selected: List[CollectorSpec] = []
+    seen: set[str] = set()
+    for spec in specs:
+        if spec.name in seen or spec.name in disabled:
+            continue
+        if not spec.enabled_by_default and spec.name not in enabled:
+            continue
+        if exclusive and spec.name not in enable:
+            continue
+        seen.add(spec.name)
+        spec_options = {**options.get(spec.name, {}), **enable.get(spec.name, {})}
+        if spec_options:
+            spec = CollectorSpec(
+                spec.name,
+                spec.module,
+                spec.class_name,
+                spec.probe,
+                spec.enabled_by_default,
+                {**spec.options, **spec_options},
+            )
+        selected.append(spec)
+    return selected
@@ -0,0 +1,321 @@
+# collectors/filesystem.py
+"""
+Filesystem capacity, inode usage and time-to-full collector.
+
+The mount table (`/proc/self/mountinfo`) is parsed once and cached. The file
+stays open and is registered with `select.poll()`: the kernel flags it with
+POLLPRI/POLLERR whenever a mount is added, removed or changed, so a tick costs
+one zero-timeout `poll()` instead of a re-read.
+
+`statvfs()` on a hung NFS/CIFS mount can block in the kernel indefinitely, so
+each call runs on its own daemon thread and the tick waits for all of them
+together with one deadline (`stat_timeout`). A mount whose call is still
+pending is reported as unresponsive and is not queried again until that call
+returns, so a dead server never piles up threads.
+
+The fill rate is a least-squares slope of used bytes over the last
+`FILL_WINDOW_SECONDS`, fitted on samples kept every `FILL_SAMPLE_SECONDS`; the
+time to full is the available space divided by that rate.
+
+Emitted URIs per mount (`/` -> `root`, `/var/lib` -> `var_lib`):
+    fs.<mount>.size_bytes, used_bytes, avail_bytes, used_percent
+    fs.<mount>.inodes_total, inodes_used_percent
+    fs.<mount>.fill_rate_bytes_per_sec, time_to_full_seconds (-1: not filling)
+    fs.<mount>.responsive (0 while statvfs() is stuck past the timeout)
+"""
+
+import os
+import select
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, wait
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from utils.rate import stable_copy
+
+from .base import BaseCollector, register_collector
+
+MOUNTINFO_PATH: str = "/proc/self/mountinfo"
+DEFAULT_STAT_TIMEOUT_SECONDS: float = 0.5
+FILL_WINDOW_SECONDS: float = 1800.0
+FILL_SAMPLE_SECONDS: float = 30.0
+FILL_MIN_SPAN_SECONDS: float = 120.0  # 이보다 짧은 구간의 기울기는 보고하지 않습니다.
+NOT_FILLING: float = -1.0
+# 용량 개념이 없거나 읽기 전용 이미지인 파일시스템
+IGNORED_FS_TYPES: frozenset = frozenset(
+    {
+        "autofs",
+        "binfmt_misc",
+        "bpf",
+        "cgroup",
+        "cgroup2",
+        "configfs",
+        "debugfs",
+        "devpts",
+        "devtmpfs",
+        "efivarfs",
+        "fusectl",
+        "hugetlbfs",
+        "iso9660",
+        "mqueue",
+        "nsfs",
+        "overlay",
+        "proc",
+        "pstore",
+        "ramfs",
+        "rpc_pipefs",
+        "securityfs",
+        "selinuxfs",
+        "squashfs",
+        "sysfs",
+        "tracefs",
+    }
+)
+IGNORED_MOUNT_PREFIXES: Tuple[str, ...] = (
+    "/proc/",
+    "/sys/",
+    "/dev/",
+    "/run/credentials/",
+    "/var/lib/docker/",
+    "/var/lib/containers/",
+    "/var/lib/kubelet/pods/",
+    "/snap/",
+)
+ALLOWED_MOUNTS: frozenset = frozenset({"/dev/shm"})
+
+
+class Mount(NamedTuple):
+    mount_point: str
+    fs_type: str
+    source: str
+    device: str  # "major:minor" (같은 파일시스템의 바인드 마운트를 한 번만 보고하기 위해)
+
+
+def _unescape(field: str) -> str:
+    """mountinfo의 8진수 이스케이프(공백 \\040, 탭 \\011 등)를 되돌립니다."""
+    if "\\" not in field:
+        return field
+    return field.encode().decode("unicode_escape").encode("latin-1").decode(errors="replace")
+
+
+def parse_mountinfo(content: str) -> List[Mount]:
+    """
+    Parses `/proc/<pid>/mountinfo` into the mounts worth reporting.
+
+    Pseudo filesystems, container-internal mounts and additional bind mounts of an
+    already listed device are skipped; the shortest mount point of a device wins.
+    When a mount point is mounted over, only the last (visible) mount is kept.
+    """
+    by_mount_point: Dict[str, Mount] = {}
+    for line in content.splitlines():
+        fields = line.split()
+        try:
+            separator = fields.index("-", 6)  # 선택 필드(shared:N 등) 뒤의 구분자
+        except ValueError:
+            continue
+        if len(fields) < separator + 3:
+            continue
+        mount_point = _unescape(fields[4])
+        fs_type = fields[separator + 1]
+        if fs_type in IGNORED_FS_TYPES or fs_type.startswith("fuse.snapfuse"):
+            continue
+        if mount_point not in ALLOWED_MOUNTS and (
+            mount_point in ("/proc", "/sys", "/dev")
+            or mount_point.startswith(IGNORED_MOUNT_PREFIXES)
+        ):
+            continue
+        by_mount_point[mount_point] = Mount(
+            mount_point, fs_type, _unescape(fields[separator + 2]), fields[2]
+        )
+    by_device: Dict[str, Mount] = {}
+    for mount in by_mount_point.values():
+        known = by_device.get(mount.device)
+        if known is None or len(mount.mount_point) < len(known.mount_point):
+            by_device[mount.device] = mount
+    return sorted(by_device.values(), key=lambda mount: mount.mount_point)
+
+
+def mount_uri_name(mount_point: str) -> str:
+    if mount_point == "/":
+        return "root"
+    return "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in mount_point.strip("/"))
+
+
+def _statvfs_async(path: str) -> "Future[os.statvfs_result]":
+    """
+    Runs `os.statvfs(path)` on a daemon thread. A thread pool is not used on purpose:
+    its workers are joined at interpreter exit, so one hung NFS call would block shutdown.
+    """
+    future: "Future[os.statvfs_result]" = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(os.statvfs(path))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=f"statvfs:{path}", daemon=True).start()
+    return future
+
+
+class FillRateEstimator:
+    """
+    Least-squares slope of used bytes over a sliding time window.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = FILL_WINDOW_SECONDS,
+        sample_seconds: float = FILL_SAMPLE_SECONDS,
+    ) -> None:
+        self.window_seconds = window_seconds
+        self.sample_seconds = sample_seconds
+        self.samples: Deque[Tuple[float, float]] = deque()  # (monotonic ts, used bytes)
+
+    def add(self, used_bytes: float, now: float) -> None:
+        if self.samples and now - self.samples[-1][0] < self.sample_seconds:
+            return
+        self.samples.append((now, used_bytes))
+        while self.samples and now - self.samples[0][0] > self.window_seconds:
+            self.samples.popleft()
+
+    def slope(self) -> Optional[float]:
+        """Bytes per second, or None while the window spans less than FILL_MIN_SPAN_SECONDS."""
+        if len(self.samples) < 2 or self.samples[-1][0] - self.samples[0][0] < (
+            FILL_MIN_SPAN_SECONDS
+        ):
+            return None
+        count = len(self.samples)
+        mean_t = sum(ts for ts, _ in self.samples) / count
+        mean_used = sum(used for _, used in self.samples) / count
+        numerator = sum((ts - mean_t) * (used - mean_used) for ts, used in self.samples)
+        denominator = sum((ts - mean_t) ** 2 for ts, _ in self.samples)
+        return numerator / denominator if denominator > 0 else None
+
+
+@register_collector
+class FilesystemCollector(BaseCollector):
+    def __init__(
+        self,
+        stat_timeout: float = DEFAULT_STAT_TIMEOUT_SECONDS,
+        mountinfo_path: str = MOUNTINFO_PATH,
+    ) -> None:
+        """
+        Args:
+            stat_timeout (float): How long a tick waits for all statvfs() calls.
+            mountinfo_path (str): Mount table to follow.
+        """
+        self.stat_timeout = stat_timeout
+        self.mountinfo_path = mountinfo_path
+        self.mounts: List[Mount] = []
+        self._mountinfo = open(mountinfo_path, "r", encoding="utf-8", errors="replace")
+        self._poller = select.poll()
+        self._poller.register(self._mountinfo, select.POLLPRI | select.POLLERR)
+        self._pending: Dict[str, "Future[os.statvfs_result]"] = {}
+        self._fill: Dict[str, FillRateEstimator] = {}
+        self._reload_mounts()
+
+    def _reload_mounts(self) -> None:
+        self._mountinfo.seek(0)
+        self.mounts = parse_mountinfo(self._mountinfo.read())
+        current = {mount.mount_point for mount in self.mounts}
+        for mount_point in list(self._fill):
+            if mount_point not in current:
+                del self._fill[mount_point]  # 해제된 마운트의 채움 속도 기록 정리
+
+    def _refresh_mounts_if_changed(self) -> None:
+        # 마운트 테이블이 바뀌면 커널이 POLLPRI|POLLERR를 한 번 알립니다 (poll이 상태를 소비).
+        if self._poller.poll(0):
+            self._reload_mounts()
+
+    def _mount_metrics(
+        self, mount: Mount, st: os.statvfs_result, now: float
+    ) -> List[Tuple[str, float]]:
+        prefix = f"fs.{mount_uri_name(mount.mount_point)}"
+        size = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        avail = st.f_bavail * st.f_frsize
+        metrics = [
+            (f"{prefix}.size_bytes", float(size)),
+            (f"{prefix}.used_bytes", float(used)),
+            (f"{prefix}.avail_bytes", float(avail)),
+            # df와 같이 루트 예약 블록을 뺀 용량 기준
+            (f"{prefix}.used_percent", used / (used + avail) * 100.0 if used + avail else 0.0),
+            (f"{prefix}.responsive", 1.0),
+        ]
+        if st.f_files:
+            inodes_used = st.f_files - st.f_ffree
+            metrics.append((f"{prefix}.inodes_total", float(st.f_files)))
+            metrics.append((f"{prefix}.inodes_used_percent", inodes_used / st.f_files * 100.0))
+
+        estimator = self._fill.setdefault(mount.mount_point, FillRateEstimator())
+        estimator.add(float(used), now)
+        slope = estimator.slope()
+        if slope is not None:
+            metrics.append((f"{prefix}.fill_rate_bytes_per_sec", slope))
+            metrics.append(
+                (f"{prefix}.time_to_full_seconds", avail / slope if slope > 0 else NOT_FILLING)
+            )
+        return metrics
+
+    def collect(self) -> List[Tuple[str, float]]:
+        try:
+            self._refresh_mounts_if_changed()
+        except OSError as e:
+            print(f"[WARN][FilesystemCollector] 마운트 테이블 읽기 실패: {e}")
+
+        for mount in self.mounts:
+            if mount.mount_point not in self._pending:
+                self._pending[mount.mount_point] = _statvfs_async(mount.mount_point)
+        wait(list(self._pending.values()), timeout=self.stat_timeout)
+
+        now = time.monotonic()
+        metrics: List[Tuple[str, float]] = []
+        for mount in self.mounts:
+            future = self._pending[mount.mount_point]
+            if not future.done():
+                # 응답 없는 마운트: 이전 호출이 끝날 때까지 새로 호출하지 않습니다.
+                metrics.append((f"fs.{mount_uri_name(mount.mount_point)}.responsive", 0.0))
+                continue
+            del self._pending[mount.mount_point]
+            try:
+                metrics.extend(self._mount_metrics(mount, future.result(), now))
+            except OSError:
+                continue  # 검사 직후 해제되었거나 권한 없음
+        # 마운트 테이블에서 사라진 마운트의 끝난 호출 정리 (멈춘 호출은 끝날 때까지 유지)
+        current = {mount.mount_point for mount in self.mounts}
+        for mount_point in [p for p, f in self._pending.items() if p not in current and f.done()]:
+            del self._pending[mount_point]
+        return metrics
+
+    def get_state(self) -> Optional[Any]:
+        offset = time.time() - time.monotonic()
+        fill = stable_copy(
+            lambda: [
+                (mount_point, list(estimator.samples))
+                for mount_point, estimator in list(self._fill.items())
+            ]
+        )
+        return {
+            mount_point: [[ts + offset, used] for ts, used in samples]
+            for mount_point, samples in fill
+        }
+
+    def set_state(self, state: Any, max_age_seconds: Optional[float] = None) -> None:
+        """재시작 전 채움 기록을 복원합니다 (가장 최근 표본이 max_age보다 오래되면 버림)."""
+        wall_now = time.time()
+        offset = wall_now - time.monotonic()
+        for mount_point, samples in state.items():
+            if not samples:
+                continue
+            if max_age_seconds is not None and wall_now - samples[-1][0] > max_age_seconds:
+                continue
+            estimator = self._fill.setdefault(mount_point, FillRateEstimator())
+            for wall_ts, used in samples:
+                estimator.add(used, wall_ts - offset)
+
+    async def aclose(self) -> None:
+        """마운트 테이블 파일을 닫습니다 (앱 종료 시 호출). 멈춘 statvfs 스레드는 데몬이라 기다리지 않습니다."""
+        self._poller.unregister(self._mountinfo)
+        self._mountinfo.close()
@@ -0,0 +1,124 @@
+# collectors/io_throughput.py
+"""
+호스트 전체 디스크/네트워크 처리량 컬렉터.
+
+`/proc/diskstats` and `/proc/net/dev` are each read once per tick; the cumulative
+byte counters are turned into per-second rates with monotonic timestamps, and
+counter wraps are handled by `utils.rate.wrapped_delta`.
+"""
+
+import os
+import time
+from typing import Any, List, Optional, Set, Tuple
+
+from utils.rate import RateCounter
+
+from .base import BaseCollector, register_collector
+
+SECTOR_SIZE: int = 512  # diskstats의 섹터 단위는 장치와 무관하게 항상 512바이트
+WHOLE_DISK_REFRESH_SECONDS: float = 60.0
+_IGNORED_DISK_PREFIXES: Tuple[str, ...] = ("loop", "ram", "fd")
+_IGNORED_INTERFACES: Set[str] = {"lo"}
+
+
+def _uri_safe(name: str) -> str:
+    return "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in name)
+
+
+@register_collector
+class IoThroughputCollector(BaseCollector):
+    def __init__(self, proc_root: str = "/proc", sys_block_root: str = "/sys/block") -> None:
+        """
+        Args:
+            proc_root (str): procfs mount point (a fake tree can be used for testing).
+            sys_block_root (str): Directory listing whole block devices.
+        """
+        self.diskstats_path = os.path.join(proc_root, "diskstats")
+        self.net_dev_path = os.path.join(proc_root, "net", "dev")
+        self.sys_block_root = sys_block_root
+        self._rates = RateCounter()
+        self._whole_disks: Optional[Set[str]] = None
+        self._whole_disks_checked_at: float = 0.0
+
+    def _read(self, path: str) -> Optional[bytes]:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _is_whole_disk(self, name: str, now: float) -> bool:
+        """파티션(sda1 등)을 제외하고 /sys/block에 있는 전체 디스크만 허용합니다."""
+        if self._whole_disks is None or now - self._whole_disks_checked_at > (
+            WHOLE_DISK_REFRESH_SECONDS
+        ):
+            try:
+                self._whole_disks = {
+                    entry.replace("!", "/") for entry in os.listdir(self.sys_block_root)
+                }
+            except OSError:
+                self._whole_disks = set()
+            self._whole_disks_checked_at = now
+        if self._whole_disks:
+            return name in self._whole_disks
+        return True  # /sys/block을 읽을 수 없으면 필터링하지 않습니다.
+
+    def _collect_disks(self, now: float) -> List[Tuple[str, float]]:
+        data = self._read(self.diskstats_path)
+        if data is None:
+            return []
+        metrics: List[Tuple[str, float]] = []
+        for line in data.splitlines():
+            fields = line.split()
+            if len(fields) < 10:
+                continue
+            name = fields[2].decode(errors="replace")
+            if name.startswith(_IGNORED_DISK_PREFIXES) or not self._is_whole_disk(name, now):
+                continue
+            read_rate = self._rates.rate(("disk_read", name), int(fields[5]) * SECTOR_SIZE, now)
+            write_rate = self._rates.rate(("disk_write", name), int(fields[9]) * SECTOR_SIZE, now)
+            uri_name = _uri_safe(name)
+            if read_rate is not None:
+                metrics.append((f"system.disk.{uri_name}.read_bytes_per_sec", read_rate))
+            if write_rate is not None:
+                metrics.append((f"system.disk.{uri_name}.write_bytes_per_sec", write_rate))
+        return metrics
+
+    def _collect_network(self, now: float) -> List[Tuple[str, float]]:
+        data = self._read(self.net_dev_path)
+        if data is None:
+            return []
+        metrics: List[Tuple[str, float]] = []
+        for line in data.splitlines()[2:]:  # 헤더 2줄 건너뛰기
+            iface_raw, sep, counters = line.partition(b":")
+            if not sep:
+                continue
+            iface = iface_raw.strip().decode(errors="replace")
+            fields = counters.split()
+            if iface in _IGNORED_INTERFACES or len(fields) < 9:
+                continue
+            rx_rate = self._rates.rate(("net_rx", iface), int(fields[0]), now)
+            tx_rate = self._rates.rate(("net_tx", iface), int(fields[8]), now)
+            uri_name = _uri_safe(iface)
+            if rx_rate is not None:
+                metrics.append((f"system.net.{uri_name}.rx_bytes_per_sec", rx_rate))
+            if tx_rate is not None:
+                metrics.append((f"system.net.{uri_name}.tx_bytes_per_sec", tx_rate))
+        return metrics
+
+    def get_state(self) -> Optional[Any]:
+        return self._rates.get_state()
+
+    def set_state(self, state: Any, max_age_seconds: Optional[float] = None) -> None:
+        self._rates.set_state(state, max_age_seconds)
+
+    def collect(self) -> List[Tuple[str, float]]:
+        now = time.monotonic()
+        metrics: List[Tuple[str, float]] = []
+        try:
+            metrics.extend(self._collect_disks(now))
+            metrics.extend(self._collect_network(now))
+        except (ValueError, IndexError) as e:
+            print(f"[WARN][IoThroughputCollector] 카운터 파싱 실패: {e}")
+        self._rates.sweep()  # 사라진 장치/인터페이스 정리
+        return metrics
@@ -0,0 +1,205 @@
+# collectors/log_index.py
+"""
+Feeds syslog and kernel (/dev/kmsg) messages into the on-disk log index
+(`utils/log_index.py`) that backs the dashboard's log search panel (`/` key).
+
+Both sources are tailed incrementally with a persisted cursor (file inode +
+offset, kmsg boot id + sequence number), so a restart neither re-indexes nor
+skips messages. Work per tick is bounded by `max_bytes_per_tick`, so catching up
+on a large backlog is spread over several ticks.
+"""
+
+import errno
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.log_index import (
+    DEFAULT_INDEX_DIR,
+    DEFAULT_RETENTION_DAYS,
+    LogIndex,
+    parse_syslog_timestamp,
+)
+
+from .base import BaseCollector, register_collector
+from .discovery import KMSG_PATH, SYSLOG_PATHS
+
+BOOT_ID_PATH: str = "/proc/sys/kernel/random/boot_id"
+CURSOR_FILE: str = "cursors.json"
+DEFAULT_MAX_BYTES_PER_TICK: int = 4 * 1024 * 1024
+DEFAULT_BACKFILL_BYTES: int = 16 * 1024 * 1024
+KMSG_RECORD_SIZE: int = 8192
+
+
+def _read_boot_id() -> str:
+    try:
+        with open(BOOT_ID_PATH) as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+@register_collector
+class LogIndexCollector(BaseCollector):
+    def __init__(
+        self,
+        index_dir: Optional[str] = None,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        max_bytes_per_tick: int = DEFAULT_MAX_BYTES_PER_TICK,
+        backfill_bytes: int = DEFAULT_BACKFILL_BYTES,
+        kernel: bool = True,
+    ) -> None:
+        """
+        Args:
+            index_dir (str | None): Index directory (default: state/log_index).
+            retention_days (int): Hourly segments older than this are deleted.
+            max_bytes_per_tick (int): Upper bound of syslog bytes indexed per tick.
+            backfill_bytes (int): On the first run, index at most this much of the
+                existing syslog file (its tail).
+            kernel (bool): Also read /dev/kmsg (needs read permission).
+        """
+        self.index = LogIndex(
+            Path(index_dir) if index_dir else DEFAULT_INDEX_DIR, retention_days=retention_days
+        )
+        self.max_bytes_per_tick = max_bytes_per_tick
+        self.backfill_bytes = backfill_bytes
+        self._cursor_path = self.index.directory / CURSOR_FILE
+        self._cursors: Dict[str, Any] = self._load_cursors()
+        self._syslog_last_ts: Optional[float] = None
+        self._kmsg_fd: Optional[int] = None
+        self._kmsg_enabled = kernel
+        self._boot_id = _read_boot_id()
+        # CLOCK_MONOTONIC(µs) 기준 kmsg 타임스탬프를 벽시계 시각으로 바꾸는 오프셋
+        self._monotonic_offset = time.time() - time.monotonic()
+
+    def _load_cursors(self) -> Dict[str, Any]:
+        try:
+            with open(self._cursor_path, encoding="utf-8") as f:
+                cursors = json.load(f)
+            return cursors if isinstance(cursors, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cursors(self) -> None:
+        tmp_path = self._cursor_path.with_name(CURSOR_FILE + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._cursors, f)
+            os.replace(tmp_path, self._cursor_path)
+        except OSError as e:
+            print(f"[WARN][LogIndexCollector] 커서 저장 실패: {e}")
+
+    def _tail_syslog(self) -> int:
+        path = next((p for p in SYSLOG_PATHS if os.access(p, os.R_OK)), None)
+        if path is None:
+            return 0
+        try:
+            st = os.stat(path)
+        except OSError:
+            return 0
+        cursor = self._cursors.get("syslog") or {}
+        offset = cursor.get("offset", 0)
+        if cursor.get("path") != path or cursor.get("inode") != st.st_ino:
+            # 처음 실행이면 파일 끝부분만, 로테이션된 새 파일이면 처음부터 읽습니다.
+            offset = max(0, st.st_size - self.backfill_bytes) if not cursor else 0
+        elif offset > st.st_size:
+            offset = 0  # copytruncate 로테이션
+        if offset >= st.st_size:
+            self._cursors["syslog"] = {"path": path, "inode": st.st_ino, "offset": offset}
+            return 0
+
+        with open(path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read(self.max_bytes_per_tick)
+        if offset > 0 and not cursor:
+            skip = chunk.find(b"\n") + 1  # 백필 시작점이 줄 중간이면 다음 줄부터
+            chunk, offset = chunk[skip:], offset + skip
+        end = chunk.rfind(b"\n") + 1  # 완전한 줄까지만 (나머지는 다음 틱)
+        count = 0
+        last_ts = self._syslog_last_ts or time.time()
+        for raw in chunk[:end].splitlines():
+            line = raw.decode("utf-8", "replace").rstrip()
+            if not line:
+                continue
+            last_ts = parse_syslog_timestamp(line) or last_ts
+            self.index.add(last_ts, "syslog", line)
+            count += 1
+        self._syslog_last_ts = last_ts
+        self._cursors["syslog"] = {"path": path, "inode": st.st_ino, "offset": offset + end}
+        return count
+
+    def _read_kmsg(self) -> int:
+        if not self._kmsg_enabled:
+            return 0
+        if self._kmsg_fd is None:
+            try:
+                self._kmsg_fd = os.open(KMSG_PATH, os.O_RDONLY | os.O_NONBLOCK)
+            except OSError as e:
+                print(f"[WARN][LogIndexCollector] {KMSG_PATH} 읽기 불가, 커널 메시지 제외: {e}")
+                self._kmsg_enabled = False
+                return 0
+        cursor = self._cursors.get("kernel") or {}
+        last_seq = cursor.get("seq", -1) if cursor.get("boot_id") == self._boot_id else -1
+        count = 0
+        budget = self.max_bytes_per_tick
+        while budget > 0:
+            try:
+                record = os.read(self._kmsg_fd, KMSG_RECORD_SIZE)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == errno.EPIPE:
+                    continue  # 읽기 전에 링 버퍼에서 덮어쓰인 레코드
+                raise
+            if not record:
+                break
+            budget -= len(record)
+            parsed = self._parse_kmsg(record)
+            if parsed is None or parsed[0] <= last_seq:
+                continue
+            seq, ts, message = parsed
+            self.index.add(ts, "kernel", message)
+            last_seq = seq
+            count += 1
+        self._cursors["kernel"] = {"boot_id": self._boot_id, "seq": last_seq}
+        return count
+
+    def _parse_kmsg(self, record: bytes) -> Optional[Tuple[int, float, str]]:
+        """'pri,seq,ts_us,flags;message\\n KEY=value...' 레코드를 (seq, ts, 메시지)로 바꿉니다."""
+        prefix, _, body = record.partition(b";")
+        fields = prefix.split(b",")
+        if len(fields) < 3:
+            return None
+        try:
+            seq, ts_us = int(fields[1]), int(fields[2])
+        except ValueError:
+            return None
+        message = body.split(b"\n", 1)[0].decode("utf-8", "replace")
+        return seq, self._monotonic_offset + ts_us / 1_000_000, message
+
+    async def aclose(self) -> None:
+        """kmsg 파일과 색인을 닫습니다 (앱 종료 시 호출)."""
+        if self._kmsg_fd is not None:
+            os.close(self._kmsg_fd)
+            self._kmsg_fd = None
+        self.index.close()
+
+    def collect(self) -> List[Tuple[str, float]]:
+        ingested = 0
+        try:
+            ingested += self._tail_syslog()
+            ingested += self._read_kmsg()
+        except Exception as e:
+            print(f"[WARN][LogIndexCollector] 메시지 색인 실패: {e}")
+        self.index.commit()
+        if ingested:
+            self._save_cursors()
+        self.index.maintain()
+        stats = self.index.stats()
+        return [
+            ("log.index.ingested_lines", float(ingested)),
+            ("log.index.segments", stats["segments"]),
+            ("log.index.active_docs", stats["active_docs"]),
+        ]
@@ -0,0 +1,203 @@
+# collectors/pressure_memory.py
+"""
+Pressure-stall (PSI) and detailed memory collector.
+
+Reads `/proc/pressure/{cpu,memory,io}`, `/proc/meminfo` and `/proc/vmstat` once per
+tick each, through file descriptors that stay open (`pread` at offset 0 makes
+procfs regenerate the content). Line positions of the wanted fields are looked up
+once and kept in an offset table; each tick only checks that the line at the
+cached position still starts with the expected key, and re-resolves the table if
+the layout ever changes (e.g. after a kernel upgrade with a restart).
+"""
+
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.rate import RateCounter
+
+from .base import BaseCollector, register_collector
+
+READ_SIZE: int = 16384  # vmstat은 약 6KB, meminfo는 약 1.5KB
+PRESSURE_RESOURCES: Tuple[str, ...] = ("cpu", "memory", "io")
+PAGE_SIZE: int = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# meminfo 키 -> URI 접미사 (값은 kB 단위로 기록되어 있음)
+MEMINFO_FIELDS: Dict[bytes, str] = {
+    b"MemAvailable": "available_bytes",
+    b"Dirty": "dirty_bytes",
+    b"Writeback": "writeback_bytes",
+    b"Slab": "slab_bytes",
+    b"SwapTotal": "swap_total_bytes",
+    b"SwapFree": "swap_free_bytes",
+}
+# vmstat 키 -> URI 접미사 (누적 페이지 수, 초당 바이트로 변환)
+VMSTAT_FIELDS: Dict[bytes, str] = {
+    b"pswpin": "swap_in_bytes_per_sec",
+    b"pswpout": "swap_out_bytes_per_sec",
+}
+
+
+class _OffsetTable:
+    """
+    키 -> 줄 번호 표. 처음 한 번만 전체를 훑고, 이후에는 캐시된 줄만 확인합니다.
+    """
+
+    def __init__(self, keys: Dict[bytes, str]) -> None:
+        self.keys = keys
+        self.offsets: Optional[List[Tuple[int, bytes, str]]] = None
+
+    def _resolve(self, lines: List[bytes]) -> List[Tuple[int, bytes, str]]:
+        offsets: List[Tuple[int, bytes, str]] = []
+        for index, line in enumerate(lines):
+            # meminfo는 "Key:   123 kB", vmstat은 "key 123" 형식입니다.
+            for separator in (b":", b" "):
+                key, found, _ = line.partition(separator)
+                if found and key in self.keys:
+                    offsets.append((index, key + separator, self.keys[key]))
+                    break
+        return offsets
+
+    def parse(self, data: bytes) -> Dict[str, int]:
+        """각 필드의 두 번째 토큰(정수)을 읽습니다."""
+        lines = data.split(b"\n")
+        for _ in range(2):
+            if self.offsets is None:
+                self.offsets = self._resolve(lines)
+            values: Dict[str, int] = {}
+            for index, prefix, name in self.offsets:
+                if index >= len(lines) or not lines[index].startswith(prefix):
+                    break  # 배치가 바뀜: 표를 다시 만듭니다.
+                start = len(prefix)
+                values[name] = int(lines[index][start:].split()[0])
+            else:
+                return values
+            self.offsets = None
+        return {}
+
+
+class _ProcFile:
+    """열어둔 procfs 파일. 읽을 때마다 pread로 처음부터 다시 읽습니다."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        try:
+            self.fd: Optional[int] = os.open(path, os.O_RDONLY)
+        except OSError:
+            self.fd = None
+
+    def read(self) -> Optional[bytes]:
+        if self.fd is None:
+            return None
+        try:
+            return os.pread(self.fd, READ_SIZE, 0)
+        except OSError:
+            return None
+
+    def close(self) -> None:
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+
+
+def _parse_pressure(data: bytes) -> List[Tuple[str, float, float, float, int]]:
+    """
+    PSI 형식은 고정입니다:
+        some avg10=0.78 avg60=1.41 avg300=1.30 total=19966926
+    토큰 위치와 접두어 길이(avg10= 6, avg60= 6, avg300= 7, total= 6)로 바로 잘라 읽습니다.
+    """
+    rows: List[Tuple[str, float, float, float, int]] = []
+    for line in data.split(b"\n"):
+        tokens = line.split()
+        if len(tokens) != 5:
+            continue
+        rows.append(
+            (
+                tokens[0].decode(),
+                float(tokens[1][6:]),
+                float(tokens[2][6:]),
+                float(tokens[3][7:]),
+                int(tokens[4][6:]),
+            )
+        )
+    return rows
+
+
+@register_collector
+class PressureMemoryCollector(BaseCollector):
+    def __init__(self, proc_root: str = "/proc") -> None:
+        """
+        Args:
+            proc_root (str): procfs mount point (a fake tree can be used for testing).
+        """
+        self._pressure_files = {
+            resource: _ProcFile(os.path.join(proc_root, "pressure", resource))
+            for resource in PRESSURE_RESOURCES
+        }
+        self._meminfo = _ProcFile(os.path.join(proc_root, "meminfo"))
+        self._vmstat = _ProcFile(os.path.join(proc_root, "vmstat"))
+        self._meminfo_table = _OffsetTable(MEMINFO_FIELDS)
+        self._vmstat_table = _OffsetTable(VMSTAT_FIELDS)
+        self._rates = RateCounter()
+
+    def _collect_pressure(self, now: float) -> List[Tuple[str, float]]:
+        metrics: List[Tuple[str, float]] = []
+        for resource, proc_file in self._pressure_files.items():
+            data = proc_file.read()
+            if data is None:
+                continue
+            for kind, avg10, avg60, avg300, total_us in _parse_pressure(data):
+                prefix = f"system.pressure.{resource}.{kind}"
+                metrics.append((f"{prefix}.avg10", avg10))
+                metrics.append((f"{prefix}.avg60", avg60))
+                metrics.append((f"{prefix}.avg300", avg300))
+                # 누적 정지 시간(µs)의 초당 증가량: 1e6이면 해당 자원에서 항상 정지 상태
+                stall_rate = self._rates.rate((resource, kind), total_us, now)
+                if stall_rate is not None:
+                    metrics.append((f"{prefix}.stall_us_per_sec", stall_rate))
+        return metrics
+
+    def _collect_memory(self, now: float) -> List[Tuple[str, float]]:
+        metrics: List[Tuple[str, float]] = []
+        data = self._meminfo.read()
+        if data is not None:
+            values = self._meminfo_table.parse(data)
+            for name, kilobytes in values.items():
+                metrics.append((f"system.memory.{name}", float(kilobytes * 1024)))
+            if "swap_total_bytes" in values and "swap_free_bytes" in values:
+                used_kb = values["swap_total_bytes"] - values["swap_free_bytes"]
+                metrics.append(("system.memory.swap_used_bytes", float(used_kb * 1024)))
+
+        data = self._vmstat.read()
+        if data is not None:
+            for name, pages in self._vmstat_table.parse(data).items():
+                rate = self._rates.rate(name, pages * PAGE_SIZE, now)
+                if rate is not None:
+                    metrics.append((f"system.memory.{name}", rate))
+        return metrics
+
+    def get_state(self) -> Optional[Any]:
+        return self._rates.get_state()
+
+    def set_state(self, state: Any, max_age_seconds: Optional[float] = None) -> None:
+        self._rates.set_state(state, max_age_seconds)
+
+    def collect(self) -> List[Tuple[str, float]]:
+        now = time.monotonic()
+        metrics: List[Tuple[str, float]] = []
+        try:
+            metrics.extend(self._collect_pressure(now))
+            metrics.extend(self._collect_memory(now))
+        except (ValueError, IndexError) as e:
+            print(f"[WARN][PressureMemoryCollector] 파싱 실패: {e}")
+        return metrics
+
+    async def aclose(self) -> None:
+        """열어둔 /proc 파일을 닫습니다 (앱 종료 시 호출)."""
+        for proc_file in self._pressure_files.values():
+            proc_file.close()
+        self._meminfo.close()
+        self._vmstat.close()
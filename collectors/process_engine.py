@@ -0,0 +1,201 @@
+# collectors/process_engine.py
+"""
+/proc 기반 프로세스 수집 엔진.
+
+Reads `/proc/[pid]/stat`, `status`, `io` and `fd` for every process, turns the
+cumulative counters into per-second rates using the previous sample of the same
+process, and keeps a bounded top-N heap per sort key in a single pass.
+"""
+
+import heapq
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.rate import RateCounter
+
+# 정렬 가능한 키 (위젯에서 순환) -> 표시 이름
+SORT_KEYS: Dict[str, str] = {
+    "cpu_percent": "CPU",
+    "memory_percent": "MEM",
+    "read_bytes_per_sec": "DISK READ",
+    "write_bytes_per_sec": "DISK WRITE",
+    "ctx_switches_per_sec": "CTX SWITCH",
+    "num_fds": "FD",
+    "num_threads": "THREADS",
+}
+
+_STATUS_FIELDS: Dict[bytes, str] = {
+    b"VmRSS": "rss_kb",
+    b"voluntary_ctxt_switches": "vol_ctx",
+    b"nonvoluntary_ctxt_switches": "nonvol_ctx",
+}
+
+
+class ProcessEngine:
+    """
+    Samples all processes from /proc and ranks them by several keys at once.
+    """
+
+    def __init__(self, proc_root: str = "/proc", top_n: int = 10) -> None:
+        """
+        Args:
+            proc_root (str): procfs mount point (a fake tree can be used for testing).
+            top_n (int): Number of processes kept per sort key.
+        """
+        self.proc_root = proc_root
+        self.top_n = top_n
+        self._rates = RateCounter()
+        self._clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._mem_total_kb: Optional[float] = None
+        # 마지막 샘플의 전체 프로세스 레코드 (pid -> record)
+        self.last_records: Dict[int, Dict[str, Any]] = {}
+
+    @property
+    def available(self) -> bool:
+        """procfs를 읽을 수 있는지 여부."""
+        return os.path.isfile(os.path.join(self.proc_root, "self", "stat"))
+
+    def _read(self, path: str) -> Optional[bytes]:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            return None
+
+    def _memory_total_kb(self) -> float:
+        if self._mem_total_kb is None:
+            data = self._read(os.path.join(self.proc_root, "meminfo")) or b""
+            self._mem_total_kb = 0.0
+            for line in data.splitlines():
+                if line.startswith(b"MemTotal:"):
+                    self._mem_total_kb = float(line.split()[1])
+                    break
+        return self._mem_total_kb
+
+    def _read_process(self, pid: int, now: float) -> Optional[Dict[str, Any]]:
+        base = f"{self.proc_root}/{pid}"
+        stat = self._read(f"{base}/stat")
+        if stat is None:
+            return None
+
+        # comm은 괄호 안에 공백을 포함할 수 있으므로 마지막 ')' 기준으로 분리합니다.
+        comm_start = stat.find(b"(") + 1
+        comm_end = stat.rfind(b")")
+        fields_start = comm_end + 2
+        name = stat[comm_start:comm_end].decode(errors="replace")
+        fields = stat[fields_start:].split()
+        # fields[0]은 stat의 3번째 필드(state)입니다.
+        state = fields[0].decode()
+        ppid = int(fields[1])
+        cpu_ticks = int(fields[11]) + int(fields[12])  # utime + stime
+        num_threads = int(fields[17])
+        start_time = int(fields[19])
+        identity = (pid, start_time)  # PID 재사용 시 이전 샘플과 섞이지 않도록
+
+        status_values: Dict[str, float] = {}
+        status = self._read(f"{base}/status")
+        if status is not None:
+            for line in status.splitlines():
+                key, _, rest = line.partition(b":")
+                field = _STATUS_FIELDS.get(key)
+                if field is not None:
+                    status_values[field] = float(rest.split()[0])
+
+        cpu_rate = self._rates.rate((identity, "cpu"), cpu_ticks, now)
+        rss_kb = status_values.get("rss_kb", 0.0)
+        mem_total_kb = self._memory_total_kb()
+
+        ctx_rate: Optional[float] = None
+        if "vol_ctx" in status_values:
+            ctx_rate = self._rates.rate(
+                (identity, "ctx"),
+                status_values["vol_ctx"] + status_values.get("nonvol_ctx", 0.0),
+                now,
+            )
+
+        read_rate: Optional[float] = None
+        write_rate: Optional[float] = None
+        io = self._read(f"{base}/io")  # 다른 사용자의 프로세스는 권한이 없을 수 있습니다.
+        if io is not None:
+            for line in io.splitlines():
+                if line.startswith(b"read_bytes:"):
+                    read_rate = self._rates.rate((identity, "read"), int(line[11:]), now)
+                elif line.startswith(b"write_bytes:"):
+                    write_rate = self._rates.rate((identity, "write"), int(line[12:]), now)
+
+        try:
+            num_fds: Optional[int] = len(os.listdir(f"{base}/fd"))
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            num_fds = None
+
+        return {
+            "pid": pid,
+            "ppid": ppid,
+            "start_time": start_time,
+            "name": name,
+            "state": state,
+            "cpu_percent": cpu_rate / self._clock_ticks * 100.0 if cpu_rate is not None else None,
+            "memory_percent": rss_kb / mem_total_kb * 100.0 if mem_total_kb else 0.0,
+            "read_bytes_per_sec": read_rate,
+            "write_bytes_per_sec": write_rate,
+            "ctx_switches_per_sec": ctx_rate,
+            "num_fds": num_fds,
+            "num_threads": num_threads,
+        }
+
+    def get_state(self) -> List[List[Any]]:
+        """이전 샘플의 누적 카운터 (재시작 후 첫 샘플에서도 비율을 계산하기 위함)."""
+        return self._rates.get_state()
+
+    def set_state(self, state: List[List[Any]], max_age_seconds: Optional[float] = None) -> None:
+        self._rates.set_state(state, max_age_seconds)
+
+    def sample(self) -> List[Dict[str, Any]]:
+        """
+        Reads every process once and returns the union of the top-N of each sort key.
+
+        Each returned record carries a `top_keys` tuple naming the keys it ranks in.
+        The first sample of a process has no rates yet (None), so it can only rank
+        by memory, fds or threads.
+
+        Returns:
+            list: Process records (unsorted).
+        """
+        now = time.monotonic()
+        heaps: Dict[str, List[Tuple[float, int, Dict[str, Any]]]] = {key: [] for key in SORT_KEYS}
+        records: Dict[int, Dict[str, Any]] = {}
+
+        for entry in os.scandir(self.proc_root):
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            try:
+                record = self._read_process(pid, now)
+            except (ValueError, IndexError):
+                record = None  # 읽는 도중 프로세스가 종료되어 잘린 내용
+            if record is None:
+                continue
+            records[pid] = record
+            for key, heap in heaps.items():
+                value = record[key]
+                if value is None:
+                    continue
+                item = (value, pid, record)
+                if len(heap) < self.top_n:
+                    heapq.heappush(heap, item)
+                elif item[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, item)
+
+        self._rates.sweep()  # 종료된 프로세스의 이전 샘플 제거
+        self.last_records = records
+
+        top: Dict[int, Dict[str, Any]] = {}
+        top_keys: Dict[int, List[str]] = {}
+        for key, heap in heaps.items():
+            for _, pid, record in heap:
+                top[pid] = record
+                top_keys.setdefault(pid, []).append(key)
+        for pid, record in top.items():
+            record["top_keys"] = tuple(top_keys[pid])
+        return list(top.values())
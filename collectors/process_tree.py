@@ -0,0 +1,167 @@
+# collectors/process_tree.py
+"""
+Incremental PID -> PPID index with per-subtree CPU/memory rollups.
+
+`ProcessTree.update()` only touches processes that appeared or disappeared since
+the previous sample (plus the orphans of the ones that died, which the kernel
+re-parents). The post-order used for the bottom-up rollup is cached and only
+recomputed when the shape of the tree changed.
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+class ProcessTreeSnapshot:
+    """
+    Immutable view of the tree for one sample, safe to hand to the UI thread while
+    the collector builds the next one.
+    """
+
+    __slots__ = ("roots", "children", "names", "cpu", "memory", "descendants")
+
+    def __init__(
+        self,
+        roots: List[int],
+        children: Dict[int, List[int]],
+        names: Dict[int, str],
+        cpu: Dict[int, float],
+        memory: Dict[int, float],
+        descendants: Dict[int, int],
+    ) -> None:
+        self.roots = roots
+        self.children = children  # pid -> 자식 pid 목록
+        self.names = names
+        self.cpu = cpu  # pid -> 하위 트리 전체 CPU %
+        self.memory = memory  # pid -> 하위 트리 전체 MEM %
+        self.descendants = descendants  # pid -> 하위 프로세스 수 (자신 제외)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class ProcessTree:
+    """
+    Parent/child index maintained across samples.
+    """
+
+    def __init__(self) -> None:
+        # pid -> (ppid, start_time). start_time으로 PID 재사용을 구분합니다.
+        self._parent: Dict[int, Tuple[int, int]] = {}
+        self._children: Dict[int, Set[int]] = {}
+        self._post_order: Optional[List[int]] = None
+        self.last_births: int = 0
+        self.last_deaths: int = 0
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def parent_of(self, pid: int) -> Optional[int]:
+        entry = self._parent.get(pid)
+        return entry[0] if entry else None
+
+    def children_of(self, pid: int) -> Set[int]:
+        return self._children.get(pid, set())
+
+    def _attach(self, pid: int, ppid: int, start_time: int) -> None:
+        self._parent[pid] = (ppid, start_time)
+        self._children.setdefault(ppid, set()).add(pid)
+
+    def _detach(self, pid: int) -> None:
+        ppid, _ = self._parent.pop(pid)
+        siblings = self._children.get(ppid)
+        if siblings is not None:
+            siblings.discard(pid)
+            if not siblings:
+                del self._children[ppid]
+
+    def update(self, records: Dict[int, Dict[str, Any]]) -> bool:
+        """
+        Applies one sample (pid -> record with "ppid" and "start_time").
+
+        Returns:
+            bool: Whether the shape of the tree changed.
+        """
+        known = self._parent.keys()
+        deaths = [pid for pid in known - records.keys()]
+        # 같은 PID라도 시작 시각이 다르면 다른 프로세스입니다 (PID 재사용).
+        reused = [
+            pid
+            for pid in known & records.keys()
+            if self._parent[pid][1] != records[pid].get("start_time", 0)
+        ]
+        orphans: Set[int] = set()
+        for pid in deaths + reused:
+            orphans.update(self._children.get(pid, ()))
+            self._detach(pid)
+        births = [pid for pid in records.keys() - self._parent.keys()]
+        for pid in births:
+            record = records[pid]
+            self._attach(pid, record["ppid"], record.get("start_time", 0))
+        # 부모가 종료된 프로세스는 init/subreaper로 재배치되므로 다시 연결합니다.
+        for pid in orphans:
+            orphan = records.get(pid)
+            if (
+                orphan is not None
+                and pid in self._parent
+                and self._parent[pid][0] != orphan["ppid"]
+            ):
+                self._detach(pid)
+                self._attach(pid, orphan["ppid"], orphan.get("start_time", 0))
+
+        self.last_births = len(births)
+        self.last_deaths = len(deaths)
+        changed = bool(births or deaths or orphans)
+        if changed:
+            self._post_order = None
+        return changed
+
+    def roots(self) -> List[int]:
+        """부모가 트리에 없는 프로세스 (init, kthreadd, 또는 보이지 않는 부모의 자식)."""
+        return sorted(pid for pid, (ppid, _) in self._parent.items() if ppid not in self._parent)
+
+    def post_order(self) -> List[int]:
+        """자식이 항상 부모보다 먼저 오는 순서 (구조가 바뀔 때만 다시 계산)."""
+        if self._post_order is None:
+            order: List[int] = []
+            stack: List[Tuple[int, bool]] = [(pid, False) for pid in self.roots()]
+            while stack:
+                pid, expanded = stack.pop()
+                if expanded:
+                    order.append(pid)
+                    continue
+                stack.append((pid, True))
+                stack.extend((child, False) for child in self._children.get(pid, ()))
+            self._post_order = order
+        return self._post_order
+
+    def snapshot(self, records: Dict[int, Dict[str, Any]]) -> ProcessTreeSnapshot:
+        """
+        Rolls CPU and memory up the tree in one bottom-up pass over the post-order.
+
+        Args:
+            records (dict): The same sample that was passed to `update()`.
+        """
+        cpu: Dict[int, float] = {}
+        memory: Dict[int, float] = {}
+        descendants: Dict[int, int] = {}
+        for pid, record in records.items():
+            cpu[pid] = record.get("cpu_percent") or 0.0
+            memory[pid] = record.get("memory_percent") or 0.0
+            descendants[pid] = 0
+
+        parent = self._parent
+        for pid in self.post_order():
+            ppid = parent[pid][0]
+            if ppid in cpu:
+                cpu[ppid] += cpu[pid]
+                memory[ppid] += memory[pid]
+                descendants[ppid] += descendants[pid] + 1
+
+        return ProcessTreeSnapshot(
+            roots=self.roots(),
+            children={pid: list(children) for pid, children in self._children.items()},
+            names={pid: str(record.get("name", "?")) for pid, record in records.items()},
+            cpu=cpu,
+            memory=memory,
+            descendants=descendants,
+        )
@@ -0,0 +1,137 @@
+# collectors/synthetic_load.py
+"""
+Synthetic high-cardinality load generator.
+
+Produces a configurable number of fake series per tick so the collection ->
+cache -> log -> widget path can be exercised at sizes the test host does not
+have (tens of thousands of containers or processes). Opt-in only: enable it
+with `python main.py --synthetic-series N` (or `"enabled"` in collectors.json),
+and use `python main.py --stress-run` to measure tick latency and memory growth.
+"""
+
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .base import BaseCollector, register_collector
+
+# 프로필 -> (URI 접두사, 시리즈 이름 접두사, 시리즈마다 내보낼 메트릭 이름)
+# "containers"는 docker.container.* URI를 만들어 DockerStatsWidget 경로까지 태웁니다.
+PROFILES: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "series": ("synthetic", "s", ("value",)),
+    "containers": ("docker.container", "synth-", ("cpu_percent", "mem_percent", "mem_usage_mb")),
+    "processes": ("top_cpu", "synth_", ("cpu_percent", "mem_percent")),
+}
+DISTRIBUTIONS: Tuple[str, ...] = ("constant", "uniform", "normal", "walk", "spiky")
+SPIKE_PROBABILITY: float = 0.001
+
+
+@register_collector
+class SyntheticLoadCollector(BaseCollector):
+    def __init__(
+        self,
+        series: int = 1000,
+        profile: str = "series",
+        distribution: str = "walk",
+        churn_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            series (int): Number of live series (containers/processes) per tick.
+            profile (str): URI shape, one of `PROFILES`.
+            distribution (str): Value distribution, one of `DISTRIBUTIONS`.
+                "constant" never changes (everything is deadband-suppressed), "walk" is a
+                bounded random walk, "spiky" is normal noise with rare 10x spikes.
+            churn_rate (float): Fraction of series replaced by new ids every tick
+                (0.01 with 50k series = 500 containers restarted per tick).
+            seed (int | None): Random seed for reproducible runs.
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"알 수 없는 프로필: {profile} (가능: {', '.join(PROFILES)})")
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"알 수 없는 분포: {distribution} (가능: {', '.join(DISTRIBUTIONS)})")
+        if series < 0 or not 0.0 <= churn_rate <= 1.0:
+            raise ValueError("series는 0 이상, churn_rate는 0~1 사이여야 합니다.")
+        self.series = series
+        self.profile = profile
+        self.distribution = distribution
+        self.churn_rate = churn_rate
+        self._random = random.Random(seed)
+        self._uri_prefix, self._name_prefix, self._metric_names = PROFILES[profile]
+        self._live_ids: List[int] = list(range(series))
+        self._next_id: int = series
+        # 시리즈 id -> 메트릭별 현재 값 ("walk"/"constant"에서 사용)
+        self._values: Dict[int, List[float]] = {}
+        # 시리즈 id -> 해당 시리즈의 URI 목록 (문자열 포맷팅 비용을 한 번만 지불)
+        self._uris: Dict[int, List[str]] = {}
+        self._next_value: Callable[[int, int], float] = getattr(self, f"_value_{distribution}")
+        self.total_births: int = 0
+        self.total_deaths: int = 0
+        self.last_sample_count: int = 0
+
+    def _series_uris(self, series_id: int) -> List[str]:
+        uris = self._uris.get(series_id)
+        if uris is None:
+            name = f"{self._name_prefix}{series_id:06d}"
+            if self.profile == "processes":
+                # 실제 top_cpu/top_mem 로그 URI와 같은 모양: top_cpu.NAME.pid_N.cpu_percent
+                uris = [
+                    f"top_cpu.{name}.pid_{series_id}.cpu_percent",
+                    f"top_mem.{name}.pid_{series_id}.mem_percent",
+                ]
+            else:
+                uris = [f"{self._uri_prefix}.{name}.{metric}" for metric in self._metric_names]
+            self._uris[series_id] = uris
+        return uris
+
+    def _base_value(self, series_id: int, metric_index: int) -> float:
+        values = self._values.get(series_id)
+        if values is None:
+            values = [self._random.uniform(5.0, 60.0) for _ in self._metric_names]
+            self._values[series_id] = values
+        return values[metric_index]
+
+    def _value_constant(self, series_id: int, metric_index: int) -> float:
+        return self._base_value(series_id, metric_index)
+
+    def _value_uniform(self, series_id: int, metric_index: int) -> float:
+        return self._random.uniform(0.0, 100.0)
+
+    def _value_normal(self, series_id: int, metric_index: int) -> float:
+        return max(0.0, self._random.gauss(50.0, 10.0))
+
+    def _value_walk(self, series_id: int, metric_index: int) -> float:
+        value = self._base_value(series_id, metric_index) + self._random.gauss(0.0, 1.0)
+        value = min(100.0, max(0.0, value))
+        self._values[series_id][metric_index] = value
+        return value
+
+    def _value_spiky(self, series_id: int, metric_index: int) -> float:
+        value = max(0.0, self._random.gauss(10.0, 1.0))
+        if self._random.random() < SPIKE_PROBABILITY:
+            value *= 10.0
+        return value
+
+    def _churn(self) -> None:
+        """churn_rate 비율만큼 임의의 시리즈를 종료시키고 새 id로 교체합니다."""
+        count = min(len(self._live_ids), round(self.churn_rate * len(self._live_ids)))
+        if count <= 0:
+            return
+        for index in self._random.sample(range(len(self._live_ids)), count):
+            retired = self._live_ids[index]
+            self._values.pop(retired, None)
+            self._uris.pop(retired, None)
+            self._live_ids[index] = self._next_id
+            self._next_id += 1
+        self.total_births += count
+        self.total_deaths += count
+
+    def collect(self) -> List[Tuple[str, float]]:
+        self._churn()
+        metrics: List[Tuple[str, float]] = []
+        next_value = self._next_value
+        for series_id in self._live_ids:
+            for metric_index, uri in enumerate(self._series_uris(series_id)):
+                metrics.append((uri, round(next_value(series_id, metric_index), 2)))
+        self.last_sample_count = len(metrics)
+        return metrics
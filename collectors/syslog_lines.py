@@ -5,16 +5,16 @@ from pathlib import Path
 from typing import List, Tuple
 
 from .base import BaseCollector, register_collector
+from .discovery import SYSLOG_PATHS
 
 
 @register_collector
 class SyslogLineLengthCollector(BaseCollector):
     def collect(self) -> List[Tuple[str, float]]:
         # Common log paths, agent might need configuration for this
-        log_paths_to_try = ["/var/log/syslog", "/var/log/messages"]
         log_path_found = None
 
-        for p in log_paths_to_try:
+        for p in SYSLOG_PATHS:
             if os.path.exists(p) and os.access(p, os.R_OK):
                 log_path_found = p
                 break
@@ -0,0 +1,415 @@
+# collectors/tcp_sockets.py
+"""
+TCP/UDP socket state collector.
+
+Reads `/proc/net/tcp`, `/proc/net/tcp6`, `/proc/net/udp(6)`, `/proc/net/snmp` and
+`/proc/net/netstat` once per tick.
+
+The TCP tables can hold hundreds of thousands of rows, so large tables are not
+parsed line by line (tables under `SMALL_TABLE_BYTES` are, without importing numpy,
+and so is every table when numpy is not installed):
+
+1. Each file is read in one bulk read and viewed as a numpy byte array.
+2. Row starts come from the newline positions.
+3. Every column sits at a fixed offset from the `sl:` colon of its row. The
+   columns are gathered for all rows at once and their hex digits are decoded
+   with a lookup table.
+4. Counting by state and by local port is a `bincount`. Counting by remote
+   address is a single `unique`.
+5. Only the top-N addresses are turned into text.
+
+Emitted URIs:
+    net.tcp.sockets, net.tcp.state.<state>                 socket counts
+    net.tcp.listen.queued, net.tcp.listen.saturated        accept queues of LISTEN sockets
+    net.tcp.port.<port>.connections                        top local ports (non-LISTEN)
+    net.tcp.remote.<address>.connections                   top remote addresses (see below)
+    net.tcp.<counter>_per_sec, net.tcp.retrans_percent     snmp/netstat counter rates
+    net.udp.sockets, net.udp.rx_queue_bytes, net.udp.socket_drops, net.udp.<counter>_per_sec
+
+Addresses in URIs use "_" for "." and "-" for ":" (10_0_0_5, fe80--1); IPv4-mapped
+IPv6 peers are reported as IPv4.
+"""
+
+import functools
+import importlib.util
+import socket
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from utils.rate import RateCounter
+
+from .base import BaseCollector, register_collector
+
+if TYPE_CHECKING:  # numpy는 첫 수집 때 임포트합니다 (헤드리스 --once 시작 시간).
+    import numpy as np
+
+TOP_N: int = 10
+# /proc/net/tcp의 st 열 값 -> 상태 이름 (include/net/tcp_states.h)
+TCP_STATES: Dict[int, str] = {
+    0x01: "established",
+    0x02: "syn_sent",
+    0x03: "syn_recv",
+    0x04: "fin_wait1",
+    0x05: "fin_wait2",
+    0x06: "time_wait",
+    0x07: "close",
+    0x08: "close_wait",
+    0x09: "last_ack",
+    0x0A: "listen",
+    0x0B: "closing",
+    0x0C: "new_syn_recv",
+}
+TCP_LISTEN: int = 0x0A
+# (snmp/netstat 섹션, 카운터) -> URI 접미사 (초당 비율로 변환)
+COUNTER_FIELDS: Dict[Tuple[str, str], str] = {
+    ("Tcp", "RetransSegs"): "net.tcp.retrans_segs_per_sec",
+    ("Tcp", "OutSegs"): "net.tcp.out_segs_per_sec",
+    ("Tcp", "ActiveOpens"): "net.tcp.active_opens_per_sec",
+    ("Tcp", "PassiveOpens"): "net.tcp.passive_opens_per_sec",
+    ("Tcp", "AttemptFails"): "net.tcp.attempt_fails_per_sec",
+    ("Tcp", "EstabResets"): "net.tcp.estab_resets_per_sec",
+    ("Tcp", "OutRsts"): "net.tcp.out_rsts_per_sec",
+    ("TcpExt", "ListenOverflows"): "net.tcp.listen_overflows_per_sec",
+    ("TcpExt", "ListenDrops"): "net.tcp.listen_drops_per_sec",
+    ("TcpExt", "TCPTimeouts"): "net.tcp.timeouts_per_sec",
+    ("TcpExt", "TCPSynRetrans"): "net.tcp.syn_retrans_per_sec",
+    ("Udp", "InErrors"): "net.udp.in_errors_per_sec",
+    ("Udp", "RcvbufErrors"): "net.udp.rcvbuf_errors_per_sec",
+    ("Udp", "NoPorts"): "net.udp.no_ports_per_sec",
+}
+
+SMALL_TABLE_BYTES: int = 256 * 1024  # 약 1500행 미만은 줄 단위로 파싱 (numpy 임포트 생략)
+_NEWLINE, _COLON = ord("\n"), ord(":")
+_MAX_SL_DIGITS: int = 10  # "sl:" 콜론을 찾을 행 시작부터의 범위
+
+
+def _read(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read()  # seq_file 끝까지 한 번에 (대용량이면 내부에서 여러 번 read)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy_available() -> bool:
+    return importlib.util.find_spec("numpy") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _hex_lut() -> "np.ndarray":
+    """ASCII 바이트 -> 16진수 자릿값 표 (첫 사용 때 한 번 만듭니다)."""
+    import numpy as np
+
+    lut = np.zeros(256, dtype=np.uint64)
+    for value, char in enumerate("0123456789ABCDEF"):
+        lut[ord(char)] = lut[ord(char.lower())] = value
+    return lut
+
+
+def _hex_column(data: "np.ndarray", offsets: "np.ndarray", width: int) -> "np.ndarray":
+    """모든 행의 같은 위치에 있는 16진수 `width`자리를 한 번에 정수로 바꿉니다."""
+    import numpy as np
+
+    digits = _hex_lut()[data[offsets[:, None] + np.arange(width)]]
+    values = np.zeros(len(offsets), dtype=np.uint64)
+    for column in range(width):
+        values = (values << np.uint64(4)) | digits[:, column]
+    return values
+
+
+def _row_colons(data: "np.ndarray") -> "np.ndarray":
+    """헤더를 제외한 각 행의 `sl:` 콜론 위치 (sl 자릿수에 따라 열이 밀리므로 행마다 찾습니다)."""
+    import numpy as np
+
+    newlines = np.flatnonzero(data == _NEWLINE)
+    if len(newlines) < 2:
+        return np.empty(0, dtype=np.intp)
+    starts = newlines[:-1] + 1
+    colons = np.full(len(starts), -1, dtype=np.intp)
+    for shift in range(_MAX_SL_DIGITS, 0, -1):  # 가장 앞쪽 콜론이 남도록 뒤에서부터 덮어씀
+        positions = np.minimum(starts + shift, len(data) - 1)
+        is_colon = data[positions] == _COLON
+        colons[is_colon] = positions[is_colon]
+    return colons[colons >= 0]
+
+
+def _count_unique(columns: List["np.ndarray"]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Counts distinct rows of integer key columns (numeric sort; `np.unique(axis=0)`
+    sorts opaque void records and is several times slower).
+
+    Returns:
+        tuple: (unique keys with shape (len(columns), k), counts with shape (k,))
+    """
+    import numpy as np
+
+    if len(columns) == 1:
+        unique, counts = np.unique(columns[0], return_counts=True)
+        return unique[None, :], counts
+    order = np.lexsort(columns[::-1])
+    ordered = np.stack([column[order] for column in columns])
+    changed = np.any(ordered[:, 1:] != ordered[:, :-1], axis=0)
+    firsts = np.concatenate(([0], np.flatnonzero(changed) + 1))
+    counts = np.diff(np.append(firsts, ordered.shape[1]))
+    return ordered[:, firsts], counts
+
+
+def _address_text(words: Tuple[int, ...]) -> str:
+    """/proc/net의 호스트 바이트 순서 32비트 단어들을 주소 문자열로 바꿉니다."""
+    raw = b"".join(word.to_bytes(4, sys.byteorder) for word in words)
+    if len(raw) == 16 and raw[:12] == b"\x00" * 10 + b"\xff\xff":
+        raw = raw[12:]  # IPv4-mapped IPv6 (::ffff:a.b.c.d)는 IPv4로 합칩니다.
+    return socket.inet_ntop(socket.AF_INET6 if len(raw) == 16 else socket.AF_INET, raw)
+
+
+def _uri_address(address: str) -> str:
+    # URI 구분자(.)와 겹치지 않도록 바꿉니다. IPv6 주소에는 "."이 없으므로 되돌릴 수 있습니다.
+    return address.replace(".", "_").replace(":", "-")
+
+
+class _TcpTable:
+    """한 /proc/net/tcp* 파일을 집계한 결과"""
+
+    def __init__(self) -> None:
+        self.states: Dict[int, int] = {}  # st 값 -> 소켓 수
+        self.ports: Dict[int, int] = {}  # 로컬 포트 -> LISTEN이 아닌 소켓 수
+        self.remotes: Dict[str, int] = {}
+        self.listen_queued: int = 0
+        self.listen_saturated: int = 0
+
+
+def _nonzero_counts(counts: "np.ndarray") -> Dict[int, int]:
+    import numpy as np
+
+    nonzero = np.flatnonzero(counts)
+    return dict(zip(nonzero.tolist(), counts[nonzero].tolist()))
+
+
+def parse_tcp_table(content: bytes, address_words: int, top_n: int = TOP_N) -> _TcpTable:
+    """
+    Aggregates one `/proc/net/tcp` (address_words=1) or `tcp6` (address_words=4) table.
+    """
+    if len(content) < SMALL_TABLE_BYTES or not _numpy_available():
+        return _parse_tcp_rows(content, address_words, top_n)
+    return _parse_tcp_array(content, address_words, top_n)
+
+
+def _parse_tcp_rows(content: bytes, address_words: int, top_n: int) -> _TcpTable:
+    """작은 표를 줄 단위로 집계합니다 (`_parse_tcp_array`와 같은 결과)."""
+    table = _TcpTable()
+    hex_digits = 8 * address_words
+    remotes: Dict[bytes, int] = {}
+    # 헤더와, 줄바꿈으로 끝나지 않은 잘린 마지막 행(읽는 도중 테이블이 바뀐 경우)을 제외합니다.
+    for line in content.split(b"\n")[1:-1]:
+        fields = line.split(None, 5)
+        if len(fields) < 5 or len(fields[2]) != hex_digits + 5 or len(fields[4]) != 17:
+            continue
+        local, remote, state_hex, queues = fields[1:5]
+        state = int(state_hex, 16)
+        table.states[state] = table.states.get(state, 0) + 1
+        if state == TCP_LISTEN:
+            # LISTEN 소켓: rx_queue = accept 큐 길이, tx_queue = backlog 상한
+            backlog, queued = int(queues[:8], 16), int(queues[9:], 16)
+            table.listen_queued += queued
+            if backlog > 0 and queued >= backlog:
+                table.listen_saturated += 1
+            continue
+        port = int(local[-4:], 16)
+        table.ports[port] = table.ports.get(port, 0) + 1
+        raw_address = remote[:hex_digits]
+        if raw_address.strip(b"0"):  # 원격 주소 0 (아직 연결되지 않은 소켓) 제외
+            remotes[raw_address] = remotes.get(raw_address, 0) + 1
+    ranked = sorted(remotes.items(), key=lambda item: item[1], reverse=True)[:top_n]
+    word_bounds = [(start, start + 8) for start in range(0, hex_digits, 8)]
+    for raw_address, count in ranked:
+        words = tuple(int(raw_address[start:end], 16) for start, end in word_bounds)
+        address = _address_text(words)
+        table.remotes[address] = table.remotes.get(address, 0) + count
+    return table
+
+
+def _parse_tcp_array(content: bytes, address_words: int, top_n: int) -> _TcpTable:
+    """
+    큰 표를 numpy로 한 번에 집계합니다.
+
+    Column offsets relative to the `sl:` colon, with A = 8 * address_words hex digits:
+    local port +3+A, remote address +8+A, state +14+2A, tx_queue +17+2A, rx_queue +26+2A.
+    """
+    import numpy as np
+
+    table = _TcpTable()
+    data = np.frombuffer(content, dtype=np.uint8)
+    colons = _row_colons(data)
+    hex_digits = 8 * address_words
+    # 잘린 마지막 행(읽는 도중 테이블이 바뀐 경우)을 제외합니다.
+    colons = colons[colons + 34 + 2 * hex_digits <= len(data)]
+    if len(colons) == 0:
+        return table
+
+    states = _hex_column(data, colons + 14 + 2 * hex_digits, 2).astype(np.intp)
+    table.states = _nonzero_counts(np.bincount(states, minlength=256))
+
+    listening = states == TCP_LISTEN
+    if listening.any():
+        # LISTEN 소켓: rx_queue = accept 큐 길이, tx_queue = backlog 상한
+        listen_colons = colons[listening]
+        queued = _hex_column(data, listen_colons + 26 + 2 * hex_digits, 8)
+        backlog = _hex_column(data, listen_colons + 17 + 2 * hex_digits, 8)
+        table.listen_queued = int(queued.sum())
+        table.listen_saturated = int(np.count_nonzero((queued >= backlog) & (backlog > 0)))
+
+    connected = colons[~listening]
+    if len(connected) == 0:
+        return table
+    table.ports = _nonzero_counts(
+        np.bincount(_hex_column(data, connected + 3 + hex_digits, 4).astype(np.intp))
+    )
+    # 주소를 16자리(64비트) 단위 정수 열로 읽습니다: IPv4는 1열, IPv6는 2열.
+    remote_start = connected + 8 + hex_digits
+    chunks = [
+        _hex_column(data, remote_start + offset, min(16, hex_digits))
+        for offset in range(0, hex_digits, 16)
+    ]
+    unique_chunks, counts = _count_unique(chunks)
+    nonzero = np.any(unique_chunks != 0, axis=0)  # 원격 주소 0 (아직 연결되지 않은 소켓) 제외
+    unique_chunks, counts = unique_chunks[:, nonzero], counts[nonzero]
+    if len(counts) > top_n:
+        top = np.argpartition(counts, -top_n)[-top_n:]
+        unique_chunks, counts = unique_chunks[:, top], counts[top]
+    for row, count in zip(unique_chunks.T.tolist(), counts.tolist()):
+        words = row if address_words == 1 else [w for c in row for w in (c >> 32, c & 0xFFFFFFFF)]
+        address = _address_text(tuple(words))
+        table.remotes[address] = table.remotes.get(address, 0) + count
+    return table
+
+
+def parse_counter_sections(*contents: Optional[bytes]) -> Dict[Tuple[str, str], int]:
+    """`/proc/net/snmp`/`netstat`의 "섹션: 이름들" / "섹션: 값들" 줄 쌍을 읽습니다."""
+    counters: Dict[Tuple[str, str], int] = {}
+    for content in contents:
+        if not content:
+            continue
+        lines = content.splitlines()
+        for header, values in zip(lines[::2], lines[1::2]):
+            section, _, names = header.partition(b":")
+            value_section, _, numbers = values.partition(b":")
+            if section != value_section:
+                continue
+            prefix = section.decode()
+            for name, number in zip(names.split(), numbers.split()):
+                try:
+                    counters[(prefix, name.decode())] = int(number)
+                except ValueError:
+                    continue
+    return counters
+
+
+@register_collector
+class TcpSocketCollector(BaseCollector):
+    def __init__(self, proc_root: str = "/proc", top_n: int = TOP_N) -> None:
+        """
+        Args:
+            proc_root (str): procfs mount point (a fake tree can be used for testing).
+            top_n (int): Number of local ports / remote addresses reported each tick.
+        """
+        self.net_root = f"{proc_root}/net"
+        self.top_n = top_n
+        self._rates = RateCounter()
+
+    def get_state(self) -> Optional[Any]:
+        return self._rates.get_state()
+
+    def set_state(self, state: Any, max_age_seconds: Optional[float] = None) -> None:
+        self._rates.set_state(state, max_age_seconds)
+
+    def _collect_tcp(self) -> List[Tuple[str, float]]:
+        tables = []
+        for name, address_words in (("tcp", 1), ("tcp6", 4)):
+            content = _read(f"{self.net_root}/{name}")
+            if content is not None:
+                tables.append(parse_tcp_table(content, address_words, self.top_n))
+        if not tables:
+            return []
+
+        states: Dict[int, int] = {}
+        ports: Dict[int, int] = {}
+        remotes: Dict[str, int] = {}
+        for table in tables:
+            for totals, counts in ((states, table.states), (ports, table.ports)):
+                for key, count in counts.items():
+                    totals[key] = totals.get(key, 0) + count
+            for address, count in table.remotes.items():
+                remotes[address] = remotes.get(address, 0) + count
+
+        metrics: List[Tuple[str, float]] = [("net.tcp.sockets", float(sum(states.values())))]
+        metrics.extend(
+            (f"net.tcp.state.{name}", float(states.get(code, 0)))
+            for code, name in TCP_STATES.items()
+        )
+        metrics.append(("net.tcp.listen.queued", float(sum(t.listen_queued for t in tables))))
+        metrics.append(("net.tcp.listen.saturated", float(sum(t.listen_saturated for t in tables))))
+        top_ports = sorted(ports.items(), key=lambda item: item[1], reverse=True)
+        metrics.extend(
+            (f"net.tcp.port.{port}.connections", float(count))
+            for port, count in top_ports[: self.top_n]
+        )
+        top_remotes = sorted(remotes.items(), key=lambda item: item[1], reverse=True)
+        metrics.extend(
+            (f"net.tcp.remote.{_uri_address(address)}.connections", float(count))
+            for address, count in top_remotes[: self.top_n]
+        )
+        return metrics
+
+    def _collect_udp(self) -> List[Tuple[str, float]]:
+        sockets = rx_queue = drops = 0
+        found = False
+        for name in ("udp", "udp6"):
+            content = _read(f"{self.net_root}/{name}")
+            if content is None:
+                continue
+            found = True
+            for line in content.splitlines()[1:]:
+                fields = line.split()
+                if len(fields) < 13:
+                    continue
+                sockets += 1
+                rx_queue += int(fields[4].partition(b":")[2], 16)
+                drops += int(fields[-1])
+        if not found:
+            return []
+        return [
+            ("net.udp.sockets", float(sockets)),
+            ("net.udp.rx_queue_bytes", float(rx_queue)),
+            ("net.udp.socket_drops", float(drops)),
+        ]
+
+    def _collect_counters(self, now: float) -> List[Tuple[str, float]]:
+        counters = parse_counter_sections(
+            _read(f"{self.net_root}/snmp"), _read(f"{self.net_root}/netstat")
+        )
+        metrics: List[Tuple[str, float]] = []
+        rates: Dict[str, float] = {}
+        for key, uri in COUNTER_FIELDS.items():
+            if key not in counters:
+                continue
+            rate = self._rates.rate(key, counters[key], now)
+            if rate is not None:
+                rates[uri] = rate
+                metrics.append((uri, rate))
+        out_segs = rates.get("net.tcp.out_segs_per_sec")
+        retrans = rates.get("net.tcp.retrans_segs_per_sec")
+        if out_segs and retrans is not None:
+            metrics.append(("net.tcp.retrans_percent", retrans / out_segs * 100.0))
+        return metrics
+
+    def collect(self) -> List[Tuple[str, float]]:
+        now = time.monotonic()
+        metrics: List[Tuple[str, float]] = []
+        for part in (self._collect_tcp, self._collect_udp, lambda: self._collect_counters(now)):
+            try:
+                metrics.extend(part())
+            except Exception as e:
+                print(f"[WARN][TcpSocketCollector] 소켓 통계 수집 실패: {e}")
+        return metrics
@@ -0,0 +1,122 @@
+# collectors/thread_sampler.py
+"""
+Per-thread sampler for a single process.
+
+Reads `/proc/[pid]/task/*/stat` (and `wchan`) for one process only. It is not a
+registered collector: the thread drill-down panel creates it when it opens,
+samples it at its own, faster interval and drops it when it closes, so the
+regular collection tick never pays for per-thread reads.
+"""
+
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from utils.rate import RateCounter
+
+# stat에서 ')' 뒤 필드 기준 인덱스 (fields[0]은 stat의 3번째 필드 state)
+_STATE, _UTIME, _STIME, _PRIORITY, _NICE, _START_TIME, _PROCESSOR = 0, 11, 12, 15, 16, 19, 36
+
+
+class ThreadSampler:
+    """
+    Samples the threads of one process and turns their CPU ticks into percentages.
+    """
+
+    def __init__(self, pid: int, proc_root: str = "/proc") -> None:
+        """
+        Args:
+            pid (int): Process to sample.
+            proc_root (str): procfs mount point.
+        """
+        self.pid = pid
+        self.proc_root = proc_root
+        self._task_dir = f"{proc_root}/{pid}/task"
+        self._rates = RateCounter()
+        self._clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        # 패널을 연 뒤 PID가 재사용되면 다른 프로세스를 보여주지 않도록 시작 시각을 기억합니다.
+        self._start_time = self._process_start_time()
+
+    def _process_start_time(self) -> Optional[int]:
+        stat = self._read(f"{self.proc_root}/{self.pid}/stat")
+        if stat is None:
+            return None
+        fields_start = stat.rfind(b")") + 2
+        try:
+            return int(stat[fields_start:].split()[_START_TIME])
+        except (ValueError, IndexError):
+            return None
+
+    def _read(self, path: str) -> Optional[bytes]:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            return None
+
+    def _read_thread(self, tid: int, now: float) -> Optional[Dict[str, Any]]:
+        base = f"{self._task_dir}/{tid}"
+        stat = self._read(f"{base}/stat")
+        if stat is None:
+            return None
+        # comm은 괄호 안에 공백을 포함할 수 있으므로 마지막 ')' 기준으로 분리합니다.
+        comm_start = stat.find(b"(") + 1
+        comm_end = stat.rfind(b")")
+        fields_start = comm_end + 2
+        name = stat[comm_start:comm_end].decode(errors="replace")
+        fields = stat[fields_start:].split()
+        utime, stime = int(fields[_UTIME]), int(fields[_STIME])
+        identity = (tid, int(fields[_START_TIME]))  # TID 재사용과 섞이지 않도록
+        user_rate = self._rates.rate((identity, "utime"), utime, now)
+        system_rate = self._rates.rate((identity, "stime"), stime, now)
+        scale = 100.0 / self._clock_ticks
+
+        wchan = (self._read(f"{base}/wchan") or b"").decode(errors="replace").strip()
+        return {
+            "tid": tid,
+            "name": name,
+            "state": fields[_STATE].decode(),
+            "user_percent": user_rate * scale if user_rate is not None else None,
+            "system_percent": system_rate * scale if system_rate is not None else None,
+            "cpu_percent": (
+                (user_rate + system_rate) * scale
+                if user_rate is not None and system_rate is not None
+                else None
+            ),
+            "processor": int(fields[_PROCESSOR]) if len(fields) > _PROCESSOR else None,
+            "priority": int(fields[_PRIORITY]),
+            "nice": int(fields[_NICE]),
+            # "0"은 실행 중(대기 함수 없음), 빈 값은 권한 없음 (kptr_restrict)
+            "wchan": "" if wchan == "0" else wchan,
+        }
+
+    def sample(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Reads every thread of the process once.
+
+        Returns:
+            list | None: Thread records sorted by CPU (first sample: rates are None),
+                or None when the process has exited.
+        """
+        now = time.monotonic()
+        if self._start_time is None or self._process_start_time() != self._start_time:
+            return None
+        try:
+            entries = os.listdir(self._task_dir)
+        except (FileNotFoundError, ProcessLookupError):
+            return None
+        except PermissionError:
+            return []
+        threads: List[Dict[str, Any]] = []
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+            try:
+                record = self._read_thread(int(entry), now)
+            except (ValueError, IndexError):
+                record = None  # 읽는 도중 스레드가 종료되어 잘린 내용
+            if record is not None:
+                threads.append(record)
+        self._rates.sweep()  # 종료된 스레드의 이전 샘플 제거
+        threads.sort(key=lambda t: (t["cpu_percent"] or 0.0, t["tid"]), reverse=True)
+        return threads
@@ -1,15 +1,49 @@
 # apps/collectors/top_processes.py (수정됨)
-from typing import Any, Dict, List  # Tuple 대신 Dict, Any 임포트
-
-import psutil
+from typing import Any, Dict, List, Optional  # Tuple 대신 Dict, Any 임포트
 
 from .base import BaseCollector, register_collector
+from .process_engine import ProcessEngine
+from .process_tree import ProcessTree, ProcessTreeSnapshot
+
+TOP_N: int = 10  # 정렬 키별로 유지할 상위 프로세스 수 (TopProcessesWidget에서 10개를 사용)
 
 
 @register_collector
 class TopProcessCollector(BaseCollector):
+    def __init__(self) -> None:
+        self.engine = ProcessEngine(top_n=TOP_N)
+        self.tree = ProcessTree()
+        # 마지막 샘플의 트리 (UI는 이 참조만 읽으므로 다음 수집과 경합하지 않습니다)
+        self.tree_snapshot: Optional[ProcessTreeSnapshot] = None
+
+    def get_state(self) -> Optional[Any]:
+        return self.engine.get_state()
+
+    def set_state(self, state: Any, max_age_seconds: Optional[float] = None) -> None:
+        self.engine.set_state(state, max_age_seconds)
+
     # 반환 타입을 List[Dict[str, Any]]로 변경
     def collect(self) -> List[Dict[str, Any]]:
+        # /proc이 있으면 I/O, 컨텍스트 스위치, fd, 스레드 수까지 포함하는 엔진을 사용합니다.
+        # 반환값은 각 정렬 키별 상위 TOP_N의 합집합이며, 정렬은 위젯에서 수행합니다.
+        if self.engine.available:
+            try:
+                top = self.engine.sample()
+            except Exception as e:
+                print(f"[WARN][TopProcessCollector] /proc 프로세스 수집 실패: {e}")
+                return []
+            try:
+                self.tree.update(self.engine.last_records)
+                self.tree_snapshot = self.tree.snapshot(self.engine.last_records)
+            except Exception as e:
+                print(f"[WARN][TopProcessCollector] 프로세스 트리 갱신 실패: {e}")
+            return top
+        return self._collect_psutil()
+
+    def _collect_psutil(self) -> List[Dict[str, Any]]:
+        """procfs가 없는 플랫폼용: CPU/메모리만 수집합니다."""
+        import psutil  # procfs가 있으면 필요 없으므로 대체 경로에서만 임포트합니다.
+
         procs_data: List[Dict[str, Any]] = []  # 타입 명시
         try:
             pids = psutil.pids()
@@ -39,8 +73,7 @@ class TopProcessCollector(BaseCollector):
                 reverse=True,
             )
 
-            # 상위 10개 프로세스 정보를 반환합니다 (TopProcessesWidget에서 10개를 사용).
-            return sorted_procs[:10]
+            return sorted_procs[:TOP_N]
 
         except Exception as e:
             print(f"[WARN][TopProcessCollector] 상위 프로세스 수집 실패: {e}")
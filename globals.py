@@ -22,6 +22,11 @@ def set_instantiated_collectors(collectors: List[BaseCollector]) -> None:
     _instantiated_collectors_cache = collectors
 
 
+def add_instantiated_collector(collector: BaseCollector) -> None:
+    """Appends a collector that finished initializing to the cached list."""
+    _instantiated_collectors_cache.append(collector)
+
+
 def get_log_writer_instance() -> Optional[LogWriter]:
     """Returns the cached LogWriter instance."""
     return _log_writer_instance_cache
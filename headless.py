@@ -0,0 +1,281 @@
+# headless.py
+"""
+Headless output modes (no Textual, no widgets).
+
+    python main.py --once                  # one JSON snapshot
+    python main.py --stream --interval 5   # one NDJSON line per interval
+
+Collectors are discovered and instantiated exactly as the dashboard does it
+(`collectors.discovery` -> `collector_registry`), then every collector of a pass
+runs concurrently: async collectors on the event loop, the others in the thread
+pool. Nothing here imports `app`/`textual`. `--once` with the default collectors
+(all synchronous) runs on a plain thread pool and does not import asyncio either;
+the event loop is only started for `--stream` or when an async collector (e.g.
+CommandCollector) is enabled.
+
+Output object:
+    {"ts": ISO-8601 UTC, "host": hostname, "elapsed_ms": pass duration,
+     "metrics": {uri: value}, "processes": [TopProcessCollector records],
+     "errors": {collector: message}}
+
+Collector warnings go to stderr so stdout stays machine-readable. Rates that
+need two samples (CPU %, I/O per second, ...) are absent or null in a `--once`
+snapshot; use `--stream` when those matter.
+"""
+
+import contextlib
+import datetime
+import json
+import os
+import socket
+import sys
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional
+
+from collectors.base import BaseCollector
+from collectors.discovery import CollectorSpec, discover_collectors
+
+COLLECTOR_CONFIG_PATH: Path = Path(__file__).resolve().parent / "collectors.json"
+DEFAULT_STREAM_INTERVAL_SECONDS: float = 2.0
+# 대시보드 전용 기능을 위한 컬렉터 (명시적으로 --only에 적지 않으면 헤드리스에서 제외)
+HEADLESS_EXCLUDED: frozenset = frozenset({"LogIndexCollector"})
+MAX_WORKERS: int = 16
+CO_COROUTINE: int = 0x80  # inspect.CO_COROUTINE (inspect/asyncio 임포트 없이 검사하기 위해)
+
+
+def _is_coroutine_function(func: Callable[..., Any]) -> bool:
+    code = getattr(func, "__code__", None)
+    return code is not None and bool(code.co_flags & CO_COROUTINE)
+
+
+def _instantiate(spec: CollectorSpec) -> Optional[BaseCollector]:
+    if not spec.is_available():
+        return None
+    try:
+        return spec.instantiate()
+    except Exception as e:
+        print(f"[WARN][headless] 컬렉터 {spec.name} 인스턴스화 실패: {e}", file=sys.stderr)
+        return None
+
+
+def load_collectors(
+    pool: Executor,
+    only: Optional[List[str]] = None,
+    extra_collectors: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[BaseCollector]:
+    """
+    Discovers the enabled collectors and probes/instantiates them concurrently.
+
+    Args:
+        pool (Executor): Thread pool the probes and constructors run in.
+        only (list | None): Collector names to run (others are skipped).
+        extra_collectors (dict | None): Name -> constructor options enabled regardless
+            of collectors.json (e.g. `--synthetic-series`).
+
+    Returns:
+        list: Ready collectors, in discovery order.
+    """
+    enable = dict(extra_collectors or {})
+    for name in only or []:
+        enable.setdefault(name, {})
+    specs = discover_collectors(COLLECTOR_CONFIG_PATH, enable, exclusive=bool(only))
+    if not only:
+        specs = [spec for spec in specs if spec.name not in HEADLESS_EXCLUDED]
+    return [collector for collector in pool.map(_instantiate, specs) if collector is not None]
+
+
+def _build_snapshot(
+    collectors: List[BaseCollector],
+    results: List[Any],
+    ts: datetime.datetime,
+    started: float,
+) -> Dict[str, Any]:
+    """컬렉터별 결과(또는 예외)를 하나의 출력 객체로 합칩니다."""
+    metrics: Dict[str, Any] = {}
+    processes: List[Dict[str, Any]] = []
+    errors: Dict[str, str] = {}
+    for collector, result in zip(collectors, results):
+        name = collector.__class__.__name__
+        if isinstance(result, BaseException):
+            errors[name] = str(result) or result.__class__.__name__
+            continue
+        if name == "TopProcessCollector":
+            processes = list(result or [])
+            continue
+        for item in result or []:
+            if isinstance(item, tuple) and len(item) == 2:
+                metrics[item[0]] = item[1]
+    return {
+        "ts": ts.isoformat(),
+        "host": socket.gethostname(),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        "metrics": metrics,
+        "processes": processes,
+        "errors": errors,
+    }
+
+
+def collect_snapshot_in_threads(collectors: List[BaseCollector], pool: Executor) -> Dict[str, Any]:
+    """Runs every (synchronous) collector once in `pool`, concurrently, without an event loop."""
+    ts = datetime.datetime.now(datetime.timezone.utc)
+    started = time.perf_counter()
+    futures = [pool.submit(collector.collect) for collector in collectors]
+    results: List[Any] = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+    return _build_snapshot(collectors, results, ts, started)
+
+
+async def _run_collector(collector: BaseCollector) -> Any:
+    import asyncio
+
+    if _is_coroutine_function(collector.collect):
+        return await collector.collect()  # type: ignore[misc]
+    return await asyncio.get_running_loop().run_in_executor(None, collector.collect)
+
+
+async def collect_snapshot(collectors: List[BaseCollector]) -> Dict[str, Any]:
+    """Runs every collector once, concurrently, and merges the results into one object."""
+    import asyncio
+
+    ts = datetime.datetime.now(datetime.timezone.utc)
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_run_collector(collector) for collector in collectors), return_exceptions=True
+    )
+    return _build_snapshot(collectors, list(results), ts, started)
+
+
+def _write(out: IO[str], snapshot: Dict[str, Any], indent: Optional[int] = None) -> None:
+    # 스크립트가 바로 읽을 수 있도록 줄마다 flush합니다 (NaN/Inf 등 비표준 값은 문자열로).
+    out.write(json.dumps(snapshot, indent=indent, ensure_ascii=False, default=str) + "\n")
+    out.flush()
+
+
+def _warn_close_failed(collector: BaseCollector, error: Any) -> None:
+    print(
+        f"[WARN][headless] {collector.__class__.__name__} 종료 실패: {error}",
+        file=sys.stderr,
+    )
+
+
+async def _close_collectors(collectors: List[BaseCollector]) -> None:
+    for collector in collectors:
+        aclose = getattr(collector, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception as e:
+                _warn_close_failed(collector, e)
+
+
+def _close_collectors_without_loop(collectors: List[BaseCollector]) -> None:
+    """
+    동기 컬렉터의 aclose()는 아무것도 await하지 않으므로, 이벤트 루프 없이 코루틴을
+    한 번 진행시켜 끝까지 실행합니다.
+    """
+    for collector in collectors:
+        aclose = getattr(collector, "aclose", None)
+        if aclose is None:
+            continue
+        coroutine = aclose()
+        try:
+            coroutine.send(None)
+        except StopIteration:
+            continue
+        except Exception as e:
+            _warn_close_failed(collector, e)
+            continue
+        coroutine.close()
+        _warn_close_failed(collector, "aclose()가 이벤트 루프를 기다립니다")
+
+
+def run_once(out: IO[str], collectors: List[BaseCollector], pool: Executor) -> None:
+    """Writes one JSON snapshot of synchronous collectors (no event loop)."""
+    try:
+        _write(out, collect_snapshot_in_threads(collectors, pool), indent=2)
+    finally:
+        _close_collectors_without_loop(collectors)
+
+
+async def run_headless(
+    out: IO[str],
+    collectors: List[BaseCollector],
+    pool: Executor,
+    stream: bool = False,
+    interval: float = DEFAULT_STREAM_INTERVAL_SECONDS,
+    count: Optional[int] = None,
+) -> None:
+    """
+    Writes one JSON snapshot (`stream=False`) or NDJSON lines every `interval` seconds.
+
+    Args:
+        out (IO): Where snapshots are written (stdout).
+        collectors (list): Collectors from `load_collectors`.
+        pool (Executor): Thread pool used as the loop's default executor.
+        stream (bool): Keep sampling until interrupted (or `count` lines were written).
+        interval (float): Seconds between stream lines, measured start to start.
+        count (int | None): Stop the stream after this many lines.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(pool)
+    try:
+        if not stream:
+            _write(out, await collect_snapshot(collectors), indent=2)
+            return
+        written = 0
+        next_tick = loop.time()
+        while count is None or written < count:
+            _write(out, await collect_snapshot(collectors))
+            written += 1
+            if count is not None and written >= count:
+                break
+            # 수집 시간만큼 밀리지 않도록 시작 시각 기준으로 다음 틱을 잡습니다.
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+    finally:
+        await _close_collectors(collectors)
+
+
+def main_headless(
+    stream: bool = False,
+    interval: float = DEFAULT_STREAM_INTERVAL_SECONDS,
+    count: Optional[int] = None,
+    only: Optional[List[str]] = None,
+    extra_collectors: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> int:
+    """
+    Entry point used by main.py. Returns the process exit code.
+
+    Collector warnings printed to stdout are redirected to stderr for the duration.
+    """
+    out = sys.stdout
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                collectors = load_collectors(pool, only, extra_collectors)
+                if not collectors:
+                    print("[WARN][headless] 사용 가능한 컬렉터가 없습니다.", file=sys.stderr)
+                if not stream and not any(
+                    _is_coroutine_function(collector.collect) for collector in collectors
+                ):
+                    run_once(out, collectors, pool)
+                    return 0
+                import asyncio  # --stream이거나 비동기 컬렉터가 있을 때만 (임포트 비용이 큼)
+
+                asyncio.run(run_headless(out, collectors, pool, stream, interval, count))
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # `| head` 등으로 읽는 쪽이 먼저 닫힌 경우: 종료 시 다시 flush하다 실패하지 않도록
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, out.fileno())
+        return 0
+    return 0
@@ -2,25 +2,257 @@
 
 """
 Main entry point for the Pysnoop Monitoring Dashboard application.
-Initializes and runs the Textual application.
+Initializes and runs the Textual application, or one of the headless modes
+(`--once`, `--stream`, `--stress-run`) that never import Textual.
 """
 
+from utils import startup_timer  # Imported first so startup is timed from here
 
-from app import MonitoringDashboardApp  # Import the main app class
+# isort: split
+import argparse
+import datetime
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 
-def main_dashboard() -> None:
+def _parse_clock(value: str) -> datetime.time:
+    """'HH:MM' 또는 'HH:MM:SS' 형식의 시각을 파싱합니다."""
+    try:
+        return datetime.time.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"시각 형식이 잘못되었습니다 (HH:MM[:SS]): {value}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pysnoop 실시간 시스템 모니터링 대시보드")
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        metavar="FILE",
+        help="기록된 logs/metrics-YYYYMMDD.jsonl 파일을 대시보드로 재생합니다.",
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="리플레이 배속 (기본값: 1, 예: 10, 100)"
+    )
+    parser.add_argument(
+        "--start", type=_parse_clock, metavar="HH:MM", help="리플레이를 시작할 시각 (로컬 시간)"
+    )
+    parser.add_argument(
+        "--shm-name",
+        default="pysnoop_metrics",
+        metavar="NAME",
+        help="최신 메트릭을 게시할 공유 메모리 세그먼트 이름 (기본값: pysnoop_metrics)",
+    )
+    parser.add_argument(
+        "--no-shm", action="store_true", help="공유 메모리 스냅숏을 게시하지 않습니다."
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="OpenMetrics/Prometheus 엔드포인트(/metrics)를 이 포트로 엽니다 (예: 9464).",
+    )
+    parser.add_argument(
+        "--metrics-host",
+        default="127.0.0.1",
+        metavar="HOST",
+        help="메트릭 엔드포인트 바인드 주소 (기본값: 127.0.0.1)",
+    )
+
+    headless = parser.add_argument_group("헤드리스 출력 (Textual 없이 stdout으로)")
+    output_mode = headless.add_mutually_exclusive_group()
+    output_mode.add_argument(
+        "--once",
+        action="store_true",
+        help="모든 컬렉터를 한 번 동시에 실행하고 JSON 스냅숏을 출력한 뒤 종료합니다.",
+    )
+    output_mode.add_argument(
+        "--stream",
+        action="store_true",
+        help="--interval마다 NDJSON 한 줄씩 출력합니다 (Ctrl+C로 종료).",
+    )
+    headless.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        metavar="SECONDS",
+        help="--stream 출력 간격 (기본값: 2)",
+    )
+    headless.add_argument(
+        "--count", type=int, metavar="N", help="--stream에서 N줄을 출력한 뒤 종료합니다."
+    )
+    headless.add_argument(
+        "--only",
+        metavar="NAME[,NAME...]",
+        help="실행할 컬렉터 이름 (쉼표 구분, 예: PressureMemoryCollector,IoThroughputCollector)",
+    )
+
+    fleet = parser.add_argument_group("플릿 모드 (여러 호스트의 --stream 출력을 한 화면에)")
+    fleet.add_argument(
+        "--fleet",
+        type=Path,
+        metavar="FILE",
+        help="호스트 목록 JSON (ssh/tcp/command, 형식은 utils/fleet.py 참고)",
+    )
+    fleet.add_argument(
+        "--fleet-host",
+        action="append",
+        default=[],
+        metavar="KIND:TARGET",
+        help="호스트 추가 (반복 가능): ssh:user@host, tcp:host:port, cmd:'명령'",
+    )
+    fleet.add_argument(
+        "--fleet-synthetic",
+        type=int,
+        metavar="N",
+        help="원격 없이 가짜 NDJSON 스트림 N개로 플릿 화면을 띄웁니다 (예: 500).",
+    )
+
+    synthetic = parser.add_argument_group("합성 부하 (SyntheticLoadCollector)")
+    synthetic.add_argument(
+        "--synthetic-series",
+        type=int,
+        metavar="N",
+        help="합성 시리즈 N개를 만드는 컬렉터를 켭니다 (예: 50000).",
+    )
+    synthetic.add_argument(
+        "--synthetic-profile",
+        choices=("series", "containers", "processes"),
+        default="series",
+        help="URI 모양: synthetic.*, docker.container.*, top_cpu/top_mem.* (기본값: series)",
+    )
+    synthetic.add_argument(
+        "--synthetic-distribution",
+        choices=("constant", "uniform", "normal", "walk", "spiky"),
+        default="walk",
+        help="값 분포 (기본값: walk)",
+    )
+    synthetic.add_argument(
+        "--synthetic-churn",
+        type=float,
+        default=0.0,
+        metavar="RATE",
+        help="틱마다 새 id로 교체할 시리즈 비율 (예: 0.01)",
+    )
+    synthetic.add_argument("--synthetic-seed", type=int, help="난수 시드")
+    synthetic.add_argument(
+        "--stress-run",
+        action="store_true",
+        help="화면 없이 합성 부하만으로 틱을 연속 실행하고 지연 백분위수와 메모리 증가를 출력합니다.",
+    )
+    synthetic.add_argument("--ticks", type=int, default=30, help="스트레스 실행 틱 수 (기본값: 30)")
+    synthetic.add_argument(
+        "--warmup-ticks", type=int, default=3, help="측정 전에 버릴 틱 수 (기본값: 3)"
+    )
+    synthetic.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="스트레스 실행 중 메모리가 늘어난 상위 할당 위치를 함께 출력합니다.",
+    )
+    return parser.parse_args(argv)
+
+
+def synthetic_options(args: argparse.Namespace) -> Optional[Dict[str, Any]]:
+    """--synthetic-* 인자를 SyntheticLoadCollector 생성자 옵션으로 바꿉니다."""
+    if args.synthetic_series is None and not args.stress_run:
+        return None
+    options: Dict[str, Any] = {
+        "series": args.synthetic_series if args.synthetic_series is not None else 10000,
+        "profile": args.synthetic_profile,
+        "distribution": args.synthetic_distribution,
+        "churn_rate": args.synthetic_churn,
+    }
+    if args.synthetic_seed is not None:
+        options["seed"] = args.synthetic_seed
+    return options
+
+
+def fleet_specs(args: argparse.Namespace) -> Optional[List[Any]]:
+    """--fleet/--fleet-host/--fleet-synthetic 인자를 HostSpec 목록으로 바꿉니다."""
+    if args.fleet is None and not args.fleet_host and not args.fleet_synthetic:
+        return None
+    from utils.fleet import load_fleet_config, parse_host_argument, synthetic_specs
+
+    try:
+        specs = load_fleet_config(args.fleet) if args.fleet is not None else []
+        specs += [parse_host_argument(value) for value in args.fleet_host]
+    except (OSError, ValueError) as e:
+        sys.exit(f"ERROR: 플릿 설정을 읽지 못했습니다: {e}")
+    specs += synthetic_specs(args.fleet_synthetic or 0)
+    if not specs:
+        sys.exit("ERROR: 플릿에 호스트가 없습니다.")
+    return specs
+
+
+def main_dashboard(args: argparse.Namespace) -> None:
     """메인 대시보드 애플리케이션을 실행합니다."""
+    options = synthetic_options(args)
+    if args.once or args.stream:
+        from headless import main_headless
+
+        only = (
+            [name.strip() for name in args.only.split(",") if name.strip()] if args.only else None
+        )
+        sys.exit(
+            main_headless(
+                stream=args.stream,
+                interval=args.interval,
+                count=args.count,
+                only=only,
+                extra_collectors={"SyntheticLoadCollector": options} if options else None,
+            )
+        )
+
+    if args.stress_run:
+        from stress_run import main_stress
+
+        assert options is not None
+        main_stress(
+            options,
+            ticks=args.ticks,
+            warmup_ticks=args.warmup_ticks,
+            trace_allocations=args.tracemalloc,
+        )
+        return
+
+    specs = fleet_specs(args)  # 설정 오류는 Textual을 임포트하기 전에 알립니다.
+    from app import MonitoringDashboardApp  # 헤드리스 모드가 Textual을 임포트하지 않도록 여기서
+
+    startup_timer.mark("app_imported")
+
+    if args.replay is not None:
+        print(f"애플리케이션 초기화 중 (리플레이 모드: {args.replay})...")
+        app = MonitoringDashboardApp(
+            replay_path=args.replay, replay_speed=args.speed, replay_start=args.start
+        )
+        app.run()
+        return
+
+    if specs is not None:
+        print(f"애플리케이션 초기화 중 (플릿 모드: 호스트 {len(specs)}대)...")
+        MonitoringDashboardApp(fleet_specs=specs).run()
+        return
+
     print("애플리케이션 초기화 중 (대시보드 모드)...")
     # Consider any pre-initialization steps if needed here
     # For example, setting up logging for the very start of the app
 
     # Create an instance of the app
-    app = MonitoringDashboardApp()
+    extra_collectors = {"SyntheticLoadCollector": options} if options is not None else None
+    metrics_address = (
+        (args.metrics_host, args.metrics_port) if args.metrics_port is not None else None
+    )
+    app = MonitoringDashboardApp(
+        extra_collectors=extra_collectors,
+        shm_name=None if args.no_shm else args.shm_name,
+        metrics_address=metrics_address,
+    )
+    startup_timer.mark("app_constructed")
 
     # Run the app
     app.run()
 
 
 if __name__ == "__main__":
-    main_dashboard()
+    main_dashboard(parse_args())
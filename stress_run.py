@@ -0,0 +1,203 @@
+# stress_run.py
+"""
+Headless stress run.
+
+Drives the real dashboard (`MonitoringDashboardApp` under Textual's test driver)
+with `SyntheticLoadCollector` only, calling `run_metric_collection_background()`
+back to back, so every tick goes through the same collector -> MetricCache ->
+deadband/LogWriter -> alerts/anomaly detector -> widget path as a live session.
+
+Reported per tick:
+    * collect: `run_metric_collection_background()` (collection, cache, log queue, alerts)
+    * total:   collect plus everything the event loop runs before going idle again
+               (widget refresh/render, LogWriter file writes)
+    * RSS growth after the warm-up ticks (and the top allocation sites with --tracemalloc)
+
+Usage:
+    python main.py --stress-run --synthetic-series 50000 --synthetic-churn 0.01 --ticks 30
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import globals
+from app import MonitoringDashboardApp
+from utils.log_writer import LogWriter
+
+STRESS_SCREEN_SIZE = (160, 60)
+TRACEMALLOC_TOP_SITES: int = 10
+PAGE_SIZE: int = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_bytes() -> int:
+    """현재 프로세스의 RSS (Linux: /proc/self/statm, 그 외: 최대 RSS로 대체)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """정렬된 목록에서 nearest-rank 백분위수를 구합니다."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _slope(values: List[float]) -> float:
+    """틱 번호에 대한 최소제곱 기울기 (틱당 증가량)."""
+    count = len(values)
+    if count < 2:
+        return 0.0
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    denominator = sum((x - mean_x) ** 2 for x in range(count))
+    return numerator / denominator
+
+
+def _latency_summary(durations: List[float]) -> Dict[str, float]:
+    ordered = sorted(durations)
+    return {
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p90_ms": percentile(ordered, 0.90) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+    }
+
+
+async def run_stress(
+    collector_options: Dict[str, Any],
+    ticks: int = 30,
+    warmup_ticks: int = 3,
+    trace_allocations: bool = False,
+    log_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Runs the stress loop and returns the measurements.
+
+    Args:
+        collector_options (dict): Constructor options of `SyntheticLoadCollector`.
+        ticks (int): Measured ticks.
+        warmup_ticks (int): Ticks run before measuring (first allocation of every series).
+        trace_allocations (bool): Also report the top allocation sites that grew
+            during the measured ticks (tracemalloc slows the ticks down noticeably).
+        log_dir (Path | None): Where LogWriter writes; a temporary directory by default.
+
+    Returns:
+        dict: Latency summaries, memory growth and counters (see `format_report`).
+    """
+    with tempfile.TemporaryDirectory(prefix="pysnoop-stress-") as temp_dir:
+        # 실제 logs/에 합성 메트릭이 섞이지 않도록 별도 디렉터리의 LogWriter를 먼저 등록합니다.
+        log_writer = LogWriter(log_dir=log_dir or Path(temp_dir))
+        globals.set_log_writer_instance(log_writer)
+        app = MonitoringDashboardApp(
+            extra_collectors={"SyntheticLoadCollector": collector_options}, stress_mode=True
+        )
+        try:
+            async with app.run_test(headless=True, size=STRESS_SCREEN_SIZE) as pilot:
+                await app.workers.wait_for_complete()
+                if not globals.get_instantiated_collectors():
+                    raise RuntimeError("SyntheticLoadCollector를 로드하지 못했습니다.")
+                collector = globals.get_instantiated_collectors()[0]
+
+                for _ in range(warmup_ticks):
+                    await app.run_metric_collection_background()
+                    await pilot.pause()
+                if trace_allocations:
+                    tracemalloc.start()
+                    baseline = tracemalloc.take_snapshot()
+
+                collect_durations: List[float] = []
+                total_durations: List[float] = []
+                rss_samples: List[float] = []
+                max_log_backlog = 0
+                rss_start = current_rss_bytes()
+                for _ in range(ticks):
+                    started = time.perf_counter()
+                    await app.run_metric_collection_background()
+                    collected = time.perf_counter()
+                    await pilot.pause()  # 위젯 갱신/렌더링까지 포함
+                    finished = time.perf_counter()
+                    collect_durations.append(collected - started)
+                    total_durations.append(finished - started)
+                    rss_samples.append(float(current_rss_bytes()))
+                    max_log_backlog = max(max_log_backlog, log_writer.queue.qsize())
+
+                drain_started = time.perf_counter()
+                await log_writer.queue.join()
+                drain_seconds = time.perf_counter() - drain_started
+
+                top_sites: List[str] = []
+                if trace_allocations:
+                    stats = tracemalloc.take_snapshot().compare_to(baseline, "lineno")
+                    top_sites = [str(stat) for stat in stats[:TRACEMALLOC_TOP_SITES]]
+                    tracemalloc.stop()
+
+                cache_entries = len(await app.metric_cache.snapshot())
+                deadband_stats = app.deadband.stats()
+        finally:
+            globals.set_log_writer_instance(None)
+            globals.set_instantiated_collectors([])
+
+    return {
+        "options": collector_options,
+        "ticks": ticks,
+        "samples_per_tick": getattr(collector, "last_sample_count", 0),
+        "collect": _latency_summary(collect_durations),
+        "total": _latency_summary(total_durations),
+        "rss_start_bytes": rss_start,
+        "rss_end_bytes": int(rss_samples[-1]) if rss_samples else rss_start,
+        "rss_growth_per_tick_bytes": _slope(rss_samples),
+        "cache_entries": cache_entries,
+        "series_born": getattr(collector, "total_births", 0),
+        "max_log_backlog": max_log_backlog,
+        "log_drain_seconds": drain_seconds,
+        "deadband_compression_ratio": deadband_stats.get("compression_ratio"),
+        "top_allocation_sites": top_sites,
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """`run_stress()` 결과를 사람이 읽기 좋은 여러 줄 텍스트로 바꿉니다."""
+    mib = 1024 * 1024
+    lines = [
+        f"스트레스 실행: {report['options']}",
+        f"틱 {report['ticks']}회, 틱당 샘플 {report['samples_per_tick']}개, "
+        f"누적 신규 시리즈 {report['series_born']}개",
+    ]
+    for key, label in (("collect", "수집+캐시+로그"), ("total", "렌더링·로그 쓰기 포함")):
+        summary = report[key]
+        lines.append(
+            f"  {label:<16} p50={summary['p50_ms']:.1f}ms p90={summary['p90_ms']:.1f}ms "
+            f"p99={summary['p99_ms']:.1f}ms max={summary['max_ms']:.1f}ms"
+        )
+    lines.append(
+        f"  RSS {report['rss_start_bytes'] / mib:.1f} MiB -> "
+        f"{report['rss_end_bytes'] / mib:.1f} MiB "
+        f"(틱당 {report['rss_growth_per_tick_bytes'] / 1024:+.1f} KiB)"
+    )
+    lines.append(
+        f"  캐시 항목 {report['cache_entries']}개, 로그 큐 최대 적체 {report['max_log_backlog']}건 "
+        f"(비우는 데 {report['log_drain_seconds']:.2f}s), "
+        f"데드밴드 압축률 {report['deadband_compression_ratio']}"
+    )
+    if report["top_allocation_sites"]:
+        lines.append("  메모리 증가 상위 위치 (tracemalloc):")
+        lines.extend(f"    {site}" for site in report["top_allocation_sites"])
+    return "\n".join(lines)
+
+
+def main_stress(collector_options: Dict[str, Any], **kwargs: Any) -> None:
+    """스트레스 실행 후 보고서를 출력합니다."""
+    report = asyncio.run(run_stress(collector_options, **kwargs))
+    print(format_report(report))
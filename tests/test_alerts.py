@@ -0,0 +1,62 @@
+# tests/test_alerts.py
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from utils.alerts import DEFAULT_RULES, AlertEngine, AlertRule, load_alert_config
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _engine() -> AlertEngine:
+    return AlertEngine(
+        [AlertRule("proc_hot", "top_cpu.*.cpu_percent", threshold=90, for_seconds=10)]
+    )
+
+
+def test_forget_resolves_firing_alert() -> None:
+    engine = _engine()
+    uri = "top_cpu.nginx.pid_42.cpu_percent"
+    assert engine.evaluate(uri, 95, T0) == []
+    (fired,) = engine.evaluate(uri, 97, T0 + timedelta(seconds=10))
+    assert fired.state == "firing"
+
+    (resolved,) = engine.forget(uri, T0 + timedelta(seconds=20))
+    assert resolved.state == "resolved"
+    assert resolved.reason == "series_forgotten"
+    assert resolved.observed == 97
+    assert resolved.to_dict()["reason"] == "series_forgotten"
+    assert engine.firing() == []
+
+
+def test_forget_pending_or_unknown_series_emits_nothing() -> None:
+    engine = _engine()
+    uri = "top_cpu.nginx.pid_42.cpu_percent"
+    engine.evaluate(uri, 95, T0)  # 대기 중 (for_seconds 미충족)
+    assert engine.forget(uri, T0) == []
+    assert engine.forget("top_cpu.other.pid_1.cpu_percent", T0) == []
+
+
+def test_rate_rule_needs_two_samples() -> None:
+    engine = AlertEngine([AlertRule("errors", "kernel.*.errors", threshold=1, kind="rate")])
+    uri = "kernel.dmesg.errors"
+    assert engine.evaluate(uri, 10, T0) == []  # 첫 표본은 속도가 없음
+    (fired,) = engine.evaluate(uri, 30, T0 + timedelta(seconds=10))
+    assert fired.state == "firing"
+    assert fired.observed == 2.0
+
+
+def test_load_alert_config_rejects_duplicate_rule_names(tmp_path: Path) -> None:
+    config = tmp_path / "alerts.json"
+    rule = {"name": "cpu_hot", "pattern": "system.cpu.*", "threshold": 90}
+    config.write_text(json.dumps({"rules": [rule, dict(rule, threshold=95)]}))
+    with pytest.raises(ValueError, match="cpu_hot"):
+        load_alert_config(config)
+
+
+def test_default_rules_have_unique_names() -> None:
+    rules = load_alert_config(None)["rules"]
+    assert len({rule.name for rule in rules}) == len(DEFAULT_RULES)
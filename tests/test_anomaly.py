@@ -0,0 +1,47 @@
+# tests/test_anomaly.py
+
+import math
+from datetime import datetime
+
+import numpy as np
+
+from utils.anomaly import AnomalyDetector
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _warm(detector: AnomalyDetector, uris: list, ticks: int = 40) -> None:
+    for tick in range(ticks):
+        for uri in uris:
+            detector.observe(uri, 100.0 + (tick % 3))
+        assert detector.step(T0) == []
+
+
+def test_staged_samples_flag_a_spike() -> None:
+    detector = AnomalyDetector(warmup_samples=10)
+    _warm(detector, ["a", "b"])
+    detector.observe("a", 500.0)
+    detector.observe("b", 101.0)
+    (anomaly,) = detector.step(T0)
+    assert anomaly.uri == "a"
+    assert anomaly.value == 500.0
+    assert 99.0 < anomaly.expected < 102.0
+
+
+def test_non_numeric_and_non_finite_samples_are_ignored() -> None:
+    detector = AnomalyDetector(warmup_samples=10)
+    _warm(detector, ["a"])
+    for value in ("busy", True, math.nan, math.inf, 1e300):  # 1e300은 float32에서 inf
+        detector.observe("a", value)
+    assert detector.step(T0) == []
+    assert np.isnan(detector._values).all()
+
+
+def test_forget_drops_staged_sample_of_reused_id() -> None:
+    detector = AnomalyDetector(warmup_samples=10)
+    _warm(detector, ["a"])
+    detector.observe("a", 500.0)
+    detector.forget("a")
+    assert detector.series_id("b") == 0  # 같은 ID 재사용
+    assert detector.step(T0) == []  # "a"의 스파이크가 "b"로 넘어가지 않음
+    assert math.isnan(detector._mean[0, 0])
@@ -0,0 +1,161 @@
+# tests/test_cgroup_stats.py
+"""CgroupStatsCollector against a fake cgroup v2 tree in a temp directory."""
+
+import asyncio
+import json
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+import pytest
+
+from collectors import cgroup_stats
+from collectors.cgroup_stats import CgroupStatsCollector, ContainerNameResolver
+
+CONTAINER_ID = "ab" * 32
+
+
+def _write_group(group: Path, usage_usec: int, memory: int, io_stat: str, pids: int) -> None:
+    group.mkdir(parents=True, exist_ok=True)
+    (group / "cpu.stat").write_text(f"usage_usec {usage_usec}\nuser_usec 0\nsystem_usec 0\n")
+    (group / "memory.current").write_text(f"{memory}\n")
+    (group / "io.stat").write_text(io_stat)
+    (group / "pids.current").write_text(f"{pids}\n")
+
+
+def _collect(collector: CgroupStatsCollector) -> Dict[str, float]:
+    metrics: List[Tuple[str, float]] = collector.collect()
+    return dict(metrics)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    fake = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(cgroup_stats, "time", SimpleNamespace(monotonic=lambda: fake.now))
+    monkeypatch.setattr(cgroup_stats, "RESCAN_INTERVAL_SECONDS", 0.0)  # 틱마다 다시 탐색
+    return fake
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path / "cgroup"
+    _write_group(
+        root / "system.slice" / f"docker-{CONTAINER_ID}.scope",
+        usage_usec=1_000_000,
+        memory=100 * 1024 * 1024,
+        io_stat="8:0 rbytes=1000 wbytes=2000 rios=1 wios=2\n8:16 rbytes=500 wbytes=0\n",
+        pids=7,
+    )
+    _write_group(
+        root / "user.slice",
+        usage_usec=5_000_000,
+        memory=50 * 1024 * 1024,
+        io_stat="",
+        pids=3,
+    )
+    docker_root = tmp_path / "docker"
+    config = docker_root / "containers" / CONTAINER_ID / "config.v2.json"
+    config.parent.mkdir(parents=True)
+    config.write_text(json.dumps({"Name": "/web"}))
+    return root
+
+
+def _collector(tree: Path) -> CgroupStatsCollector:
+    resolver = ContainerNameResolver(
+        docker_root=str(tree.parent / "docker"),
+        podman_containers_json=str(tree.parent / "missing.json"),
+    )
+    return CgroupStatsCollector(cgroup_root=str(tree), name_resolver=resolver)
+
+
+def test_first_collect_reports_gauges_only(tree: Path, clock: SimpleNamespace) -> None:
+    collector = _collector(tree)
+    try:
+        metrics = _collect(collector)
+    finally:
+        asyncio.run(collector.aclose())
+
+    assert metrics == {
+        "cgroup.docker.web.mem_usage_mb": 100.0,
+        "cgroup.docker.web.pids": 7.0,
+        "cgroup.slice.user.mem_usage_mb": 50.0,
+        "cgroup.slice.user.pids": 3.0,
+    }
+
+
+def test_second_collect_reports_cpu_and_io_rates(tree: Path, clock: SimpleNamespace) -> None:
+    collector = _collector(tree)
+    try:
+        _collect(collector)
+        clock.now += 2.0
+        _write_group(
+            tree / "system.slice" / f"docker-{CONTAINER_ID}.scope",
+            usage_usec=2_000_000,  # 2초 동안 1초 사용 -> 50%
+            memory=120 * 1024 * 1024,
+            io_stat="8:0 rbytes=3000 wbytes=6000\n8:16 rbytes=500 wbytes=0\n",
+            pids=9,
+        )
+        metrics = _collect(collector)
+    finally:
+        asyncio.run(collector.aclose())
+
+    assert metrics["cgroup.docker.web.cpu_percent"] == pytest.approx(50.0)
+    assert metrics["cgroup.docker.web.io_read_bytes_per_sec"] == pytest.approx(1000.0)
+    assert metrics["cgroup.docker.web.io_write_bytes_per_sec"] == pytest.approx(2000.0)
+    assert metrics["cgroup.docker.web.mem_usage_mb"] == 120.0
+    assert metrics["cgroup.docker.web.pids"] == 9.0
+    assert metrics["cgroup.slice.user.cpu_percent"] == pytest.approx(0.0)
+    # io.stat가 비어 있으면 합계 0 -> 속도 0
+    assert metrics["cgroup.slice.user.io_read_bytes_per_sec"] == 0.0
+
+
+def test_removed_cgroup_disappears_and_its_fds_are_closed(
+    tree: Path, clock: SimpleNamespace
+) -> None:
+    collector = _collector(tree)
+    try:
+        _collect(collector)
+        user_path = str(tree / "user.slice")
+        fds = list(collector._groups[user_path].fds.values())
+        assert len(fds) == 4
+
+        shutil.rmtree(tree / "user.slice")
+        clock.now += 2.0
+        metrics = _collect(collector)
+
+        assert not any(uri.startswith("cgroup.slice.user.") for uri in metrics)
+        assert "cgroup.docker.web.cpu_percent" in metrics
+        assert user_path not in collector._groups
+        for fd in fds:
+            with pytest.raises(OSError):
+                cgroup_stats.os.fstat(fd)
+
+        clock.now += 2.0
+        _collect(collector)
+        assert (user_path, "cpu") not in collector._rates  # 사라진 그룹의 속도 상태도 정리
+    finally:
+        asyncio.run(collector.aclose())
+
+
+def test_unknown_groups_are_ignored(tree: Path, clock: SimpleNamespace) -> None:
+    _write_group(tree / "init.scope", usage_usec=1, memory=1, io_stat="", pids=1)
+    collector = _collector(tree)
+    try:
+        metrics = _collect(collector)
+    finally:
+        asyncio.run(collector.aclose())
+    assert not any("init" in uri for uri in metrics)
+
+
+def test_aclose_closes_every_fd(tree: Path, clock: SimpleNamespace) -> None:
+    collector = _collector(tree)
+    _collect(collector)
+    fds = [fd for group in collector._groups.values() for fd in group.fds.values()]
+    assert fds
+
+    asyncio.run(collector.aclose())  # 앱과 headless 모드가 종료 시 호출하는 훅
+    assert not collector._groups
+    for fd in fds:
+        with pytest.raises(OSError):
+            cgroup_stats.os.fstat(fd)
@@ -0,0 +1,75 @@
+# tests/test_command.py
+
+import asyncio
+import sys
+from typing import Dict, List
+
+import pytest
+
+from collectors import command
+from collectors.command import CommandCollector
+
+OUTPUT = "conn 3\nconn 4\nidle 1\n"
+
+
+def _collect_ticks(collector: CommandCollector, ticks: int) -> List[Dict[str, float]]:
+    async def run() -> List[Dict[str, float]]:
+        results = []
+        try:
+            for _ in range(ticks):
+                results.append(dict(await collector.collect()))
+        finally:
+            await collector.aclose()
+        return results
+
+    return asyncio.run(run())
+
+
+def test_shared_argv_runs_once_and_parses_once_per_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[str] = []
+    lines_factory = command.parser_registry["lines"]
+
+    def counting_factory(config: Dict[str, object]) -> command.Parser:
+        parse = lines_factory(config)
+
+        def counted(output: str) -> command.Samples:
+            calls.append(output)
+            return parse(output)
+
+        return counted
+
+    monkeypatch.setitem(command.parser_registry, "lines", counting_factory)
+    argv = [sys.executable, "-c", f"print({OUTPUT!r}, end='')"]
+    collector = CommandCollector(
+        [
+            {"name": "all", "argv": argv, "interval": 60},
+            {"name": "conn", "argv": argv, "interval": 60, "match": "^conn"},
+        ],
+        tick_budget=10.0,
+    )
+
+    ticks = _collect_ticks(collector, 3)
+
+    for metrics in ticks:
+        assert metrics["command.all.lines"] == 3.0
+        assert metrics["command.conn.lines"] == 2.0
+        assert metrics["command.all.status"] == command.STATUS_OK
+    assert len(calls) == 2  # 한 번 실행, 항목마다 한 번 파싱 (틱마다 다시 파싱하지 않음)
+
+
+def test_failed_and_unparsable_commands_report_status_only() -> None:
+    collector = CommandCollector(
+        [
+            {"name": "fail", "argv": [sys.executable, "-c", "raise SystemExit(3)"]},
+            {"name": "bad", "argv": [sys.executable, "-c", "print('x')"], "parser": "json"},
+            {"name": "missing", "argv": ["/nonexistent/command"]},
+        ],
+        tick_budget=10.0,
+    )
+
+    (metrics,) = _collect_ticks(collector, 1)
+
+    assert metrics["command.fail.status"] == command.STATUS_FAILED
+    assert metrics["command.bad.status"] == command.STATUS_OK
+    assert metrics["command.missing.status"] == command.STATUS_NOT_FOUND
+    assert {uri.rsplit(".", 1)[1] for uri in metrics} == {"status", "duration_ms"}
@@ -0,0 +1,93 @@
+# tests/test_deadband.py
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from utils.deadband import TOMBSTONE_EVENT, DeadbandFilter, reconstruct_step_series
+
+T0 = datetime(2025, 5, 22, 14, 0, tzinfo=timezone.utc)
+
+
+def _at(seconds: float) -> datetime:
+    return T0 + timedelta(seconds=seconds)
+
+
+def test_tolerance_band_is_measured_against_last_written_value() -> None:
+    deadband = DeadbandFilter(keepalive_seconds=60, tolerances={"cpu.*": (0.5, 0.0)})
+    assert deadband.should_write("cpu.total", 10.0, _at(0))
+    assert not deadband.should_write("cpu.total", 10.4, _at(2))
+    # 0.4씩 천천히 움직여도 기준은 마지막으로 쓴 10.0이므로 드리프트가 쌓이지 않습니다.
+    assert not deadband.should_write("cpu.total", 10.5, _at(4))
+    assert deadband.should_write("cpu.total", 10.6, _at(6))
+    assert not deadband.should_write("cpu.total", 10.2, _at(8))
+
+
+def test_relative_tolerance_and_non_numeric_values() -> None:
+    deadband = DeadbandFilter(default_rel_tolerance=0.01)
+    assert deadband.should_write("mem.used_bytes", 1000, _at(0))
+    assert not deadband.should_write("mem.used_bytes", 1010, _at(2))
+    assert deadband.should_write("mem.used_bytes", 1011, _at(4))
+    # 숫자가 아닌 값은 바뀔 때만 씁니다 (bool도 숫자로 보지 않음).
+    assert deadband.should_write("uptime", "3 days", _at(0))
+    assert not deadband.should_write("uptime", "3 days", _at(2))
+    assert deadband.should_write("uptime", "4 days", _at(4))
+    coarse = DeadbandFilter(default_abs_tolerance=1.0)
+    assert coarse.should_write("flag", False, _at(0))
+    assert coarse.should_write("flag", True, _at(2))  # 숫자였다면 |1 - 0| <= 1로 생략됨
+
+
+def test_keepalive_forces_a_write() -> None:
+    deadband = DeadbandFilter(keepalive_seconds=60, default_abs_tolerance=1.0)
+    assert deadband.should_write("load", 1.0, _at(0))
+    assert not deadband.should_write("load", 1.0, _at(59))
+    assert deadband.should_write("load", 1.0, _at(60))
+    assert not deadband.should_write("load", 1.0, _at(62))
+    assert deadband.stats()["samples_seen"] == 4
+    assert deadband.stats()["samples_written"] == 2
+    assert deadband.compression_ratio == 2.0
+
+
+def test_forget_reports_written_state_and_resets_it() -> None:
+    deadband = DeadbandFilter(default_abs_tolerance=1.0)
+    assert not deadband.forget("load")  # 쓴 적 없는 URI: 툼스톤 불필요
+    deadband.should_write("load", 1.0, _at(0))
+    assert deadband.forget("load")
+    assert not deadband.forget("load")
+    # 잊은 뒤 첫 샘플은 허용 범위 안이라도 기록됩니다.
+    assert deadband.should_write("load", 1.0, _at(2))
+
+
+def _log(deadband: DeadbandFilter, samples: List[Any]) -> List[Dict[str, Any]]:
+    entries = []
+    for seconds, value in samples:
+        if deadband.should_write("cpu", value, _at(seconds)):
+            entries.append({"ts": _at(seconds).isoformat(), "uri": "cpu", "value": value})
+    return entries
+
+
+def test_reconstruction_stays_within_tolerance() -> None:
+    deadband = DeadbandFilter(keepalive_seconds=60, default_abs_tolerance=0.5)
+    samples = [(seconds, 10.0 + 0.3 * ((seconds // 2) % 5)) for seconds in range(0, 200, 2)]
+    entries = _log(deadband, samples)
+    assert len(entries) < len(samples)
+
+    timestamps = [_at(seconds) for seconds, _ in samples]
+    rebuilt = reconstruct_step_series(entries, "cpu", timestamps, keepalive_seconds=60)
+    for (_, value), held in zip(samples, rebuilt):
+        assert held is not None
+        assert abs(held - value) <= 0.5
+
+
+def test_reconstruction_gaps_and_tombstones() -> None:
+    deadband = DeadbandFilter(keepalive_seconds=60)
+    entries = _log(deadband, [(0, 5.0), (60, 5.0)])
+    entries.append({"ts": _at(100).isoformat(), "uri": "cpu", "event": "alert", "value": 99})
+    entries.append({"ts": _at(300).isoformat(), "uri": "cpu", "value": 7.0})
+    entries.append({"ts": _at(310).isoformat(), "uri": "cpu", "event": TOMBSTONE_EVENT})
+    entries.append({"ts": _at(320).isoformat(), "uri": "other", "value": 1.0})
+
+    at = [-1, 0, 100, 180, 181, 300, 305, 310, 320]
+    rebuilt = reconstruct_step_series(entries, "cpu", [_at(s) for s in at], keepalive_seconds=60)
+    # 첫 기록 전 None, 알림 이벤트는 무시, keepalive 두 번(120초) 넘게 공백이면 None,
+    # 툼스톤 뒤에는 None.
+    assert rebuilt == [None, 5.0, 5.0, 5.0, None, 7.0, 7.0, None, None]
@@ -0,0 +1,209 @@
+# tests/test_fleet.py
+"""FleetManager / HostState against local fake streams (TCP server, `python -c` commands)."""
+
+import asyncio
+import json
+import socket
+import sys
+from typing import Any, Awaitable, Callable, Dict, List
+
+import pytest
+
+from utils import fleet
+from utils.fleet import FleetManager, HostSpec, HostState
+
+
+def _snapshot(metric_count: int = 2, cpu: float = 40.0) -> Dict[str, Any]:
+    metrics: Dict[str, Any] = {
+        "system.cpu.core0": cpu,
+        "system.cpu.core1": cpu + 20.0,
+        "system.memory.used_percent": 55.0,
+        "kernel.dmesg.errors": 3.0,
+        "fs.root.used_percent": 70.0,
+        "fs.data.used_percent": 92.5,
+    }
+    metrics.update({f"extra.series{index}": float(index) for index in range(metric_count)})
+    return {"ts": "2026-01-01T00:00:00+00:00", "metrics": metrics, "processes": []}
+
+
+def _line(snapshot: Dict[str, Any]) -> bytes:
+    return json.dumps(snapshot).encode() + b"\n"
+
+
+def _python_command(name: str, code: str) -> HostSpec:
+    return HostSpec(name, "command", argv=[sys.executable, "-c", code])
+
+
+async def _until(predicate: Callable[[], bool], timeout: float = 10.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not reached before timeout")
+        await asyncio.sleep(0.02)
+
+
+def _run(manager: FleetManager, scenario: Callable[[], Awaitable[None]]) -> None:
+    async def main() -> None:
+        manager.start()
+        try:
+            await scenario()
+        finally:
+            await manager.close()
+
+    asyncio.run(main())
+
+
+@pytest.fixture(autouse=True)
+def fast_reconnect(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fleet, "RECONNECT_BASE_SECONDS", 0.05)
+    monkeypatch.setattr(fleet, "RECONNECT_MAX_SECONDS", 0.2)
+
+
+def test_host_state_apply_is_bounded() -> None:
+    state = HostState(HostSpec("h", "synthetic"))
+    snapshot = _snapshot(metric_count=5000)
+    snapshot["metrics"]["system.uptime.description"] = "x" * 10_000
+    snapshot["metrics"]["nested"] = {"not": "a sample"}
+    snapshot["processes"] = [{"pid": pid, "cpu_percent": float(pid)} for pid in range(500)]
+
+    for now in range(3):
+        state.apply(snapshot, max_series=100, now=float(now))
+
+    assert len(state.metrics) == 100
+    assert state.dropped_series == len(snapshot["metrics"]) - 100
+    assert len(state.processes) == fleet.MAX_PROCESSES
+    assert state.processes[0]["pid"] == 499  # CPU 상위부터
+    assert state.lines == 3 and state.status == "up"
+
+    # 매 줄 URI가 바뀌어도 이전 스냅숏을 누적하지 않습니다.
+    for now in range(50):
+        churn = {f"churn.{now}.{index}": 1.0 for index in range(500)}
+        state.apply({"metrics": churn}, max_series=100, now=float(now))
+        assert len(state.metrics) == 100
+    assert all(uri.startswith("churn.49.") for uri in state.metrics)
+
+    state.apply(_snapshot(), max_series=100, now=3.0)
+    assert "nested" not in state.metrics
+    assert state.dropped_series == 0
+    assert state.cpu == pytest.approx(50.0)
+    assert state.memory == 55.0 and state.dmesg == 3.0 and state.disk == 92.5
+
+
+def test_host_state_truncates_strings() -> None:
+    state = HostState(HostSpec("h", "synthetic"))
+    state.apply(
+        {"ts": "t" * 500, "metrics": {"system.uptime.description": "x" * 10_000}},
+        max_series=10,
+        now=0.0,
+    )
+    assert len(state.metrics["system.uptime.description"]) == fleet.MAX_STRING_CHARS
+    assert len(state.snapshot_ts) <= 40
+
+
+def test_reconnect_delay_backs_off_exponentially_up_to_cap() -> None:
+    delays = [fleet.reconnect_delay(failures) for failures in range(1, 8)]
+    assert delays[:2] == [0.1, 0.2]
+    assert delays == sorted(delays)
+    assert max(delays) == fleet.RECONNECT_MAX_SECONDS
+
+
+def test_tcp_stream_goes_up_stale_down_and_reconnects() -> None:
+    connections: List[asyncio.StreamWriter] = []
+    manager = FleetManager(
+        [HostSpec("tcp", "tcp", "127.0.0.1:0")], max_series_per_host=20, stale_after=0.3
+    )
+    state = manager.hosts["tcp"]
+
+    async def scenario() -> None:
+        closed, stopped = asyncio.Event(), asyncio.Event()
+
+        async def serve(_reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            connections.append(writer)
+            writer.write(_line(_snapshot(metric_count=50)))
+            await writer.drain()
+            # 첫 연결만 테스트가 끊고, 재연결한 연결은 테스트 끝까지 유지합니다.
+            await (closed if len(connections) == 1 else stopped).wait()
+            writer.close()
+
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        state.spec.target = f"127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        manager.start()
+        try:
+            await _until(lambda: state.status == "up")
+            assert len(state.metrics) == 20
+            assert state.dropped_series == len(_snapshot(metric_count=50)["metrics"]) - 20
+            assert state.cpu == pytest.approx(50.0)
+
+            await _until(lambda: manager.states()[0].status == "stale")
+            assert manager.stats()["stale"] == 1
+
+            closed.set()  # 서버가 연결을 끊음 -> down -> 백오프 후 재연결
+            await _until(lambda: state.status == "down")
+            assert state.error == "스트림 종료 (EOF)"
+            await _until(lambda: state.lines >= 2)
+            assert state.status == "up" and state.reconnects == 1
+        finally:
+            await manager.close()
+            stopped.set()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(scenario())
+    assert len(connections) == 2
+
+
+def test_command_stream_applies_lines_then_goes_down_on_eof() -> None:
+    lines = [json.dumps(_snapshot(cpu=float(cpu))) for cpu in (10, 20, 30)]
+    code = f"import sys\nfor line in {lines!r}:\n    print(line, flush=True)\n"
+    manager = FleetManager([_python_command("cmd", code)])
+    state = manager.hosts["cmd"]
+
+    async def scenario() -> None:
+        await _until(lambda: state.lines >= 3)
+        await _until(lambda: state.status == "down")
+
+    _run(manager, scenario)
+    assert state.cpu == pytest.approx(40.0)  # 마지막 줄 (30, 50)
+    assert state.error == "스트림 종료 (EOF)"
+    assert state.reconnects >= 1
+
+
+def test_bad_and_oversized_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fleet, "MAX_LINE_BYTES", 4096)
+    monkeypatch.setattr(fleet, "RECONNECT_BASE_SECONDS", 5.0)  # down 상태를 관찰할 수 있도록
+    good = json.dumps(_snapshot())
+    code = (
+        f"print({good!r}, flush=True)\n"
+        "print('not json', flush=True)\n"
+        "print('[1, 2]', flush=True)\n"
+        "print('x' * 100000, flush=True)\n"
+        "import time; time.sleep(30)\n"
+    )
+    manager = FleetManager([_python_command("big", code)])
+    state = manager.hosts["big"]
+
+    async def scenario() -> None:
+        await _until(lambda: state.status == "down")
+
+    _run(manager, scenario)
+    assert state.lines == 1  # 잘못된 줄 전의 스냅숏은 유지
+    assert state.bad_lines == 2
+    assert "limit" in state.error
+    assert state.reconnects == 1
+
+
+def test_refused_port_stays_down_and_retries() -> None:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    manager = FleetManager([fleet.parse_host_argument(f"tcp:127.0.0.1:{port}")])
+    state = manager.hosts[f"127.0.0.1:{port}"]
+
+    async def scenario() -> None:
+        await _until(lambda: state.reconnects >= 3)
+
+    _run(manager, scenario)
+    assert state.lines == 0
+    assert state.received_at is None
+    assert state.error
+    assert manager.stats()["up"] == 0
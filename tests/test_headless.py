@@ -0,0 +1,48 @@
+# tests/test_headless.py
+
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from collectors.base import BaseCollector
+from headless import _is_coroutine_function, run_once
+
+
+class _Gauges(BaseCollector):
+    def __init__(self) -> None:
+        self.closed = False
+
+    def collect(self) -> List[Tuple[str, Any]]:
+        return [("system.load1", 0.5), ("system.uptime", "3 days")]
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _Broken(BaseCollector):
+    def collect(self) -> List[Tuple[str, Any]]:
+        raise OSError("no /proc")
+
+
+class _Async(BaseCollector):
+    async def collect(self) -> List[Tuple[str, Any]]:  # type: ignore[override]
+        return []
+
+
+def test_coroutine_detection() -> None:
+    assert _is_coroutine_function(_Async().collect)
+    assert not _is_coroutine_function(_Gauges().collect)
+
+
+def test_run_once_without_event_loop() -> None:
+    gauges = _Gauges()
+    out = io.StringIO()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        run_once(out, [gauges, _Broken()], pool)
+
+    snapshot: Dict[str, Any] = json.loads(out.getvalue())
+    assert snapshot["metrics"] == {"system.load1": 0.5, "system.uptime": "3 days"}
+    assert snapshot["errors"] == {"_Broken": "no /proc"}
+    # 루프 없이도 aclose()가 끝까지 실행됩니다.
+    assert gauges.closed
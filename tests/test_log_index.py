@@ -0,0 +1,58 @@
+# tests/test_log_index.py
+
+import time
+from pathlib import Path
+
+from utils.log_index import INDEX_FILE, LogIndex
+
+
+def test_search_active_segment_before_and_after_seal(tmp_path: Path) -> None:
+    now = time.time()
+    index = LogIndex(tmp_path)
+    try:
+        index.add(now - 5, "syslog", "nginx reloaded")
+        index.add(now, "kernel", "Out of memory: oom killer picked web-1")
+        index.add(now, "kernel", "oom killer picked web-10")
+        index.commit()
+
+        result = index.search('oom "web-1" since:1h', now=now)  # 봉인 전 (현재 시간 세그먼트)
+        assert [hit.text for hit in result.hits] == ["Out of memory: oom killer picked web-1"]
+        assert result.hits[0].source == "kernel"
+
+        later = now + 3600
+        index.maintain(later)  # 지난 시간 세그먼트 봉인
+        assert list(tmp_path.glob(f"*/{INDEX_FILE}"))
+        result = index.search('oom "web-1" since:2h', now=later)
+        assert [hit.text for hit in result.hits] == ["Out of memory: oom killer picked web-1"]
+        assert index.search("source:syslog nginx", now=later).hits[0].text == "nginx reloaded"
+    finally:
+        index.close()
+
+
+def test_read_only_index_searches_segment_being_written(tmp_path: Path) -> None:
+    now = time.time()
+    writer = LogIndex(tmp_path)
+    reader = LogIndex(tmp_path, writable=False)
+    try:
+        writer.add(now, "syslog", "sshd accepted publickey")
+        writer.commit()
+        assert [hit.text for hit in reader.search("sshd", now=now).hits] == [
+            "sshd accepted publickey"
+        ]
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_reopened_index_continues_active_segment(tmp_path: Path) -> None:
+    now = time.time()
+    index = LogIndex(tmp_path)
+    index.add(now, "syslog", "first")
+    index.close()
+
+    index = LogIndex(tmp_path)
+    try:
+        index.add(now, "syslog", "second")
+        assert {hit.text for hit in index.search("", now=now).hits} == {"first", "second"}
+    finally:
+        index.close()
@@ -0,0 +1,83 @@
+# tests/test_parquet_export.py
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+from utils.parquet_export import export_day, export_logs
+
+
+def _write_log(path: Path, lines: List[Any]) -> None:
+    with open(path, "w") as f:
+        for line in lines:
+            f.write(line if isinstance(line, str) else json.dumps(line))
+            f.write("\n")
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    ts = ["2025-05-22T14:00:00.250000+00:00", "2025-05-22T23:00:00+09:00"]
+    entries: List[Any] = [
+        {"ts": ts[0], "uri": "system.cpu.total", "value": 12.5, "source": "CpuCollector"},
+        {"ts": ts[0], "uri": "docker.container.web.cpu_percent", "value": 3, "source": "Docker"},
+        {"ts": ts[0], "uri": "system.uptime", "value": "3 days", "source": "Uptime"},
+        {"ts": ts[0], "event": "startup_timing", "total_ms": 80.0},
+        {"ts": ts[1], "uri": "system.cpu.total", "event": "alert", "value": 99.0},
+        {"ts": ts[1], "uri": "system.cpu.total", "event": "series_forgotten"},
+        {"ts": ts[1], "uri": "system.cpu.total", "value": 50.0, "source": "CpuCollector"},
+        '{"ts": "2025-05-22T14:00:02+00:00", "uri": "system.cpu',  # 잘린 마지막 줄
+    ]
+    _write_log(log_dir / "metrics-20250522.jsonl", entries)
+    (log_dir / "notes.txt").write_text("not a log\n")
+
+    out_dir = tmp_path / "export"
+    [summary] = export_logs(log_dir, out_dir, workers=1)
+    assert summary["rows"] == 3
+    assert summary["prefixes"] == 2
+    assert summary["skipped_events"] == 3  # startup_timing, 알림, 툼스톤
+    assert summary["skipped_non_numeric"] == 1
+    assert summary["skipped_invalid"] == 1
+
+    date_dir = out_dir / "date=2025-05-22"
+    assert sorted(path.name for path in date_dir.iterdir()) == ["prefix=docker", "prefix=system"]
+    assert not list(out_dir.rglob("*.tmp"))
+
+    system = pq.read_table(date_dir / "prefix=system" / "part-20250522.parquet").to_pylist()
+    assert [row["uri"] for row in system] == ["system.cpu.total", "system.cpu.total"]
+    assert [row["value"] for row in system] == [12.5, 50.0]
+    # 오프셋이 있는 ts는 UTC로 변환되고, 마이크로초는 보존됩니다.
+    assert [row["ts"] for row in system] == [
+        datetime(2025, 5, 22, 14, 0, 0, 250000, tzinfo=timezone.utc),
+        datetime(2025, 5, 22, 14, 0, 0, tzinfo=timezone.utc),
+    ]
+    docker = pq.read_table(date_dir / "prefix=docker" / "part-20250522.parquet").to_pylist()
+    assert docker[0]["value"] == 3.0
+    assert docker[0]["source"] == "Docker"
+
+
+def test_chunk_flushing_writes_row_groups(tmp_path: Path) -> None:
+    log_path = tmp_path / "metrics-20250523.jsonl"
+    lines: List[Dict[str, Any]] = []
+    for second in range(25):
+        ts = f"2025-05-23T00:00:{second:02d}+00:00"
+        lines.append({"ts": ts, "uri": "fs.root.used_percent", "value": second})
+        if second < 2:
+            lines.append({"ts": ts, "uri": "fs.boot.used_percent", "value": 50})
+    _write_log(log_path, lines)
+
+    summary = export_day(log_path, tmp_path / "export", chunk_rows=10, prefix_depth=2)
+    assert summary["rows"] == 27
+    assert summary["prefixes"] == 2
+
+    date_dir = tmp_path / "export" / "date=2025-05-23"
+    root = pq.ParquetFile(date_dir / "prefix=fs.root" / "part-20250523.parquet")
+    # 접두사별로 chunk_rows마다 행 그룹 하나, 나머지는 close()에서 씁니다.
+    groups = [root.metadata.row_group(i).num_rows for i in range(root.metadata.num_row_groups)]
+    assert groups == [10, 10, 5]
+    assert root.read().column("value").to_pylist() == [float(v) for v in range(25)]
+    boot = pq.ParquetFile(date_dir / "prefix=fs.boot" / "part-20250523.parquet")
+    assert boot.metadata.num_rows == 2
@@ -0,0 +1,131 @@
+# tests/test_quantile_sketch.py
+
+import random
+import tracemalloc
+from typing import List
+
+import pytest
+
+from utils.quantile_sketch import DDSketch, QuantileSketchStore
+
+QS = (0.5, 0.9, 0.95, 0.99)
+
+
+def _exact(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def _assert_within(sketch: DDSketch, values: List[float], accuracy: float = 0.01) -> None:
+    for q in QS:
+        estimate = sketch.quantile(q)
+        assert estimate is not None
+        assert estimate == pytest.approx(_exact(values, q), rel=accuracy * 1.01)
+
+
+def test_quantiles_are_within_relative_accuracy() -> None:
+    rng = random.Random(1)
+    values = [rng.lognormvariate(3.0, 1.0) for _ in range(20_000)]
+    sketch = DDSketch()
+    for value in values:
+        sketch.add(value)
+    _assert_within(sketch, values)  # 값 범위가 버킷 상한보다 넓어도 p50..p99는 보장
+    assert sketch.quantile(1.0) == max(values)
+    assert sketch.count == len(values)
+
+
+def test_negative_zero_and_positive_values() -> None:
+    values = [-50.0, -5.0, -0.5, 0.0, 0.0, 0.5, 5.0, 50.0, 500.0]
+    sketch = DDSketch()
+    for value in values:
+        sketch.add(value)
+    for q, expected in ((0.0, -50.0), (0.25, -0.5), (0.375, 0.0), (1.0, 500.0)):
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+
+
+def test_merge_equals_sketch_of_all_values() -> None:
+    rng = random.Random(2)
+    left_values = [rng.uniform(0.1, 100.0) for _ in range(5000)]
+    right_values = [rng.uniform(50.0, 5000.0) for _ in range(5000)]
+    left, right, combined = DDSketch(), DDSketch(), DDSketch()
+    for value in left_values:
+        left.add(value)
+        combined.add(value)
+    for value in right_values:
+        right.add(value)
+        combined.add(value)
+
+    left.merge(right)
+    assert left.quantiles(QS) == combined.quantiles(QS)
+    assert left.count == combined.count
+    assert (left.min, left.max) == (combined.min, combined.max)
+    _assert_within(left, left_values + right_values)
+
+    with pytest.raises(ValueError):
+        left.merge(DDSketch(relative_accuracy=0.02))
+
+
+def test_to_dict_round_trip() -> None:
+    sketch = DDSketch()
+    for value in (-3.0, 0.0, 1.0, 10.0, 100.0):
+        sketch.add(value)
+    restored = DDSketch.from_dict(sketch.to_dict())
+    assert restored.quantiles(QS) == sketch.quantiles(QS)
+    assert restored.to_dict() == sketch.to_dict()
+
+
+def test_bins_are_capped_and_upper_quantiles_keep_accuracy() -> None:
+    sketch = DDSketch(max_bins=64)
+    values = [1.01**exponent for exponent in range(2000)]  # 2000개 버킷에 걸친 값
+    for value in reversed(values):
+        sketch.add(value)
+    assert len(sketch.positive) == 64
+    assert sketch.quantile(0.99) == pytest.approx(_exact(values, 0.99), rel=0.0101)
+    assert sketch.count == len(values)
+
+
+def test_store_windows_spans_and_forget() -> None:
+    store = QuantileSketchStore(window_seconds=10, windows=3)
+    for tick in range(10):  # 창 0 (t=0..9): 값 1
+        store.observe("a", 1.0)
+        store.flush(float(tick))
+    for tick in range(10, 20):  # 창 1: 값 100
+        store.observe("a", 100.0)
+        store.observe("b", "not a number")
+        store.flush(float(tick))
+
+    assert store.quantiles("a", (0.0, 1.0), span_seconds=10) == [
+        pytest.approx(100.0, rel=0.01),
+        pytest.approx(100.0, rel=0.01),
+    ]
+    low, high = store.quantiles("a", (0.0, 1.0)) or [None, None]
+    assert low == pytest.approx(1.0, rel=0.01) and high == pytest.approx(100.0, rel=0.01)
+    assert store.quantiles("b", (0.5,)) is None
+
+    for tick in range(40, 42):  # 창 4: 창 0과 1은 보관 범위 밖
+        store.observe("a", 7.0)
+        store.flush(float(tick))
+    assert store.quantiles("a", (0.0, 1.0)) == [pytest.approx(7.0, rel=0.01)] * 2
+    assert "a" in store.export()
+
+    store.forget("a")
+    assert store.quantiles("a", (0.5,)) is None
+    assert len(store) == 0
+
+
+def test_memory_per_uri_stays_bounded() -> None:
+    rng = random.Random(3)
+    uris = [f"bench.series.{index}" for index in range(200)]
+    tracemalloc.start()
+    try:
+        store = QuantileSketchStore()
+        for tick in range(store.windows * 4):  # 창마다 틱 4번, 모든 창을 채움
+            for uri in uris:
+                store.observe(uri, rng.uniform(0.0, 100.0))
+                store.observe(uri, -rng.uniform(0.0, 100.0))  # 음수 쪽 버킷도 사용
+            store.flush(tick * store.window_seconds / 4)
+        per_uri = tracemalloc.get_traced_memory()[0] / len(uris)
+    finally:
+        tracemalloc.stop()
+    assert len(store) == len(uris)
+    assert per_uri < 16 * 1024
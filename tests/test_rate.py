@@ -0,0 +1,60 @@
+# tests/test_rate.py
+
+import threading
+from typing import List
+
+import pytest
+
+from utils.rate import RateCounter, stable_copy, wrapped_delta
+
+
+def test_wrapped_delta_handles_32_bit_wrap_and_reset() -> None:
+    assert wrapped_delta(10, 15) == 5
+    assert wrapped_delta(2**32 - 10, 5) == 15
+    assert wrapped_delta(100, 5) is None
+
+
+def test_stable_copy_retries_when_source_changes() -> None:
+    calls: List[int] = []
+
+    def copy() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise RuntimeError("dictionary changed size during iteration")
+        return "copied"
+
+    assert stable_copy(copy) == "copied"
+    assert len(calls) == 3
+
+    def always_fails() -> None:
+        raise RuntimeError("dictionary changed size during iteration")
+
+    with pytest.raises(RuntimeError):
+        stable_copy(always_fails, attempts=2)
+
+
+def test_get_state_while_another_thread_collects() -> None:
+    counter = RateCounter()
+    stop = threading.Event()
+
+    def collect() -> None:
+        tick = 0
+        while not stop.is_set():
+            tick += 1
+            for pid in range(tick % 50, tick % 50 + 200):  # 키가 계속 생기고 사라짐
+                counter.rate(pid, float(tick), now=float(tick))
+            counter.sweep()
+
+    thread = threading.Thread(target=collect)
+    thread.start()
+    try:
+        for _ in range(300):
+            state = counter.get_state()
+            assert all(len(entry) == 3 for entry in state)
+    finally:
+        stop.set()
+        thread.join()
+
+    restored = RateCounter()
+    restored.set_state(counter.get_state())
+    assert len(restored) == len(counter)
@@ -0,0 +1,92 @@
+# tests/test_replay.py
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from utils.deadband import TOMBSTONE_EVENT
+from utils.replay import MetricLogReader, ReplayState
+
+T0 = datetime(2025, 5, 22, 14, 0, tzinfo=timezone.utc)
+
+
+def _sample(uri: str, value: Any) -> Dict[str, Any]:
+    return {"uri": uri, "value": value, "source": "TopProcessCollector"}
+
+
+def _tombstone(uri: str) -> Dict[str, Any]:
+    return {"uri": uri, "event": TOMBSTONE_EVENT}
+
+
+def test_tombstone_removes_held_process() -> None:
+    state = ReplayState()
+    state.apply(
+        T0,
+        [
+            _sample("top_cpu.nginx.pid_10.cpu_percent", 40.0),
+            _sample("top_cpu.sleep.pid_11.cpu_percent", 5.0),
+        ],
+    )
+    assert {row["pid"] for row in state.processes()} == {"10", "11"}
+
+    # pid 11이 상위 목록에서 빠짐: 값은 유지되지 않고 바로 사라져야 합니다.
+    state.apply(T0 + timedelta(seconds=2), [_tombstone("top_cpu.sleep.pid_11.cpu_percent")])
+    assert [row["pid"] for row in state.processes()] == ["10"]
+
+
+def test_alert_event_is_not_a_sample() -> None:
+    state = ReplayState()
+    state.apply(T0, [{"uri": "system.cpu.total", "value": 10.0}])
+    alert = {"uri": "system.cpu.total", "event": "alert", "value": 99.0, "state": "firing"}
+    state.apply(T0 + timedelta(seconds=2), [alert])
+    assert state.samples() == [("system.cpu.total", 10.0)]
+
+
+def test_processes_sorted_by_cpu_and_capped() -> None:
+    state = ReplayState()
+    entries: List[Dict[str, Any]] = [
+        _sample(f"top_cpu.worker.pid_{pid}.cpu_percent", float(pid)) for pid in range(30)
+    ]
+    # CPU는 낮지만 메모리 상위인 프로세스는 수집기처럼 합집합에 남습니다.
+    entries.append(_sample("top_mem.java.pid_100.mem_percent", 60.0))
+    state.apply(T0, entries)
+
+    rows = state.processes(limit=10)
+    assert [row["pid"] for row in rows[:10]] == [str(pid) for pid in range(29, 19, -1)]
+    assert len(rows) == 11
+    assert rows[-1] == {"pid": "100", "name": "java", "memory_percent": 60.0}
+
+
+def test_stale_values_expire() -> None:
+    state = ReplayState(stale_after_seconds=120)
+    state.apply(T0, [_sample("top_cpu.nginx.pid_10.cpu_percent", 40.0)])
+    state.apply(T0 + timedelta(seconds=60), [{"uri": "system.cpu.total", "value": 1.0}])
+    assert len(state.processes()) == 1
+    state.apply(T0 + timedelta(seconds=121), [{"uri": "system.cpu.total", "value": 1.0}])
+    assert state.processes() == []
+
+
+def test_reader_yields_tombstones_within_ticks(tmp_path: Path) -> None:
+    path = tmp_path / "metrics-20250522.jsonl"
+    lines = [
+        {"ts": T0.isoformat(), **_sample("top_cpu.nginx.pid_10.cpu_percent", 40.0)},
+        {"ts": T0.isoformat(), "event": "startup_timing", "total_ms": 12.0},
+        {
+            "ts": (T0 + timedelta(seconds=2)).isoformat(),
+            **_tombstone("top_cpu.nginx.pid_10.cpu_percent"),
+        },
+    ]
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+    reader = MetricLogReader(path)
+    try:
+        state = ReplayState()
+        ticks = list(reader.ticks())
+        assert [len(entries) for _, _, entries in ticks] == [1, 1]
+        state.apply(ticks[0][1], ticks[0][2])
+        assert len(state.processes()) == 1
+        state.apply(ticks[1][1], ticks[1][2])
+        assert state.processes() == []
+    finally:
+        reader.close()
@@ -0,0 +1,96 @@
+# tests/test_shm_snapshot.py
+
+import os
+import struct
+import time
+import uuid
+from multiprocessing import shared_memory
+
+import pytest
+
+from utils import shm_snapshot
+from utils.shm_snapshot import SegmentInUse, SnapshotPublisher, SnapshotReader
+
+
+@pytest.fixture
+def name() -> str:
+    return f"pysnoop-test-{uuid.uuid4().hex[:12]}"
+
+
+def test_publish_and_read_roundtrip(name: str) -> None:
+    publisher = SnapshotPublisher(name, capacity=16)
+    try:
+        publisher.stage("system.cpu.total", 12.5)
+        publisher.stage("system.memory.used_percent", 40.0)
+        publisher.publish()
+        reader = SnapshotReader(name)
+        try:
+            assert reader.read("system.*") == {
+                "system.cpu.total": 12.5,
+                "system.memory.used_percent": 40.0,
+            }
+        finally:
+            reader.close()
+    finally:
+        publisher.close()
+    publisher.close()  # 두 번 닫아도 안전
+
+
+def test_live_segment_is_not_taken_over(name: str) -> None:
+    live = SnapshotPublisher(name, capacity=16)
+    try:
+        live.stage("system.cpu.total", 1.0)
+        live.publish()
+        with pytest.raises(SegmentInUse, match="--shm-name"):
+            SnapshotPublisher(name, capacity=16)
+        reader = SnapshotReader(name)  # 기존 세그먼트는 그대로 남아 있어야 합니다.
+        try:
+            assert reader.get("system.cpu.total") == 1.0
+        finally:
+            reader.close()
+    finally:
+        live.close()
+
+
+def test_never_published_segment_of_live_writer_is_not_taken_over(name: str) -> None:
+    live = SnapshotPublisher(name, capacity=16)
+    try:
+        with pytest.raises(SegmentInUse):
+            SnapshotPublisher(name, capacity=16)
+    finally:
+        live.close()
+
+
+def test_stale_segment_is_replaced(name: str) -> None:
+    old = SnapshotPublisher(name, capacity=16)
+    old.publish()
+    # 비정상 종료를 흉내 냅니다: 게시 시각을 오래전으로 돌리고 unlink 없이 연결만 닫습니다.
+    struct.pack_into(
+        "<d",
+        old._buf,
+        shm_snapshot._PUBLISHED_AT_OFFSET,
+        time.time() - shm_snapshot.STALE_SEGMENT_SECONDS - 1,
+    )
+    old._values.release()
+    old._segment.close()
+
+    publisher = SnapshotPublisher(name, capacity=16)
+    publisher.close()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_foreign_segment_is_not_unlinked(name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    foreign = shared_memory.SharedMemory(name=name, create=True, size=4096)
+    monkeypatch.setattr(shm_snapshot, "_created_here", {name})  # 이 프로세스가 만든 세그먼트
+    try:
+        with pytest.raises(SegmentInUse):
+            SnapshotPublisher(name, capacity=16)
+    finally:
+        foreign.close()
+        foreign.unlink()
+
+
+def test_pid_alive() -> None:
+    assert shm_snapshot._pid_alive(os.getpid())
+    assert not shm_snapshot._pid_alive(0)
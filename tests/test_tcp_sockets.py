@@ -0,0 +1,81 @@
+# tests/test_tcp_sockets.py
+
+import random
+from typing import Tuple
+
+import pytest
+
+from collectors import tcp_sockets
+
+HEADER = "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid"
+
+
+def _table(rows: int, address_words: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    lines = [HEADER]
+    for index in range(rows):
+        state = rng.choice([0x01, 0x01, 0x06, 0x08, 0x0A])
+        if address_words == 1:
+            local, remote = "0100007F", f"{rng.randint(0, 40):08X}"
+        else:
+            local = "0" * 24 + "01000000"
+            remote = rng.choice(
+                ["0000000000000000FFFF00000100007F", "0" * 32, f"{rng.randint(1, 30):032X}"]
+            )
+        lines.append(
+            f"{index:4d}: {local}:{rng.randint(1, 30):04X} {remote}:{rng.randint(1, 65535):04X} "
+            f"{state:02X} {rng.randint(0, 9):08X}:{rng.randint(0, 9):08X} 00:00000000 00000000 "
+            f" 1000        0 {index} 1 0000000000000000 20 4 30 10 -1"
+        )
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _summary(table: "tcp_sockets._TcpTable") -> Tuple[object, ...]:
+    return (table.states, table.ports, table.remotes, table.listen_queued, table.listen_saturated)
+
+
+@pytest.mark.parametrize("address_words", [1, 4])
+@pytest.mark.parametrize("rows", [0, 1, 500])
+def test_row_parser_matches_numpy_parser(rows: int, address_words: int) -> None:
+    content = _table(rows, address_words)
+    for data in (content, content[:-30]):  # 잘린 마지막 행 포함
+        assert _summary(tcp_sockets._parse_tcp_rows(data, address_words, 1000)) == _summary(
+            tcp_sockets._parse_tcp_array(data, address_words, 1000)
+        )
+
+
+def test_ipv4_mapped_and_unconnected_remotes() -> None:
+    content = _table(200, 4, seed=1)
+    remotes = tcp_sockets.parse_tcp_table(content, 4, top_n=100).remotes
+    assert "127.0.0.1" in remotes  # ::ffff:127.0.0.1 -> IPv4
+    assert "::" not in remotes  # 원격 주소 0 제외
+
+
+def test_small_tables_do_not_need_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*_args: object) -> None:
+        raise AssertionError("numpy path used for a small table")
+
+    monkeypatch.setattr(tcp_sockets, "_parse_tcp_array", fail)
+    table = tcp_sockets.parse_tcp_table(_table(100, 1), 1)
+    assert sum(table.states.values()) == 100
+
+
+def test_large_tables_fall_back_to_rows_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*_args: object) -> None:
+        raise AssertionError("numpy path used without numpy")
+
+    monkeypatch.setattr(tcp_sockets, "_parse_tcp_array", fail)
+    monkeypatch.setattr(tcp_sockets, "_numpy_available", lambda: False)
+    content = _table(3000, 1)
+    assert len(content) >= tcp_sockets.SMALL_TABLE_BYTES
+    table = tcp_sockets.parse_tcp_table(content, 1)
+    assert sum(table.states.values()) == 3000
+
+
+def test_discovery_probe_does_not_require_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    from collectors import discovery
+
+    (spec,) = [s for s in discovery.BUILTIN_COLLECTORS if s.name == "TcpSocketCollector"]
+    monkeypatch.setattr(discovery.os.path, "exists", lambda path: path == "/proc/net/tcp")
+    monkeypatch.setattr(discovery.importlib.util, "find_spec", lambda name: None)
+    assert spec.is_available()
@@ -0,0 +1,357 @@
+# utils/alerts.py
+"""
+Incremental alert rule engine.
+
+Rules are compiled once; each incoming sample is routed only to the rules whose URI
+pattern matches (via an index on the first URI segment plus a per-URI memo), and
+each (rule, URI) pair keeps O(1) state, so evaluation cost does not depend on how
+much history has been seen.
+
+Rule config (`alerts.json` next to app.py):
+
+    {
+        "rules": [
+            {"name": "cpu_core_hot", "pattern": "system.cpu.core*", "op": ">",
+             "threshold": 90, "for_seconds": 30},
+            {"name": "dmesg_new_errors", "pattern": "kernel.dmesg.errors",
+             "kind": "rate", "op": ">", "threshold": 0}
+        ],
+        "webhook_url": "http://127.0.0.1:9000/alerts",
+        "command": ["/usr/local/bin/notify", "--json"]
+    }
+"""
+
+import asyncio
+import fnmatch
+import json
+import operator
+import re
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+_OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+_LOCAL_HOSTS = {"127.0.0.1", "localhost", "::1"}
+HOOK_TIMEOUT_SECONDS: float = 5.0
+
+
+class AlertRule:
+    """
+    A compiled alert rule.
+
+    kind "threshold" compares the sample value; kind "rate" compares the change per
+    second since the previous sample of the same URI. The condition must hold for
+    `for_seconds` before the alert fires, and the alert resolves as soon as it stops
+    holding.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        pattern: str,
+        threshold: float,
+        op: str = ">",
+        kind: str = "threshold",
+        for_seconds: float = 0.0,
+        severity: str = "warning",
+    ) -> None:
+        if op not in _OPERATORS:
+            raise ValueError(f"Unknown operator '{op}' in rule '{name}'")
+        if kind not in ("threshold", "rate"):
+            raise ValueError(f"Unknown rule kind '{kind}' in rule '{name}'")
+        self.name = name
+        self.pattern = pattern
+        self.threshold = float(threshold)
+        self.op = op
+        self.kind = kind
+        self.for_seconds = float(for_seconds)
+        self.severity = severity
+        self._compare = _OPERATORS[op]
+        self._regex = re.compile(fnmatch.translate(pattern))
+        first_segment = pattern.split(".", 1)[0]
+        # 첫 세그먼트에 와일드카드가 없으면 인덱스 키로 사용합니다.
+        self.index_key: Optional[str] = (
+            None if any(c in first_segment for c in "*?[") else first_segment
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AlertRule":
+        return cls(
+            name=data["name"],
+            pattern=data["pattern"],
+            threshold=data["threshold"],
+            op=data.get("op", ">"),
+            kind=data.get("kind", "threshold"),
+            for_seconds=data.get("for_seconds", 0.0),
+            severity=data.get("severity", "warning"),
+        )
+
+    def matches(self, uri: str) -> bool:
+        return self._regex.match(uri) is not None
+
+    def holds(self, observed: float) -> bool:
+        return self._compare(observed, self.threshold)
+
+
+class AlertEvent:
+    """A state transition of one (rule, URI) pair."""
+
+    def __init__(
+        self,
+        rule: AlertRule,
+        uri: str,
+        state: str,
+        value: float,
+        observed: float,
+        ts: datetime,
+        reason: str = "",
+    ) -> None:
+        self.rule = rule
+        self.uri = uri
+        self.state = state  # "firing" | "resolved"
+        self.value = value
+        self.observed = observed  # threshold 규칙은 값, rate 규칙은 초당 변화량
+        self.ts = ts
+        self.reason = reason  # 조건 해소가 아닌 이유로 해제된 경우 (예: "series_forgotten")
+
+    @property
+    def message(self) -> str:
+        what = "rate" if self.rule.kind == "rate" else "value"
+        suffix = f" [{self.reason}]" if self.reason else ""
+        return (
+            f"[{self.state.upper()}] {self.rule.name}: {self.uri} {what}={self.observed:.2f} "
+            f"({self.rule.op} {self.rule.threshold:g}){suffix}"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ts": self.ts.isoformat(),
+            "event": "alert",
+            "rule": self.rule.name,
+            "uri": self.uri,
+            "state": self.state,
+            "severity": self.rule.severity,
+            "value": self.value,
+            "observed": self.observed,
+            "reason": self.reason or None,
+            "message": self.message,
+        }
+
+
+class _SeriesState:
+    """(규칙, URI) 쌍마다 유지하는 O(1) 상태."""
+
+    __slots__ = (
+        "pending_since",
+        "firing",
+        "last_value",
+        "last_ts",
+        "fired_value",
+        "fired_observed",
+    )
+
+    def __init__(self) -> None:
+        self.pending_since: Optional[datetime] = None
+        self.firing: bool = False
+        self.last_value: Optional[float] = None
+        self.last_ts: Optional[datetime] = None
+        # 마지막으로 조건을 만족한 값 (시리즈가 정리될 때 합성 resolved 이벤트에 사용)
+        self.fired_value: float = 0.0
+        self.fired_observed: float = 0.0
+
+
+class AlertEngine:
+    """
+    Evaluates compiled rules against samples as they arrive from the collection loop.
+    """
+
+    def __init__(self, rules: List[AlertRule]) -> None:
+        self.rules = rules
+        self._index: Dict[Optional[str], List[AlertRule]] = {}
+        for rule in rules:
+            self._index.setdefault(rule.index_key, []).append(rule)
+        self._matches: Dict[str, List[AlertRule]] = {}
+        self._states: Dict[Tuple[str, str], _SeriesState] = {}
+
+    def rules_for(self, uri: str) -> List[AlertRule]:
+        """URI에 해당하는 규칙 목록 (URI별로 한 번만 계산해 캐시)."""
+        matched = self._matches.get(uri)
+        if matched is None:
+            candidates = self._index.get(uri.split(".", 1)[0], []) + self._index.get(None, [])
+            matched = [rule for rule in candidates if rule.matches(uri)]
+            self._matches[uri] = matched
+        return matched
+
+    def evaluate(self, uri: str, value: Any, ts: datetime) -> List[AlertEvent]:
+        """
+        Feeds one sample to the matching rules.
+
+        Args:
+            uri (str): The URI path.
+            value (Any): The metric value (non-numeric values are ignored).
+            ts (datetime): The timestamp of the sample.
+
+        Returns:
+            list: Alerts that started firing or resolved with this sample.
+        """
+        rules = self.rules_for(uri)
+        if not rules or isinstance(value, bool) or not isinstance(value, (int, float)):
+            return []
+        value = float(value)
+
+        events: List[AlertEvent] = []
+        for rule in rules:
+            key = (rule.name, uri)
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _SeriesState()
+
+            observed = value
+            if rule.kind == "rate":
+                rate: Optional[float] = None
+                if state.last_value is not None and state.last_ts is not None:
+                    elapsed = (ts - state.last_ts).total_seconds()
+                    if elapsed > 0:
+                        rate = (value - state.last_value) / elapsed
+                state.last_value = value
+                state.last_ts = ts
+                if rate is None:
+                    continue
+                observed = rate
+
+            if rule.holds(observed):
+                state.fired_value, state.fired_observed = value, observed
+                if state.pending_since is None:
+                    state.pending_since = ts
+                if (
+                    not state.firing
+                    and (ts - state.pending_since).total_seconds() >= rule.for_seconds
+                ):
+                    state.firing = True
+                    events.append(AlertEvent(rule, uri, "firing", value, observed, ts))
+            else:
+                state.pending_since = None
+                if state.firing:
+                    state.firing = False
+                    events.append(AlertEvent(rule, uri, "resolved", value, observed, ts))
+        return events
+
+    def firing(self) -> List[Tuple[str, str]]:
+        """현재 발생 중인 (규칙 이름, URI) 목록."""
+        return [key for key, state in self._states.items() if state.firing]
+
+    def forget(self, uri: str, ts: datetime) -> List[AlertEvent]:
+        """
+        URI에 대한 캐시와 상태를 제거합니다 (사라진 시리즈 정리용).
+
+        Returns:
+            list: 발생 중이던 알림마다 합성한 resolved 이벤트 (위젯·훅이 해제를 알 수 있도록).
+        """
+        events: List[AlertEvent] = []
+        for rule in self._matches.pop(uri, []):
+            state = self._states.pop((rule.name, uri), None)
+            if state is not None and state.firing:
+                events.append(
+                    AlertEvent(
+                        rule,
+                        uri,
+                        "resolved",
+                        state.fired_value,
+                        state.fired_observed,
+                        ts,
+                        reason="series_forgotten",
+                    )
+                )
+        return events
+
+
+DEFAULT_RULES: List[Dict[str, Any]] = [
+    {"name": "cpu_core_hot", "pattern": "system.cpu.core*", "threshold": 95, "for_seconds": 30},
+    {"name": "memory_high", "pattern": "system.memory.used_percent", "threshold": 90},
+    {
+        "name": "memory_pressure_stall",
+        "pattern": "system.pressure.memory.full.avg10",
+        "threshold": 10,
+        "for_seconds": 30,
+    },
+    {
+        "name": "container_memory_high",
+        "pattern": "docker.container.*.mem_percent",
+        "threshold": 90,
+        "for_seconds": 60,
+    },
+    {"name": "dmesg_new_errors", "pattern": "kernel.dmesg.errors", "kind": "rate", "threshold": 0},
+    {"name": "fs_full", "pattern": "fs.*.used_percent", "threshold": 90, "for_seconds": 60},
+    {
+        "name": "fs_inodes_full",
+        "pattern": "fs.*.inodes_used_percent",
+        "threshold": 90,
+        "for_seconds": 60,
+    },
+]
+
+
+def load_alert_config(config_path: Optional[Path]) -> Dict[str, Any]:
+    """
+    Loads the alert config, falling back to `DEFAULT_RULES` without hooks.
+
+    Returns:
+        dict: {"rules": List[AlertRule], "webhook_url": str | None, "command": list | None}
+    """
+    raw: Dict[str, Any] = {}
+    if config_path is not None and config_path.is_file():
+        with open(config_path, encoding="utf-8") as f:
+            raw = json.load(f)
+    rules = [AlertRule.from_dict(rule) for rule in raw.get("rules", DEFAULT_RULES)]
+    # 상태는 (규칙 이름, URI)로 구분하므로 같은 이름의 규칙이 있으면 서로의 상태를 덮어씁니다.
+    names = [rule.name for rule in rules]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"duplicate alert rule names: {', '.join(duplicates)}")
+    webhook_url = raw.get("webhook_url")
+    if webhook_url and urlparse(webhook_url).hostname not in _LOCAL_HOSTS:
+        raise ValueError(f"webhook_url must point to a local address: {webhook_url}")
+    return {"rules": rules, "webhook_url": webhook_url, "command": raw.get("command")}
+
+
+def _post_json(url: str, payload: bytes) -> None:
+    request = urllib.request.Request(
+        url, data=payload, headers={"Content-Type": "application/json"}, method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=HOOK_TIMEOUT_SECONDS):
+        pass
+
+
+async def dispatch_hooks(
+    event: AlertEvent, webhook_url: Optional[str], command: Optional[List[str]]
+) -> None:
+    """
+    Sends an alert to the optional local webhook and/or command hook.
+    The command receives the event as JSON on stdin and is killed after the timeout.
+    """
+    payload = json.dumps(event.to_dict(), ensure_ascii=False).encode("utf-8")
+    if webhook_url:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _post_json, webhook_url, payload)
+    if command:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            await asyncio.wait_for(process.communicate(payload), timeout=HOOK_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
@@ -0,0 +1,179 @@
+# utils/cardinality.py
+"""
+Series cardinality guard.
+
+Every sample passes `admit()` before it reaches the log, the cache or any other
+per-URI state. Series are grouped by the first matching URI glob pattern; each
+group keeps its series in LRU order (least recently seen first), which makes the
+two bounding operations cheap:
+
+    * limit: a new series in a full group first takes the place of the group's
+      least recently seen series if that one was idle (not seen this tick).
+      Otherwise the sample overflows: it is added to the group's "other" bucket
+      (e.g. `top_cpu.other.cpu_percent`, summed per tick) or dropped.
+    * idle eviction: `evict_idle()` pops series not seen for `idle_seconds` from the
+      front of each group. The caller then forgets them in every per-series store.
+
+Both are O(1) per sample or per evicted series, so state stays flat on hosts
+with short-lived PIDs or containers, no matter how long the process runs.
+"""
+
+import fnmatch
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_IDLE_SECONDS: float = 300.0
+OTHER_BUCKET_NAME: str = "other"
+
+
+class _SeriesGroup:
+    __slots__ = ("pattern", "limit", "aggregate", "series", "other_prefix")
+
+    def __init__(self, pattern: str, limit: Optional[int], aggregate: bool) -> None:
+        self.pattern = pattern
+        self.limit = limit
+        self.aggregate = aggregate
+        self.series: "OrderedDict[str, datetime]" = OrderedDict()  # uri -> 마지막 샘플 시각
+        # "top_cpu.*" -> "top_cpu.": 패턴의 고정 접두사 뒤에 other 버킷을 만듭니다.
+        self.other_prefix = pattern.split("*", 1)[0].split("?", 1)[0].split("[", 1)[0]
+
+    def other_uri(self, uri: str) -> str:
+        metric = uri.rsplit(".", 1)[-1]
+        return f"{self.other_prefix}{OTHER_BUCKET_NAME}.{metric}"
+
+
+class CardinalityGuard:
+    """
+    Per-pattern series limits with LRU eviction and "other" overflow buckets.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[int, bool]]] = None,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+    ) -> None:
+        """
+        Args:
+            limits (dict | None): URI glob pattern -> (max series, aggregate overflow into
+                an "other" bucket). The first matching pattern wins; URIs matching no
+                pattern are unlimited but still evicted when idle.
+            idle_seconds (float): Series not seen for this long are evicted.
+        """
+        self.idle_seconds = idle_seconds
+        self._groups: List[_SeriesGroup] = [
+            _SeriesGroup(pattern, limit, aggregate)
+            for pattern, (limit, aggregate) in (limits or {}).items()
+        ]
+        self._unlimited = _SeriesGroup("*", None, False)
+        self._group_cache: Dict[str, _SeriesGroup] = {}
+        self._other_uris: set[str] = set()
+        self._overflow: Dict[str, float] = {}  # other 버킷 URI -> 이번 틱 합계
+        self._evicted: List[str] = []  # admit()에서 자리를 넘긴 시리즈 (evict_idle()이 반환)
+        self.dropped_samples: int = 0
+        self.overflow_samples: int = 0
+        self.evicted_series: int = 0
+        self.replaced_series: int = 0
+
+    def _group_for(self, uri: str) -> _SeriesGroup:
+        group = self._group_cache.get(uri)
+        if group is None:
+            group = self._unlimited
+            for candidate in self._groups:
+                if fnmatch.fnmatchcase(uri, candidate.pattern):
+                    group = candidate
+                    break
+            self._group_cache[uri] = group
+        return group
+
+    def _forget_cached_group(self, uri: str) -> None:
+        self._group_cache.pop(uri, None)
+
+    def admit(self, uri: str, value: Any, ts: datetime) -> Optional[str]:
+        """
+        Decides what happens to one sample.
+
+        Returns:
+            str | None: The URI to record the sample under, or None when the sample
+                overflowed (dropped, or added to an "other" bucket that is emitted by
+                `drain_overflow()`).
+        """
+        if uri in self._other_uris:
+            return uri
+        group = self._group_for(uri)
+        series = group.series
+        if uri in series:
+            series[uri] = ts
+            series.move_to_end(uri)
+            return uri
+        if group.limit is not None and len(series) >= group.limit:
+            oldest_uri, oldest_ts = next(iter(series.items()))
+            if oldest_ts < ts:
+                # 이번 틱에 보이지 않은 가장 오래된 시리즈를 내보내고 자리를 넘깁니다.
+                del series[oldest_uri]
+                self._forget_cached_group(oldest_uri)
+                self._evicted.append(oldest_uri)
+                self.replaced_series += 1
+            else:
+                self._overflow_sample(group, uri, value)
+                self._forget_cached_group(uri)
+                return None
+        series[uri] = ts
+        return uri
+
+    def _overflow_sample(self, group: _SeriesGroup, uri: str, value: Any) -> None:
+        if group.aggregate and isinstance(value, (int, float)):
+            other_uri = group.other_uri(uri)
+            self._other_uris.add(other_uri)
+            self._overflow[other_uri] = self._overflow.get(other_uri, 0.0) + float(value)
+            self.overflow_samples += 1
+        else:
+            self.dropped_samples += 1
+
+    def drain_overflow(self) -> List[Tuple[str, float]]:
+        """이번 틱의 other 버킷 합계를 돌려주고 비웁니다 (틱 끝에 한 번 호출)."""
+        overflow, self._overflow = self._overflow, {}
+        return list(overflow.items())
+
+    def evict_idle(self, now: datetime) -> List[str]:
+        """
+        Returns the series that left the guard since the last call: the ones replaced
+        by `admit()` plus the ones idle for longer than `idle_seconds`.
+        """
+        evicted, self._evicted = self._evicted, []
+        for group in self._groups + [self._unlimited]:
+            series = group.series
+            while series:
+                uri, last_seen = next(iter(series.items()))
+                if (now - last_seen).total_seconds() <= self.idle_seconds:
+                    break
+                del series[uri]
+                self._forget_cached_group(uri)
+                evicted.append(uri)
+        self.evicted_series += len(evicted)
+        return evicted
+
+    def __len__(self) -> int:
+        return sum(len(group.series) for group in self._groups) + len(self._unlimited.series)
+
+    def stats(self) -> Dict[str, Any]:
+        """그룹별 시리즈 수와 누적 카운터."""
+        return {
+            "series": len(self),
+            "groups": {
+                group.pattern: len(group.series) for group in self._groups + [self._unlimited]
+            },
+            "dropped_samples": self.dropped_samples,
+            "overflow_samples": self.overflow_samples,
+            "evicted_series": self.evicted_series,
+            "replaced_series": self.replaced_series,
+        }
+
+    def metrics(self) -> List[Tuple[str, float]]:
+        """자기 관측용 URI (pysnoop.series.*)로 카운터를 내보냅니다."""
+        return [
+            ("pysnoop.series.tracked", float(len(self))),
+            ("pysnoop.series.dropped_samples_total", float(self.dropped_samples)),
+            ("pysnoop.series.overflow_samples_total", float(self.overflow_samples)),
+            ("pysnoop.series.evicted_total", float(self.evicted_series)),
+        ]
@@ -0,0 +1,75 @@
+# utils/cpu_topology.py
+"""
+CPU grouping (NUMA node, else socket) read from `/sys/devices/system/cpu`.
+"""
+
+import os
+from typing import Dict, List
+
+SYS_CPU_ROOT: str = "/sys/devices/system/cpu"
+
+
+def _read_int(path: str) -> int:
+    with open(path, encoding="ascii") as f:
+        return int(f.read().strip())
+
+
+def format_cpu_list(cpus: List[int]) -> str:
+    """[0, 1, 2, 5, 7, 8] -> "0-2,5,7-8" (커널의 cpulist 형식)."""
+    ranges: List[str] = []
+    start = previous = None
+    for cpu in sorted(cpus):
+        if previous is not None and cpu == previous + 1:
+            previous = cpu
+            continue
+        if start is not None:
+            ranges.append(str(start) if start == previous else f"{start}-{previous}")
+        start = previous = cpu
+    if start is not None:
+        ranges.append(str(start) if start == previous else f"{start}-{previous}")
+    return ",".join(ranges)
+
+
+def read_cpu_groups(sys_cpu_root: str = SYS_CPU_ROOT) -> Dict[int, str]:
+    """
+    Maps each CPU id to a group label.
+
+    The NUMA node comes from the `nodeN` link inside `cpuN/`. With a single node
+    the physical package (socket) id is used instead, and if that does not split
+    the CPUs either, every CPU lands in one unnamed group.
+
+    Args:
+        sys_cpu_root (str): Path of the sysfs CPU directory (overridable for tests).
+
+    Returns:
+        dict: CPU id -> label such as "node0" or "socket1" ("" when unknown).
+    """
+    try:
+        names = os.listdir(sys_cpu_root)
+    except OSError:
+        return {}
+    cpu_ids = sorted(
+        int(name[3:]) for name in names if name.startswith("cpu") and name[3:].isdigit()
+    )
+
+    nodes: Dict[int, str] = {}
+    packages: Dict[int, str] = {}
+    for cpu in cpu_ids:
+        cpu_dir = os.path.join(sys_cpu_root, f"cpu{cpu}")
+        try:
+            node = next((entry for entry in os.listdir(cpu_dir) if entry.startswith("node")), None)
+        except OSError:
+            node = None
+        if node is not None and node[4:].isdigit():
+            nodes[cpu] = node
+        try:
+            package = _read_int(os.path.join(cpu_dir, "topology", "physical_package_id"))
+            packages[cpu] = f"socket{package}"
+        except (OSError, ValueError):
+            pass
+
+    # 그룹이 하나뿐이면 나눌 필요가 없으므로 라벨을 비웁니다.
+    for labels in (nodes, packages):
+        if len(set(labels.values())) > 1:
+            return {cpu: labels.get(cpu, "") for cpu in cpu_ids}
+    return {cpu: "" for cpu in cpu_ids}
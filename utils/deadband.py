@@ -0,0 +1,188 @@
+# utils/deadband.py
+
+import fnmatch
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# 시리즈가 사라졌음을 알리는 로그 이벤트 ({"ts", "uri", "event": TOMBSTONE_EVENT}).
+# 데드밴드 로그는 변화만 담으므로, 이 줄이 없으면 재생 측은 마지막 값을 계속 유지합니다.
+TOMBSTONE_EVENT: str = "series_forgotten"
+
+
+class DeadbandFilter:
+    """
+    Change-only (deadband) stage that sits in front of LogWriter.
+
+    A sample is written only when its value leaves the tolerance band around the
+    last *written* value of the same URI, or when `keepalive_seconds` have passed
+    since the last write. Because the band is always measured against the last
+    written value (never against the last suppressed one), a reader that holds
+    each written value until the next entry of the same URI reconstructs every
+    sample to within the configured tolerance without drift, and exactly when
+    the tolerance is zero. Keepalive entries bound the gap between
+    writes, so a missing URI for longer than the keepalive means the source
+    actually stopped reporting.
+    """
+
+    def __init__(
+        self,
+        keepalive_seconds: float = 60.0,
+        default_abs_tolerance: float = 0.0,
+        default_rel_tolerance: float = 0.0,
+        tolerances: Optional[Dict[str, Tuple[float, float]]] = None,
+    ) -> None:
+        """
+        Initialize the deadband filter.
+
+        Args:
+            keepalive_seconds (float): Force a write at least this often per URI.
+            default_abs_tolerance (float): Absolute band used when no pattern matches.
+            default_rel_tolerance (float): Relative band (fraction of last value) used
+                when no pattern matches.
+            tolerances (dict | None): URI glob pattern -> (abs_tolerance, rel_tolerance).
+                The first matching pattern wins.
+        """
+        self.keepalive_seconds = keepalive_seconds
+        self._default = (default_abs_tolerance, default_rel_tolerance)
+        self._patterns: List[Tuple[str, Tuple[float, float]]] = list((tolerances or {}).items())
+        self._tolerance_cache: Dict[str, Tuple[float, float]] = {}
+        # uri -> (last written value, last written timestamp)
+        self._last: Dict[str, Tuple[Any, datetime]] = {}
+        self.samples_seen: int = 0
+        self.samples_written: int = 0
+
+    def _tolerance_for(self, uri: str) -> Tuple[float, float]:
+        tolerance = self._tolerance_cache.get(uri)
+        if tolerance is None:
+            tolerance = self._default
+            for pattern, pattern_tolerance in self._patterns:
+                if fnmatch.fnmatchcase(uri, pattern):
+                    tolerance = pattern_tolerance
+                    break
+            self._tolerance_cache[uri] = tolerance
+        return tolerance
+
+    def should_write(self, uri: str, value: Any, ts: datetime) -> bool:
+        """
+        Decide whether a sample has to be written and remember it if so.
+
+        Args:
+            uri (str): The URI path.
+            value (Any): The metric value.
+            ts (datetime): The timestamp of the sample.
+
+        Returns:
+            bool: True if the sample should be passed on to the writer.
+        """
+        self.samples_seen += 1
+        last = self._last.get(uri)
+        if last is not None:
+            last_value, last_ts = last
+            if (ts - last_ts).total_seconds() < self.keepalive_seconds and self._within_band(
+                uri, last_value, value
+            ):
+                return False
+
+        self._last[uri] = (value, ts)
+        self.samples_written += 1
+        return True
+
+    def _within_band(self, uri: str, last_value: Any, value: Any) -> bool:
+        numeric = (int, float)
+        if (
+            isinstance(value, numeric)
+            and isinstance(last_value, numeric)
+            and not isinstance(value, bool)
+            and not isinstance(last_value, bool)
+        ):
+            abs_tolerance, rel_tolerance = self._tolerance_for(uri)
+            band = max(abs_tolerance, abs(last_value) * rel_tolerance)
+            return abs(value - last_value) <= band
+        # Non-numeric values (e.g. uptime descriptions) are written on any change.
+        return value == last_value
+
+    def forget(self, uri: str) -> bool:
+        """
+        Drop the remembered state of a URI so its next sample is always written.
+
+        Returns:
+            bool: True if a value of the URI had been written (a tombstone is due).
+        """
+        self._tolerance_cache.pop(uri, None)
+        return self._last.pop(uri, None) is not None
+
+    @property
+    def compression_ratio(self) -> float:
+        """Samples seen per sample written (1.0 means nothing was suppressed)."""
+        if self.samples_written == 0:
+            return 1.0
+        return self.samples_seen / self.samples_written
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return counters describing how much the filter suppressed.
+
+        Returns:
+            dict: seen/written/suppressed sample counts and the compression ratio.
+        """
+        return {
+            "samples_seen": self.samples_seen,
+            "samples_written": self.samples_written,
+            "samples_suppressed": self.samples_seen - self.samples_written,
+            "compression_ratio": round(self.compression_ratio, 3),
+            "tracked_uris": len(self._last),
+        }
+
+
+def reconstruct_step_series(
+    entries: List[Dict[str, Any]],
+    uri: str,
+    timestamps: List[datetime],
+    keepalive_seconds: Optional[float] = None,
+) -> List[Optional[Any]]:
+    """
+    Rebuild the value of `uri` at each of `timestamps` from deadband-filtered log entries.
+
+    Each written value is held until the next written entry of the same URI. Timestamps
+    before the first entry, after a `TOMBSTONE_EVENT` entry of the URI, or more than two
+    keepalive periods after the last one, yield None.
+
+    Args:
+        entries (list): Parsed log entries ({"ts", "uri", "value", ...}) in write order.
+        uri (str): The URI to reconstruct.
+        timestamps (list): Sorted timestamps at which to evaluate the series.
+        keepalive_seconds (float | None): The filter's keepalive, used to detect gaps.
+
+    Returns:
+        list: The reconstructed value (or None) for each requested timestamp.
+    """
+    points: List[Tuple[datetime, Any]] = []
+    for entry in entries:
+        if entry.get("uri") != uri:
+            continue
+        event = entry.get("event")
+        if event is not None and event != TOMBSTONE_EVENT:
+            continue  # 알림 이벤트 등은 샘플이 아닙니다.
+        ts = entry["ts"]
+        if isinstance(ts, str):
+            ts = datetime.fromisoformat(ts)
+        points.append((ts, None if event else entry.get("value")))
+
+    result: List[Optional[Any]] = []
+    idx = -1
+    for ts in timestamps:
+        while idx + 1 < len(points) and points[idx + 1][0] <= ts:
+            idx += 1
+        if idx < 0:
+            result.append(None)
+            continue
+        point_ts, value = points[idx]
+        if (
+            keepalive_seconds is not None
+            and (ts - point_ts).total_seconds() > keepalive_seconds * 2
+        ):
+            # Source stopped reporting: no keepalive arrived in time.
+            result.append(None)
+        else:
+            result.append(value)
+    return result
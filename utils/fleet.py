@@ -0,0 +1,450 @@
+# utils/fleet.py
+"""
+Fleet mode: follow the NDJSON metric streams of many hosts on one asyncio loop.
+
+Every host runs `python main.py --stream` (see headless.py) and the dashboard
+reads its output through one of these sources:
+
+    ssh      `ssh [options] <target> <command>` subprocess, stdout is the stream
+    tcp      connect to host:port and read lines (e.g. the stream piped into
+             `socat TCP-LISTEN:9465,fork,reuseaddr EXEC:"python3 main.py --stream"`)
+    command  any local command printing NDJSON (kubectl exec, docker exec, ...)
+    synthetic  in-process fake stream (`--fleet-synthetic N`), for trying the
+             fleet view and load-testing hundreds of hosts without any remote
+
+Config file (`--fleet fleet.json`):
+
+    {
+        "command": "python3 /opt/pysnoop/main.py --stream --interval 2",
+        "ssh_options": ["-o", "BatchMode=yes", "-o", "ConnectTimeout=10"],
+        "hosts": [
+            {"name": "web-1", "ssh": "deploy@web-1"},
+            {"name": "db-1", "tcp": "10.0.0.5:9465"},
+            {"name": "k8s-node", "command": ["kubectl", "exec", "ds/pysnoop", "--", "..."]}
+        ]
+    }
+
+Per host only the latest snapshot is kept (`HostState`), capped at
+`max_series` metrics, `MAX_PROCESSES` processes and `MAX_LINE_BYTES` per line,
+so memory is bounded per host no matter what a remote sends. Each host has a
+single reader task; reconnects back off exponentially with jitter, and at most
+`max_connecting` hosts are connecting (SSH handshakes) at the same time.
+"""
+
+import asyncio
+import json
+import math
+import random
+import shlex
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MAX_LINE_BYTES: int = 1024 * 1024
+MAX_PROCESSES: int = 10
+MAX_STRING_CHARS: int = 200
+DEFAULT_MAX_SERIES_PER_HOST: int = 2000
+DEFAULT_STALE_AFTER_SECONDS: float = 10.0
+DEFAULT_MAX_CONNECTING: int = 32
+CONNECT_TIMEOUT_SECONDS: float = 20.0  # 첫 줄(스냅숏)을 받을 때까지
+RECONNECT_BASE_SECONDS: float = 1.0
+RECONNECT_MAX_SECONDS: float = 60.0
+DEFAULT_COMMAND: str = "python3 main.py --stream"
+DEFAULT_SSH_OPTIONS: Tuple[str, ...] = ("-o", "BatchMode=yes", "-o", "ConnectTimeout=10")
+SYNTHETIC_INTERVAL_SECONDS: float = 2.0
+
+# 호스트 개요 정렬 키 -> 표시 이름 (값이 클수록 나쁨)
+SORT_KEYS: Dict[str, str] = {
+    "cpu": "CPU",
+    "memory": "메모리",
+    "dmesg": "dmesg 오류",
+    "disk": "디스크",
+    "name": "이름",
+}
+
+
+@dataclass
+class HostSpec:
+    """Where one host's stream comes from."""
+
+    name: str
+    kind: str  # "ssh" | "tcp" | "command" | "synthetic"
+    target: str = ""
+    argv: List[str] = field(default_factory=list)
+
+
+class HostState:
+    """
+    Latest snapshot and connection status of one host (bounded size).
+    """
+
+    __slots__ = (
+        "spec",
+        "status",
+        "error",
+        "metrics",
+        "processes",
+        "snapshot_ts",
+        "received_at",
+        "lines",
+        "bad_lines",
+        "dropped_series",
+        "reconnects",
+        "cpu",
+        "memory",
+        "dmesg",
+        "disk",
+    )
+
+    def __init__(self, spec: HostSpec) -> None:
+        self.spec = spec
+        self.status: str = "connecting"  # connecting | up | stale | down
+        self.error: str = ""
+        self.metrics: Dict[str, Any] = {}
+        self.processes: List[Dict[str, Any]] = []
+        self.snapshot_ts: str = ""
+        self.received_at: Optional[float] = None  # monotonic
+        self.lines = self.bad_lines = self.dropped_series = self.reconnects = 0
+        self.cpu: Optional[float] = None
+        self.memory: Optional[float] = None
+        self.dmesg: Optional[float] = None
+        self.disk: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
+
+    def apply(self, snapshot: Dict[str, Any], max_series: int, now: float) -> None:
+        """스냅숏 한 줄로 상태를 교체합니다 (이전 값은 남기지 않아 호스트당 크기가 일정)."""
+        raw_metrics = snapshot.get("metrics")
+        metrics: Dict[str, Any] = {}
+        dropped = 0
+        if isinstance(raw_metrics, dict):
+            for uri, value in raw_metrics.items():
+                if len(metrics) >= max_series:
+                    dropped = len(raw_metrics) - max_series
+                    break
+                if isinstance(value, str):
+                    value = value[:MAX_STRING_CHARS]
+                elif not isinstance(value, (int, float)) or isinstance(value, bool):
+                    continue
+                metrics[str(uri)[:MAX_STRING_CHARS]] = value
+        processes = snapshot.get("processes")
+        self.processes = (
+            sorted(
+                (p for p in processes if isinstance(p, dict)),
+                key=lambda p: p.get("cpu_percent") or 0.0,
+                reverse=True,
+            )[:MAX_PROCESSES]
+            if isinstance(processes, list)
+            else []
+        )
+        self.metrics = metrics
+        self.dropped_series = dropped
+        self.snapshot_ts = str(snapshot.get("ts", ""))[:40]
+        self.received_at = now
+        self.lines += 1
+        self.status = "up"
+        self.error = ""
+        self._summarize()
+
+    def _summarize(self) -> None:
+        cores = [
+            v
+            for uri, v in self.metrics.items()
+            if uri.startswith("system.cpu.core") and isinstance(v, (int, float))
+        ]
+        self.cpu = sum(cores) / len(cores) if cores else None
+        memory = self.metrics.get("system.memory.used_percent")
+        self.memory = memory if isinstance(memory, (int, float)) else None
+        dmesg = self.metrics.get("kernel.dmesg.errors")
+        self.dmesg = dmesg if isinstance(dmesg, (int, float)) and dmesg >= 0 else None
+        disks = [
+            v
+            for uri, v in self.metrics.items()
+            if uri.startswith("fs.") and uri.endswith(".used_percent")
+        ]
+        self.disk = max(disks) if disks else None
+
+    def sort_value(self, key: str) -> Any:
+        """정렬 값 (없는 값은 가장 뒤로)."""
+        if key == "name":
+            return self.name
+        value = getattr(self, key)
+        return -math.inf if value is None else value
+
+
+def _parse_host(entry: Dict[str, Any], command: str, ssh_options: List[str]) -> HostSpec:
+    host_command = entry.get("command", command)
+    argv = shlex.split(host_command) if isinstance(host_command, str) else list(host_command)
+    if "ssh" in entry:
+        target = str(entry["ssh"])
+        remote = host_command if isinstance(host_command, str) else shlex.join(host_command)
+        return HostSpec(
+            str(entry.get("name", target)),
+            "ssh",
+            target,
+            ["ssh", *entry.get("ssh_options", ssh_options), target, remote],
+        )
+    if "tcp" in entry:
+        target = str(entry["tcp"])
+        return HostSpec(str(entry.get("name", target)), "tcp", target)
+    if "command" in entry:
+        return HostSpec(str(entry.get("name", argv[0])), "command", argv=argv)
+    raise ValueError(f"ssh, tcp, command 중 하나가 필요합니다: {entry}")
+
+
+def load_fleet_config(path: Path) -> List[HostSpec]:
+    """
+    Reads a fleet config file (see module docstring).
+
+    Raises:
+        ValueError: Invalid entries or duplicate host names.
+    """
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+    command = config.get("command", DEFAULT_COMMAND)
+    ssh_options = list(config.get("ssh_options", DEFAULT_SSH_OPTIONS))
+    specs = [_parse_host(entry, command, ssh_options) for entry in config.get("hosts", [])]
+    names = [spec.name for spec in specs]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"호스트 이름이 중복되었습니다: {', '.join(sorted(duplicates))}")
+    return specs
+
+
+def synthetic_specs(count: int) -> List[HostSpec]:
+    return [HostSpec(f"synthetic-{index:04d}", "synthetic") for index in range(count)]
+
+
+async def _synthetic_feed(
+    reader: asyncio.StreamReader, name: str, interval: float = SYNTHETIC_INTERVAL_SECONDS
+) -> None:
+    """headless.py와 같은 모양의 가짜 NDJSON 줄을 스트림에 밀어 넣습니다."""
+    rng = random.Random(name)
+    cores = rng.choice((2, 4, 8, 16))
+    base_cpu, base_mem = rng.uniform(2, 70), rng.uniform(10, 85)
+    dmesg, disk = 0, rng.uniform(5, 80)
+    await asyncio.sleep(rng.uniform(0, interval))  # 호스트마다 위상을 흩뜨림
+    while True:
+        if rng.random() < 0.01:
+            dmesg += 1
+        disk = min(100.0, disk + rng.uniform(0, 0.05))
+        metrics: Dict[str, Any] = {
+            f"system.cpu.core{core}": max(0.0, min(100.0, rng.gauss(base_cpu, 10)))
+            for core in range(cores)
+        }
+        metrics.update(
+            {
+                "system.memory.used_percent": max(0.0, min(100.0, rng.gauss(base_mem, 2))),
+                "kernel.dmesg.errors": float(dmesg),
+                "fs.root.used_percent": disk,
+                "system.uptime.description": f"Up {name}",
+            }
+        )
+        processes = [
+            {"pid": 1000 + i, "name": f"worker-{i}", "cpu_percent": rng.uniform(0, base_cpu)}
+            for i in range(3)
+        ]
+        line = json.dumps(
+            {
+                "ts": time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()),
+                "host": name,
+                "metrics": metrics,
+                "processes": processes,
+            }
+        )
+        reader.feed_data(line.encode() + b"\n")
+        await asyncio.sleep(interval)
+
+
+def reconnect_delay(failures: int) -> float:
+    """연속 실패 횟수에 따른 재연결 대기 시간 (지터 적용 전, 지수 증가 후 상한)."""
+    return min(RECONNECT_MAX_SECONDS, RECONNECT_BASE_SECONDS * 2 ** min(failures, 10))
+
+
+class FleetManager:
+    """
+    Runs one reader task per host and keeps their `HostState`s.
+    """
+
+    def __init__(
+        self,
+        specs: List[HostSpec],
+        max_series_per_host: int = DEFAULT_MAX_SERIES_PER_HOST,
+        stale_after: float = DEFAULT_STALE_AFTER_SECONDS,
+        max_connecting: int = DEFAULT_MAX_CONNECTING,
+        on_update: Optional[Callable[[HostState], None]] = None,
+    ) -> None:
+        """
+        Args:
+            specs (list): Hosts to follow (names must be unique).
+            max_series_per_host (int): Metrics kept per host snapshot (the rest is dropped).
+            stale_after (float): A host without a line for this long is shown as stale.
+            max_connecting (int): Concurrent connection attempts (bounds SSH handshake storms).
+            on_update (Callable | None): Called after each applied snapshot.
+        """
+        self.hosts: Dict[str, HostState] = {spec.name: HostState(spec) for spec in specs}
+        self.max_series_per_host = max_series_per_host
+        self.stale_after = stale_after
+        self.on_update = on_update
+        self._connect_slots = asyncio.Semaphore(max_connecting)
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Starts the reader tasks (call from the running loop)."""
+        self._tasks = [
+            asyncio.create_task(self._follow(state), name=f"fleet:{state.name}")
+            for state in self.hosts.values()
+        ]
+
+    async def close(self) -> None:
+        """Cancels every reader task (their subprocesses/sockets are closed on the way out)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def states(self) -> List[HostState]:
+        """All host states, with `stale` applied to hosts that stopped sending."""
+        now = time.monotonic()
+        for state in self.hosts.values():
+            if (
+                state.status == "up"
+                and state.received_at is not None
+                and now - state.received_at > self.stale_after
+            ):
+                state.status = "stale"
+        return list(self.hosts.values())
+
+    def stats(self) -> Dict[str, int]:
+        counts = {"hosts": len(self.hosts), "up": 0, "stale": 0, "down": 0, "connecting": 0}
+        for state in self.states():
+            counts[state.status] = counts.get(state.status, 0) + 1
+        return counts
+
+    async def _open(self, spec: HostSpec) -> Tuple[asyncio.StreamReader, Callable[[], Any]]:
+        """Returns (line reader, async closer)."""
+        if spec.kind == "tcp":
+            host, _, port = spec.target.rpartition(":")
+            reader, writer = await asyncio.open_connection(
+                host.strip("[]"), int(port), limit=MAX_LINE_BYTES
+            )
+
+            async def close_socket() -> None:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+
+            return reader, close_socket
+        if spec.kind == "synthetic":
+            reader = asyncio.StreamReader(limit=MAX_LINE_BYTES)
+            feeder = asyncio.create_task(_synthetic_feed(reader, spec.name))
+
+            async def stop_feeder() -> None:
+                feeder.cancel()
+                await asyncio.gather(feeder, return_exceptions=True)
+
+            return reader, stop_feeder
+        process = await asyncio.create_subprocess_exec(
+            *spec.argv,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=MAX_LINE_BYTES,
+            start_new_session=True,  # 터미널 Ctrl+C가 ssh로 전달되지 않도록
+        )
+        assert process.stdout is not None
+
+        async def stop_process() -> None:
+            if process.returncode is None:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=2.0)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+            # 줄 길이 초과로 읽기가 멈춘 파이프는 EOF를 읽지 못해 트랜스포트가 남으므로 직접 닫습니다.
+            transport = getattr(process, "_transport", None)
+            if transport is not None:
+                transport.close()
+
+        return process.stdout, stop_process
+
+    def _apply_line(self, state: HostState, line: bytes) -> None:
+        try:
+            snapshot = json.loads(line)
+        except ValueError:
+            state.bad_lines += 1
+            return
+        if not isinstance(snapshot, dict):
+            state.bad_lines += 1
+            return
+        state.apply(snapshot, self.max_series_per_host, time.monotonic())
+        if self.on_update is not None:
+            self.on_update(state)
+
+    async def _connect(
+        self, state: HostState
+    ) -> Tuple[asyncio.StreamReader, Callable[[], Any], bytes]:
+        """Opens the stream and waits for its first line (closes it again on failure)."""
+        state.status = "connecting"
+        reader, close = await asyncio.wait_for(self._open(state.spec), CONNECT_TIMEOUT_SECONDS)
+        try:
+            line = await asyncio.wait_for(reader.readline(), CONNECT_TIMEOUT_SECONDS)
+        except BaseException:
+            await close()
+            raise
+        return reader, close, line
+
+    async def _follow(self, state: HostState) -> None:
+        failures = 0
+        while True:
+            close: Optional[Callable[[], Any]] = None
+            try:
+                if state.spec.kind in ("ssh", "command"):
+                    # 첫 스냅숏이 올 때까지 연결 슬롯을 유지합니다 (SSH 인증 포함).
+                    async with self._connect_slots:
+                        reader, close, line = await self._connect(state)
+                else:
+                    reader, close, line = await self._connect(state)
+                while line:
+                    if line.strip():
+                        self._apply_line(state, line)
+                        failures = 0
+                    line = await reader.readline()
+                state.error = "스트림 종료 (EOF)"
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                state.error = "연결 시간 초과"
+            except (OSError, ValueError) as e:  # ValueError: MAX_LINE_BYTES를 넘는 줄
+                state.error = str(e) or e.__class__.__name__
+            finally:
+                if close is not None:
+                    await close()
+            state.status = "down"
+            state.reconnects += 1
+            failures += 1
+            await asyncio.sleep(reconnect_delay(failures) * random.uniform(0.5, 1.5))
+
+
+def parse_host_argument(value: str) -> HostSpec:
+    """
+    `--fleet-host` 값: "ssh:user@host", "tcp:host:port", "cmd:<command line>".
+    """
+    kind, sep, target = value.partition(":")
+    if not sep or not target:
+        raise ValueError(
+            f"호스트 형식이 잘못되었습니다 (ssh:HOST | tcp:HOST:PORT | cmd:COMMAND): {value}"
+        )
+    if kind == "ssh":
+        return _parse_host({"ssh": target}, DEFAULT_COMMAND, list(DEFAULT_SSH_OPTIONS))
+    if kind == "tcp":
+        return _parse_host({"tcp": target}, DEFAULT_COMMAND, [])
+    if kind == "cmd":
+        return _parse_host({"name": target, "command": target}, DEFAULT_COMMAND, [])
+    raise ValueError(f"알 수 없는 호스트 종류: {kind}")
@@ -0,0 +1,663 @@
+# utils/log_index.py
+"""
+On-disk inverted index over syslog and kernel messages.
+
+    python -m utils.log_index 'oom killer "web-1" since:6h'
+    python -m utils.log_index --ingest /var/log/syslog.1      # 과거 파일 색인
+
+Messages are stored in hourly segments (UTC) under `state/log_index/`:
+
+    2025052214/docs.bin    appended records: ts d, source B, length I, utf-8 text
+    2025052214/index.bin   written when the hour is sealed:
+
+        magic 4s b"PSLX" | version I | docs I | terms I | ts_min d | ts_max d
+        doc_ts    docs x d        message time
+        doc_off   docs x Q        record offset in docs.bin
+        term table terms x (term_off I, term_len I, postings_off I, doc_freq I), sorted by term
+        terms blob               utf-8 terms
+        postings  uint32 doc ids (ascending) per term
+
+A query looks each term up by binary search in the mmap'd term table of every
+segment inside the time window, intersects the posting lists (rarest first) and
+only then reads matching messages, newest first. The current hour is kept in
+memory (postings) and on disk (docs.bin); after a crash it is rebuilt from
+docs.bin.
+
+Query syntax: words are ANDed (`oom killer`), `"..."` requires the exact
+(case-insensitive) substring, `source:kernel|syslog` filters the source and
+`since:30m|6h|2d` limits the time window.
+"""
+
+import argparse
+import mmap
+import os
+import re
+import shutil
+import struct
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+SOURCES: Tuple[str, ...] = ("syslog", "kernel")
+DEFAULT_INDEX_DIR: Path = Path(__file__).resolve().parent.parent / "state" / "log_index"
+DEFAULT_RETENTION_DAYS: int = 7
+DEFAULT_SEARCH_LIMIT: int = 200
+MAX_TOKEN_LENGTH: int = 64
+MAX_OPEN_SEGMENTS: int = 256
+SEGMENT_FORMAT: str = "%Y%m%d%H"
+DOCS_FILE: str = "docs.bin"
+INDEX_FILE: str = "index.bin"
+MAGIC: bytes = b"PSLX"
+VERSION: int = 1
+
+_DOC_HEADER = struct.Struct("<dBI")
+_INDEX_HEADER = struct.Struct("<4sIIIdd")
+_TERM_ENTRY = struct.Struct("<IIII")
+_TS = struct.Struct("<d")
+_OFFSET = struct.Struct("<Q")
+_TOKEN = re.compile(r"[0-9a-z_]+")
+_QUERY_PART = re.compile(r'"([^"]*)"|(\S+)')
+_DURATION = re.compile(r"^(\d+(?:\.\d+)?)([smhd])$")
+_DURATION_SECONDS: Dict[str, float] = {"s": 1.0, "m": 60.0, "h": 3600.0, "d": 86400.0}
+_SEGMENT_NAME = re.compile(r"^\d{10}$")
+
+_ISO_TS = re.compile(
+    r"^(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)\s"
+)
+_RFC3164_TS = re.compile(r"^([A-Z][a-z]{2}) +(\d{1,2}) (\d{2}):(\d{2}):(\d{2})\s")
+_MONTHS: Dict[str, int] = {
+    name: index
+    for index, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+    )
+}
+
+
+class LogHit(NamedTuple):
+    ts: float
+    source: str
+    text: str
+
+
+class SearchResult(NamedTuple):
+    hits: List[LogHit]  # 최신순
+    truncated: bool  # limit 때문에 잘렸는지
+    segments_scanned: int
+    elapsed_ms: float
+
+
+def tokenize(text: str) -> Set[str]:
+    """소문자 영숫자/밑줄 토큰 (너무 긴 토큰은 버림)."""
+    return {token for token in _TOKEN.findall(text.lower()) if len(token) <= MAX_TOKEN_LENGTH}
+
+
+def parse_syslog_timestamp(line: str, now: Optional[float] = None) -> Optional[float]:
+    """
+    Parses the leading timestamp of a syslog line (ISO 8601 / RFC 5424, or the classic
+    "Oct 19 12:00:01" form, which has no year and is read as local time).
+
+    Returns:
+        float | None: Unix time, or None when the line has no recognizable timestamp.
+    """
+    match = _ISO_TS.match(line)
+    if match:
+        try:
+            parsed = datetime.fromisoformat(match.group(1).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return parsed.timestamp()  # tz 없는 값은 로컬 시간으로 해석
+    match = _RFC3164_TS.match(line)
+    if match and match.group(1) in _MONTHS:
+        now = time.time() if now is None else now
+        year = datetime.fromtimestamp(now).year
+        month, day = _MONTHS[match.group(1)], int(match.group(2))
+        hour, minute, second = (int(match.group(i)) for i in (3, 4, 5))
+        try:
+            ts = datetime(year, month, day, hour, minute, second).timestamp()
+            if ts > now + 86400:  # 연말에 작년 12월 줄을 읽는 경우
+                ts = datetime(year - 1, month, day, hour, minute, second).timestamp()
+        except ValueError:
+            return None
+        return ts
+    return None
+
+
+def _segment_name(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime(SEGMENT_FORMAT)
+
+
+def _segment_start(name: str) -> float:
+    return datetime.strptime(name, SEGMENT_FORMAT).replace(tzinfo=timezone.utc).timestamp()
+
+
+def _read_docs(path: Path) -> Iterator[Tuple[int, float, int, str]]:
+    """docs.bin의 (offset, ts, source id, text) 레코드 (잘린 마지막 레코드는 무시)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    offset, size = 0, len(data)
+    while offset + _DOC_HEADER.size <= size:
+        ts, source_id, length = _DOC_HEADER.unpack_from(data, offset)
+        text_start = offset + _DOC_HEADER.size
+        text_end = text_start + length
+        if text_end > size:
+            break
+        yield offset, ts, source_id, data[text_start:text_end].decode("utf-8", "replace")
+        offset = text_end
+
+
+def _intersect(lists: List[Sequence[int]]) -> List[int]:
+    """오름차순 doc id 목록들의 교집합 (가장 짧은 목록부터)."""
+    lists = sorted(lists, key=len)
+    result = list(lists[0])
+    for other in lists[1:]:
+        if not result:
+            break
+        if len(other) > 8 * len(result):
+            # 긴 목록은 전부 읽지 않고 이진 탐색으로 확인합니다.
+            size = len(other)
+            result = [
+                doc for doc in result if (i := bisect_left(other, doc)) < size and other[i] == doc
+            ]
+        else:
+            members = set(other)
+            result = [doc for doc in result if doc in members]
+    return result
+
+
+class _Query:
+    def __init__(self, query: str, now: float) -> None:
+        self.terms: Set[str] = set()
+        self.phrases: List[str] = []
+        self.since: Optional[float] = None
+        for match in _QUERY_PART.finditer(query):
+            phrase, word = match.group(1), match.group(2)
+            if phrase is not None:
+                if phrase.strip():
+                    self.phrases.append(phrase.lower())
+                    self.terms |= tokenize(phrase)
+                continue
+            key, _, value = word.partition(":")
+            if key == "since" and _DURATION.match(value.lower()):
+                amount, unit = _DURATION.match(value.lower()).groups()  # type: ignore[union-attr]
+                self.since = now - float(amount) * _DURATION_SECONDS[unit]
+            elif key == "source" and value.lower() in SOURCES:
+                self.terms.add(f"source:{value.lower()}")
+            else:
+                tokens = tokenize(word)
+                self.terms |= tokens
+                if len(tokens) > 1 or (tokens and word.lower() not in tokens):
+                    # "web-1"은 web, 1 토큰으로 찾은 뒤 원문 부분 문자열로 다시 확인합니다.
+                    self.phrases.append(word.lower())
+
+    def accepts(self, text: str) -> bool:
+        if not self.phrases:
+            return True
+        lowered = text.lower()
+        return all(phrase in lowered for phrase in self.phrases)
+
+
+class _Segment(ABC):
+    """검색 가능한 세그먼트의 공통 부분 (봉인된 세그먼트와 현재 시간 세그먼트)."""
+
+    name: str
+    doc_count: int
+    ts_min: float
+    ts_max: float
+
+    @abstractmethod
+    def postings(self, term: str) -> Sequence[int]:
+        pass
+
+    @abstractmethod
+    def doc_ts(self, doc_id: int) -> float:
+        pass
+
+    @abstractmethod
+    def doc(self, doc_id: int) -> LogHit:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+class _SealedSegment(_Segment):
+    def __init__(self, path: Path) -> None:
+        self.name = path.name
+        self._docs = open(path / DOCS_FILE, "rb")
+        with open(path / INDEX_FILE, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, docs, terms, ts_min, ts_max = _INDEX_HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: 알 수 없는 색인 형식")
+        self.doc_count, self.term_count = docs, terms
+        self.ts_min, self.ts_max = ts_min, ts_max
+        self._ts_base = _INDEX_HEADER.size
+        self._off_base = self._ts_base + docs * _TS.size
+        self._terms_base = self._off_base + docs * _OFFSET.size
+        self._blob_base = self._terms_base + terms * _TERM_ENTRY.size
+
+    def _term_at(self, index: int) -> Tuple[bytes, int, int]:
+        term_off, term_len, post_off, doc_freq = _TERM_ENTRY.unpack_from(
+            self._mm, self._terms_base + index * _TERM_ENTRY.size
+        )
+        start = self._blob_base + term_off
+        end = start + term_len
+        return self._mm[start:end], post_off, doc_freq
+
+    def postings(self, term: str) -> Sequence[int]:
+        key = term.encode()
+        low, high = 0, self.term_count
+        while low < high:  # 정렬된 용어 표에서 이진 탐색
+            middle = (low + high) // 2
+            if self._term_at(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.term_count:
+            return ()
+        found, post_off, doc_freq = self._term_at(low)
+        if found != key:
+            return ()
+        ids = array("I")
+        post_end = post_off + doc_freq * ids.itemsize
+        ids.frombytes(self._mm[post_off:post_end])
+        return ids
+
+    def doc_ts(self, doc_id: int) -> float:
+        return _TS.unpack_from(self._mm, self._ts_base + doc_id * _TS.size)[0]
+
+    def doc(self, doc_id: int) -> LogHit:
+        (offset,) = _OFFSET.unpack_from(self._mm, self._off_base + doc_id * _OFFSET.size)
+        header = os.pread(self._docs.fileno(), _DOC_HEADER.size, offset)
+        ts, source_id, length = _DOC_HEADER.unpack(header)
+        raw = os.pread(self._docs.fileno(), length, offset + _DOC_HEADER.size)
+        return LogHit(ts, SOURCES[source_id], raw.decode("utf-8", "replace"))
+
+    def close(self) -> None:
+        if not self._mm.closed:
+            self._mm.close()
+        self._docs.close()
+
+
+class _OpenSegment(_Segment):
+    """아직 봉인되지 않은 세그먼트: 게시 목록은 메모리, 메시지는 docs.bin에 추가합니다."""
+
+    def __init__(self, path: Path, writable: bool) -> None:
+        self.name = path.name
+        self.path = path
+        self.doc_count = 0
+        self.ts_min, self.ts_max = float("inf"), float("-inf")
+        self._postings: Dict[str, "array[int]"] = {}
+        self._doc_ts: "array[float]" = array("d")
+        self._doc_off: "array[int]" = array("Q")
+        self._size = 0
+        docs_path = path / DOCS_FILE
+        if docs_path.exists():
+            for offset, ts, source_id, text in _read_docs(docs_path):
+                self._index(offset, ts, source_id, text)
+                self._size = offset + _DOC_HEADER.size + len(text.encode())
+            if writable and docs_path.stat().st_size != self._size:
+                os.truncate(docs_path, self._size)  # 충돌로 잘린 마지막 레코드 제거
+        self._file: BinaryIO
+        if writable:
+            path.mkdir(parents=True, exist_ok=True)
+            # doc()이 같은 디스크립터로 pread하므로 추가 전용이 아닌 읽기+추가로 엽니다.
+            self._file = open(docs_path, "a+b")
+        else:
+            self._file = open(docs_path, "rb")
+        self._writable = writable
+
+    def _index(self, offset: int, ts: float, source_id: int, text: str) -> None:
+        doc_id = self.doc_count
+        self.doc_count += 1
+        self._doc_ts.append(ts)
+        self._doc_off.append(offset)
+        self.ts_min = min(self.ts_min, ts)
+        self.ts_max = max(self.ts_max, ts)
+        postings = self._postings
+        for term in tokenize(text) | {f"source:{SOURCES[source_id]}"}:
+            ids = postings.get(term)
+            if ids is None:
+                ids = postings[term] = array("I")
+            ids.append(doc_id)
+
+    def add(self, ts: float, source_id: int, text: str) -> None:
+        encoded = text.encode("utf-8", "replace")
+        self._file.write(_DOC_HEADER.pack(ts, source_id, len(encoded)))
+        self._file.write(encoded)
+        self._index(self._size, ts, source_id, text)
+        self._size += _DOC_HEADER.size + len(encoded)
+
+    def flush(self) -> None:
+        if self._writable:
+            self._file.flush()
+
+    def postings(self, term: str) -> Sequence[int]:
+        return self._postings.get(term, ())
+
+    def doc_ts(self, doc_id: int) -> float:
+        return self._doc_ts[doc_id]
+
+    def doc(self, doc_id: int) -> LogHit:
+        offset = self._doc_off[doc_id]
+        header = os.pread(self._file.fileno(), _DOC_HEADER.size, offset)
+        ts, source_id, length = _DOC_HEADER.unpack(header)
+        raw = os.pread(self._file.fileno(), length, offset + _DOC_HEADER.size)
+        return LogHit(ts, SOURCES[source_id], raw.decode("utf-8", "replace"))
+
+    def seal(self) -> None:
+        """index.bin을 쓰고 (임시 파일 -> rename) 파일을 닫습니다."""
+        self._file.close()
+        if self.doc_count == 0:
+            return
+        terms = sorted((term.encode(), ids) for term, ids in self._postings.items())
+        table = bytearray()
+        blob = bytearray()
+        postings = bytearray()
+        docs_bytes = self.doc_count * (_TS.size + _OFFSET.size)
+        postings_base = (_INDEX_HEADER.size + docs_bytes + len(terms) * _TERM_ENTRY.size) + sum(
+            len(term) for term, _ in terms
+        )
+        for term, ids in terms:
+            table += _TERM_ENTRY.pack(len(blob), len(term), postings_base + len(postings), len(ids))
+            blob += term
+            postings += ids.tobytes()
+        tmp_path = self.path / (INDEX_FILE + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(
+                _INDEX_HEADER.pack(
+                    MAGIC, VERSION, self.doc_count, len(terms), self.ts_min, self.ts_max
+                )
+            )
+            f.write(self._doc_ts.tobytes())
+            f.write(self._doc_off.tobytes())
+            f.write(table)
+            f.write(blob)
+            f.write(postings)
+        os.replace(tmp_path, self.path / INDEX_FILE)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class LogIndex:
+    """
+    Hour-segmented inverted index. One writer (the ingesting collector) and any
+    number of searches may use the same instance from different threads.
+    """
+
+    def __init__(
+        self,
+        directory: Path = DEFAULT_INDEX_DIR,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        writable: bool = True,
+    ) -> None:
+        """
+        Args:
+            directory (Path): Root directory of the hourly segments.
+            retention_days (int): Segments older than this are deleted by `maintain()`.
+            writable (bool): False for read-only use (e.g. the command-line search while
+                the dashboard is ingesting).
+        """
+        self.directory = Path(directory)
+        self.retention_days = retention_days
+        self.writable = writable
+        self._lock = threading.Lock()
+        self._active: Optional[_OpenSegment] = None
+        self._sealed: Dict[str, _SealedSegment] = {}  # 열어 둔 봉인 세그먼트 (LRU)
+        self._last_retention_check = 0.0
+        self.docs_added = 0
+        if writable:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._recover()
+
+    def _segment_names(self) -> List[str]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            entry.name
+            for entry in os.scandir(self.directory)
+            if entry.is_dir() and _SEGMENT_NAME.match(entry.name)
+        )
+
+    def _recover(self) -> None:
+        """봉인되지 않은 세그먼트를 봉인하거나, 현재 시간이면 이어서 씁니다."""
+        current = _segment_name(time.time())
+        for name in self._segment_names():
+            path = self.directory / name
+            if (path / INDEX_FILE).exists() or not (path / DOCS_FILE).exists():
+                continue
+            segment = _OpenSegment(path, writable=True)
+            if name == current and self._active is None:
+                self._active = segment
+            else:
+                segment.seal()
+
+    def add(self, ts: float, source: str, text: str) -> None:
+        """메시지 하나를 색인합니다 (시각이 바뀌면 현재 세그먼트를 봉인)."""
+        source_id = SOURCES.index(source)
+        with self._lock:
+            name = _segment_name(ts)
+            active = self._active
+            if active is None or name > active.name:
+                if active is not None:
+                    active.seal()
+                self._active = active = self._reopen(name)
+            # 늦게 도착한 이전 시간의 줄은 현재 세그먼트에 넣습니다 (ts_min이 함께 내려감).
+            active.add(ts, source_id, text)
+            self.docs_added += 1
+
+    def _reopen(self, name: str) -> _OpenSegment:
+        """
+        쓰기용 세그먼트를 엽니다. 이미 봉인된 시간이면 (과거 로그 적재 등) docs.bin에서
+        게시 목록을 다시 만들고 오래된 index.bin은 지웁니다 (다시 봉인할 때 새로 씀).
+        """
+        cached = self._sealed.pop(name, None)
+        if cached is not None:
+            cached.close()
+        path = self.directory / name
+        (path / INDEX_FILE).unlink(missing_ok=True)
+        return _OpenSegment(path, writable=True)
+
+    def commit(self) -> None:
+        """추가한 메시지를 디스크로 내보냅니다 (틱마다 한 번)."""
+        with self._lock:
+            if self._active is not None:
+                self._active.flush()
+
+    def maintain(self, now: Optional[float] = None) -> None:
+        """지난 시간의 세그먼트를 봉인하고, 한 시간에 한 번 보존 기간이 지난 세그먼트를 지웁니다."""
+        now = time.time() if now is None else now
+        with self._lock:
+            active = self._active
+            if active is not None and _segment_name(now) > active.name:
+                active.seal()
+                self._active = None
+            if now - self._last_retention_check < 3600:
+                return
+            self._last_retention_check = now
+            cutoff = _segment_name(now - self.retention_days * 86400)
+            for name in self._segment_names():
+                if name >= cutoff:
+                    break
+                segment = self._sealed.pop(name, None)
+                if segment is not None:
+                    segment.close()
+                shutil.rmtree(self.directory / name, ignore_errors=True)
+
+    def _open_sealed(self, name: str) -> Optional[_Segment]:
+        segment = self._sealed.pop(name, None)
+        if segment is None:
+            path = self.directory / name
+            try:
+                if (path / INDEX_FILE).exists():
+                    segment = _SealedSegment(path)
+                elif (path / DOCS_FILE).exists() and not self.writable:
+                    # 읽기 전용: 다른 프로세스가 쓰는 중인 세그먼트는 docs.bin에서 임시로 만듭니다.
+                    return _OpenSegment(path, writable=False)
+                else:
+                    return None
+            except (OSError, ValueError, struct.error) as e:
+                print(f"[WARN][LogIndex] 세그먼트 {name} 열기 실패: {e}")
+                return None
+        self._sealed[name] = segment  # 최근 사용 순서 유지
+        while len(self._sealed) > MAX_OPEN_SEGMENTS:
+            oldest = next(iter(self._sealed))
+            self._sealed.pop(oldest).close()
+        return segment
+
+    def search(
+        self, query: str, limit: int = DEFAULT_SEARCH_LIMIT, now: Optional[float] = None
+    ) -> SearchResult:
+        """
+        Runs a query (see module docstring) over all segments, newest first.
+
+        Returns:
+            SearchResult: Up to `limit` hits, newest first.
+        """
+        started = time.perf_counter()
+        parsed = _Query(query, time.time() if now is None else now)
+        hits: List[LogHit] = []
+        scanned = 0
+        truncated = False
+        with self._lock:
+            if self._active is not None:
+                self._active.flush()
+            names = self._segment_names()
+            for name in reversed(names):
+                if parsed.since is not None and _segment_start(name) + 3600 < parsed.since:
+                    # 세그먼트에는 그 시간 이전(늦게 도착한 줄 포함)의 메시지만 있으므로
+                    # 여기부터 더 오래된 세그먼트는 모두 범위 밖입니다.
+                    break
+                active = self._active
+                if active is not None and active.name == name:
+                    segment: Optional[_Segment] = active
+                else:
+                    segment = self._open_sealed(name)
+                if segment is None or segment.doc_count == 0:
+                    continue
+                scanned += 1
+                if parsed.since is not None and segment.ts_max < parsed.since:
+                    continue
+                truncated = self._search_segment(segment, parsed, limit, hits)
+                if isinstance(segment, _OpenSegment) and segment is not active:
+                    segment.close()
+                if truncated:
+                    break
+        hits.sort(key=lambda hit: hit.ts, reverse=True)
+        return SearchResult(hits, truncated, scanned, (time.perf_counter() - started) * 1000.0)
+
+    @staticmethod
+    def _search_segment(segment: _Segment, query: _Query, limit: int, hits: List[LogHit]) -> bool:
+        if query.terms:
+            lists = [segment.postings(term) for term in query.terms]
+            if not all(lists):
+                return False
+            candidates: Sequence[int] = _intersect(lists)
+        else:
+            candidates = range(segment.doc_count)
+        since = query.since
+        for doc_id in reversed(candidates):
+            if since is not None and segment.doc_ts(doc_id) < since:
+                continue
+            hit = segment.doc(doc_id)
+            if not query.accepts(hit.text):
+                continue
+            if len(hits) >= limit:
+                return True
+            hits.append(hit)
+        return False
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            active_docs = self._active.doc_count if self._active is not None else 0
+        return {
+            "segments": float(len(self._segment_names())),
+            "active_docs": float(active_docs),
+            "docs_added": float(self.docs_added),
+        }
+
+    def close(self) -> None:
+        """파일을 닫습니다. 현재 시간 세그먼트는 봉인하지 않습니다 (다음 시작 때 이어서 씀)."""
+        with self._lock:
+            if self._active is not None:
+                self._active.close()
+                self._active = None
+            for segment in self._sealed.values():
+                segment.close()
+            self._sealed.clear()
+
+
+def ingest_file(
+    index: LogIndex,
+    path: Path,
+    source: str = "syslog",
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """기존 로그 파일 전체를 색인합니다 (타임스탬프가 없는 줄은 직전 줄의 시각 사용)."""
+    count = 0
+    last_ts = os.stat(path).st_mtime
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            last_ts = parse_syslog_timestamp(line) or last_ts
+            index.add(last_ts, source, line)
+            count += 1
+            if progress is not None and count % 100_000 == 0:
+                progress(count)
+    index.commit()
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="pysnoop syslog/커널 메시지 색인 검색")
+    parser.add_argument("query", nargs="?", help="검색어 (예: 'oom killer \"web-1\" since:6h')")
+    parser.add_argument("--dir", type=Path, default=DEFAULT_INDEX_DIR, help="색인 디렉터리")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--ingest", type=Path, metavar="FILE", help="로그 파일을 색인에 추가")
+    parser.add_argument("--source", choices=SOURCES, default="syslog", help="--ingest 소스 이름")
+    args = parser.parse_args()
+
+    if args.ingest is not None:
+        writer = LogIndex(args.dir)
+        started = time.perf_counter()
+        total = ingest_file(
+            writer, args.ingest, args.source, lambda n: print(f"{n}줄...", file=sys.stderr)
+        )
+        writer.maintain(time.time() + 7200)  # 지난 시간 세그먼트 모두 봉인
+        writer.close()
+        print(f"{total}줄 색인, {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    if args.query is not None:
+        reader = LogIndex(args.dir, writable=False)
+        result = reader.search(args.query, limit=args.limit)
+        for hit in result.hits:
+            stamp = datetime.fromtimestamp(hit.ts).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"{stamp} [{hit.source}] {hit.text}")
+        more = " (더 있음)" if result.truncated else ""
+        print(
+            f"# {len(result.hits)}건{more}, 세그먼트 {result.segments_scanned}개, "
+            f"{result.elapsed_ms:.1f}ms",
+            file=sys.stderr,
+        )
+        reader.close()
@@ -2,10 +2,17 @@
 
 import asyncio
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
 
+def _now_like(ts: datetime) -> datetime:
+    """Returns the current time with the same awareness as `ts` (naive UTC or aware)."""
+    if ts.tzinfo is None:
+        return datetime.utcnow()
+    return datetime.now(timezone.utc)
+
+
 class MetricCache:
     """
     MetricCache stores the latest value and timestamp for each URI.
@@ -44,11 +51,11 @@ class MetricCache:
             dict: A copy of the current URI -> {timestamp, value} mapping.
         """
         async with self._lock:
-            now = datetime.utcnow()
             expired_uris = [
                 uri
                 for uri, info in self._cache.items()
-                if now - info.get("timestamp", now) > self._ttl
+                if "timestamp" in info
+                and _now_like(info["timestamp"]) - info["timestamp"] > self._ttl
             ]
 
             # Remove expired entries
@@ -68,12 +75,48 @@ class MetricCache:
             dict | None: Metric data or None if expired or not found.
         """
         async with self._lock:
-            now = datetime.utcnow()
             info = self._cache.get(uri)
-            if info and (now - info.get("timestamp", now)) <= self._ttl:
+            if info and (
+                "timestamp" not in info
+                or _now_like(info["timestamp"]) - info["timestamp"] <= self._ttl
+            ):
                 return info
             return None
 
+    async def restore(self, entries: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Load entries saved from a previous run, skipping expired ones.
+        Newer values already in the cache are kept.
+
+        Args:
+            entries (dict): URI -> {"timestamp": datetime, "value": Any}.
+
+        Returns:
+            int: Number of restored entries.
+        """
+        restored = 0
+        async with self._lock:
+            for uri, info in entries.items():
+                ts = info["timestamp"]
+                if _now_like(ts) - ts > self._ttl:
+                    continue
+                current = self._cache.get(uri)
+                if current and current["timestamp"] >= ts:
+                    continue
+                self._cache[uri] = {"timestamp": ts, "value": info["value"]}
+                restored += 1
+        return restored
+
+    async def forget(self, uri: str) -> None:
+        """
+        Remove a single URI (used when the series is evicted by the cardinality guard).
+
+        Args:
+            uri (str): The URI to drop.
+        """
+        async with self._lock:
+            self._cache.pop(uri, None)
+
     async def clear(self) -> None:
         """
         Clear the entire metric cache.
@@ -0,0 +1,313 @@
+# utils/openmetrics.py
+"""
+OpenMetrics / Prometheus text exposition of the latest metric values.
+
+    python main.py --metrics-port 9464
+    curl -s localhost:9464/metrics
+
+Dotted URIs are mapped to metric families with labels by `URI_TEMPLATES`
+(first match wins; unmatched URIs become a label-less family named after the
+whole URI):
+
+    docker.container.web-1.cpu_percent  ->  pysnoop_docker_container_cpu_percent{container="web-1"}
+    top_cpu.nginx.pid_42.cpu_percent    ->  pysnoop_top_cpu_percent{process="nginx",pid="42"}
+
+`MetricsExporter.render()` runs once per collection tick (in a worker thread)
+and stores the finished body plus its gzip encoding. `MetricsServer` is a
+minimal asyncio HTTP/1.1 server that only writes those precomputed bytes, so
+concurrent scrapes cost a socket write, not a re-serialization.
+"""
+
+import asyncio
+import gzip
+import math
+import re
+import time
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+METRIC_PREFIX: str = "pysnoop_"
+OPENMETRICS_CONTENT_TYPE: str = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+GZIP_LEVEL: int = 6
+MAX_HEADER_BYTES: int = 16 * 1024
+KEEPALIVE_TIMEOUT_SECONDS: float = 30.0
+
+# URI 템플릿 -> 메트릭 이름 템플릿. {이름}은 점이 없는 구성 요소 하나, {이름*}은 점을 포함할
+# 수 있는 구성 요소들(컨테이너/프로세스 이름)과 일치합니다. 이름 템플릿에 쓰이지 않은
+# 자리 표시자는 레이블이 됩니다.
+URI_TEMPLATES: List[Tuple[str, str]] = [
+    ("docker.container.{container*}.{metric}", "docker_container_{metric}"),
+    ("cgroup.{kind}.{group*}.{metric}", "cgroup_{metric}"),
+    ("top_cpu.{process*}.pid_{pid}.cpu_percent", "top_cpu_percent"),
+    ("top_mem.{process*}.pid_{pid}.mem_percent", "top_mem_percent"),
+    ("system.cpu.core{core}", "system_cpu_core_percent"),
+    ("system.disk.{device*}.{metric}", "system_disk_{metric}"),
+    ("system.net.{interface*}.{metric}", "system_net_{metric}"),
+    ("system.pressure.{resource}.{kind}.{metric}", "system_pressure_{metric}"),
+    ("fs.{mount}.{metric}", "fs_{metric}"),
+    ("net.tcp.state.{state}", "net_tcp_sockets_by_state"),
+    ("net.tcp.remote.{address}.{metric}", "net_tcp_remote_{metric}"),
+    ("net.tcp.port.{port}.{metric}", "net_tcp_port_{metric}"),
+    ("command.{command}.{metric*}", "command_{metric}"),
+    ("synthetic.{series}.{metric}", "synthetic_{metric}"),
+    ("pysnoop.{metric*}", "{metric}"),  # 자기 관측 메트릭 (이미 pysnoop_ 접두사가 붙음)
+]
+
+_PLACEHOLDER = re.compile(r"\{(\w+)(\*?)\}")
+_INVALID_NAME_CHARS = re.compile(r"[^A-Za-z0-9_:]")
+
+
+def sanitize_metric_name(name: str) -> str:
+    """메트릭 이름에 쓸 수 없는 문자를 '_'로 바꿉니다 (숫자로 시작하면 '_'를 붙임)."""
+    name = _INVALID_NAME_CHARS.sub("_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _compile_template(uri_template: str) -> Pattern[str]:
+    parts: List[str] = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(uri_template):
+        start = match.start()
+        parts.append(re.escape(uri_template[position:start]))
+        parts.append(
+            f"(?P<{match.group(1)}>.+?)" if match.group(2) else f"(?P<{match.group(1)}>[^.]+)"
+        )
+        position = match.end()
+    parts.append(re.escape(uri_template[position:]))
+    return re.compile("".join(parts) + r"\Z")
+
+
+class UriMapper:
+    """
+    Maps dotted URIs to (family name, label string). Results are cached per URI,
+    so the regex work is paid once per series, not once per tick.
+    """
+
+    def __init__(self, templates: Optional[List[Tuple[str, str]]] = None) -> None:
+        self._rules: List[Tuple[Pattern[str], str, List[str]]] = []
+        for uri_template, name_template in templates if templates is not None else URI_TEMPLATES:
+            name_fields = {field for field, _ in _PLACEHOLDER.findall(name_template)}
+            label_fields = [
+                field for field, _ in _PLACEHOLDER.findall(uri_template) if field not in name_fields
+            ]
+            self._rules.append((_compile_template(uri_template), name_template, label_fields))
+        self._cache: Dict[str, Tuple[str, str]] = {}
+
+    def map(self, uri: str) -> Tuple[str, str]:
+        """
+        Returns:
+            tuple: (family name, sample prefix such as `name{a="b"}`).
+        """
+        cached = self._cache.get(uri)
+        if cached is not None:
+            return cached
+        family, prefix = "", ""
+        for pattern, name_template, label_fields in self._rules:
+            match = pattern.match(uri)
+            if match is None:
+                continue
+            family = sanitize_metric_name(METRIC_PREFIX + name_template.format(**match.groupdict()))
+            labels = ",".join(
+                f'{field}="{_escape_label_value(match.group(field))}"' for field in label_fields
+            )
+            prefix = f"{family}{{{labels}}}" if labels else family
+            break
+        if not family:
+            family = prefix = sanitize_metric_name(METRIC_PREFIX + uri)
+        self._cache[uri] = (family, prefix)
+        return family, prefix
+
+    def retain(self, uris: Any) -> None:
+        """캐시를 현재 URI들로 줄입니다 (사라진 시리즈의 항목 제거)."""
+        self._cache = {uri: self._cache[uri] for uri in uris if uri in self._cache}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def _format_value(value: float) -> str:
+    if math.isfinite(value):
+        return repr(value)
+    if math.isnan(value):
+        return "NaN"
+    return "+Inf" if value > 0 else "-Inf"
+
+
+class MetricsExporter:
+    """
+    Holds the pre-rendered exposition body (plain and gzip) for the latest tick.
+    """
+
+    def __init__(self, mapper: Optional[UriMapper] = None) -> None:
+        self.mapper = mapper or UriMapper()
+        # (본문, gzip 본문)을 한 번에 교체하므로 스크레이프는 항상 같은 틱의 두 버전을 봅니다.
+        self._payload: Tuple[bytes, bytes] = (b"# EOF\n", gzip.compress(b"# EOF\n", mtime=0))
+        self.series: int = 0
+        self.render_seconds: float = 0.0
+        self.rendered_at: Optional[float] = None
+
+    @property
+    def payload(self) -> Tuple[bytes, bytes]:
+        return self._payload
+
+    def render(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Renders a MetricCache snapshot (URI -> {"timestamp", "value"}). Non-numeric
+        values are skipped. Safe to call from a worker thread.
+        """
+        started = time.perf_counter()
+        mapper = self.mapper
+        families: Dict[str, List[str]] = {}
+        seen: set = set()
+        for uri, info in snapshot.items():
+            value = info.get("value")
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            family, prefix = mapper.map(uri)
+            if prefix in seen:
+                continue  # 서로 다른 URI가 같은 이름+레이블이 되면 처음 것만 남깁니다.
+            seen.add(prefix)
+            lines = families.get(family)
+            if lines is None:
+                lines = families[family] = [f"# TYPE {family} gauge"]
+            lines.append(f"{prefix} {_format_value(float(value))}")
+        if len(mapper) > 2 * len(snapshot) + 1024:
+            mapper.retain(snapshot.keys())
+
+        chunks = ["\n".join(lines) for lines in families.values()]
+        chunks.append("# EOF\n")
+        body = "\n".join(chunks).encode()
+        self._payload = (body, gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0))
+        self.series = len(seen)
+        self.rendered_at = time.time()
+        self.render_seconds = time.perf_counter() - started
+
+
+class MetricsServer:
+    """
+    Minimal HTTP/1.1 server for `GET /metrics` (keep-alive, gzip, HEAD).
+    """
+
+    def __init__(self, exporter: MetricsExporter, host: str = "127.0.0.1", port: int = 9464):
+        self.exporter = exporter
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.StreamWriter, "asyncio.Task[None]"] = {}
+        self.requests_served: int = 0
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=MAX_HEADER_BYTES
+        )
+        sockets = self._server.sockets
+        if sockets:
+            self.port = sockets[0].getsockname()[1]  # port=0이면 실제 포트
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # keep-alive 연결을 닫아 대기 중인 핸들러가 정상 종료되게 합니다.
+            handlers = list(self._connections.values())
+            for writer in list(self._connections):
+                writer.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections[writer] = task
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), timeout=KEEPALIVE_TIMEOUT_SECONDS
+                    )
+                except (
+                    asyncio.IncompleteReadError,
+                    asyncio.LimitOverrunError,
+                    asyncio.TimeoutError,
+                ):
+                    return
+                keep_alive = self._respond(head, writer)
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (ConnectionError, OSError):
+            return
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    def _respond(self, head: bytes, writer: asyncio.StreamWriter) -> bool:
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            self._write(writer, "400 Bad Request", b"bad request\n", "text/plain", False)
+            return False
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip().lower()
+        keep_alive = (
+            headers.get("connection") != "close"
+            if version == "HTTP/1.1"
+            else headers.get("connection") == "keep-alive"
+        )
+        path = target.split("?", 1)[0]
+        if method not in ("GET", "HEAD"):
+            self._write(writer, "405 Method Not Allowed", b"", "text/plain", keep_alive)
+            return keep_alive
+        if path != "/metrics":
+            self._write(writer, "404 Not Found", b"see /metrics\n", "text/plain", keep_alive)
+            return keep_alive
+
+        body, body_gzip = self.exporter.payload
+        gzipped = "gzip" in headers.get("accept-encoding", "")
+        content_type = (
+            OPENMETRICS_CONTENT_TYPE
+            if "application/openmetrics-text" in headers.get("accept", "")
+            else PROMETHEUS_CONTENT_TYPE
+        )
+        self.requests_served += 1
+        self._write(
+            writer,
+            "200 OK",
+            body_gzip if gzipped else body,
+            content_type,
+            keep_alive,
+            gzipped=gzipped,
+            head_only=method == "HEAD",
+        )
+        return keep_alive
+
+    @staticmethod
+    def _write(
+        writer: asyncio.StreamWriter,
+        status: str,
+        body: bytes,
+        content_type: str,
+        keep_alive: bool,
+        gzipped: bool = False,
+        head_only: bool = False,
+    ) -> None:
+        header = [
+            f"HTTP/1.1 {status}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            "Vary: Accept-Encoding",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if gzipped:
+            header.append("Content-Encoding: gzip")
+        writer.write(("\r\n".join(header) + "\r\n\r\n").encode("latin-1"))
+        if not head_only:
+            writer.write(body)  # 미리 만든 본문을 그대로 씁니다 (직렬화 없음).
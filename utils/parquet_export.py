@@ -0,0 +1,296 @@
+# utils/parquet_export.py
+"""
+Export of recorded `logs/metrics-YYYYMMDD.jsonl` files to partitioned Parquet.
+
+    python -m utils.parquet_export logs/ export/ --workers 4
+
+Output layout (Hive-style partitions, readable with pandas/pyarrow/duckdb/polars):
+
+    export/date=2025-05-22/prefix=system/part-20250522.parquet
+    export/date=2025-05-22/prefix=docker/part-20250522.parquet
+
+Columns: ts (timestamp[us, UTC]), uri (dictionary<int32, string>), value (float64),
+source (dictionary<int32, string>). Non-numeric samples (e.g. the uptime text) and
+event lines (alerts, tombstones, startup timing) are skipped and counted.
+
+Each day file is handled by its own worker process. A worker streams the file
+line by line and keeps at most `chunk_rows` rows per URI prefix in memory before
+writing them out as one row group, so memory stays bounded regardless of file size.
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+DEFAULT_CHUNK_ROWS: int = 65536
+DEFAULT_PREFIX_DEPTH: int = 1
+DEFAULT_COMPRESSION: str = "zstd"
+LOG_FILE_PATTERN = re.compile(r"^metrics-(\d{8})\.jsonl$")
+
+SCHEMA = pa.schema(
+    [
+        ("ts", pa.timestamp("us", tz="UTC")),
+        ("uri", pa.dictionary(pa.int32(), pa.string())),
+        ("value", pa.float64()),
+        ("source", pa.dictionary(pa.int32(), pa.string())),
+    ]
+)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _sanitize_partition_value(value: str) -> str:
+    """파티션 디렉터리 이름에 쓸 수 없는 문자를 '_'로 바꿉니다."""
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", value) or "_"
+
+
+class _PrefixBuffer:
+    """
+    URI 접두사 하나의 열 버퍼. URI/source는 정수 코드로 쌓고, 청크를 쓸 때
+    누적 사전과 함께 DictionaryArray로 만듭니다.
+    """
+
+    def __init__(self, path: Path, compression: str) -> None:
+        self.path = path
+        self.tmp_path = path.with_name(path.name + ".tmp")
+        self.compression = compression
+        self.writer: Optional[pq.ParquetWriter] = None
+        self.uri_codes: Dict[str, int] = {}
+        self.source_codes: Dict[str, int] = {}
+        self.ts: List[int] = []
+        self.uri: List[int] = []
+        self.value: List[float] = []
+        self.source: List[int] = []
+        self.rows_written = 0
+
+    def append(self, ts_us: int, uri: str, value: float, source: str) -> None:
+        uri_code = self.uri_codes.get(uri)
+        if uri_code is None:
+            uri_code = self.uri_codes[uri] = len(self.uri_codes)
+        source_code = self.source_codes.get(source)
+        if source_code is None:
+            source_code = self.source_codes[source] = len(self.source_codes)
+        self.ts.append(ts_us)
+        self.uri.append(uri_code)
+        self.value.append(value)
+        self.source.append(source_code)
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def flush(self) -> None:
+        """버퍼를 행 그룹 하나로 쓰고 비웁니다."""
+        if not self.ts:
+            return
+        batch = pa.record_batch(
+            [
+                pa.array(self.ts, type=pa.int64()).cast(SCHEMA.field("ts").type),
+                pa.DictionaryArray.from_arrays(
+                    pa.array(self.uri, type=pa.int32()),
+                    pa.array(list(self.uri_codes), type=pa.string()),
+                ),
+                pa.array(self.value, type=pa.float64()),
+                pa.DictionaryArray.from_arrays(
+                    pa.array(self.source, type=pa.int32()),
+                    pa.array(list(self.source_codes), type=pa.string()),
+                ),
+            ],
+            schema=SCHEMA,
+        )
+        if self.writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.writer = pq.ParquetWriter(
+                self.tmp_path,
+                SCHEMA,
+                compression=self.compression,
+                use_dictionary=["uri", "source"],
+            )
+        self.writer.write_batch(batch)
+        self.rows_written += len(self.ts)
+        self.ts, self.uri, self.value, self.source = [], [], [], []
+
+    def close(self) -> None:
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            os.replace(self.tmp_path, self.path)
+
+    def abort(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.tmp_path.unlink(missing_ok=True)
+
+
+def _uri_prefix(uri: str, depth: int) -> str:
+    return ".".join(uri.split(".", depth)[:depth])
+
+
+def export_day(
+    log_path: Path,
+    out_dir: Path,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    prefix_depth: int = DEFAULT_PREFIX_DEPTH,
+    compression: str = DEFAULT_COMPRESSION,
+) -> Dict[str, Any]:
+    """
+    Exports one day file (runs inside a worker process).
+
+    Returns:
+        dict: Counters for the summary (rows, skipped lines, prefixes, seconds).
+    """
+    started = time.perf_counter()
+    match = LOG_FILE_PATTERN.match(log_path.name)
+    day = match.group(1) if match else log_path.stem
+    date_dir = out_dir / f"date={day[:4]}-{day[4:6]}-{day[6:]}"
+    buffers: Dict[str, _PrefixBuffer] = {}
+    # 한 틱의 샘플은 모두 같은 ts 문자열을 가지므로 마지막 파싱 결과를 재사용합니다.
+    last_ts: Tuple[Optional[str], int] = (None, 0)
+    skipped_events = skipped_non_numeric = skipped_invalid = 0
+
+    try:
+        with open(log_path, "rb") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    uri = entry.get("uri")
+                    raw_ts = entry["ts"] if uri is not None else None
+                except (ValueError, KeyError, AttributeError):
+                    skipped_invalid += 1  # 잘린 줄 등
+                    continue
+                if uri is None or "event" in entry:
+                    skipped_events += 1  # 알림, 툼스톤, startup_timing 같은 이벤트 줄
+                    continue
+                value = entry.get("value")
+                if not isinstance(value, (int, float)):
+                    skipped_non_numeric += 1
+                    continue
+                if raw_ts != last_ts[0]:
+                    if not isinstance(raw_ts, str):
+                        skipped_invalid += 1
+                        continue
+                    try:
+                        parsed = datetime.fromisoformat(raw_ts.replace("Z", "+00:00"))
+                    except ValueError:
+                        skipped_invalid += 1
+                        continue
+                    if parsed.tzinfo is None:
+                        parsed = parsed.astimezone()
+                    delta = parsed - _EPOCH
+                    ts_us = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+                    last_ts = (raw_ts, ts_us)
+
+                prefix = _uri_prefix(uri, prefix_depth)
+                buffer = buffers.get(prefix)
+                if buffer is None:
+                    partition = date_dir / f"prefix={_sanitize_partition_value(prefix)}"
+                    buffer = buffers[prefix] = _PrefixBuffer(
+                        partition / f"part-{day}.parquet", compression
+                    )
+                buffer.append(last_ts[1], uri, float(value), str(entry.get("source", "")))
+                if len(buffer) >= chunk_rows:
+                    buffer.flush()
+        for buffer in buffers.values():
+            buffer.close()
+    except BaseException:
+        for buffer in buffers.values():
+            buffer.abort()
+        raise
+
+    return {
+        "file": str(log_path),
+        "rows": sum(buffer.rows_written for buffer in buffers.values()),
+        "prefixes": len(buffers),
+        "skipped_events": skipped_events,
+        "skipped_non_numeric": skipped_non_numeric,
+        "skipped_invalid": skipped_invalid,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def find_log_files(log_dir: Path) -> List[Path]:
+    """log_dir 안의 metrics-YYYYMMDD.jsonl 파일 (날짜순)."""
+    return sorted(
+        path for path in log_dir.iterdir() if path.is_file() and LOG_FILE_PATTERN.match(path.name)
+    )
+
+
+def export_logs(
+    log_dir: Path,
+    out_dir: Path,
+    workers: Optional[int] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    prefix_depth: int = DEFAULT_PREFIX_DEPTH,
+    compression: str = DEFAULT_COMPRESSION,
+) -> List[Dict[str, Any]]:
+    """
+    Exports every day file in `log_dir`, one worker process per file.
+
+    Args:
+        log_dir (Path): Directory with metrics-YYYYMMDD.jsonl files.
+        out_dir (Path): Root of the partitioned dataset.
+        workers (int | None): Process pool size (default: number of CPUs).
+        chunk_rows (int): Rows buffered per URI prefix before writing a row group.
+        prefix_depth (int): Number of URI components used as the prefix partition.
+        compression (str): Parquet codec ("zstd", "snappy", "gzip", "none").
+
+    Returns:
+        list: Per-file counters from `export_day`, in completion order.
+    """
+    files = find_log_files(log_dir)
+    if not files:
+        return []
+    results: List[Dict[str, Any]] = []
+    max_workers = min(len(files), workers or os.cpu_count() or 1)
+    if max_workers == 1:
+        for path in files:
+            results.append(export_day(path, out_dir, chunk_rows, prefix_depth, compression))
+        return results
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(export_day, path, out_dir, chunk_rows, prefix_depth, compression)
+            for path in files
+        ]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="pysnoop 메트릭 로그를 Parquet으로 내보내기")
+    parser.add_argument("log_dir", type=Path, help="metrics-YYYYMMDD.jsonl 파일이 있는 디렉터리")
+    parser.add_argument("out_dir", type=Path, help="파티션된 Parquet 데이터셋을 쓸 디렉터리")
+    parser.add_argument("--workers", type=int, help="워커 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument(
+        "--prefix-depth",
+        type=int,
+        default=DEFAULT_PREFIX_DEPTH,
+        help="파티션에 쓸 URI 앞부분 구성 요소 수 (기본값: 1, 예: system, docker)",
+    )
+    parser.add_argument("--compression", default=DEFAULT_COMPRESSION)
+    args = parser.parse_args()
+
+    total_started = time.perf_counter()
+    summaries = export_logs(
+        args.log_dir,
+        args.out_dir,
+        args.workers,
+        args.chunk_rows,
+        args.prefix_depth,
+        args.compression,
+    )
+    for summary in sorted(summaries, key=lambda item: item["file"]):
+        print(
+            f"{summary['file']}: {summary['rows']}행, 접두사 {summary['prefixes']}개, "
+            f"{summary['seconds']:.1f}s (건너뜀: 이벤트 {summary['skipped_events']}, "
+            f"숫자 아님 {summary['skipped_non_numeric']}, 잘못된 줄 {summary['skipped_invalid']})"
+        )
+    print(f"파일 {len(summaries)}개, 총 {time.perf_counter() - total_started:.1f}s")
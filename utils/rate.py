@@ -0,0 +1,155 @@
+# utils/rate.py
+
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# 다른 스레드의 수집과 겹쳐 복사가 실패할 때 다시 시도하는 횟수
+STABLE_COPY_ATTEMPTS = 5
+
+
+def wrapped_delta(previous: float, current: float) -> Optional[float]:
+    """
+    Returns the increase of a monotonically increasing counter between two reads.
+
+    A decrease is treated as a wrap of a 32-bit or 64-bit counter when the previous
+    value sat in the upper half of that range; otherwise it is a counter reset
+    (process restarted, device re-attached) and None is returned.
+
+    Args:
+        previous (float): Earlier counter value.
+        current (float): Later counter value.
+
+    Returns:
+        float | None: Non-negative increase, or None on reset.
+    """
+    if current >= previous:
+        return current - previous
+    for bits in (32, 64):
+        modulus = 1 << bits
+        if modulus // 2 <= previous < modulus:
+            return current + modulus - previous
+    return None
+
+
+def stable_copy(copy: Callable[[], T], attempts: int = STABLE_COPY_ATTEMPTS) -> T:
+    """
+    Runs `copy` until it completes without the source changing underneath it.
+
+    Collectors run in executor threads, so `get_state()` called from the event loop
+    can iterate a dict or deque while `collect()` mutates it ("dictionary changed size
+    during iteration"). Copying with a C-level `list(...)` keeps that window tiny; the
+    retry covers the rare case where it is hit anyway.
+
+    Args:
+        copy (Callable): Builds a detached copy of the shared state.
+        attempts (int): Tries before the last RuntimeError is raised.
+
+    Returns:
+        The copy.
+    """
+    for _ in range(attempts - 1):
+        try:
+            return copy()
+        except RuntimeError:
+            time.sleep(0)  # 수집 스레드에 GIL을 넘깁니다.
+    return copy()
+
+
+def _as_hashable(key: Any) -> Hashable:
+    """JSON으로 직렬화되며 리스트가 된 튜플 키를 다시 튜플로 바꿉니다."""
+    if isinstance(key, list):
+        return tuple(_as_hashable(part) for part in key)
+    return key
+
+
+class RateCounter:
+    """
+    Turns successive counter readings into per-second rates.
+
+    Timestamps come from `time.monotonic()` so wall-clock jumps never produce
+    negative or inflated rates. Keys that are not updated between two calls of
+    `sweep()` are dropped, which keeps the state bounded for short-lived keys
+    such as PIDs.
+    """
+
+    def __init__(self) -> None:
+        # key -> (last counter value, monotonic timestamp)
+        self._previous: Dict[Hashable, Tuple[float, float]] = {}
+        self._touched: Set[Hashable] = set()
+
+    def rate(self, key: Hashable, value: float, now: Optional[float] = None) -> Optional[float]:
+        """
+        Records a counter reading and returns the rate since the previous reading.
+
+        Args:
+            key (Hashable): Identity of the counter.
+            value (float): Current counter value.
+            now (float | None): Monotonic timestamp of the reading (default: now).
+
+        Returns:
+            float | None: Units per second, or None for the first reading or a reset.
+        """
+        if now is None:
+            now = time.monotonic()
+        self._touched.add(key)
+        previous = self._previous.get(key)
+        self._previous[key] = (value, now)
+        if previous is None:
+            return None
+        previous_value, previous_ts = previous
+        elapsed = now - previous_ts
+        if elapsed <= 0:
+            return None
+        delta = wrapped_delta(previous_value, value)
+        if delta is None:
+            return None
+        return delta / elapsed
+
+    def sweep(self) -> int:
+        """
+        Drops keys that were not updated since the last sweep.
+
+        Returns:
+            int: Number of dropped keys.
+        """
+        stale = [key for key in self._previous if key not in self._touched]
+        for key in stale:
+            del self._previous[key]
+        self._touched.clear()
+        return len(stale)
+
+    def get_state(self) -> List[List[Any]]:
+        """
+        Exports the previous readings with wall-clock timestamps, so they stay
+        meaningful across a restart (monotonic clocks are per boot).
+
+        Returns:
+            list: [key, value, unix_ts] triples.
+        """
+        offset = time.time() - time.monotonic()
+        items = stable_copy(lambda: list(self._previous.items()))
+        return [[key, value, ts + offset] for key, (value, ts) in items]
+
+    def set_state(self, state: List[List[Any]], max_age_seconds: Optional[float] = None) -> None:
+        """
+        Restores readings exported by `get_state()`. The first rate after a restore
+        is the average over the downtime instead of a spike or a missing value.
+
+        Args:
+            state (list): [key, value, unix_ts] triples (JSON lists are turned back into tuples).
+            max_age_seconds (float | None): Readings older than this are ignored.
+        """
+        wall_now = time.time()
+        offset = wall_now - time.monotonic()
+        for key, value, wall_ts in state:
+            if max_age_seconds is not None and wall_now - wall_ts > max_age_seconds:
+                continue
+            self._previous[_as_hashable(key)] = (value, wall_ts - offset)
+
+    def __len__(self) -> int:
+        return len(self._previous)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._previous
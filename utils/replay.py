@@ -0,0 +1,251 @@
+# utils/replay.py
+"""
+Streaming reader for recorded `metrics-YYYYMMDD.jsonl` files.
+
+The file is memory-mapped and never loaded as a whole: entries are decoded one line
+at a time, and seeking to a timestamp is a binary search over byte offsets (the log
+is append-only, so timestamps are non-decreasing). Every probe made by a search is
+kept in a sparse (offset, ts) seek index, so later jumps near already-visited times
+narrow down immediately.
+"""
+
+import bisect
+import json
+import mmap
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from utils.deadband import TOMBSTONE_EVENT
+
+# 데드밴드 keepalive(60초)의 두 배: 이보다 오래 갱신되지 않은 값은 사라진 것으로 봅니다.
+STALE_AFTER_SECONDS: float = 120.0
+# collectors.top_processes.TOP_N과 같은 값 (재생에서 psutil을 임포트하지 않도록 따로 둡니다)
+TOP_PROCESS_LIMIT: int = 10
+
+
+def _parse_ts(raw: Any) -> Optional[datetime]:
+    if not isinstance(raw, str):
+        return None
+    try:
+        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class MetricLogReader:
+    """
+    mmap-based reader with timestamp seeking.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path (Path): A metrics JSONL file written by LogWriter.
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        size = self.path.stat().st_size
+        self._mm: Optional[mmap.mmap] = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        )
+        self.size = size
+        # 희소 탐색 인덱스: 오프셋 오름차순 (offset, ts)
+        self._index_offsets: List[int] = []
+        self._index_ts: List[datetime] = []
+        self.first_ts: Optional[datetime] = None
+        self.last_ts: Optional[datetime] = None
+        if self._mm is not None:
+            first = self._next_timestamped(0)
+            self.first_ts = first[1] if first else None
+            self.last_ts = self._last_timestamp()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def _line_end(self, start: int) -> int:
+        assert self._mm is not None
+        end = self._mm.find(b"\n", start)
+        return self.size if end == -1 else end
+
+    def _decode(self, start: int, end: int) -> Optional[Dict[str, Any]]:
+        assert self._mm is not None
+        try:
+            entry = json.loads(self._mm[start:end])
+        except ValueError:
+            return None  # 잘린 마지막 줄 등
+        return entry if isinstance(entry, dict) else None
+
+    def _next_timestamped(self, offset: int) -> Optional[Tuple[int, datetime]]:
+        """offset 이후(포함) 처음으로 ts를 가진 줄의 (시작 오프셋, ts)."""
+        while offset < self.size:
+            end = self._line_end(offset)
+            entry = self._decode(offset, end)
+            ts = _parse_ts(entry.get("ts")) if entry else None
+            if ts is not None:
+                self._remember(offset, ts)
+                return offset, ts
+            offset = end + 1
+        return None
+
+    def _last_timestamp(self) -> Optional[datetime]:
+        assert self._mm is not None
+        end = self.size
+        while end > 0:
+            start = self._mm.rfind(b"\n", 0, end - 1) + 1
+            entry = self._decode(start, end)
+            ts = _parse_ts(entry.get("ts")) if entry else None
+            if ts is not None:
+                return ts
+            end = start
+        return None
+
+    def _remember(self, offset: int, ts: datetime) -> None:
+        position = bisect.bisect_left(self._index_offsets, offset)
+        if position < len(self._index_offsets) and self._index_offsets[position] == offset:
+            return
+        self._index_offsets.insert(position, offset)
+        self._index_ts.insert(position, ts)
+
+    def seek(self, target: datetime) -> int:
+        """
+        Returns the offset of the first entry with `ts >= target`.
+
+        The search starts from the tightest bracket known from the seek index.
+        """
+        if self._mm is None:
+            return 0
+        position = bisect.bisect_left(self._index_ts, target)
+        low = self._index_offsets[position - 1] if position > 0 else 0
+        high = self._index_offsets[position] if position < len(self._index_offsets) else self.size
+
+        while low < high:
+            middle = (low + high) // 2
+            line_start = self._mm.rfind(b"\n", 0, middle) + 1
+            found = self._next_timestamped(line_start)
+            if found is None or found[1] >= target:
+                if found is not None and found[0] < high:
+                    high = found[0]
+                elif line_start < high:
+                    high = line_start
+                else:
+                    break
+            else:
+                low = self._line_end(found[0]) + 1
+        return min(low, self.size)
+
+    def entries(self, offset: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yields (offset of the following line, entry) for metric entries from `offset`.
+        Event entries (no "uri") are skipped.
+        """
+        if self._mm is None:
+            return
+        while offset < self.size:
+            end = self._line_end(offset)
+            entry = self._decode(offset, end)
+            offset = end + 1
+            if entry and "uri" in entry and "ts" in entry:
+                yield offset, entry
+
+    def ticks(self, offset: int = 0) -> Iterator[Tuple[int, datetime, List[Dict[str, Any]]]]:
+        """
+        Groups consecutive entries sharing a timestamp (one collection tick).
+
+        Yields:
+            (offset after the tick, tick timestamp, entries of the tick)
+        """
+        current_ts: Optional[datetime] = None
+        current_raw: Optional[str] = None
+        batch: List[Dict[str, Any]] = []
+        batch_end = offset
+        for next_offset, entry in self.entries(offset):
+            if entry["ts"] != current_raw:
+                if batch and current_ts is not None:
+                    yield batch_end, current_ts, batch
+                current_raw = entry["ts"]
+                current_ts = _parse_ts(current_raw)
+                batch = []
+            batch.append(entry)
+            batch_end = next_offset
+        if batch and current_ts is not None:
+            yield batch_end, current_ts, batch
+
+
+class ReplayState:
+    """
+    Forward-filled view of the recorded series at the current playback time.
+
+    Deadband-filtered logs only contain changes and keepalives, so each value is held
+    until it is overwritten, removed by a `series_forgotten` tombstone (the process left
+    the top list, or the cardinality guard evicted the series), or goes stale
+    (`STALE_AFTER_SECONDS` without an entry).
+    """
+
+    def __init__(self, stale_after_seconds: float = STALE_AFTER_SECONDS) -> None:
+        self.stale_after = timedelta(seconds=stale_after_seconds)
+        self._values: Dict[str, Tuple[Any, datetime]] = {}
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def apply(self, ts: datetime, entries: List[Dict[str, Any]]) -> None:
+        for entry in entries:
+            event = entry.get("event")
+            if event is None:
+                self._values[entry["uri"]] = (entry.get("value"), ts)
+            elif event == TOMBSTONE_EVENT:
+                self._values.pop(entry["uri"], None)
+            # 그 밖의 이벤트(알림 등)는 uri를 가져도 샘플이 아닙니다.
+        cutoff = ts - self.stale_after
+        stale = [uri for uri, (_, seen) in self._values.items() if seen < cutoff]
+        for uri in stale:
+            del self._values[uri]
+
+    def samples(self) -> List[Tuple[str, Any]]:
+        """(uri, value) for every live series, excluding per-process URIs."""
+        return [
+            (uri, value)
+            for uri, (value, _) in self._values.items()
+            if not uri.startswith(("top_cpu.", "top_mem."))
+        ]
+
+    def processes(self, limit: int = TOP_PROCESS_LIMIT) -> List[Dict[str, Any]]:
+        """
+        Rebuilds TopProcessesWidget rows from `top_cpu.*` / `top_mem.*` URIs.
+
+        Like the collector, only the union of the top `limit` rows by CPU and by memory
+        is returned (sorted by CPU), so held values of processes that were not
+        tombstoned (e.g. logs written before tombstones existed) cannot grow the table.
+        """
+        processes: Dict[str, Dict[str, Any]] = {}
+        for uri, (value, _) in self._values.items():
+            if uri.startswith("top_cpu.") and uri.endswith(".cpu_percent"):
+                body = uri.removeprefix("top_cpu.").removesuffix(".cpu_percent")
+                field = "cpu_percent"
+            elif uri.startswith("top_mem.") and uri.endswith(".mem_percent"):
+                body = uri.removeprefix("top_mem.").removesuffix(".mem_percent")
+                field = "memory_percent"
+            else:
+                continue
+            name, sep, pid = body.rpartition(".pid_")
+            if not sep:
+                continue
+            record = processes.setdefault(pid, {"pid": pid, "name": name})
+            record[field] = value
+
+        # 해당 값이 기록된 프로세스만 그 키의 상위 후보가 됩니다 (수집기의 top_keys와 같음).
+        keep: Set[str] = set()
+        for field in ("memory_percent", "cpu_percent"):
+            ranked = sorted(
+                (record for record in processes.values() if field in record),
+                key=lambda record: record[field] or 0.0,
+                reverse=True,
+            )
+            keep.update(record["pid"] for record in ranked[:limit])
+        rows = [record for record in processes.values() if record["pid"] in keep]
+        rows.sort(key=lambda record: record.get("cpu_percent") or 0.0, reverse=True)
+        return rows
@@ -0,0 +1,457 @@
+# utils/shm_snapshot.py
+"""
+Latest-metric snapshot published in a `multiprocessing.shared_memory` segment.
+
+Local tools (health checks, sidecars) can read what the dashboard already
+collected instead of collecting it again. This module only uses the standard
+library so it can be imported (or copied) by those tools as-is.
+
+Segment layout (little endian, fixed for the lifetime of the segment):
+
+    offset  size  field
+    0       4     magic b"PSNS"
+    4       2     layout version (1)
+    6       2     reserved
+    8       8     seq: seqlock counter, odd while the writer is updating
+    16      8     table generation: bumped whenever the URI table changes
+    24      8     published_at (unix time, float64)
+    32      4     capacity (number of value slots)
+    36      4     count (slots in use)
+    40      4     table capacity (bytes)
+    44      4     table bytes used
+    48      4     writer pid (0: unknown)
+    52      12    reserved
+    64      8*capacity     float64 values, slot i belongs to the i-th URI (NaN: no value)
+    ...     table capacity URI table: UTF-8 URIs separated by b"\\n", in slot order
+
+Readers use the seqlock protocol: read `seq` (retry while odd), read what they
+need straight from the mapped buffer, then re-read `seq` and retry if it
+changed. A read is a few memory loads - no syscalls and no copy of the whole
+segment (the URI table is only decoded again when its generation changes).
+
+Command-line reader:
+
+    python -m utils.shm_snapshot "system.cpu.*"
+"""
+
+import argparse
+import fnmatch
+import math
+import os
+import struct
+import sys
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+DEFAULT_SEGMENT_NAME: str = "pysnoop_metrics"
+DEFAULT_CAPACITY: int = 16384
+DEFAULT_TABLE_BYTES_PER_URI: int = 64
+MAGIC: bytes = b"PSNS"
+LAYOUT_VERSION: int = 1
+HEADER_SIZE: int = 64
+_PREFIX = struct.Struct("<4sHH")
+_SEQ = struct.Struct("<Q")
+_GENERATION = struct.Struct("<Q")
+_PUBLISHED_AT = struct.Struct("<d")
+_SIZES = struct.Struct("<IIII")  # capacity, count, table capacity, table used
+_WRITER_PID = struct.Struct("<I")
+_SEQ_OFFSET = 8
+_GENERATION_OFFSET = 16
+_PUBLISHED_AT_OFFSET = 24
+_SIZES_OFFSET = 32
+_WRITER_PID_OFFSET = 48
+# 이 시간보다 오래 게시되지 않은 기존 세그먼트는 비정상 종료가 남긴 것으로 보고 다시 만듭니다.
+STALE_SEGMENT_SECONDS: float = 30.0
+EXPIRY_CHECK_EVERY: int = 16  # 만료 검사는 N번 게시마다 한 번만 (시리즈 수에 비례하는 순회)
+READ_SPIN_YIELD_EVERY: int = 64  # 작성자가 도중에 선점된 경우를 위해 가끔 CPU를 양보합니다.
+MAX_READ_ATTEMPTS: int = 100000
+
+
+class SnapshotUnavailable(Exception):
+    """세그먼트가 없거나 형식이 다를 때 발생합니다."""
+
+
+class SegmentInUse(FileExistsError):
+    """Raised when a segment with the same name belongs to a live writer or another program."""
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # 다른 사용자의 프로세스
+    return True
+
+
+def _segment_is_stale(name: str) -> bool:
+    """
+    An existing segment may only be replaced when it is a pysnoop segment that has not
+    been published for `STALE_SEGMENT_SECONDS` (or, if never published, whose writer
+    process is gone).
+    """
+    segment = _attach(name)
+    try:
+        buf = _segment_buf(segment)
+        if len(buf) < HEADER_SIZE or _PREFIX.unpack_from(buf, 0)[0] != MAGIC:
+            return False  # pysnoop 세그먼트가 아니면 건드리지 않습니다.
+        published_at = _PUBLISHED_AT.unpack_from(buf, _PUBLISHED_AT_OFFSET)[0]
+        writer_pid = _WRITER_PID.unpack_from(buf, _WRITER_PID_OFFSET)[0]
+        del buf
+    finally:
+        segment.close()
+    if published_at > 0:
+        return time.time() - published_at > STALE_SEGMENT_SECONDS
+    return not _pid_alive(writer_pid)
+
+
+# 이 프로세스가 만든 세그먼트 이름 (resource_tracker 등록을 _attach가 지우지 않도록)
+_created_here: Set[str] = set()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    기존 세그먼트에 연결합니다. Python 3.13 미만에서는 resource_tracker가 연결만 한
+    프로세스가 끝날 때 세그먼트를 지워 버리므로 추적 대상에서 뺍니다.
+    같은 프로세스가 만든 세그먼트라면 만든 쪽의 등록을 그대로 둡니다.
+    """
+    try:
+        segment = shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        from multiprocessing import resource_tracker
+
+        segment = shared_memory.SharedMemory(name=name)
+        if name not in _created_here:
+            tracked_name = segment._name  # type: ignore[attr-defined]
+            resource_tracker.unregister(tracked_name, "shared_memory")
+    return segment
+
+
+def _segment_buf(segment: shared_memory.SharedMemory) -> memoryview:
+    # typeshed은 close() 이후를 고려해 Optional로 선언하지만, 열린 세그먼트에서는 항상 존재합니다.
+    buf = segment.buf
+    assert buf is not None
+    return buf
+
+
+class SnapshotPublisher:
+    """
+    Writer side. Samples are staged during a tick and written under the seqlock
+    by one `publish()` call at the end of the tick.
+    """
+
+    def __init__(
+        self,
+        name: str = DEFAULT_SEGMENT_NAME,
+        capacity: int = DEFAULT_CAPACITY,
+        table_bytes: Optional[int] = None,
+        ttl_seconds: float = 300.0,
+    ) -> None:
+        """
+        Args:
+            name (str): Segment name (`/dev/shm/<name>` on Linux).
+            capacity (int): Maximum number of URIs. The layout never grows; URIs
+                beyond capacity are dropped (counted in `dropped_uris`) until expired
+                URIs free up slots.
+            table_bytes (int | None): Size of the URI table area (default: 64 bytes per slot).
+            ttl_seconds (float): Values not updated for this long are published as NaN,
+                and their slots can be reused.
+        """
+        self.name = name
+        self.capacity = capacity
+        self.table_capacity = table_bytes or capacity * DEFAULT_TABLE_BYTES_PER_URI
+        self.ttl_seconds = ttl_seconds
+        size = HEADER_SIZE + 8 * capacity + self.table_capacity
+        try:
+            self._segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            if not _segment_is_stale(name):
+                raise SegmentInUse(
+                    f"공유 메모리 세그먼트 {name}을(를) 실행 중인 다른 인스턴스가 사용 중입니다. "
+                    f"--shm-name으로 다른 이름을 지정하거나 --no-shm을 사용하세요."
+                )
+            # 이전 실행이 비정상 종료하며 남긴 세그먼트: 지우고 새로 만듭니다.
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self._segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _created_here.add(name)
+        self._closed = False
+        self._buf = _segment_buf(self._segment)
+        values_end = self._table_offset = HEADER_SIZE + 8 * capacity
+        self._values = self._buf[HEADER_SIZE:values_end].cast("d")
+        self._seq = 0
+        self._generation = 0
+        self._slots: Dict[str, int] = {}
+        self._uris: List[str] = []
+        self._table_used = 0
+        self._table_dirty = False
+        self._last_update: List[float] = []
+        self._staged: Dict[str, float] = {}
+        self._forgotten: List[str] = []
+        self._publish_count = 0
+        self.dropped_uris = 0
+        self._warned_full = False
+
+        _PREFIX.pack_into(self._buf, 0, MAGIC, LAYOUT_VERSION, 0)
+        _WRITER_PID.pack_into(self._buf, _WRITER_PID_OFFSET, os.getpid())
+        _SIZES.pack_into(self._buf, _SIZES_OFFSET, capacity, 0, self.table_capacity, 0)
+        for slot in range(capacity):
+            self._values[slot] = math.nan
+
+    def stage(self, uri: str, value: Any) -> None:
+        """이번 틱의 값을 모아 둡니다. 숫자가 아닌 값(문자열 등)은 무시합니다."""
+        if isinstance(value, (int, float)):
+            self._staged[uri] = float(value)
+
+    def forget(self, uri: str) -> None:
+        """다음 게시 때 URI를 만료 처리해 슬롯을 회수할 수 있게 합니다."""
+        self._staged.pop(uri, None)
+        if uri in self._slots:
+            self._forgotten.append(uri)
+
+    def _allocate(self, uri: str, now: float) -> Optional[int]:
+        encoded = len(uri.encode("utf-8")) + 1
+        if len(self._uris) >= self.capacity or self._table_used + encoded > self.table_capacity:
+            self._compact(now)
+            if len(self._uris) >= self.capacity or (
+                self._table_used + encoded > self.table_capacity
+            ):
+                self.dropped_uris += 1
+                if not self._warned_full:
+                    self._warned_full = True
+                    print(
+                        f"[WARN][SnapshotPublisher] 공유 메모리 슬롯 부족 "
+                        f"(용량 {self.capacity}), 새 URI를 게시하지 않습니다."
+                    )
+                return None
+        slot = len(self._uris)
+        self._slots[uri] = slot
+        self._uris.append(uri)
+        self._last_update.append(now)
+        self._table_used += encoded
+        self._table_dirty = True
+        return slot
+
+    def _compact(self, now: float) -> None:
+        """만료된 URI를 표에서 빼고 남은 URI를 앞으로 모읍니다 (슬롯 번호가 바뀝니다)."""
+        keep = [
+            slot
+            for slot, updated in enumerate(self._last_update)
+            if now - updated <= self.ttl_seconds
+        ]
+        if len(keep) == len(self._uris):
+            return
+        for new_slot, old_slot in enumerate(keep):
+            self._values[new_slot] = self._values[old_slot]
+        for slot in range(len(keep), len(self._uris)):
+            self._values[slot] = math.nan
+        self._uris = [self._uris[slot] for slot in keep]
+        self._last_update = [self._last_update[slot] for slot in keep]
+        self._slots = {uri: slot for slot, uri in enumerate(self._uris)}
+        self._table_used = sum(len(uri.encode("utf-8")) + 1 for uri in self._uris)
+        self._table_dirty = True
+
+    def _write_table(self) -> None:
+        table = "".join(f"{uri}\n" for uri in self._uris).encode("utf-8")
+        start = self._table_offset
+        end = start + len(table)
+        self._buf[start:end] = table
+        self._generation += 1
+        self._table_dirty = False
+        _GENERATION.pack_into(self._buf, _GENERATION_OFFSET, self._generation)
+        _SIZES.pack_into(
+            self._buf,
+            _SIZES_OFFSET,
+            self.capacity,
+            len(self._uris),
+            self.table_capacity,
+            len(table),
+        )
+
+    def publish(self) -> None:
+        """모아 둔 값을 seqlock 안에서 한 번에 씁니다."""
+        now = time.monotonic()
+        staged, self._staged = self._staged, {}
+        self._publish_count += 1
+
+        self._seq += 1  # 홀수: 쓰는 중
+        _SEQ.pack_into(self._buf, _SEQ_OFFSET, self._seq)
+        for uri, value in staged.items():
+            slot = self._slots.get(uri)
+            if slot is None:
+                slot = self._allocate(uri, now)
+                if slot is None:
+                    continue
+            self._values[slot] = value
+            self._last_update[slot] = now
+        forgotten, self._forgotten = self._forgotten, []
+        for uri in forgotten:
+            slot = self._slots.get(uri)
+            if slot is not None:
+                self._values[slot] = math.nan
+                self._last_update[slot] = -math.inf
+        if self._publish_count % EXPIRY_CHECK_EVERY == 0:
+            for slot, updated in enumerate(self._last_update):
+                if now - updated > self.ttl_seconds:
+                    self._values[slot] = math.nan
+        if self._table_dirty:
+            self._write_table()
+        _PUBLISHED_AT.pack_into(self._buf, _PUBLISHED_AT_OFFSET, time.time())
+        self._seq += 1  # 짝수: 일관된 상태
+        _SEQ.pack_into(self._buf, _SEQ_OFFSET, self._seq)
+
+    def close(self) -> None:
+        """세그먼트를 해제하고 삭제합니다 (이미 연결한 리더는 자신의 매핑을 계속 사용)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._values.release()
+        self._segment.close()
+        try:
+            self._segment.unlink()
+        except FileNotFoundError:
+            pass
+        _created_here.discard(self.name)
+
+
+class SnapshotReader:
+    """
+    Reader side for local tools.
+
+        reader = SnapshotReader()
+        load = reader.get("system.cpu.core0")
+        memory = reader.read("system.memory.*")
+    """
+
+    def __init__(self, name: str = DEFAULT_SEGMENT_NAME) -> None:
+        try:
+            self._segment = _attach(name)
+        except FileNotFoundError:
+            raise SnapshotUnavailable(f"공유 메모리 세그먼트 {name}이(가) 없습니다.")
+        self._buf = _segment_buf(self._segment)
+        magic, version, _ = _PREFIX.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self._segment.close()
+            raise SnapshotUnavailable(f"지원하지 않는 세그먼트 형식: {magic!r} v{version}")
+        capacity = _SIZES.unpack_from(self._buf, _SIZES_OFFSET)[0]
+        values_end = self._table_offset = HEADER_SIZE + 8 * capacity
+        self._values = self._buf[HEADER_SIZE:values_end].cast("d")
+        self._generation = -1
+        self._uris: List[str] = []
+        self._slots: Dict[str, int] = {}
+
+    def _seq(self) -> int:
+        return _SEQ.unpack_from(self._buf, _SEQ_OFFSET)[0]
+
+    def _begin(self, attempt: int) -> int:
+        """쓰기가 끝난(짝수) seq를 기다렸다가 반환하고, 필요하면 URI 표를 다시 읽습니다."""
+        while True:
+            seq = self._seq()
+            if not seq & 1:
+                break
+            attempt += 1
+            if attempt >= MAX_READ_ATTEMPTS:
+                raise TimeoutError("작성자가 스냅숏을 너무 오래 쓰고 있습니다.")
+            if attempt % READ_SPIN_YIELD_EVERY == 0:
+                time.sleep(0)
+        generation = _GENERATION.unpack_from(self._buf, _GENERATION_OFFSET)[0]
+        if generation != self._generation:
+            count, table_used = _SIZES.unpack_from(self._buf, _SIZES_OFFSET)[1::2]
+            start = self._table_offset
+            end = start + table_used
+            uris = bytes(self._buf[start:end]).decode("utf-8", "replace").split("\n")[:count]
+            self._uris = uris
+            self._slots = {uri: slot for slot, uri in enumerate(uris)}
+            self._generation = generation
+        return seq
+
+    def _consistent(self, read: Any) -> Any:
+        for attempt in range(MAX_READ_ATTEMPTS):
+            seq = self._begin(attempt)
+            try:
+                result = read()
+            except (IndexError, UnicodeDecodeError):
+                result = None  # 표와 값이 어긋난 순간: seq 확인 후 재시도합니다.
+            if self._seq() == seq:
+                return result
+            self._generation = -1
+            if attempt % READ_SPIN_YIELD_EVERY == READ_SPIN_YIELD_EVERY - 1:
+                time.sleep(0)
+        raise TimeoutError("일관된 스냅숏을 읽지 못했습니다.")
+
+    def get(self, uri: str) -> Optional[float]:
+        """URI 하나의 최신 값 (없거나 만료되었으면 None)."""
+
+        def read() -> Optional[float]:
+            slot = self._slots.get(uri)
+            return None if slot is None else self._values[slot]
+
+        value = self._consistent(read)
+        return None if value is None or math.isnan(value) else value
+
+    def read(self, pattern: Optional[str] = None) -> Dict[str, float]:
+        """
+        일관된 스냅숏 하나를 dict로 읽습니다.
+
+        Args:
+            pattern (str | None): fnmatch 패턴 (예: "docker.container.*"). 없으면 전체.
+        """
+
+        def read_all() -> List[Tuple[str, float]]:
+            values = self._values
+            return [(uri, values[slot]) for uri, slot in self._slots.items()]
+
+        pairs = self._consistent(read_all) or []
+        return {
+            uri: value
+            for uri, value in pairs
+            if not math.isnan(value) and (pattern is None or fnmatch.fnmatchcase(uri, pattern))
+        }
+
+    def read_many(self, uris: Iterable[str]) -> List[Optional[float]]:
+        """여러 URI를 같은 스냅숏 시점으로 읽습니다 (없는 URI는 None)."""
+        wanted = list(uris)
+
+        def read() -> List[float]:
+            values, slots = self._values, self._slots
+            return [values[slots[uri]] if uri in slots else math.nan for uri in wanted]
+
+        values = self._consistent(read) or [math.nan] * len(wanted)
+        return [None if math.isnan(value) else value for value in values]
+
+    @property
+    def published_at(self) -> float:
+        """마지막 게시 시각 (unix time). 작성자가 멈췄는지 확인하는 데 사용합니다."""
+        return self._consistent(
+            lambda: _PUBLISHED_AT.unpack_from(self._buf, _PUBLISHED_AT_OFFSET)[0]
+        )
+
+    def uris(self) -> List[str]:
+        """현재 게시 중인 URI 목록."""
+        return list(self._consistent(lambda: self._uris))
+
+    def close(self) -> None:
+        self._values.release()
+        self._segment.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="pysnoop 공유 메모리 스냅숏 읽기")
+    parser.add_argument("pattern", nargs="?", help='URI 패턴 (예: "system.cpu.*")')
+    parser.add_argument("--name", default=DEFAULT_SEGMENT_NAME, help="세그먼트 이름")
+    args = parser.parse_args()
+    try:
+        reader = SnapshotReader(args.name)
+    except SnapshotUnavailable as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    age = time.time() - reader.published_at
+    for uri, value in sorted(reader.read(args.pattern).items()):
+        print(f"{uri} {value:.15g}")
+    print(f"# {age:.1f}s 전 게시", file=sys.stderr)
+    reader.close()
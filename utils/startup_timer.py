@@ -0,0 +1,31 @@
+# utils/startup_timer.py
+"""
+Startup-time measurement.
+
+Import this module as early as possible (main.py does it before anything else);
+the import time is used as the reference point for all marks. It only imports
+`time`, so keeping it first costs the headless `--once` path nothing measurable.
+"""
+
+import time
+
+_T0: float = time.perf_counter()
+_marks: dict[str, float] = {}
+
+
+def mark(label: str) -> float:
+    """
+    Records the milliseconds elapsed since process start under `label`.
+    Only the first mark of a label is kept.
+
+    Returns:
+        float: Elapsed milliseconds.
+    """
+    elapsed_ms = (time.perf_counter() - _T0) * 1000.0
+    _marks.setdefault(label, round(elapsed_ms, 2))
+    return elapsed_ms
+
+
+def marks() -> dict[str, float]:
+    """Returns a copy of all recorded marks (label -> elapsed ms)."""
+    return dict(_marks)
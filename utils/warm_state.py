@@ -0,0 +1,178 @@
+# utils/warm_state.py
+"""
+Warm-start snapshots of MetricCache and per-collector delta state.
+
+File layout (little-endian):
+
+    magic    4s   b"PSNW"
+    version  B
+    boot_id  16s  kernel boot id (zeros if unknown)
+    saved_at d    unix time of the snapshot
+    count    I    number of cache entries
+    entries       count x (uri_len H, uri bytes, unix_ts d, kind B, payload)
+                  kind 0: float64 d | 1: int64 q | 2: utf-8 string (len I + bytes)
+    state_len I   length of the collector-state blob
+    state         zlib-compressed JSON {collector name: state}
+
+Collector state is only restored when the boot id matches, since cumulative kernel
+counters restart from zero after a reboot.
+"""
+
+import json
+import os
+import struct
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+MAGIC: bytes = b"PSNW"
+VERSION: int = 1
+BOOT_ID_PATH: str = "/proc/sys/kernel/random/boot_id"
+
+_HEADER = struct.Struct("<4sB16sdI")
+_ENTRY_HEAD = struct.Struct("<H")
+_ENTRY_META = struct.Struct("<dB")
+_FLOAT = struct.Struct("<d")
+_INT = struct.Struct("<q")
+_LEN = struct.Struct("<I")
+
+_KIND_FLOAT, _KIND_INT, _KIND_STR = 0, 1, 2
+
+
+def current_boot_id() -> bytes:
+    """현재 부팅 ID (16바이트). 알 수 없으면 0으로 채운 값."""
+    try:
+        with open(BOOT_ID_PATH, encoding="ascii") as f:
+            return bytes.fromhex(f.read().strip().replace("-", ""))[:16].ljust(16, b"\0")
+    except (OSError, ValueError):
+        return b"\0" * 16
+
+
+def encode_warm_state(
+    cache_entries: Dict[str, Dict[str, Any]], collector_states: Dict[str, Any]
+) -> bytes:
+    """
+    Serializes cache entries and collector states into the binary layout above.
+    Values that are not int/float/str are skipped.
+    """
+    body = bytearray()
+    count = 0
+    for uri, info in cache_entries.items():
+        value = info.get("value")
+        ts: datetime = info["timestamp"]
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            continue
+        if isinstance(value, int) and not -(2**63) <= value < 2**63:
+            continue
+        uri_bytes = uri.encode("utf-8")
+        body += _ENTRY_HEAD.pack(len(uri_bytes))
+        body += uri_bytes
+        if isinstance(value, float):
+            body += _ENTRY_META.pack(ts.timestamp(), _KIND_FLOAT) + _FLOAT.pack(value)
+        elif isinstance(value, int):
+            body += _ENTRY_META.pack(ts.timestamp(), _KIND_INT) + _INT.pack(value)
+        else:
+            value_bytes = value.encode("utf-8")
+            body += _ENTRY_META.pack(ts.timestamp(), _KIND_STR)
+            body += _LEN.pack(len(value_bytes)) + value_bytes
+        count += 1
+
+    state_blob = zlib.compress(json.dumps(collector_states).encode("utf-8"))
+    header = _HEADER.pack(
+        MAGIC, VERSION, current_boot_id(), datetime.now(timezone.utc).timestamp(), count
+    )
+    return header + bytes(body) + _LEN.pack(len(state_blob)) + state_blob
+
+
+def decode_warm_state(
+    data: bytes,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any], bool]:
+    """
+    Parses a snapshot produced by `encode_warm_state`.
+
+    Returns:
+        tuple: (cache entries, collector states, whether the boot id matches).
+
+    Raises:
+        ValueError: If the data is not a snapshot of a supported version.
+    """
+    try:
+        magic, version, boot_id, _, count = _HEADER.unpack_from(data, 0)
+    except struct.error as e:
+        raise ValueError(f"truncated warm state header: {e}")
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a pysnoop warm state file (or unsupported version)")
+
+    offset = _HEADER.size
+    entries: Dict[str, Dict[str, Any]] = {}
+    try:
+        for _ in range(count):
+            (uri_len,) = _ENTRY_HEAD.unpack_from(data, offset)
+            offset += _ENTRY_HEAD.size
+            end = offset + uri_len
+            uri = data[offset:end].decode("utf-8")
+            offset = end
+            unix_ts, kind = _ENTRY_META.unpack_from(data, offset)
+            offset += _ENTRY_META.size
+            value: Any
+            if kind == _KIND_FLOAT:
+                (value,) = _FLOAT.unpack_from(data, offset)
+                offset += _FLOAT.size
+            elif kind == _KIND_INT:
+                (value,) = _INT.unpack_from(data, offset)
+                offset += _INT.size
+            elif kind == _KIND_STR:
+                (length,) = _LEN.unpack_from(data, offset)
+                offset += _LEN.size
+                end = offset + length
+                value = data[offset:end].decode("utf-8")
+                offset = end
+            else:
+                raise ValueError(f"unknown value kind {kind}")
+            entries[uri] = {
+                "timestamp": datetime.fromtimestamp(unix_ts, timezone.utc),
+                "value": value,
+            }
+        (state_len,) = _LEN.unpack_from(data, offset)
+        offset += _LEN.size
+        end = offset + state_len
+        state_blob = data[offset:end]
+        collector_states = json.loads(zlib.decompress(state_blob)) if state_len else {}
+    except (struct.error, zlib.error, UnicodeDecodeError) as e:
+        raise ValueError(f"corrupt warm state file: {e}")
+
+    same_boot = boot_id == current_boot_id() and boot_id != b"\0" * 16
+    return entries, collector_states, same_boot
+
+
+def save_warm_state(
+    path: Path, cache_entries: Dict[str, Dict[str, Any]], collector_states: Dict[str, Any]
+) -> int:
+    """
+    Atomically writes a snapshot (temp file + rename).
+
+    Returns:
+        int: Size of the written file in bytes.
+    """
+    data = encode_warm_state(cache_entries, collector_states)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def load_warm_state(
+    path: Path,
+) -> Optional[Tuple[Dict[str, Dict[str, Any]], Dict[str, Any], bool]]:
+    """스냅숏 파일을 읽습니다. 파일이 없으면 None."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return decode_warm_state(data)
@@ -2,18 +2,34 @@
 
 """Exports all widgets for easier importing."""
 
+from .alerts_widget import AlertsWidget
+from .anomalies_widget import AnomaliesWidget
+from .cpu_heatmap_widget import CpuHeatmapWidget
 from .current_time_widget import CurrentTimeWidget
 from .dmesg_errors_widget import DmesgErrorsWidget
 from .docker_stats_widget import DockerStatsWidget
+from .fleet_overview_widget import FleetOverviewWidget
+from .io_throughput_widget import IoThroughputWidget
+from .log_search_widget import LogSearchWidget
 from .system_info_widget import SystemInfoWidget
+from .tcp_talkers_widget import TcpTalkersWidget
+from .thread_drilldown_widget import ThreadDrillDownWidget
 from .top_processes_widget import TopProcessesWidget
 from .uptime_widget import UptimeWidget
 
 __all__ = [
+    "AlertsWidget",
+    "AnomaliesWidget",
+    "CpuHeatmapWidget",
     "CurrentTimeWidget",
     "DmesgErrorsWidget",
     "DockerStatsWidget",
+    "FleetOverviewWidget",
+    "IoThroughputWidget",
+    "LogSearchWidget",
     "SystemInfoWidget",
+    "TcpTalkersWidget",
+    "ThreadDrillDownWidget",
     "TopProcessesWidget",
     "UptimeWidget",
 ]
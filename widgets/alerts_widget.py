@@ -0,0 +1,49 @@
+# widgets/alerts_widget.py
+
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+from rich.text import Text
+from textual.widgets import Static
+
+from utils.alerts import AlertEvent
+
+MAX_RECENT_EVENTS: int = 5
+
+
+class AlertsWidget(Static):
+    """발생 중인 알림과 최근 해제된 알림을 표시하는 위젯"""
+
+    BORDER_TITLE = "🚨 알림"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._firing: Dict[Tuple[str, str], AlertEvent] = {}
+        self._resolved: Deque[AlertEvent] = deque(maxlen=MAX_RECENT_EVENTS)
+
+    def on_mount(self) -> None:
+        """위젯 마운트 시 호출됩니다."""
+        self._refresh_text()
+
+    def add_event(self, event: AlertEvent) -> None:
+        """알림 상태 변화를 반영합니다."""
+        key = (event.rule.name, event.uri)
+        if event.state == "firing":
+            self._firing[key] = event
+        else:
+            self._firing.pop(key, None)
+            self._resolved.appendleft(event)
+        self._refresh_text()
+
+    def _refresh_text(self) -> None:
+        if not self._firing and not self._resolved:
+            self.update("발생 중인 알림 없음")
+            return
+        text = Text()
+        for event in sorted(self._firing.values(), key=lambda e: e.ts, reverse=True):
+            style = "bold red" if event.rule.severity == "critical" else "yellow"
+            text.append(f"● {event.ts:%H:%M:%S} {event.message}\n", style=style)
+        for event in self._resolved:
+            text.append(f"○ {event.ts:%H:%M:%S} {event.message}\n", style="dim")
+        text.rstrip()
+        self.update(text)
@@ -0,0 +1,54 @@
+# widgets/anomalies_widget.py
+
+from collections import deque
+from typing import TYPE_CHECKING, Deque, List
+
+from rich.text import Text
+from textual.widgets import Static
+
+if TYPE_CHECKING:  # numpy를 첫 화면 전에 임포트하지 않도록 타입 검사 때만 가져옵니다.
+    from utils.anomaly import Anomaly
+
+MAX_RECENT_ANOMALIES: int = 8
+
+
+class AnomaliesWidget(Static):
+    """EWMA 기준선에서 크게 벗어난 최근 샘플을 표시하는 위젯"""
+
+    BORDER_TITLE = "📈 이상 징후"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._recent: Deque["Anomaly"] = deque(maxlen=MAX_RECENT_ANOMALIES)
+        self.available: bool = True
+
+    def on_mount(self) -> None:
+        """위젯 마운트 시 호출됩니다."""
+        self._refresh_text()
+
+    def set_unavailable(self) -> None:
+        """탐지기를 만들 수 없을 때 (numpy 미설치) 안내 문구를 표시합니다."""
+        self.available = False
+        self._refresh_text()
+
+    def add_anomalies(self, anomalies: List["Anomaly"]) -> None:
+        """이번 틱의 이상치를 |z|가 큰 순서로 추가합니다."""
+        if not anomalies:
+            return
+        for anomaly in sorted(anomalies, key=lambda a: abs(a.z_score)):
+            self._recent.appendleft(anomaly)
+        self._refresh_text()
+
+    def _refresh_text(self) -> None:
+        if not self.available:
+            self.update("numpy가 설치되지 않아 이상 탐지가 비활성화되었습니다.")
+            return
+        if not self._recent:
+            self.update("감지된 이상 징후 없음")
+            return
+        text = Text()
+        for anomaly in self._recent:
+            style = "bold red" if abs(anomaly.z_score) >= 8 else "yellow"
+            text.append(f"▲ {anomaly.ts:%H:%M:%S} {anomaly.message}\n", style=style)
+        text.rstrip()
+        self.update(text)
@@ -0,0 +1,185 @@
+# widgets/cpu_heatmap_widget.py
+
+from typing import Dict, List, Optional, Tuple
+
+from rich.segment import Segment
+from rich.style import Style
+from textual import events
+from textual.geometry import Region, Size
+from textual.strip import Strip
+from textual.widget import Widget
+
+from utils.cpu_topology import format_cpu_list, read_cpu_groups
+
+CORE_URI_PREFIX: str = "system.cpu.core"
+CELL: str = "■ "
+CELL_WIDTH: int = len(CELL)
+LEVELS: int = 10  # 색상 단계 (10% 단위). 단계가 바뀐 셀만 다시 그립니다.
+_GRADIENT: List[Tuple[int, int, int]] = [(46, 160, 67), (230, 190, 40), (215, 55, 45)]
+
+
+def _level_style(level: int) -> Style:
+    """0~LEVELS-1 단계를 초록 -> 노랑 -> 빨강 그라데이션 색으로 바꿉니다."""
+    position = level / (LEVELS - 1) * (len(_GRADIENT) - 1)
+    index = min(int(position), len(_GRADIENT) - 2)
+    fraction = position - index
+    start, end = _GRADIENT[index], _GRADIENT[index + 1]
+    r, g, b = (round(s + (e - s) * fraction) for s, e in zip(start, end))
+    return Style(color=f"rgb({r},{g},{b})")
+
+
+_LEVEL_STYLES: List[Style] = [_level_style(level) for level in range(LEVELS)]
+_UNKNOWN_STYLE: Style = Style(color="grey23")
+_HEADER_STYLE: Style = Style(dim=True, bold=True)
+
+
+class CpuHeatmapWidget(Widget):
+    """
+    코어마다 한 칸씩 사용률 색으로 표시하는 히트맵.
+
+    코어 순서와 화면 위치는 토폴로지/폭이 바뀔 때만 계산하고, 틱마다는 색 단계가 바뀐
+    셀의 영역만 refresh 합니다 (Line API로 줄 단위 렌더링).
+    """
+
+    DEFAULT_CSS = """
+    CpuHeatmapWidget {
+        height: auto;
+    }
+    """
+
+    def __init__(self, sys_cpu_root: Optional[str] = None, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._sys_cpu_root = sys_cpu_root
+        self._cpu_groups: Dict[int, str] = {}
+        # URI -> 셀 인덱스 (정렬된 코어 순서)
+        self._cell_index: Dict[str, int] = {}
+        self._cpu_ids: List[int] = []
+        self._levels: List[int] = []
+        self._values: List[float] = []
+        # 화면 배치: 줄마다 (그룹 제목 또는 None, 셀 인덱스 목록)
+        self._rows: List[Tuple[Optional[str], List[int]]] = []
+        self._cell_positions: List[Tuple[int, int]] = []  # 셀 인덱스 -> (x, y)
+        self._columns: int = 0
+
+    def on_mount(self) -> None:
+        """sysfs 읽기가 UI를 막지 않도록 토폴로지는 스레드에서 읽습니다."""
+        self.run_worker(self._load_topology, thread=True, exclusive=True, group="cpu-topology")
+
+    def _load_topology(self) -> None:
+        if self._sys_cpu_root is None:
+            groups = read_cpu_groups()
+        else:
+            groups = read_cpu_groups(self._sys_cpu_root)
+        self.app.call_from_thread(self.set_topology, groups)
+
+    def set_topology(self, cpu_groups: Dict[int, str]) -> None:
+        """CPU -> 그룹 라벨 매핑을 적용하고 배치를 다시 계산합니다."""
+        self._cpu_groups = cpu_groups
+        self._rebuild_order(self._cpu_ids)
+
+    def _rebuild_order(self, cpu_ids: List[int]) -> None:
+        """그룹, CPU 번호 순으로 셀 순서를 정합니다 (코어 구성이 바뀔 때만 호출)."""
+        previous = {
+            cpu: (level, value)
+            for cpu, level, value in zip(self._cpu_ids, self._levels, self._values)
+        }
+        ordered = sorted(set(cpu_ids), key=lambda cpu: (self._cpu_groups.get(cpu, ""), cpu))
+        self._cpu_ids = ordered
+        self._cell_index = {f"{CORE_URI_PREFIX}{cpu}": i for i, cpu in enumerate(ordered)}
+        self._levels = [previous.get(cpu, (-1, 0.0))[0] for cpu in ordered]
+        self._values = [previous.get(cpu, (-1, 0.0))[1] for cpu in ordered]
+        self._columns = 0  # 다음 배치 계산을 강제합니다.
+        self._layout(self.size.width)
+        self.refresh(layout=True)
+
+    def _layout(self, width: int) -> None:
+        columns = max(1, width // CELL_WIDTH) if width else 16
+        if columns == self._columns and self._rows:
+            return
+        self._columns = columns
+        self._rows = []
+        self._cell_positions = [(0, 0)] * len(self._cpu_ids)
+        grouped = any(self._cpu_groups.get(cpu) for cpu in self._cpu_ids)
+        start = 0
+        while start < len(self._cpu_ids):
+            label = self._cpu_groups.get(self._cpu_ids[start], "")
+            end = start
+            while (
+                end < len(self._cpu_ids) and self._cpu_groups.get(self._cpu_ids[end], "") == label
+            ):
+                end += 1
+            if grouped:
+                cpus = format_cpu_list(self._cpu_ids[start:end])
+                self._rows.append((f"{label or '?'} · CPU {cpus}", []))
+            for row_start in range(start, end, columns):
+                cells = list(range(row_start, min(row_start + columns, end)))
+                y = len(self._rows)
+                for column, cell in enumerate(cells):
+                    self._cell_positions[cell] = (column * CELL_WIDTH, y)
+                self._rows.append((None, cells))
+            start = end
+
+    def on_resize(self, event: events.Resize) -> None:
+        previous_rows = len(self._rows)
+        self._layout(event.size.width)
+        if len(self._rows) != previous_rows:
+            self.refresh(layout=True)
+
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        self._layout(width)
+        return max(1, len(self._rows))
+
+    def update_usage(self, per_core: Dict[str, float]) -> None:
+        """
+        코어별 사용률(`system.cpu.coreN` -> %)을 반영합니다.
+        색 단계가 바뀐 셀의 영역만 다시 그리도록 요청합니다.
+        """
+        new_ids: List[int] = []
+        for uri in per_core:
+            if uri not in self._cell_index:
+                suffix = uri.removeprefix(CORE_URI_PREFIX)
+                if suffix != uri and suffix.isdigit():
+                    new_ids.append(int(suffix))
+        if new_ids:
+            self._rebuild_order(self._cpu_ids + new_ids)
+
+        dirty: List[Region] = []
+        for uri, usage in per_core.items():
+            index = self._cell_index.get(uri)
+            if index is None:
+                continue
+            self._values[index] = usage
+            level = min(LEVELS - 1, max(0, int(usage * LEVELS / 100.0)))
+            if level != self._levels[index]:
+                self._levels[index] = level
+                x, y = self._cell_positions[index]
+                dirty.append(Region(x, y, CELL_WIDTH, 1))
+        if dirty:
+            self.refresh(*dirty)
+
+    def render_line(self, y: int) -> Strip:
+        if y >= len(self._rows):
+            return Strip.blank(self.size.width)
+        header, cells = self._rows[y]
+        if header is not None:
+            return Strip([Segment(header, _HEADER_STYLE)])
+        segments = []
+        for cell in cells:
+            level = self._levels[cell]
+            segments.append(Segment(CELL, _LEVEL_STYLES[level] if level >= 0 else _UNKNOWN_STYLE))
+        return Strip(segments, len(cells) * CELL_WIDTH)
+
+    def on_mouse_move(self, event: events.MouseMove) -> None:
+        """마우스가 가리키는 코어의 번호와 사용률을 툴팁으로 보여 줍니다."""
+        if event.y >= len(self._rows):
+            self.tooltip = None
+            return
+        cells = self._rows[event.y][1]
+        column = event.x // CELL_WIDTH
+        if column >= len(cells):
+            self.tooltip = None
+            return
+        cell = cells[column]
+        group = self._cpu_groups.get(self._cpu_ids[cell], "")
+        suffix = f" ({group})" if group else ""
+        self.tooltip = f"core{self._cpu_ids[cell]}{suffix}: {self._values[cell]:.1f}%"
@@ -8,11 +8,23 @@ from textual.css.query import NoMatches
 from textual.widgets import DataTable
 
 
+def _format_optional(value: Any) -> str:
+    """백분위수처럼 아직 없을 수 있는 값을 표시합니다."""
+    return "-" if value is None else f"{value:.2f}"
+
+
 class DockerStatsWidget(Container):
     """도커 컨테이너 통계를 표시하는 위젯"""
 
     BORDER_TITLE: str = "🐳 도커 컨테이너"
-    _columns: List[str] = ["컨테이너명", "CPU %", "MEM %", "MEM 사용량(MB)"]
+    _columns: List[str] = [
+        "컨테이너명",
+        "CPU %",
+        "CPU p95(1h)",
+        "CPU p99(1h)",
+        "MEM %",
+        "MEM 사용량(MB)",
+    ]
 
     def compose(self) -> ComposeResult:
         """위젯의 하위 구성요소를 정의합니다."""
@@ -41,6 +53,8 @@ class DockerStatsWidget(Container):
                 table.add_row(
                     str(container_stats.get("name", "N/A")),
                     f"{container_stats.get('cpu_percent', 0.0):.2f}",
+                    _format_optional(container_stats.get("cpu_p95")),
+                    _format_optional(container_stats.get("cpu_p99")),
                     f"{container_stats.get('mem_percent', 0.0):.2f}",
                     f"{container_stats.get('mem_usage_mb', 0.0):.2f}",
                 )
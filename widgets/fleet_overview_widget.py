@@ -0,0 +1,115 @@
+# widgets/fleet_overview_widget.py
+
+from typing import Any, List, Optional
+
+from textual.app import ComposeResult
+from textual.containers import Container
+from textual.message import Message
+from textual.widgets import DataTable
+
+from utils.fleet import SORT_KEYS, HostState
+
+_STATUS_LABELS = {
+    "up": "[green]● up[/]",
+    "stale": "[yellow]◐ stale[/]",
+    "down": "[red]○ down[/]",
+    "connecting": "[dim]… 연결 중[/]",
+}
+
+
+def _percent(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+class FleetOverviewWidget(Container):
+    """플릿 모드의 호스트 개요 표 (가장 나쁜 호스트가 위로 오도록 정렬)"""
+
+    BORDER_TITLE = "🛰 호스트 개요"
+    _columns = ("호스트", "상태", "CPU %", "MEM %", "dmesg", "디스크 %", "비고")
+    # 헤더 클릭 -> 정렬 키
+    _column_sort_keys = {0: "name", 2: "cpu", 3: "memory", 4: "dmesg", 5: "disk"}
+
+    class HostSelected(Message):
+        """호스트 행을 선택(Enter)했을 때 보내는 메시지"""
+
+        def __init__(self, name: str) -> None:
+            super().__init__()
+            self.name = name
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.sort_key: str = "cpu"
+        self.selected_host: Optional[str] = None
+        self._last_states: List[HostState] = []
+
+    def compose(self) -> ComposeResult:
+        """위젯의 하위 구성요소를 정의합니다."""
+        yield DataTable(id="fleet_table", cursor_type="row")
+
+    def on_mount(self) -> None:
+        """위젯 마운트 시 호출됩니다."""
+        self.query_one("#fleet_table", DataTable).add_columns(*self._columns)
+        self._update_title()
+
+    def _update_title(self, summary: str = "") -> None:
+        title = f"🛰 호스트 개요 ({SORT_KEYS[self.sort_key]} 기준)"
+        self.border_title = f"{title} · {summary}" if summary else title
+
+    def cycle_sort_key(self) -> str:
+        """다음 정렬 키로 전환하고 마지막 데이터로 표를 다시 그립니다."""
+        keys = list(SORT_KEYS)
+        self.sort_key = keys[(keys.index(self.sort_key) + 1) % len(keys)]
+        self.update_hosts(self._last_states)
+        return self.sort_key
+
+    def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        """열 헤더를 클릭하면 그 열 기준으로 정렬합니다."""
+        event.stop()
+        sort_key = self._column_sort_keys.get(event.column_index)
+        if sort_key is not None:
+            self.sort_key = sort_key
+            self.update_hosts(self._last_states)
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        """선택한 호스트로 HostSelected 메시지를 보냅니다 (기존 위젯에 드릴인)."""
+        event.stop()
+        if event.row_key.value is None:
+            return
+        self.selected_host = event.row_key.value
+        self.post_message(self.HostSelected(event.row_key.value))
+
+    def update_hosts(self, states: List[HostState]) -> None:
+        """호스트 상태 목록으로 표를 다시 그립니다. 커서는 같은 호스트에 머뭅니다."""
+        self._last_states = states
+        table = self.query_one("#fleet_table", DataTable)
+        cursor_host: Optional[str] = None
+        if table.row_count:
+            cursor_host = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
+        table.clear()
+        ordered = sorted(
+            states,
+            key=lambda state: state.sort_value(self.sort_key),
+            reverse=self.sort_key != "name",
+        )
+        counts = {status: 0 for status in _STATUS_LABELS}
+        for state in ordered:
+            counts[state.status] = counts.get(state.status, 0) + 1
+            note = state.error[:40]
+            if not note and state.dropped_series:
+                note = f"시리즈 {state.dropped_series}개 버림"
+            name = f"[b]{state.name}[/]" if state.name == self.selected_host else state.name
+            table.add_row(
+                name,
+                _STATUS_LABELS.get(state.status, state.status),
+                _percent(state.cpu),
+                _percent(state.memory),
+                "-" if state.dmesg is None else f"{state.dmesg:.0f}",
+                _percent(state.disk),
+                note,
+                key=state.name,
+            )
+        if cursor_host is not None and cursor_host in table.rows:
+            table.move_cursor(row=table.get_row_index(cursor_host), scroll=False)
+        self._update_title(
+            f"{len(states)}대: up {counts['up']} · stale {counts['stale']} · down {counts['down']}"
+        )
@@ -0,0 +1,81 @@
+# widgets/io_throughput_widget.py
+
+from typing import Dict, List, Tuple
+
+from rich.text import Text
+from textual.widgets import Static
+
+BAR_WIDTH: int = 20
+_PARTIAL_BLOCKS: str = " ▏▎▍▌▋▊▉"
+# 막대 눈금의 최솟값 (유휴 상태에서 작은 변화가 꽉 찬 막대로 보이지 않도록)
+_MIN_SCALE_BYTES: float = 1024.0 * 1024.0
+_PEAK_DECAY: float = 0.95
+
+
+def _format_bytes_per_sec(value: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024:
+            return f"{value:6.1f} {unit}/s"
+        value /= 1024
+    return f"{value:6.1f} TB/s"
+
+
+def _bar(fraction: float) -> str:
+    fraction = min(max(fraction, 0.0), 1.0)
+    eighths = int(round(fraction * BAR_WIDTH * 8))
+    full, remainder = divmod(eighths, 8)
+    bar = "█" * full
+    if remainder and full < BAR_WIDTH:
+        bar += _PARTIAL_BLOCKS[remainder]
+    return bar.ljust(BAR_WIDTH)
+
+
+class IoThroughputWidget(Static):
+    """디스크/네트워크 처리량을 막대로 표시하는 위젯"""
+
+    BORDER_TITLE = "💽 디스크 / 🌐 네트워크"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # 막대 눈금: 관측된 최댓값을 천천히 감소시키며 유지합니다.
+        self._peak: float = _MIN_SCALE_BYTES
+
+    def on_mount(self) -> None:
+        """위젯 마운트 시 호출됩니다."""
+        self.update("처리량 데이터 수집 중...")
+
+    def update_throughput(self, rates: Dict[str, float]) -> None:
+        """
+        URI별 초당 바이트 값으로 막대를 다시 그립니다.
+
+        Args:
+            rates: 예) {"system.disk.sda.read_bytes_per_sec": 1024.0, ...}
+        """
+        rows: List[Tuple[str, str, float]] = []
+        for uri, value in rates.items():
+            parts = uri.split(".")
+            if len(parts) != 4:
+                continue
+            _, kind, device, metric = parts
+            label = {
+                "read_bytes_per_sec": "R",
+                "write_bytes_per_sec": "W",
+                "rx_bytes_per_sec": "RX",
+                "tx_bytes_per_sec": "TX",
+            }.get(metric, metric)
+            icon = "💽" if kind == "disk" else "🌐"
+            rows.append((f"{icon} {device} {label}", kind, value))
+
+        if not rows:
+            self.update("처리량 데이터 없음")
+            return
+
+        self._peak = max(_MIN_SCALE_BYTES, self._peak * _PEAK_DECAY, *(row[2] for row in rows))
+        label_width = max(len(row[0]) for row in rows)
+        text = Text()
+        for label, kind, value in sorted(rows, key=lambda row: (row[1], row[0])):
+            text.append(f"{label:<{label_width}} ")
+            text.append(_bar(value / self._peak), style="green" if kind == "disk" else "cyan")
+            text.append(f" {_format_bytes_per_sec(value)}\n")
+        text.rstrip()
+        self.update(text)
@@ -0,0 +1,89 @@
+# widgets/log_search_widget.py
+
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Container
+from textual.widgets import DataTable, Input, Static
+
+from utils.log_index import LogIndex, SearchResult
+
+MAX_MESSAGE_CHARS: int = 300
+
+
+class LogSearchWidget(Container):
+    """syslog/커널 메시지 색인을 검색하는 패널 (`/` 키로 열고 `Esc`로 닫음)"""
+
+    BORDER_TITLE = "🔎 로그 검색"
+    BINDINGS = [Binding("escape", "close", "닫기")]
+    _columns = ("시각", "소스", "메시지")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._index: Optional[LogIndex] = None
+        self._searching: bool = False
+
+    def compose(self) -> ComposeResult:
+        """위젯의 하위 구성요소를 정의합니다."""
+        yield Input(
+            placeholder='검색어 (예: oom killer "web-1" source:kernel since:6h)',
+            id="log_search_input",
+        )
+        yield Static("", id="log_search_status")
+        yield DataTable(id="log_search_table", cursor_type="row")
+
+    def on_mount(self) -> None:
+        """위젯 마운트 시 호출됩니다."""
+        self.query_one("#log_search_table", DataTable).add_columns(*self._columns)
+
+    def set_index(self, index: Optional[LogIndex]) -> None:
+        """검색할 색인을 지정합니다 (None이면 안내 문구 표시)."""
+        self._index = index
+        if index is None:
+            self.query_one("#log_search_status", Static).update(
+                "로그 색인이 없습니다 (LogIndexCollector가 꺼져 있거나 아직 색인된 메시지가 없음)."
+            )
+
+    def open(self) -> None:
+        """패널을 보이고 입력란에 포커스를 둡니다."""
+        self.display = True
+        self.query_one("#log_search_input", Input).focus()
+
+    def action_close(self) -> None:
+        self.display = False
+
+    async def on_input_submitted(self, event: Input.Submitted) -> None:
+        """검색어 입력 시 스레드 풀에서 검색하고 결과를 표에 채웁니다."""
+        event.stop()
+        query = event.value.strip()
+        if not query or self._index is None or self._searching:
+            return
+        status = self.query_one("#log_search_status", Static)
+        status.update("검색 중...")
+        self._searching = True
+        try:
+            result: SearchResult = await asyncio.get_running_loop().run_in_executor(
+                None, self._index.search, query
+            )
+        except Exception as e:
+            status.update(f"검색 실패: {e}")
+            return
+        finally:
+            self._searching = False
+
+        table = self.query_one("#log_search_table", DataTable)
+        table.clear()
+        for hit in result.hits:
+            table.add_row(
+                datetime.fromtimestamp(hit.ts).strftime("%m-%d %H:%M:%S"),
+                hit.source,
+                hit.text[:MAX_MESSAGE_CHARS],
+            )
+        more = "+" if result.truncated else ""
+        status.update(
+            f"{len(result.hits)}{more}건 · 세그먼트 {result.segments_scanned}개 · "
+            f"{result.elapsed_ms:.1f}ms"
+        )
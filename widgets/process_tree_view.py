@@ -0,0 +1,177 @@
+# widgets/process_tree_view.py
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from rich.segment import Segment
+from rich.style import Style
+from textual.binding import Binding
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from collectors.process_tree import ProcessTreeSnapshot
+
+# 오른쪽 숫자 열: Σ CPU %, Σ MEM %, 하위 프로세스 수
+_NUMBERS_WIDTH: int = 22
+_CURSOR_STYLE: Style = Style(reverse=True)
+_MARKER_STYLE: Style = Style(color="cyan", bold=True)
+_DIM_STYLE: Style = Style(dim=True)
+
+
+class ProcessTreeView(ScrollView, can_focus=True):
+    """
+    접고 펼 수 있는 프로세스 트리. 펼쳐진 노드만 행 목록에 포함하고, 화면에 보이는
+    행만 render_line에서 그리므로 프로세스가 1만 개여도 비용은 화면 높이에 비례합니다.
+    """
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "위", show=False),
+        Binding("down", "cursor_down", "아래", show=False),
+        Binding("pageup", "page_up", "페이지 위", show=False),
+        Binding("pagedown", "page_down", "페이지 아래", show=False),
+        Binding("enter", "toggle_node", "접기/펴기"),
+        Binding("left", "collapse_node", "접기", show=False),
+        Binding("right", "expand_node", "펴기", show=False),
+    ]
+
+    DEFAULT_CSS = """
+    ProcessTreeView {
+        height: 20;
+    }
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._snapshot: Optional[ProcessTreeSnapshot] = None
+        self._expanded: Set[int] = set()
+        self._rows: List[Tuple[int, int]] = []  # (pid, depth)
+        self._row_of: Dict[int, int] = {}  # pid -> 행 번호
+        self.cursor_row: int = 0
+
+    def update_tree(self, snapshot: ProcessTreeSnapshot) -> None:
+        """새 스냅숏을 적용합니다. 커서는 같은 PID에 머무릅니다."""
+        if self._snapshot is None:
+            self._expanded.update(snapshot.roots)  # 처음에는 최상위 노드만 펼칩니다.
+        cursor_pid = self._cursor_pid()
+        self._expanded &= snapshot.names.keys()  # 종료된 프로세스 정리
+        self._snapshot = snapshot
+        self._rebuild_rows(cursor_pid)
+
+    def _sorted_children(self, pid: int) -> List[int]:
+        assert self._snapshot is not None
+        children = self._snapshot.children.get(pid, [])
+        cpu, memory = self._snapshot.cpu, self._snapshot.memory
+        return sorted(children, key=lambda child: (cpu[child], memory[child]), reverse=True)
+
+    def _rebuild_rows(self, cursor_pid: Optional[int] = None) -> None:
+        """펼쳐진 노드만 따라 내려가며 보이는 행 목록을 만듭니다."""
+        rows: List[Tuple[int, int]] = []
+        if self._snapshot is not None:
+            cpu = self._snapshot.cpu
+            roots = sorted(self._snapshot.roots, key=lambda pid: cpu[pid], reverse=True)
+            stack: List[Tuple[int, int]] = [(pid, 0) for pid in reversed(roots)]
+            while stack:
+                pid, depth = stack.pop()
+                rows.append((pid, depth))
+                if pid in self._expanded:
+                    children = self._sorted_children(pid)
+                    stack.extend((child, depth + 1) for child in reversed(children))
+        self._rows = rows
+        self._row_of = {pid: index for index, (pid, _) in enumerate(rows)}
+        if cursor_pid is not None and cursor_pid in self._row_of:
+            self.cursor_row = self._row_of[cursor_pid]
+        self.cursor_row = min(self.cursor_row, max(0, len(rows) - 1))
+        self.virtual_size = Size(self.size.width, len(rows))
+        self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        row_index = self.scroll_offset.y + y
+        if self._snapshot is None or row_index >= len(self._rows):
+            return Strip.blank(width)
+        pid, depth = self._rows[row_index]
+        snapshot = self._snapshot
+        has_children = bool(snapshot.children.get(pid))
+        marker = ("▾ " if pid in self._expanded else "▸ ") if has_children else "  "
+        label = f"{snapshot.names.get(pid, '?')} ({pid})"
+        numbers = (
+            f"{snapshot.cpu.get(pid, 0.0):7.1f}{snapshot.memory.get(pid, 0.0):7.1f}"
+            f"{snapshot.descendants.get(pid, 0):8d}"
+        )
+        indent = "  " * depth
+        label_width = max(0, width - _NUMBERS_WIDTH - len(indent) - len(marker))
+        label = label[:label_width].ljust(label_width)
+        segments = [
+            Segment(indent),
+            Segment(marker, _MARKER_STYLE),
+            Segment(label),
+            Segment(numbers, None if has_children else _DIM_STYLE),
+        ]
+        strip = Strip(segments).crop_extend(0, width, None)
+        if row_index == self.cursor_row and self.has_focus:
+            strip = strip.apply_style(_CURSOR_STYLE)
+        return strip
+
+    def _move_cursor(self, row: int) -> None:
+        if not self._rows:
+            return
+        self.cursor_row = max(0, min(row, len(self._rows) - 1))
+        top = self.scroll_offset.y
+        height = max(1, self.size.height)
+        if self.cursor_row < top:
+            self.scroll_to(y=self.cursor_row, animate=False)
+        elif self.cursor_row >= top + height:
+            self.scroll_to(y=self.cursor_row - height + 1, animate=False)
+        self.refresh()
+
+    def _cursor_pid(self) -> Optional[int]:
+        return self._rows[self.cursor_row][0] if self._rows else None
+
+    def action_cursor_up(self) -> None:
+        self._move_cursor(self.cursor_row - 1)
+
+    def action_cursor_down(self) -> None:
+        self._move_cursor(self.cursor_row + 1)
+
+    def action_page_up(self) -> None:
+        self._move_cursor(self.cursor_row - max(1, self.size.height))
+
+    def action_page_down(self) -> None:
+        self._move_cursor(self.cursor_row + max(1, self.size.height))
+
+    def action_toggle_node(self) -> None:
+        pid = self._cursor_pid()
+        if pid is None:
+            return
+        if pid in self._expanded:
+            self._expanded.discard(pid)
+        else:
+            self._expanded.add(pid)
+        self._rebuild_rows(pid)
+
+    def action_collapse_node(self) -> None:
+        """펼쳐진 노드는 접고, 이미 접혀 있으면 부모 행으로 이동합니다."""
+        pid = self._cursor_pid()
+        if pid is None:
+            return
+        if pid in self._expanded and self._snapshot and self._snapshot.children.get(pid):
+            self._expanded.discard(pid)
+            self._rebuild_rows(pid)
+            return
+        depth = self._rows[self.cursor_row][1]
+        for row in range(self.cursor_row - 1, -1, -1):
+            if self._rows[row][1] < depth:
+                self._move_cursor(row)
+                return
+
+    def action_expand_node(self) -> None:
+        pid = self._cursor_pid()
+        if pid is not None and pid not in self._expanded:
+            self._expanded.add(pid)
+            self._rebuild_rows(pid)
+
+    def on_focus(self) -> None:
+        self.refresh()
+
+    def on_blur(self) -> None:
+        self.refresh()
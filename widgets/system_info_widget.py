@@ -1,6 +1,6 @@
 # widgets/system_info_widget.py
 
-from typing import Dict, List
+from typing import Dict
 
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll  # 스크롤 가능한 컨테이너
@@ -8,6 +8,8 @@ from textual.reactive import reactive
 from textual.widget import Widget  # 기본 Widget으로 변경
 from textual.widgets import Static  # 개별 정보 표시에 사용
 
+from .cpu_heatmap_widget import CpuHeatmapWidget
+
 
 class SystemInfoWidget(Widget):  # Static 대신 Widget을 상속받도록 변경
     """시스템 CPU 및 메모리 정보를 표시하는 스크롤 가능한 위젯"""
@@ -23,7 +25,7 @@ class SystemInfoWidget(Widget):  # Static 대신 Widget을 상속받도록 변
         # 스크롤 가능한 컨테이너를 생성합니다.
         with VerticalScroll(id="system_info_scroll_area"):
             yield Static(id="cpu_overall_static")
-            yield Static(id="cpu_per_core_static")
+            yield CpuHeatmapWidget(id="cpu_heatmap")
             yield Static(id="mem_usage_static")
 
     # cpu_usage_overall 값이 변경될 때 호출됩니다.
@@ -36,20 +38,10 @@ class SystemInfoWidget(Widget):  # Static 대신 Widget을 상속받도록 변
             pass  # 또는 self.app.log.error(...) 등으로 로깅
 
     # cpu_usage_per_core 값이 변경될 때 호출됩니다.
+    # 정렬/배치는 히트맵이 코어 구성이 바뀔 때만 계산하고, 여기서는 값만 넘깁니다.
     def watch_cpu_usage_per_core(self, new_value: Dict[str, float]) -> None:
         try:
-            cpu_per_core_widget = self.query_one("#cpu_per_core_static", Static)
-            core_lines: List[str] = []
-            if new_value:
-                # 코어 이름(예: core0, core10)을 기준으로 정렬하여 표시
-                sorted_cores = sorted(
-                    new_value.items(),
-                    key=lambda item: int(item[0].replace("system.cpu.core", "")),
-                )
-                for core_uri_key, usage in sorted_cores:
-                    display_core_name = core_uri_key.replace("system.cpu.", "")  # 예: "core0"
-                    core_lines.append(f"   - {display_core_name}: {usage:.2f}%")
-            cpu_per_core_widget.update("\n".join(core_lines))
+            self.query_one("#cpu_heatmap", CpuHeatmapWidget).update_usage(new_value)
         except Exception:
             pass
 
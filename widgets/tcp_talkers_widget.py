@@ -0,0 +1,102 @@
+# widgets/tcp_talkers_widget.py
+
+from typing import Dict, List, Tuple
+
+from textual.app import ComposeResult
+from textual.containers import Container
+from textual.widgets import DataTable, Static
+
+# 요약 줄에 표시할 상태 (나머지는 대개 0이거나 순간적)
+_SUMMARY_STATES: Tuple[Tuple[str, str], ...] = (
+    ("established", "ESTAB"),
+    ("time_wait", "TIME_WAIT"),
+    ("close_wait", "CLOSE_WAIT"),
+    ("syn_recv", "SYN_RECV"),
+    ("syn_sent", "SYN_SENT"),
+    ("listen", "LISTEN"),
+)
+
+
+def _address_from_uri(segment: str) -> str:
+    """TcpSocketCollector가 URI에 맞게 바꾼 주소를 되돌립니다 (IPv6: "-" -> ":", IPv4: "_" -> ".")."""
+    if "-" in segment:
+        return segment.replace("-", ":")
+    return segment.replace("_", ".")
+
+
+def _ranked(values: Dict[str, float]) -> List[Tuple[str, float]]:
+    return sorted(values.items(), key=lambda item: item[1], reverse=True)
+
+
+class TcpTalkersWidget(Container):
+    """TCP 상태별 소켓 수, 재전송/리슨 드롭 비율, 연결 수 상위 원격 주소·로컬 포트 위젯"""
+
+    BORDER_TITLE = "🔌 TCP 연결 (상위 원격 주소 / 로컬 포트)"
+    _columns = ("원격 주소", "연결", "로컬 포트", "포트 연결")
+
+    def compose(self) -> ComposeResult:
+        """위젯의 하위 구성요소를 정의합니다."""
+        yield Static("소켓 데이터 수집 중...", id="tcp_summary")
+        yield DataTable(id="tcp_talkers_table", cursor_type="none")
+
+    def on_mount(self) -> None:
+        """위젯 마운트 시 호출됩니다."""
+        self.query_one("#tcp_talkers_table", DataTable).add_columns(*self._columns)
+
+    def update_sockets(self, metrics: Dict[str, float]) -> None:
+        """
+        한 틱의 `net.tcp.*`/`net.udp.*` 값으로 요약과 상위 목록을 다시 그립니다.
+
+        Args:
+            metrics: 예) {"net.tcp.state.established": 120.0,
+                          "net.tcp.remote.10_0_0_5.connections": 40.0, ...}
+        """
+        remotes: Dict[str, float] = {}
+        ports: Dict[str, float] = {}
+        for uri, value in metrics.items():
+            parts = uri.split(".")
+            if len(parts) == 5 and parts[4] == "connections":
+                if parts[2] == "remote":
+                    remotes[_address_from_uri(parts[3])] = value
+                elif parts[2] == "port":
+                    ports[parts[3]] = value
+
+        states = " · ".join(
+            f"{label} {metrics[f'net.tcp.state.{state}']:.0f}"
+            for state, label in _SUMMARY_STATES
+            if f"net.tcp.state.{state}" in metrics
+        )
+        rates = []
+        retrans = metrics.get("net.tcp.retrans_segs_per_sec")
+        if retrans is not None:
+            percent = metrics.get("net.tcp.retrans_percent")
+            suffix = f" ({percent:.2f}%)" if percent is not None else ""
+            rates.append(f"재전송 {retrans:.1f}/s{suffix}")
+        for uri, label in (
+            ("net.tcp.listen_drops_per_sec", "리슨 드롭"),
+            ("net.tcp.listen_overflows_per_sec", "큐 초과"),
+            ("net.tcp.passive_opens_per_sec", "수락"),
+            ("net.udp.rcvbuf_errors_per_sec", "UDP 버퍼 드롭"),
+        ):
+            if uri in metrics:
+                rates.append(f"{label} {metrics[uri]:.1f}/s")
+        if metrics.get("net.tcp.listen.saturated"):
+            rates.append(f"[b red]가득 찬 accept 큐 {metrics['net.tcp.listen.saturated']:.0f}[/]")
+        self.query_one("#tcp_summary", Static).update(
+            "\n".join(line for line in (states, " · ".join(rates)) if line) or "소켓 데이터 없음"
+        )
+
+        table = self.query_one("#tcp_talkers_table", DataTable)
+        table.clear()
+        ranked_remotes, ranked_ports = _ranked(remotes), _ranked(ports)
+        for index in range(max(len(ranked_remotes), len(ranked_ports))):
+            address, address_count = (
+                ranked_remotes[index] if index < len(ranked_remotes) else ("", None)
+            )
+            port, port_count = ranked_ports[index] if index < len(ranked_ports) else ("", None)
+            table.add_row(
+                address,
+                "" if address_count is None else f"{address_count:.0f}",
+                port,
+                "" if port_count is None else f"{port_count:.0f}",
+            )
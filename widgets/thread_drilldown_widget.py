@@ -0,0 +1,114 @@
+# widgets/thread_drilldown_widget.py
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Container
+from textual.timer import Timer
+from textual.widgets import DataTable, Static
+
+from collectors.thread_sampler import ThreadSampler
+
+THREAD_SAMPLE_INTERVAL_SECONDS: float = 0.5
+MAX_THREAD_ROWS: int = 50
+
+
+def _format_percent(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+class ThreadDrillDownWidget(Container):
+    """
+    선택한 프로세스의 스레드별 CPU/상태/wchan 패널. 열려 있는 동안에만 그 프로세스의
+    /proc/[pid]/task/*/stat을 짧은 주기로 샘플링하고, 닫으면 샘플러와 타이머를 버립니다.
+    """
+
+    BORDER_TITLE = "🧵 스레드"
+    BINDINGS = [Binding("escape", "close", "닫기")]
+    _columns = ("TID", "이름", "상태", "CPU %", "USR %", "SYS %", "CPU#", "WCHAN")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._sampler: Optional[ThreadSampler] = None
+        self._timer: Optional[Timer] = None
+        self._sampling: bool = False
+
+    def compose(self) -> ComposeResult:
+        """위젯의 하위 구성요소를 정의합니다."""
+        yield Static("", id="thread_drilldown_status")
+        yield DataTable(id="thread_drilldown_table", cursor_type="row")
+
+    def on_mount(self) -> None:
+        """위젯 마운트 시 호출됩니다."""
+        self.query_one("#thread_drilldown_table", DataTable).add_columns(*self._columns)
+
+    @property
+    def is_sampling(self) -> bool:
+        return self._timer is not None
+
+    def open(self, pid: int, name: str) -> None:
+        """프로세스의 스레드 샘플링을 시작하고 패널을 보입니다."""
+        self.stop_sampling()
+        self.border_title = f"🧵 스레드 · {name} (PID {pid}) · {THREAD_SAMPLE_INTERVAL_SECONDS}s"
+        self._sampler = ThreadSampler(pid)
+        self.query_one("#thread_drilldown_table", DataTable).clear()
+        self.query_one("#thread_drilldown_status", Static).update("샘플링 중...")
+        self.display = True
+        self.query_one("#thread_drilldown_table", DataTable).focus()
+        self._timer = self.set_interval(THREAD_SAMPLE_INTERVAL_SECONDS, self._refresh_threads)
+        self.call_later(self._refresh_threads)  # 첫 샘플(비율 기준점)을 바로 잡습니다.
+
+    def stop_sampling(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        self._sampler = None
+
+    def action_close(self) -> None:
+        """패널을 닫고 샘플링을 멈춥니다."""
+        self.stop_sampling()
+        self.display = False
+
+    def on_unmount(self) -> None:
+        self.stop_sampling()
+
+    async def _refresh_threads(self) -> None:
+        sampler = self._sampler
+        if sampler is None or self._sampling:
+            return  # 이전 샘플이 아직 끝나지 않았으면 건너뜁니다 (스레드가 아주 많은 경우).
+        self._sampling = True
+        try:
+            threads = await asyncio.get_running_loop().run_in_executor(None, sampler.sample)
+        finally:
+            self._sampling = False
+        if sampler is not self._sampler:
+            return  # 그 사이에 닫혔거나 다른 프로세스로 바뀜
+        status = self.query_one("#thread_drilldown_status", Static)
+        if threads is None:
+            status.update(f"PID {sampler.pid} 프로세스가 종료되었습니다.")
+            self.stop_sampling()
+            return
+        self._update_table(threads)
+        total = sum(t["cpu_percent"] or 0.0 for t in threads)
+        running = sum(1 for t in threads if t["state"] == "R")
+        status.update(f"스레드 {len(threads)}개 · 실행 중 {running}개 · 합계 CPU {total:.1f}%")
+
+    def _update_table(self, threads: List[Dict[str, Any]]) -> None:
+        table = self.query_one("#thread_drilldown_table", DataTable)
+        cursor_row = table.cursor_row
+        table.clear()
+        for thread in threads[:MAX_THREAD_ROWS]:
+            table.add_row(
+                str(thread["tid"]),
+                thread["name"][:20],
+                thread["state"],
+                _format_percent(thread["cpu_percent"]),
+                _format_percent(thread["user_percent"]),
+                _format_percent(thread["system_percent"]),
+                "-" if thread["processor"] is None else str(thread["processor"]),
+                thread["wchan"][:24] or "-",
+            )
+        if 0 < cursor_row < table.row_count:
+            table.move_cursor(row=cursor_row)
@@ -1,22 +1,58 @@
 # widgets/top_processes_widget.py
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.css.query import NoMatches
+from textual.message import Message
 from textual.widgets import DataTable
 
+from collectors.process_engine import SORT_KEYS
+from collectors.process_tree import ProcessTreeSnapshot
+
+from .process_tree_view import ProcessTreeView
+
+
+def _format_rate(value: Optional[float]) -> str:
+    """초당 바이트/횟수를 짧은 단위로 표시합니다."""
+    if value is None:
+        return "-"
+    for unit in ("", "K", "M", "G"):
+        if abs(value) < 1024:
+            return f"{value:.0f}{unit}"
+        value /= 1024
+    return f"{value:.0f}T"
+
 
 class TopProcessesWidget(Container):
     """상위 프로세스 정보를 표시하는 DataTable 위젯"""
 
     BORDER_TITLE: str = "📈 상위 프로세스 (CPU 기준)"
-    _columns: List[str] = ["PID", "이름", "CPU %", "MEM %"]
+    _columns: List[str] = ["PID", "이름", "CPU %", "MEM %", "R/s", "W/s", "CSW/s", "FD", "THR"]
+
+    class ProcessSelected(Message):
+        """상위 프로세스 표에서 행을 선택(Enter)했을 때 보내는 메시지"""
+
+        def __init__(self, pid: int, name: str) -> None:
+            super().__init__()
+            self.pid = pid
+            self.name = name
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.sort_key: str = "cpu_percent"
+        self.tree_mode: bool = False
+        self._last_processes: List[Dict[str, Any]] = []
+        self._last_tree: Optional[ProcessTreeSnapshot] = None
+        self._row_names: Dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
         """위젯의 하위 구성요소를 정의합니다."""
-        yield DataTable(id="top_procs_table")
+        yield DataTable(id="top_procs_table", cursor_type="row")
+        tree_view = ProcessTreeView(id="process_tree")
+        tree_view.display = False
+        yield tree_view
 
     def on_mount(self) -> None:
         """위젯 마운트 시 호출됩니다."""
@@ -31,20 +67,87 @@ class TopProcessesWidget(Container):
             else:
                 print("TopProcessesWidget: WARNING - DataTable 초기화 중 찾을 수 없습니다.")
 
+    def toggle_tree_mode(self) -> bool:
+        """상위 목록과 프로세스 트리 보기를 전환합니다."""
+        self.tree_mode = not self.tree_mode
+        table = self.query_one("#top_procs_table", DataTable)
+        tree_view = self.query_one("#process_tree", ProcessTreeView)
+        table.display = not self.tree_mode
+        tree_view.display = self.tree_mode
+        if self.tree_mode:
+            self.border_title = "🌳 프로세스 트리 (이름 · Σ CPU % · Σ MEM % · 하위 수)"
+            if self._last_tree is not None:
+                tree_view.update_tree(self._last_tree)
+            tree_view.focus()
+        else:
+            self.border_title = f"📈 상위 프로세스 ({SORT_KEYS[self.sort_key]} 기준)"
+        return self.tree_mode
+
+    def update_tree(self, snapshot: ProcessTreeSnapshot) -> None:
+        """프로세스 트리 스냅숏을 반영합니다 (트리 보기일 때만 다시 그립니다)."""
+        self._last_tree = snapshot
+        if self.tree_mode:
+            self.query_one("#process_tree", ProcessTreeView).update_tree(snapshot)
+
+    def cycle_sort_key(self) -> str:
+        """다음 정렬 키로 전환하고 마지막 데이터로 테이블을 다시 그립니다."""
+        keys = list(SORT_KEYS)
+        self.sort_key = keys[(keys.index(self.sort_key) + 1) % len(keys)]
+        self.border_title = f"📈 상위 프로세스 ({SORT_KEYS[self.sort_key]} 기준)"
+        self.update_processes(self._last_processes)
+        return self.sort_key
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        """선택한 행의 PID로 ProcessSelected 메시지를 보냅니다 (스레드 드릴다운)."""
+        event.stop()
+        key = event.row_key.value
+        if key is None or not key.isdigit():
+            return
+        self.post_message(self.ProcessSelected(int(key), self._row_names.get(key, key)))
+
     def update_processes(self, processes_data: List[Dict[str, Any]]) -> None:
         """프로세스 데이터로 테이블을 업데이트합니다."""
+        self._last_processes = processes_data
         try:
             table = self.query_one("#top_procs_table", DataTable)
+            # 매 틱 다시 그려도 커서가 같은 프로세스에 머물도록 선택된 PID를 기억합니다.
+            selected_pid: Optional[str] = None
+            if table.row_count and table.has_focus:
+                selected_pid = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
             table.clear()
+            self._row_names = {}
             if not table.columns:  # Ensure columns are added if table was cleared/recreated
                 table.add_columns(*self._columns)
 
-            for p_info in processes_data[:10]:  # 상위 10개
+            sorted_processes = sorted(
+                processes_data,
+                key=lambda p_info: p_info.get(self.sort_key) or 0.0,
+                reverse=True,
+            )
+            for p_info in sorted_processes[:10]:  # 상위 10개
                 pid = p_info.get("pid", "N/A")
                 name = str(p_info.get("name", "N/A"))[:25]  # 이름 길이 제한
-                cpu = p_info.get("cpu_percent", 0.0)
-                mem = p_info.get("memory_percent", 0.0)
-                table.add_row(str(pid), name, f"{cpu:.2f}", f"{mem:.2f}")
+                cpu = p_info.get("cpu_percent") or 0.0
+                mem = p_info.get("memory_percent") or 0.0
+                num_fds = p_info.get("num_fds")
+                num_threads = p_info.get("num_threads")
+                if str(pid) in self._row_names:
+                    continue  # 같은 PID가 중복되면 행 키가 충돌하므로 건너뜁니다.
+                self._row_names[str(pid)] = name
+                table.add_row(
+                    str(pid),
+                    name,
+                    f"{cpu:.2f}",
+                    f"{mem:.2f}",
+                    _format_rate(p_info.get("read_bytes_per_sec")),
+                    _format_rate(p_info.get("write_bytes_per_sec")),
+                    _format_rate(p_info.get("ctx_switches_per_sec")),
+                    "-" if num_fds is None else str(num_fds),
+                    "-" if num_threads is None else str(num_threads),
+                    key=str(pid),
+                )
+            if selected_pid in self._row_names:
+                table.move_cursor(row=table.get_row_index(selected_pid))
         except NoMatches:
             if hasattr(self, "app") and hasattr(self.app, "log"):
                 self.app.log.warning(